@@ -3,7 +3,7 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 
-from fantasy_helper.db.database import Base, db_engine
+from fantasy_helper.db.database import Base, create_database_if_missing, db_engine
 from fantasy_helper.db.models.coeff import Coeff
 from fantasy_helper.db.models.source import Source
 from fantasy_helper.db.models.user import User
@@ -23,8 +23,14 @@ from fantasy_helper.db.models.feature_store.fs_players_free_kicks import (
 )
 from fantasy_helper.db.models.feature_store.fs_sports_players import FSSportsPlayers
 from fantasy_helper.db.models.feature_store.fs_calendars import FSCalendars
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
 from fantasy_helper.db.models.ml.team_name import TeamName
 from fantasy_helper.db.models.ml.player_name import PlayerName
+from fantasy_helper.db.models.ml.naming_cache import NamingCache
+from fantasy_helper.db.models.scheduled_job import ScheduledJob
+from fantasy_helper.db.models.job_run import JobRun
 
 config = context.config
 
@@ -76,6 +82,7 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    create_database_if_missing()
     configuration = config.get_section(config.config_ini_section)
     configuration['sqlalchemy.url'] = get_database_url()
     
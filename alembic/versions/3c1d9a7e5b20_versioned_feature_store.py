@@ -0,0 +1,52 @@
+"""Versioned feature store snapshots
+
+Revision ID: 3c1d9a7e5b20
+Revises: f442e864ac06
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1d9a7e5b20'
+down_revision = 'f442e864ac06'
+branch_labels = None
+depends_on = None
+
+
+VERSIONED_TABLES = ('fs_players_stats', 'fs_coeffs', 'fs_calendars', 'fs_sports_players')
+
+
+def upgrade() -> None:
+    op.create_table('fs_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('league_name', sa.String(), nullable=False),
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('league_name', 'table_name')
+    )
+    # existing rows become version 0 of every league and are published as is
+    for table_name in VERSIONED_TABLES:
+        op.add_column(table_name, sa.Column('version', sa.Integer(), nullable=True))
+        op.execute(f"UPDATE {table_name} SET version = 0")
+        op.alter_column(table_name, 'version', nullable=False)
+        op.execute(
+            f"INSERT INTO fs_versions (league_name, table_name, version, timestamp) "
+            f"SELECT DISTINCT league_name, '{table_name}', 0, now() FROM {table_name}"
+        )
+
+
+def downgrade() -> None:
+    # keep only the published snapshot of every league
+    for table_name in VERSIONED_TABLES:
+        op.execute(
+            f"DELETE FROM {table_name} t WHERE t.version IS DISTINCT FROM ("
+            f"SELECT v.version FROM fs_versions v "
+            f"WHERE v.league_name = t.league_name AND v.table_name = '{table_name}')"
+        )
+        op.drop_column(table_name, 'version')
+    op.drop_table('fs_versions')
@@ -0,0 +1,60 @@
+"""Composite indexes for the DAO read filters
+
+Revision ID: 8e2f4b6c1a93
+Revises: 3c1d9a7e5b20
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2f4b6c1a93'
+down_revision = '3c1d9a7e5b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_players_league_year_dedup', 'players', ['league_name', 'year', 'name', 'team_name', 'position', 'games', sa.text('timestamp DESC')], unique=False)
+    op.create_index('ix_players_league_team', 'players', ['league_name', 'team_name'], unique=False)
+    op.create_index('ix_players_matches_league_year_dedup', 'players_matches', ['league_name', 'year', 'player_id', 'date', sa.text('timestamp DESC')], unique=False)
+    op.create_index('ix_coeffs_league_year_timestamp', 'coeffs', ['league_name', 'year', 'timestamp'], unique=False)
+    op.create_index('ix_schedules_league_year_date', 'schedules', ['league_name', 'year', 'date'], unique=False)
+    op.create_index('ix_fbref_schedules_league_year_parsed', 'fbref_schedules', ['league_name', 'year', 'match_parsed'], unique=False)
+    op.create_index('ix_tables_league_year_dedup', 'tables', ['league_name', 'year', 'team_name', sa.text('timestamp DESC')], unique=False)
+    op.create_index('ix_lineups_league_year_dedup', 'lineups', ['league_name', 'year', 'team_name', sa.text('timestamp DESC')], unique=False)
+    op.create_index('ix_lineups_timestamp', 'lineups', ['timestamp'], unique=False)
+    op.create_index('ix_actual_players_league_year', 'actual_players', ['league_name', 'year'], unique=False)
+    op.create_index('ix_sports_players_league_year_tour', 'sports_players', ['league_name', 'year', 'tour'], unique=False)
+    op.create_index('ix_teams_names_league_year', 'teams_names', ['league_name', 'year'], unique=False)
+    op.create_index('ix_players_names_league_year_team', 'players_names', ['league_name', 'year', 'team_name'], unique=False)
+    op.create_index('ix_fs_players_stats_league_version_type', 'fs_players_stats', ['league_name', 'version', 'type'], unique=False)
+    op.create_index('ix_fs_coeffs_league_version', 'fs_coeffs', ['league_name', 'version'], unique=False)
+    op.create_index('ix_fs_calendars_league_version', 'fs_calendars', ['league_name', 'version'], unique=False)
+    op.create_index('ix_fs_sports_players_league_version', 'fs_sports_players', ['league_name', 'version'], unique=False)
+    op.create_index('ix_fs_players_free_kicks_league', 'fs_players_free_kicks', ['league_name'], unique=False)
+    op.create_index('ix_fs_lineups_league', 'fs_lineups', ['league_name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fs_lineups_league', table_name='fs_lineups')
+    op.drop_index('ix_fs_players_free_kicks_league', table_name='fs_players_free_kicks')
+    op.drop_index('ix_fs_sports_players_league_version', table_name='fs_sports_players')
+    op.drop_index('ix_fs_calendars_league_version', table_name='fs_calendars')
+    op.drop_index('ix_fs_coeffs_league_version', table_name='fs_coeffs')
+    op.drop_index('ix_fs_players_stats_league_version_type', table_name='fs_players_stats')
+    op.drop_index('ix_players_names_league_year_team', table_name='players_names')
+    op.drop_index('ix_teams_names_league_year', table_name='teams_names')
+    op.drop_index('ix_sports_players_league_year_tour', table_name='sports_players')
+    op.drop_index('ix_actual_players_league_year', table_name='actual_players')
+    op.drop_index('ix_lineups_timestamp', table_name='lineups')
+    op.drop_index('ix_lineups_league_year_dedup', table_name='lineups')
+    op.drop_index('ix_tables_league_year_dedup', table_name='tables')
+    op.drop_index('ix_fbref_schedules_league_year_parsed', table_name='fbref_schedules')
+    op.drop_index('ix_schedules_league_year_date', table_name='schedules')
+    op.drop_index('ix_coeffs_league_year_timestamp', table_name='coeffs')
+    op.drop_index('ix_players_matches_league_year_dedup', table_name='players_matches')
+    op.drop_index('ix_players_league_team', table_name='players')
+    op.drop_index('ix_players_league_year_dedup', table_name='players')
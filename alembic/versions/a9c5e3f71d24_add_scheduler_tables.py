@@ -0,0 +1,51 @@
+"""Schedule and history of the update daemon jobs
+
+Revision ID: a9c5e3f71d24
+Revises: f3b8d1c6a2e9
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c5e3f71d24'
+down_revision = 'f3b8d1c6a2e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduled_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('job', sa.String(), nullable=False),
+    sa.Column('league_name', sa.String(), nullable=True),
+    sa.Column('cron', sa.String(), nullable=False),
+    sa.Column('enabled', sa.Boolean(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scheduled_jobs_name', 'scheduled_jobs', ['name'], unique=True)
+    op.create_table('jobs_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('job', sa.String(), nullable=False),
+    sa.Column('league_name', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('scheduled_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('duration', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_runs_name_started_at', 'jobs_runs', ['name', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_runs_name_started_at', table_name='jobs_runs')
+    op.drop_table('jobs_runs')
+    op.drop_index('ix_scheduled_jobs_name', table_name='scheduled_jobs')
+    op.drop_table('scheduled_jobs')
@@ -0,0 +1,26 @@
+"""Owner and heartbeat of the update daemon jobs runs
+
+Revision ID: b4e8f2a6c913
+Revises: a9c5e3f71d24
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e8f2a6c913'
+down_revision = 'a9c5e3f71d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs_runs', sa.Column('owner', sa.String(), nullable=True))
+    op.add_column('jobs_runs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs_runs', 'heartbeat_at')
+    op.drop_column('jobs_runs', 'owner')
@@ -0,0 +1,41 @@
+"""Versioned fs_lineups snapshots
+
+Revision ID: b7d35e0c9f14
+Revises: 8e2f4b6c1a93
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d35e0c9f14'
+down_revision = '8e2f4b6c1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # existing rows become version 0 of every league and are published as is
+    op.add_column('fs_lineups', sa.Column('version', sa.Integer(), nullable=True))
+    op.execute("UPDATE fs_lineups SET version = 0")
+    op.alter_column('fs_lineups', 'version', nullable=False)
+    op.execute(
+        "INSERT INTO fs_versions (league_name, table_name, version, timestamp) "
+        "SELECT DISTINCT league_name, 'fs_lineups', 0, now() FROM fs_lineups"
+    )
+    op.drop_index('ix_fs_lineups_league', table_name='fs_lineups')
+    op.create_index('ix_fs_lineups_league_version', 'fs_lineups', ['league_name', 'version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fs_lineups_league_version', table_name='fs_lineups')
+    op.create_index('ix_fs_lineups_league', 'fs_lineups', ['league_name'], unique=False)
+    op.execute(
+        "DELETE FROM fs_lineups t WHERE t.version IS DISTINCT FROM ("
+        "SELECT v.version FROM fs_versions v "
+        "WHERE v.league_name = t.league_name AND v.table_name = 'fs_lineups')"
+    )
+    op.execute("DELETE FROM fs_versions WHERE table_name = 'fs_lineups'")
+    op.drop_column('fs_lineups', 'version')
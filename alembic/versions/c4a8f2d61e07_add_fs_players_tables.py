@@ -0,0 +1,35 @@
+"""Precomputed players tables
+
+Revision ID: c4a8f2d61e07
+Revises: b7d35e0c9f14
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a8f2d61e07'
+down_revision = 'b7d35e0c9f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('fs_players_tables',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('league_name', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('games_count', sa.Integer(), nullable=False),
+    sa.Column('normalization', sa.String(), nullable=False),
+    sa.Column('rows', sa.JSON(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_fs_players_tables_lookup', 'fs_players_tables', ['league_name', 'version', 'normalization', 'games_count'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fs_players_tables_lookup', table_name='fs_players_tables')
+    op.drop_table('fs_players_tables')
@@ -0,0 +1,31 @@
+"""Drop the published cumulative players stats snapshots
+
+The players tables and stats index are computed from fs_players_matches,
+the cumulative snapshots of fs_players_stats are no longer published nor
+read. The abs and norm typed rows are kept and read by league without a
+version, so the fs_players_stats pointers go as well.
+
+Revision ID: c5f1a8d3e726
+Revises: b4e8f2a6c913
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5f1a8d3e726'
+down_revision = 'b4e8f2a6c913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM fs_players_stats WHERE type IS NULL")
+    op.execute("DELETE FROM fs_versions WHERE table_name = 'fs_players_stats'")
+
+
+def downgrade() -> None:
+    # the snapshots are rebuilt by the next players stats update of the previous revision
+    pass
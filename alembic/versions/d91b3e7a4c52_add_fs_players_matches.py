@@ -0,0 +1,60 @@
+"""Players matches for the players stats index
+
+Revision ID: d91b3e7a4c52
+Revises: c4a8f2d61e07
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91b3e7a4c52'
+down_revision = 'c4a8f2d61e07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('fs_players_matches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('league_name', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('team', sa.String(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('match_number', sa.Integer(), nullable=False),
+    sa.Column('gameweek', sa.Integer(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.Column('minutes', sa.Integer(), nullable=True),
+    sa.Column('goals', sa.Integer(), nullable=True),
+    sa.Column('shots', sa.Integer(), nullable=True),
+    sa.Column('shots_on_target', sa.Integer(), nullable=True),
+    sa.Column('xg', sa.Float(), nullable=True),
+    sa.Column('xg_np', sa.Float(), nullable=True),
+    sa.Column('xg_xa', sa.Float(), nullable=True),
+    sa.Column('xg_np_xa', sa.Float(), nullable=True),
+    sa.Column('assists', sa.Integer(), nullable=True),
+    sa.Column('xa', sa.Float(), nullable=True),
+    sa.Column('passes_into_penalty_area', sa.Integer(), nullable=True),
+    sa.Column('crosses_into_penalty_area', sa.Integer(), nullable=True),
+    sa.Column('touches_in_attacking_third', sa.Integer(), nullable=True),
+    sa.Column('touches_in_attacking_penalty_area', sa.Integer(), nullable=True),
+    sa.Column('carries_in_attacking_third', sa.Integer(), nullable=True),
+    sa.Column('carries_in_attacking_penalty_area', sa.Integer(), nullable=True),
+    sa.Column('sca', sa.Integer(), nullable=True),
+    sa.Column('gca', sa.Integer(), nullable=True),
+    sa.Column('ball_recoveries', sa.Integer(), nullable=True),
+    sa.Column('sports_team', sa.String(), nullable=True),
+    sa.Column('sports_name', sa.String(), nullable=True),
+    sa.Column('role', sa.String(), nullable=True),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_fs_players_matches_league_version', 'fs_players_matches', ['league_name', 'version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fs_players_matches_league_version', table_name='fs_players_matches')
+    op.drop_table('fs_players_matches')
@@ -0,0 +1,24 @@
+"""Source watermark of feature store snapshots
+
+Revision ID: e2c7a9d40b18
+Revises: d91b3e7a4c52
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c7a9d40b18'
+down_revision = 'd91b3e7a4c52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('fs_versions', sa.Column('watermark', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('fs_versions', 'watermark')
@@ -0,0 +1,36 @@
+"""Cache of llm names matching results
+
+Revision ID: f3b8d1c6a2e9
+Revises: e2c7a9d40b18
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d1c6a2e9'
+down_revision = 'e2c7a9d40b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('naming_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_naming_cache_key', 'naming_cache', ['key'], unique=True)
+    op.create_index('ix_naming_cache_kind', 'naming_cache', ['kind'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_naming_cache_kind', table_name='naming_cache')
+    op.drop_index('ix_naming_cache_key', table_name='naming_cache')
+    op.drop_table('naming_cache')
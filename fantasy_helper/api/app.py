@@ -1,5 +1,6 @@
 from collections import defaultdict
 from dataclasses import asdict
+import datetime
 import os
 import sys
 from typing import Dict, List, Literal, Optional
@@ -10,28 +11,29 @@ import httpx
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from hydra.utils import instantiate
-import pandas as pd
 from loguru import logger
 
 from fantasy_helper.db.dao.feature_store.fs_calendar import FSCalendarsDAO
-from fantasy_helper.utils.common import load_config
-from fantasy_helper.db.dao.coeff import CoeffDAO
-from fantasy_helper.db.dao.player import PlayerDAO
+from fantasy_helper.db.dao.provider import get_dao_provider
+from fantasy_helper.db.dao.schedule import ScheduleDao
 from fantasy_helper.db.dao.user import UserDAO
 from fantasy_helper.db.dao.feature_store.fs_coeffs import FSCoeffsDAO
 from fantasy_helper.db.dao.feature_store.fs_lineups import FSLineupsDAO
 from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
 from fantasy_helper.db.dao.feature_store.fs_sports_players import FSSportsPlayersDAO
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
+from fantasy_helper.api.cache import ResponseCache
+from fantasy_helper.api.db_threads import run_in_db_thread
 from fantasy_helper.api.keycloak_client import KeycloakClient
 from fantasy_helper.api.auth_dep import get_keycloak_client, get_current_user
 
 from fantasy_helper.utils.dataclasses import CalendarInfo, CalendarTableRow, CoeffTableRow, KeycloakUser, LeagueInfo, MatchInfo, PlayerStatsInfo, PlayersLeagueStats, PlayersTableRow, SportsPlayerDiff, TeamLineup
+from fantasy_helper.utils.league_registry import get_league_registry
 from fantasy_helper.conf.config import KEYCLOAK_BASE_URL, KEYCLOAK_SERVER_URL, KEYCLOAK_REALM, KEYCLOAK_CLIENT_ID, KEYCLOAK_CLIENT_SECRET, FRONTEND_URL_HTTPS, BACKEND_URL_HTTPS
 
 
-cfg = load_config(config_path="../conf", config_name="config")
-leagues = {league.ru_name: league.name for league in instantiate(cfg.leagues) if league.is_active}
+league_registry = get_league_registry()
+leagues = dict(league_registry.ru_name_2_name)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -68,14 +70,15 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"]
 )
-User_dao = UserDAO()
-Coeff_dao = CoeffDAO()
-Player_dao = PlayerDAO()
-FS_Coeff_dao = FSCoeffsDAO()
-FS_Lineup_dao = FSLineupsDAO()
-FS_Player_dao = FSPlayersStatsDAO()
-FS_Sports_Players_dao = FSSportsPlayersDAO()
-FS_Calendars_dao = FSCalendarsDAO()
+# DAOs are built on the first request using them, the api never builds the parsers of the update jobs
+dao_provider = get_dao_provider(league_registry)
+
+
+def get_league_versions(league_name: str) -> Dict[str, int]:
+    return dao_provider.get(FSVersionsDAO).get_league_versions(league_name)
+
+
+response_cache = ResponseCache(get_league_versions)
 
 
 @app.get("/me")
@@ -132,7 +135,7 @@ async def login_callback(
             raise HTTPException(status_code=401, detail="ID пользователя не найден")
 
         # Проверка существования пользователя, создание нового при необходимости
-        user = User_dao.get_user_by_id(user_id)
+        user = await run_in_db_thread(dao_provider.get(UserDAO).get_user_by_id, user_id)
         logger.info(f"user get_user_by_id: {user}")
         if not user and isinstance(user_info, dict):
             user_info["id"] = user_info.pop("sub")
@@ -145,7 +148,7 @@ async def login_callback(
                 given_name=user_info["given_name"],
                 family_name=user_info["family_name"],
             )
-            User_dao.add_user(user)
+            await run_in_db_thread(dao_provider.get(UserDAO).add_user, user)
 
         response = JSONResponse(content={"message": "Login successful"}) 
         response.set_cookie(
@@ -232,12 +235,7 @@ async def get_leagues_info() -> List[LeagueInfo]:
     Returns:
         A dictionary with league names as keys and league descriptions as values.
     """
-    result = []
-    for league_config in cfg.leagues:
-        league_info = instantiate(league_config)
-        if league_info.is_active:
-            result.append(league_info)
-    return result
+    return list(league_registry.leagues)
 
 
 @app.get("/leagues_names/")
@@ -262,29 +260,50 @@ async def get_players_stats(league_name: str) -> Dict:
     Returns:
         Dict: A dictionary containing the players' statistics.
     """
-    players_stats = FS_Player_dao.get_players_stats(league_name)
+    players_stats = await run_in_db_thread(dao_provider.get(FSPlayersStatsDAO).get_players_stats, league_name)
     return players_stats.to_json()
 
 
 @app.get("/players_stats_info/")
+@response_cache.cached
 async def get_players_stats_info(
     league_name: str,
     games_count: Optional[int] = None,
     normalize_minutes: bool = False,
     normalize_matches: bool = False,
-    min_minutes: Optional[int] = None
+    min_minutes: Optional[int] = None,
+    gameweek_from: Optional[int] = None,
+    gameweek_to: Optional[int] = None,
+    date_from: Optional[datetime.date] = None
 ) -> List[PlayersTableRow]:
-    players_stats_info = FS_Player_dao.get_players_table_rows(
-        league_name,
-        games_count,
-        normalize_minutes,
-        normalize_matches,
-        min_minutes
-    )
-    return players_stats_info
+    if gameweek_from is None and gameweek_to is None and date_from is None:
+        return await run_in_db_thread(
+            dao_provider.get(FSPlayersStatsDAO).get_published_players_table_rows,
+            league_name,
+            games_count,
+            normalize_minutes,
+            normalize_matches,
+            min_minutes
+        )
+
+    try:
+        return await run_in_db_thread(
+            dao_provider.get(FSPlayersStatsDAO).get_players_window_rows,
+            league_name,
+            games_count,
+            gameweek_from,
+            gameweek_to,
+            date_from,
+            normalize_minutes,
+            normalize_matches,
+            min_minutes
+        )
+    except ValueError as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
 
 
 @app.get("/players_stats_teams_names/")
+@response_cache.cached
 async def get_players_stats_teams_names(league_name: str) -> List[str]:
     """
     Get the names of all teams in the database.
@@ -295,10 +314,11 @@ async def get_players_stats_teams_names(league_name: str) -> List[str]:
     Returns:
         List[str]: A list of team names in the specified league.
     """
-    return FS_Player_dao.get_teams_names(league_name)
+    return await run_in_db_thread(dao_provider.get(FSPlayersStatsDAO).get_teams_names, league_name)
 
 
 @app.get("/players_stats_players_names/")
+@response_cache.cached
 async def get_players_stats_players_names(league_name: str, team_name: str) -> List[str]:
     """
     Get the names of all players in the database.
@@ -310,12 +330,13 @@ async def get_players_stats_players_names(league_name: str, team_name: str) -> L
     Returns:
         List[str]: A list of player names in the specified league and team.
     """
-    return FS_Player_dao.get_players_names(league_name, team_name)
+    return await run_in_db_thread(dao_provider.get(FSPlayersStatsDAO).get_players_names, league_name, team_name)
 
 
 @app.get("/coeffs/")
+@response_cache.cached
 async def get_coeffs(league_name: str) -> List[CoeffTableRow]:
-    return FS_Coeff_dao.get_coeffs(league_name)
+    return await run_in_db_thread(dao_provider.get(FSCoeffsDAO).get_coeffs, league_name)
 
 
 @app.get("/tour_number/")
@@ -329,10 +350,11 @@ async def get_tour_number(league_name: str) -> Optional[int]:
     Returns:
         int: The tour number for the given league.
     """
-    return Coeff_dao.get_tour_number(league_name)
+    return await run_in_db_thread(dao_provider.get(ScheduleDao).get_current_tour_number, league_name)
 
 
 @app.get("/lineups/")
+@response_cache.cached
 async def get_lineups(league_name: str) -> List[TeamLineup]:
     """
     Retrieves the lineups for a specific league.
@@ -343,20 +365,23 @@ async def get_lineups(league_name: str) -> List[TeamLineup]:
     Returns:
         List[TeamLineup]: A list of TeamLineup objects representing the lineups for the league.
     """
-    return FS_Lineup_dao.get_lineups(league_name)
+    return await run_in_db_thread(dao_provider.get(FSLineupsDAO).get_lineups, league_name)
 
 
 @app.get("/sports_players/")
+@response_cache.cached
 async def get_sports_players(league_name: str) -> List[SportsPlayerDiff]:
-    return FS_Sports_Players_dao.get_sports_players(league_name)
+    return await run_in_db_thread(dao_provider.get(FSSportsPlayersDAO).get_sports_players, league_name)
 
 
 @app.get("/calendar/")
+@response_cache.cached
 async def get_calendar(league_name: str) -> List[CalendarTableRow]:
-    return FS_Calendars_dao.get_calendar(league_name)
+    return await run_in_db_thread(dao_provider.get(FSCalendarsDAO).get_calendar, league_name)
 
 
 @app.get("/players_stats_prices/")
+@response_cache.cached
 async def get_players_stats_prices(league_name: str) -> List[float]:
     """
     Get the maximum price for a given league.
@@ -367,4 +392,15 @@ async def get_players_stats_prices(league_name: str) -> List[float]:
     Returns:
         int: The maximum price for the given league.
     """
-    return FS_Sports_Players_dao.get_players_prices(league_name)
+    return await run_in_db_thread(dao_provider.get(FSSportsPlayersDAO).get_players_prices, league_name)
+
+
+@app.get("/cache_stats/")
+async def get_cache_stats() -> Dict:
+    """
+    Get the hit and miss counters of the API response cache.
+
+    Returns:
+        Dict: The cache counters and the current number of entries.
+    """
+    return response_cache.stats()
@@ -0,0 +1,139 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fantasy_helper.api.db_threads import run_in_db_thread
+from fantasy_helper.conf.config import (
+    API_CACHE_ENABLED,
+    API_CACHE_MAX_ENTRIES,
+    API_CACHE_TTL,
+    API_CACHE_VERSION_CHECK_INTERVAL,
+)
+
+
+VersionsToken = Tuple[Tuple[str, int], ...]
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of endpoint results keyed by endpoint name and query params.
+
+    Every entry remembers the feature store versions of its league at the time
+    it was computed. The versions are re-read at most once per
+    version_check_interval seconds per league, so a publish made by an update
+    job in another process invalidates the league entries shortly after it
+    completes.
+    """
+
+    def __init__(
+        self,
+        versions_getter: Callable[[str], Dict[str, int]],
+        max_entries: int = API_CACHE_MAX_ENTRIES,
+        ttl: float = API_CACHE_TTL,
+        version_check_interval: float = API_CACHE_VERSION_CHECK_INTERVAL,
+        enabled: bool = API_CACHE_ENABLED,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._versions_getter = versions_getter
+        self._max_entries = max(max_entries, 1)
+        self._ttl = ttl
+        self._version_check_interval = version_check_interval
+        self._enabled = enabled
+        self._clock = clock
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, VersionsToken, Any]]" = OrderedDict()
+        self._versions: Dict[str, Tuple[float, VersionsToken]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _cached_league_versions(self, league_name: Optional[str]) -> Optional[VersionsToken]:
+        if league_name is None:
+            return ()
+
+        with self._lock:
+            checked = self._versions.get(league_name)
+        if checked is not None and self._clock() - checked[0] < self._version_check_interval:
+            return checked[1]
+        return None
+
+    def _refresh_league_versions(self, league_name: str) -> VersionsToken:
+        now = self._clock()
+        token = tuple(sorted(self._versions_getter(league_name).items()))
+        with self._lock:
+            self._versions[league_name] = (now, token)
+        return token
+
+    def get(self, key: Hashable, versions: VersionsToken) -> Tuple[bool, Any]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_versions, value = entry
+                if expires_at > now and entry_versions == versions:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                if entry_versions != versions:
+                    self.invalidations += 1
+            self.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, versions: VersionsToken, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "enabled": self._enabled,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def cached(self, endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """
+        Decorates an async endpoint whose params are passed as keyword arguments,
+        as FastAPI does. The league_name param selects the versions to track.
+        """
+        if not self._enabled:
+            return endpoint
+
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs):
+            key = (endpoint.__name__, tuple(sorted(kwargs.items())))
+            league_name = kwargs.get("league_name")
+            versions = self._cached_league_versions(league_name)
+            if versions is None:
+                versions = await run_in_db_thread(self._refresh_league_versions, league_name)
+
+            hit, value = self.get(key, versions)
+            if hit:
+                return value
+
+            value = await endpoint(**kwargs)
+            self.put(key, versions, value)
+            return value
+
+        return wrapper
@@ -0,0 +1,32 @@
+import functools
+from typing import Callable, Optional, TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+
+from fantasy_helper.conf.config import API_DB_WORKERS
+
+
+T = TypeVar("T")
+
+_limiter: Optional[CapacityLimiter] = None
+
+
+def get_db_limiter() -> CapacityLimiter:
+    """Limiter shared by all offloaded DB calls, created lazily inside the running event loop."""
+    global _limiter
+    if _limiter is None:
+        _limiter = CapacityLimiter(API_DB_WORKERS)
+    return _limiter
+
+
+async def run_in_db_thread(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a blocking DAO call in a worker thread so it does not stall the event loop.
+
+    At most API_DB_WORKERS calls run at the same time, the rest wait for a
+    free worker without blocking other requests.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=get_db_limiter()
+    )
@@ -3,10 +3,7 @@ import ast
 from typing import Any, List
 
 from dotenv import load_dotenv
-from hydra import compose, initialize
-from hydra.core.global_hydra import GlobalHydra
-
-from fantasy_helper.utils.common import load_config, instantiate_leagues
+from fantasy_helper.utils.league_registry import get_league_registry
 
 
 def parse_env_list(var_name: str) -> List[Any]:
@@ -83,6 +80,59 @@ PROXY_PORTS = parse_env_list("PROXY_PORTS")
 PROXY_USERS = parse_env_list("PROXY_USERS")
 PROXY_PASSWORDS = parse_env_list("PROXY_PASSWORDS")
 
+# fbref webdriver pool
+FBREF_DRIVER_POOL_SIZE = int(os.getenv("FBREF_DRIVER_POOL_SIZE", "2"))
+FBREF_DRIVER_MAX_PAGES = int(os.getenv("FBREF_DRIVER_MAX_PAGES", "50"))
+
+# fbref http fetching, selenium is used as fallback
+FBREF_FETCH_MODE = str(os.getenv("FBREF_FETCH_MODE", "http"))
+FBREF_HTTP_POOL_SIZE = int(os.getenv("FBREF_HTTP_POOL_SIZE", "4"))
+
+# fbref match reports scraping
+FBREF_MATCHES_CONCURRENCY = int(os.getenv("FBREF_MATCHES_CONCURRENCY", "2"))
+FBREF_REQUESTS_PER_MINUTE = float(os.getenv("FBREF_REQUESTS_PER_MINUTE", "10"))
+FBREF_MATCHES_RETRIES = int(os.getenv("FBREF_MATCHES_RETRIES", "2"))
+FBREF_MATCHES_BATCH_SIZE = int(os.getenv("FBREF_MATCHES_BATCH_SIZE", "20"))
+
+# betcity
+BETCITY_MAX_CONCURRENT_PAGES = int(os.getenv("BETCITY_MAX_CONCURRENT_PAGES", "4"))
+
+# db
+BULK_INSERT_BATCH_SIZE = int(os.getenv("BULK_INSERT_BATCH_SIZE", "1000"))
+# published feature store snapshots kept per league, older ones are garbage collected
+FS_KEEP_VERSIONS = int(os.getenv("FS_KEEP_VERSIONS", "2"))
+# recompute players stats only for the teams with matches parsed since the last publish
+FS_INCREMENTAL_UPDATE = os.getenv("FS_INCREMENTAL_UPDATE", "1") == "1"
+
+# worker threads for the blocking stages of update_league_full, stages sharing a scraped site still run one by one
+LEAGUE_PIPELINE_MAX_THREADS = int(os.getenv("LEAGUE_PIPELINE_MAX_THREADS", "4"))
+
+# worker threads for blocking DB calls made by the api, keep below the engine pool size + overflow
+API_DB_WORKERS = int(os.getenv("API_DB_WORKERS", "10"))
+
+# api response cache, entries are dropped once a newer feature store version is published
+API_CACHE_ENABLED = os.getenv("API_CACHE_ENABLED", "1") == "1"
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "600"))
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "512"))
+API_CACHE_VERSION_CHECK_INTERVAL = float(os.getenv("API_CACHE_VERSION_CHECK_INTERVAL", "5"))
+
+# local fuzzy names matching before the llm, pairs below the score or the margin over other candidates go to the llm
+NAMING_FUZZY_MIN_SCORE = float(os.getenv("NAMING_FUZZY_MIN_SCORE", "0.75"))
+NAMING_FUZZY_MIN_MARGIN = float(os.getenv("NAMING_FUZZY_MIN_MARGIN", "0.2"))
+# persistent cache of llm names matching results, cleared by db/scripts/clear_naming_cache.py
+NAMING_CACHE_ENABLED = os.getenv("NAMING_CACHE_ENABLED", "1") == "1"
+# players names matching of a league, teams matched at once and llm retries with exponential backoff
+NAMING_MAX_CONCURRENT_TEAMS = int(os.getenv("NAMING_MAX_CONCURRENT_TEAMS", "4"))
+NAMING_LLM_RETRIES = int(os.getenv("NAMING_LLM_RETRIES", "3"))
+NAMING_LLM_BACKOFF = float(os.getenv("NAMING_LLM_BACKOFF", "2"))
+# in-memory teams and players names index per league, rebuilt on naming writes of this process or after ttl seconds
+NAMING_INDEX_TTL = float(os.getenv("NAMING_INDEX_TTL", "300"))
+# update daemon db/scripts/scheduler.py, schedule table check interval, age of a running run counted as stale
+# and age of the last heartbeat of a run after which its daemon counts as dead
+SCHEDULER_TICK = float(os.getenv("SCHEDULER_TICK", "30"))
+SCHEDULER_STALE_RUN_HOURS = float(os.getenv("SCHEDULER_STALE_RUN_HOURS", "12"))
+SCHEDULER_HEARTBEAT_MINUTES = float(os.getenv("SCHEDULER_HEARTBEAT_MINUTES", "5"))
+
 # open ai
 OPENAI_API_KEY = str(os.getenv("OPENAI_API_KEY"))
 OPENROUTER_API_KEY = str(os.getenv("OPENROUTER_API_KEY"))
@@ -98,8 +148,5 @@ KEYCLOAK_REALM=str(os.getenv("KEYCLOAK_REALM"))
 KEYCLOAK_CLIENT_ID=str(os.getenv("KEYCLOAK_CLIENT_ID"))                                                                                                                                                                                                                                                                                                                                     
 KEYCLOAK_CLIENT_SECRET=str(os.getenv("KEYCLOAK_CLIENT_SECRET"))
 
-# load leagues info
-if not GlobalHydra().is_initialized():
-    initialize(config_path=".", version_base=None)
-cfg = compose(config_name="config")
-leagues = instantiate_leagues(cfg)
+# load leagues info, the registry is built once per process and shared by the DAOs and parsers
+leagues = list(get_league_registry().leagues)
@@ -1,24 +1,26 @@
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Literal, Optional, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Literal, Optional, Tuple
 import os.path as path
 from datetime import timezone
 
 from fantasy_helper.db.dao.schedule import ScheduleDao
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session as SQLSession
-from hydra import compose, initialize
-from hydra.core.global_hydra import GlobalHydra
 from loguru import logger
 
 from fantasy_helper.db.models.coeff import Coeff
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.dao.feature_store.fs_coeffs import FSCoeffsDAO
 from fantasy_helper.db.dao.ml.naming import NamingDAO
-from fantasy_helper.parsers.betcity import BetcityParser
-from fantasy_helper.parsers.sports import SportsParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, MatchInfo
+from fantasy_helper.utils.dataclasses import MatchInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.betcity import BetcityParser
 
 
 utc = timezone.utc
@@ -28,19 +30,27 @@ class CoeffDAO:
     TEAM1_MAX_LEN = 9
     TEAM2_MAX_LEN = 9
 
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def _schedule_dao(self) -> ScheduleDao:
+        return get_dao_provider(self._league_registry).get(ScheduleDao)
+
+    @cached_property
+    def _naming_dao(self) -> NamingDAO:
+        return get_dao_provider(self._league_registry).get(NamingDAO)
 
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
+    @cached_property
+    def _betcity_parser(self) -> "BetcityParser":
+        # playwright is only needed to update coeffs, the api reads them
+        from fantasy_helper.parsers.betcity import BetcityParser
 
-        self._betcity_parser = BetcityParser(leagues=self._leagues)
-        self._schedule_dao = ScheduleDao()
-        self._naming_dao = NamingDAO()
+        return get_dao_provider(self._league_registry).get(BetcityParser)
 
     def get_actual_coeffs(self, league_name: str) -> List[MatchInfo]:
         current_datetime = datetime.now()
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -94,21 +104,18 @@ class CoeffDAO:
     async def update_coeffs(self, league_name: str) -> None:
         logger.info(f"Start update coeffs for {league_name}")
 
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         matches = await self._betcity_parser.get_league_matches(league_name)
         logger.info(f"Got {len(matches)} matches for {league_name}")
 
         db_session: SQLSession = Session()
 
-        for match in matches:
-            db_session.add(
-                Coeff(
-                    **match.__dict__,
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                    year=year
-                )
-            )
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, Coeff, (
+            dict(**match.__dict__, timestamp=timestamp, year=year)
+            for match in matches
+        ))
 
         db_session.commit()
         db_session.close()
@@ -116,18 +123,18 @@ class CoeffDAO:
         logger.info(f"Updated {len(matches)} match coeffs for {league_name}")
 
     async def update_coeffs_all_leagues(self) -> None:
-        for league in self._leagues:
+        for league in self._league_registry:
             await self.update_coeffs(league.name)
 
     def update_feature_store_all_leagues(self) -> None:
-        for league in self._leagues:
+        for league in self._league_registry:
             self.update_feature_store(league.name)
 
     def update_feature_store(self, league_name: str) -> None:
         logger.info(f"start update coeffs feature store for {league_name}")
         feature_store = FSCoeffsDAO()
 
-        if league_name in [x.name for x in self._leagues]:
+        if league_name in self._league_registry:
             actual_coeffs = self.get_actual_coeffs(league_name)
             logger.info(f"Got {len(actual_coeffs)} actual coeffs for {league_name}")
 
@@ -1,36 +1,46 @@
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import List
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 import os.path as path
 
 from sqlalchemy.orm import Session as SQLSession
 from sqlalchemy import and_, func, or_
 from loguru import logger
 
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.models.fbref_schedule import FbrefSchedule
 from fantasy_helper.db.dao.players_match import PlayersMatchDao
-from fantasy_helper.parsers.fbref import FbrefParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, LeagueScheduleInfo
+from fantasy_helper.utils.dataclasses import LeagueScheduleInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.fbref import FbrefParser
 
 utc = timezone.utc
 
 
 class FbrefScheduleDao:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def _players_match_dao(self) -> PlayersMatchDao:
+        return get_dao_provider(self._league_registry).get(PlayersMatchDao)
+
+    @cached_property
+    def _fbref_parser(self) -> "FbrefParser":
+        from fantasy_helper.parsers.fbref import FbrefParser
 
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._fbref_parser = FbrefParser(leagues=self._leagues)
-        self._players_match_dao = PlayersMatchDao()
+        return get_dao_provider(self._league_registry).get(FbrefParser)
 
     def get_leagues(self) -> List[str]:
-        return [league.name for league in self._leagues]
+        return self._league_registry.names
     
     def remove_unparsed_matches(self, league_name: str) -> None:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -48,19 +58,21 @@ class FbrefScheduleDao:
     def add_new_matches(self, matches: List[LeagueScheduleInfo]) -> None:
         db_session: SQLSession = Session()
 
-        for match in matches:
-            year = self._league_2_year.get(match.league_name, "2024")
-            db_session.add(FbrefSchedule(
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, FbrefSchedule, (
+            dict(
                 **asdict(match),
-                timestamp=datetime.now().replace(tzinfo=utc),
-                year=year
-            ))
+                timestamp=timestamp,
+                year=self._league_registry.year(match.league_name)
+            )
+            for match in matches
+        ))
 
         db_session.commit()
         db_session.close()
 
     def get_parsed_matches(self, league_name: str) -> List[LeagueScheduleInfo]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -101,7 +113,7 @@ class FbrefScheduleDao:
     def update_schedule(self, league_name: str) -> None:
         if league_name in self._fbref_parser.get_schedule_leagues():
             logger.info(f"Start update fbref schedule for {league_name}")
-            year = self._league_2_year.get(league_name, "2024")
+            year = self._league_registry.year(league_name)
             cup = False
             if league_name == "ChampionsLeague" or league_name == "EuropaLeague" or league_name == "ClubWorldCup":
                 cup = True
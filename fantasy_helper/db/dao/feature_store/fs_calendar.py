@@ -1,9 +1,9 @@
+import math
+from functools import cached_property
 import os.path as path
-from typing import Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional
 from datetime import datetime, timezone
 
-import numpy as np
-import pandas as pd
 from sqlalchemy import and_
 from sqlalchemy.orm import Session as SQLSession
 from loguru import logger
@@ -12,31 +12,47 @@ from fantasy_helper.db.dao.table import TableDao
 from fantasy_helper.db.dao.schedule import ScheduleDao
 from fantasy_helper.db.dao.ml.naming import NamingDAO
 from fantasy_helper.db.models.feature_store.fs_calendars import FSCalendars
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import CalendarInfo, CalendarTableRow, LeagueInfo, LeagueScheduleInfo, LeagueTableInfo, SportsTourInfo
+from fantasy_helper.utils.dataclasses import CalendarInfo, CalendarTableRow, LeagueScheduleInfo, LeagueTableInfo, SportsTourInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 utc = timezone.utc
 
 
 class FSCalendarsDAO:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._schedule_dao = ScheduleDao()
-        self._table_dao = TableDao()
-        self._naming_dao = NamingDAO()
-
-        self._valid_leagues = []
-        for league in self._leagues:
-            if league.name in self._schedule_dao.get_leagues() \
-                and league.name in self._table_dao.get_leagues():
-                self._valid_leagues.append(league.name)
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+        self._versions_dao = FSVersionsDAO()
+
+    @cached_property
+    def _schedule_dao(self) -> ScheduleDao:
+        return get_dao_provider(self._league_registry).get(ScheduleDao)
+
+    @cached_property
+    def _table_dao(self) -> TableDao:
+        return get_dao_provider(self._league_registry).get(TableDao)
+
+    @cached_property
+    def _naming_dao(self) -> NamingDAO:
+        return get_dao_provider(self._league_registry).get(NamingDAO)
+
+    @cached_property
+    def _valid_leagues(self) -> List[str]:
+        schedule_leagues = set(self._schedule_dao.get_leagues())
+        table_leagues = set(self._table_dao.get_leagues())
+        return [
+            league_name for league_name in self._league_registry.names
+            if league_name in schedule_leagues and league_name in table_leagues
+        ]
 
     def _prepare_league_table(self, league_name: str) -> Dict[str, LeagueTableInfo]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
         table: List[LeagueTableInfo] = self._table_dao.get_table(league_name, year)
 
         result = {}
@@ -46,7 +62,7 @@ class FSCalendarsDAO:
         return result
 
     def _prepare_league_schedule(self, league_name: str) -> List[LeagueScheduleInfo]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
         schedule: List[LeagueScheduleInfo] = self._schedule_dao.get_schedule(
             league_name,
             year
@@ -84,7 +100,7 @@ class FSCalendarsDAO:
     def _get_value_color(
         val: Optional[float], q_1: float, q_2: float, q_3: float, q_4: float
     ) -> str:
-        if val is None or pd.isna(val):
+        if val is None or math.isnan(val):
             return ""
         elif val <= q_1:
             return "#E06456"
@@ -99,7 +115,7 @@ class FSCalendarsDAO:
 
     def _compute_color_for_score(
             self, 
-            all_scores: Optional[np.ndarray],
+            all_scores: Optional["np.ndarray"],
             score: Optional[float],
             opponent_score: Optional[float],
     ) -> Optional[str]:
@@ -122,6 +138,8 @@ class FSCalendarsDAO:
     def _compute_new_calendar(
         self, league_name: str, max_tour_count: int = 5
     ) -> List[CalendarTableRow]:
+        import numpy as np
+
         prepared_schedule = self._prepare_league_schedule(league_name)
         prepared_table = self._prepare_league_table(league_name)
         result = []
@@ -139,10 +157,10 @@ class FSCalendarsDAO:
             )
         )
 
-        teams_names = self._naming_dao.get_teams(league_name)
+        teams_sports_2_fbref = self._naming_dao.get_naming_index(league_name).teams_sports_2_fbref
         sports_team_2_table_row = {
-            team.sports_name: prepared_table.get(team.fbref_name)
-            for team in teams_names
+            sports_name: prepared_table.get(fbref_name)
+            for sports_name, fbref_name in teams_sports_2_fbref.items()
         }
 
         team_2_matches = dict()
@@ -264,7 +282,7 @@ class FSCalendarsDAO:
 
         calendar_rows = (
             db_session.query(FSCalendars)
-            .filter(and_(FSCalendars.league_name == league_name))
+            .filter(FSVersionsDAO.is_current(FSCalendars, league_name))
             .all()
         )
 
@@ -297,22 +315,11 @@ class FSCalendarsDAO:
             logger.warning(f"Calendar is empty for {league_name}")
             return None
 
-        db_session: SQLSession = Session()
-
-        db_session.query(FSCalendars).filter(
-            FSCalendars.league_name == league_name
-        ).delete()
-
-        for new_calendar_row in new_calendar_rows:
-            db_session.add(
-                FSCalendars(
-                    **new_calendar_row.__dict__,
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                )
-            )
-
-        db_session.commit()
-        db_session.close()
+        timestamp = datetime.now().replace(tzinfo=utc)
+        self._versions_dao.publish(FSCalendars, league_name, (
+            dict(new_calendar_row.__dict__, timestamp=timestamp)
+            for new_calendar_row in new_calendar_rows
+        ))
 
         logger.info(f"Updated {len(new_calendar_rows)} calendar rows for {league_name}")
 
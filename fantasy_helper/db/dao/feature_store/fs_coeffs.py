@@ -5,6 +5,7 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session as SQLSession
 
 from fantasy_helper.db.models.feature_store.fs_coeffs import FSCoeffs
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
 from fantasy_helper.db.database import Session
 from fantasy_helper.utils.dataclasses import CoeffTableRow, MatchInfo
 
@@ -13,12 +14,15 @@ utc = timezone.utc
 
 
 class FSCoeffsDAO:
+    def __init__(self):
+        self._versions_dao = FSVersionsDAO()
+
     def get_coeffs(self, league_name: str) -> List[CoeffTableRow]:
         db_session: SQLSession = Session()
 
         cur_tour_matches = (
             db_session.query(FSCoeffs)
-            .filter(FSCoeffs.league_name == league_name)
+            .filter(FSVersionsDAO.is_current(FSCoeffs, league_name))
             .all()
         )
 
@@ -204,23 +208,10 @@ class FSCoeffsDAO:
     def update_coeffs(
         self, league_name: str, matches: List[MatchInfo]
     ) -> None:
-        db_session: SQLSession = Session()
-
-        # remove all previous matches
-        db_session.query(FSCoeffs).filter(
-            FSCoeffs.league_name == league_name
-        ).delete()
-
         coeffs_rows = self._get_coeffs_rows(league_name, matches)
 
-        # add new matches
-        for coeff_row in coeffs_rows:
-            db_session.add(
-                FSCoeffs(
-                    **coeff_row.__dict__,
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                )
-            )
-
-        db_session.commit()
-        db_session.close()
+        timestamp = datetime.now().replace(tzinfo=utc)
+        self._versions_dao.publish(FSCoeffs, league_name, (
+            dict(coeff_row.__dict__, timestamp=timestamp)
+            for coeff_row in coeffs_rows
+        ))
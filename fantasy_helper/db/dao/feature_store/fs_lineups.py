@@ -2,12 +2,16 @@ from typing import List
 
 from sqlalchemy.orm import Session as SQLSession
 
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
 from fantasy_helper.db.database import Session
 from fantasy_helper.utils.dataclasses import TeamLineup
 from fantasy_helper.db.models.feature_store.fs_lineups import FSLineups
 
 
 class FSLineupsDAO:
+    def __init__(self):
+        self._versions_dao = FSVersionsDAO()
+
     def get_lineups(self, league_name: str) -> List[TeamLineup]:
         """
         Retrieves the lineups for a given league.
@@ -21,7 +25,7 @@ class FSLineupsDAO:
         db_session: SQLSession = Session()
 
         league_lineups = (
-            db_session.query(FSLineups).filter(FSLineups.league_name == league_name).all()
+            db_session.query(FSLineups).filter(FSVersionsDAO.is_current(FSLineups, league_name)).all()
         )
 
         result = [
@@ -49,22 +53,10 @@ class FSLineupsDAO:
         Returns:
             None
         """
-        db_session: SQLSession = Session()
-
-        # remove all previous matches
-        db_session.query(FSLineups).filter(
-            FSLineups.league_name == league_name
-        ).delete()
-
-        # add new lineups
-        for lineup in lineups:
-            db_session.add(
-                FSLineups(
-                    league_name=lineup.league_name,
-                    team_name=lineup.team_name,
-                    lineup=lineup.lineup,
-                )
+        self._versions_dao.publish(FSLineups, league_name, (
+            dict(
+                team_name=lineup.team_name,
+                lineup=lineup.lineup,
             )
-
-        db_session.commit()
-        db_session.close()
+            for lineup in lineups
+        ))
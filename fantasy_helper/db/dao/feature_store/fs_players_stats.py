@@ -1,28 +1,36 @@
 from collections import defaultdict
-from copy import deepcopy
-from dataclasses import asdict
-from typing import List, Literal, Optional
-
-import numpy as np
-import pandas as pd
-import polars as pl
-from sqlalchemy import and_, func, union, case
+from dataclasses import asdict, replace
+from datetime import date, datetime, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING, Collection, Dict, List, Literal, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, union
 from sqlalchemy.orm import Session as SQLSession
-from sqlalchemy.sql.functions import coalesce
 from sqlalchemy.orm import aliased
 from loguru import logger
 
-from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.conf.config import FS_INCREMENTAL_UPDATE
 from fantasy_helper.db.database import Session
-from fantasy_helper.utils.dataclasses import LeagueInfo, PlayerStatsInfo, PlayersLeagueStats, PlayersTableRow, SportsPlayerDiff
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+from fantasy_helper.utils.dataclasses import PlayerMatchStatsInfo, PlayerStatsInfo, PlayersLeagueStats, PlayersTableRow, SportsPlayerDiff
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
 from fantasy_helper.db.models.feature_store.fs_players_free_kicks import (
     FSPlayersFreeKicks,
 )
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
 from fantasy_helper.db.models.feature_store.fs_players_stats import FSPlayersStats
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
 from fantasy_helper.db.models.fbref_schedule import FbrefSchedule
 from fantasy_helper.db.models.players_match import PlayersMatch
 from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
 from fantasy_helper.db.dao.feature_store.fs_sports_players import FSSportsPlayersDAO
+from fantasy_helper.db.dao.provider import get_dao_provider
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from fantasy_helper.utils.stats_index import PlayersStatsIndex
 
 
 STATS_COLUMNS = (
@@ -39,70 +47,39 @@ POSITIONS_MAPPING = {
     "FORWARD": "нп",
 }
 
+Normalization = Literal["abs", "minutes", "matches"]
+NORMALIZATIONS = ("abs", "minutes", "matches")
 
-class FSPlayersStatsDAO:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._naming_dao = NamingDAO()
-        self._fs_sports_players_dao = FSSportsPlayersDAO()
-
-    def _add_empty_matches(self, players_stats: List[PlayerStatsInfo]) -> List[PlayerStatsInfo]:
-        team_to_players = defaultdict(lambda: defaultdict(dict))
-        team_to_max_matches = dict()
-
-        for player_stat in players_stats:
-            team_to_players[player_stat.team][player_stat.name][player_stat.games_all] = player_stat
-            team_to_max_matches[player_stat.team] = max(
-                team_to_max_matches.get(player_stat.team, 0), player_stat.games_all
-            )
+utc = timezone.utc
 
-        result = []
-        for team_name, team_players_stats in team_to_players.items():
-            for player_name, player_stats in team_players_stats.items():
-                prev_match_stat = None
-                for match_number in range(1, team_to_max_matches.get(team_name, 0) + 1):
-                    if match_number in player_stats:
-                        prev_match_stat = deepcopy(player_stats[match_number])
-                        result.append(player_stats[match_number])
-                    elif prev_match_stat is not None:
-                        prev_match_stat.games_all = match_number
-                        result.append(deepcopy(prev_match_stat))
-                    else:
-                        result.append(PlayerStatsInfo(
-                            team=team_name,
-                            name=player_name,
-                            games=0,
-                            games_all=match_number,
-                            minutes=0,
-                            goals=0,
-                            shots=0,
-                            shots_on_target=0,
-                            average_shot_distance=0,
-                            xg=0,
-                            xg_np=0,
-                            xg_xa=0,
-                            xg_np_xa=0,
-                            assists=0,
-                            xa=0,
-                            key_passes=0,
-                            passes_into_penalty_area=0,
-                            crosses_into_penalty_area=0,
-                            touches_in_attacking_third=0,
-                            touches_in_attacking_penalty_area=0,
-                            carries_in_attacking_third=0,
-                            carries_in_attacking_penalty_area=0,
-                            sca=0,
-                            gca=0
-                        ))
 
-        return result
-
-    def compute_players_stats_info(self, league_name: str) -> List[PlayerStatsInfo]:
-        year = self._league_2_year.get(league_name, "2024")
-
-        db_session: SQLSession = Session()
+class FSPlayersStatsDAO:
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+        self._versions_dao = FSVersionsDAO()
+        self._stats_indexes: Dict[str, Tuple[Optional[int], "PlayersStatsIndex"]] = {}
+
+    @cached_property
+    def _naming_dao(self) -> NamingDAO:
+        # only needed to add the sports info on updates, readers never build it
+        return get_dao_provider(self._league_registry).get(NamingDAO)
+
+    @cached_property
+    def _fs_sports_players_dao(self) -> FSSportsPlayersDAO:
+        return get_dao_provider(self._league_registry).get(FSSportsPlayersDAO)
+
+    def _query_clean_matches_with_players(
+        self, db_session: SQLSession, league_name: str, teams: Optional[Collection[str]] = None
+    ):
+        """
+        Builds a subquery of the league players stats in every team match, where
+        match_number = 1 is the latest match of the team. Limited to the given
+        teams, if any.
+        """
+        year = self._league_registry.year(league_name)
+        home_teams_filter = [] if teams is None else [FbrefSchedule.home_team.in_(teams)]
+        away_teams_filter = [] if teams is None else [FbrefSchedule.away_team.in_(teams)]
+        players_teams_filter = [] if teams is None else [PlayersMatch.team_name.in_(teams)]
 
         # get all teams matches
         home_teams_matches = (
@@ -119,7 +96,8 @@ class FSPlayersStatsDAO:
             ).filter(and_(
                 FbrefSchedule.league_name == league_name,
                 FbrefSchedule.year == year,
-                FbrefSchedule.match_parsed == True
+                FbrefSchedule.match_parsed == True,
+                *home_teams_filter
             ))
         ).distinct()
         logger.info(f"got {home_teams_matches.count()} home teams matches for {league_name}")
@@ -137,7 +115,8 @@ class FSPlayersStatsDAO:
             ).filter(and_(
                 FbrefSchedule.league_name == league_name,
                 FbrefSchedule.year == year,
-                FbrefSchedule.match_parsed == True
+                FbrefSchedule.match_parsed == True,
+                *away_teams_filter
             ))
         ).distinct()
         logger.info(f"got {away_teams_matches.count()} away teams matches for {league_name}")
@@ -190,7 +169,8 @@ class FSPlayersStatsDAO:
             .filter(and_(
                 PlayersMatch.league_name == league_name,
                 PlayersMatch.year == year,
-                PlayersMatch.date != None
+                PlayersMatch.date != None,
+                *players_teams_filter
             ))
             .distinct()
             .subquery()
@@ -225,200 +205,200 @@ class FSPlayersStatsDAO:
         )
         logger.info(f"got {db_session.query(func.count()).select_from(clean_matches_with_players).scalar()} clean matches with players for {league_name}")
 
-        cumulitive_stats = db_session.query(
+        return clean_matches_with_players
+
+    def compute_players_matches(
+        self, league_name: str, teams: Optional[Collection[str]] = None
+    ) -> List[PlayerMatchStatsInfo]:
+        db_session: SQLSession = Session()
+
+        clean_matches_with_players = self._query_clean_matches_with_players(db_session, league_name, teams)
+
+        players_matches = db_session.query(
             # common
             clean_matches_with_players.c.name,
             clean_matches_with_players.c.team_name.label("team"),
             clean_matches_with_players.c.position,
+            # team match
+            clean_matches_with_players.c.match_number,
+            clean_matches_with_players.c.gameweek,
+            clean_matches_with_players.c.date,
             # playing time
-            clean_matches_with_players.c.match_number.label("games_all"),
-            func.sum(case(
-                [(
-                    coalesce(clean_matches_with_players.c.minutes, 0) > 0, 
-                    1
-                )], 
-                else_=0
-            ))
-            .over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("games"),
-            func.sum(clean_matches_with_players.c.minutes).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("minutes"),
+            clean_matches_with_players.c.minutes,
             # shooting
-            func.sum(clean_matches_with_players.c.goals).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("goals"),
-            func.sum(clean_matches_with_players.c.shots).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("shots"),
-            func.sum(clean_matches_with_players.c.shots_on_target).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("shots_on_target"),
-            func.sum(clean_matches_with_players.c.xg).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("xg"),
-            func.sum(clean_matches_with_players.c.xg_np).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("xg_np"),
+            clean_matches_with_players.c.goals,
+            clean_matches_with_players.c.shots,
+            clean_matches_with_players.c.shots_on_target,
+            clean_matches_with_players.c.xg,
+            clean_matches_with_players.c.xg_np,
             # passing
-            func.sum(clean_matches_with_players.c.assists).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("assists"),
-            func.sum(clean_matches_with_players.c.xg_assist).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("xa"),
-            func.sum(clean_matches_with_players.c.passes_into_penalty_area).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("passes_into_penalty_area"),
-            func.sum(clean_matches_with_players.c.crosses_into_penalty_area).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("crosses_into_penalty_area"),
+            clean_matches_with_players.c.assists,
+            clean_matches_with_players.c.xg_assist.label("xa"),
+            clean_matches_with_players.c.passes_into_penalty_area,
+            clean_matches_with_players.c.crosses_into_penalty_area,
             # possesion
-            func.sum(clean_matches_with_players.c.touches_att_3rd).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("touches_in_attacking_third"),
-            func.sum(clean_matches_with_players.c.touches_att_pen_area).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("touches_in_attacking_penalty_area"),
-            func.sum(clean_matches_with_players.c.carries_into_final_third).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("carries_in_attacking_third"),
-            func.sum(clean_matches_with_players.c.carries_into_penalty_area).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("carries_in_attacking_penalty_area"),
+            clean_matches_with_players.c.touches_att_3rd.label("touches_in_attacking_third"),
+            clean_matches_with_players.c.touches_att_pen_area.label("touches_in_attacking_penalty_area"),
+            clean_matches_with_players.c.carries_into_final_third.label("carries_in_attacking_third"),
+            clean_matches_with_players.c.carries_into_penalty_area.label("carries_in_attacking_penalty_area"),
             # shot creation
-            func.sum(clean_matches_with_players.c.sca).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("sca"),
-            func.sum(clean_matches_with_players.c.gca).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("gca"),
+            clean_matches_with_players.c.sca,
+            clean_matches_with_players.c.gca,
             # miscellaneous
-            func.sum(clean_matches_with_players.c.ball_recoveries).over(
-                partition_by=clean_matches_with_players.c.player_id, 
-                order_by=clean_matches_with_players.c.match_number
-            ).label("ball_recoveries")
+            clean_matches_with_players.c.ball_recoveries
         )
-        logger.info(f"got {db_session.query(func.count()).select_from(cumulitive_stats).scalar()} cumulitive stats for {league_name}")
 
         result = []
-        for row in cumulitive_stats.all():
-            player_stat = PlayerStatsInfo(**dict(row._mapping))
-            if player_stat.xg is not None and player_stat.xa is not None:
-                player_stat.xg_xa = player_stat.xg + player_stat.xa
-            if player_stat.xg_np is not None and player_stat.xa is not None:
-                player_stat.xg_np_xa = player_stat.xg_np + player_stat.xa
-            result.append(player_stat)
+        for row in players_matches.all():
+            player_match = PlayerMatchStatsInfo(**dict(row._mapping))
+            if player_match.xg is not None and player_match.xa is not None:
+                player_match.xg_xa = player_match.xg + player_match.xa
+            if player_match.xg_np is not None and player_match.xa is not None:
+                player_match.xg_np_xa = player_match.xg_np + player_match.xa
+            result.append(player_match)
 
         db_session.commit()
         db_session.close()
 
-        result = self._add_empty_matches(result)
+        logger.info(f"got {len(result)} players matches for {league_name}")
 
         return result
 
     def get_players_stats_info(self, league_name: str) -> List[PlayerStatsInfo]:
+        """
+        Returns the cumulative players stats of a league, a row per player and
+        number of the last team matches, summed from the published players
+        matches.
+        """
+        index = self.get_players_stats_index(league_name)
+        return [PlayerStatsInfo(**row) for row in index.cumulative().to_dicts()]
+
+    def get_source_watermark(self, league_name: str) -> Optional[datetime]:
+        """
+        Returns the latest timestamp of the players matches and parsed schedule
+        rows of the league season, the source rows of the players stats.
+        """
+        year = self._league_registry.year(league_name)
+
         db_session: SQLSession = Session()
 
-        league_players_stats = db_session.query(FSPlayersStats).filter(
-            FSPlayersStats.league_name == league_name
-        ).all()
+        players_matches_timestamp = db_session.query(func.max(PlayersMatch.timestamp)).filter(and_(
+            PlayersMatch.league_name == league_name,
+            PlayersMatch.year == year
+        )).scalar()
+        schedule_timestamp = db_session.query(func.max(FbrefSchedule.timestamp)).filter(and_(
+            FbrefSchedule.league_name == league_name,
+            FbrefSchedule.year == year,
+            FbrefSchedule.match_parsed == True
+        )).scalar()
 
-        result = []
-        for player_stat in league_players_stats:
-            result.append(PlayerStatsInfo(
-                name=player_stat.name,
-                team=player_stat.team,
-                position=player_stat.position,
-                # playing time
-                games=player_stat.games,
-                games_all=player_stat.games_all,
-                minutes=player_stat.minutes,
-                # shooting
-                goals=player_stat.goals,
-                shots=player_stat.shots,
-                shots_on_target=player_stat.shots_on_target,
-                average_shot_distance=player_stat.average_shot_distance,
-                xg=player_stat.xg,
-                xg_np=player_stat.xg_np,
-                xg_xa=player_stat.xg_xa,
-                xg_np_xa=player_stat.xg_np_xa,
-                # passing
-                assists=player_stat.assists,
-                xa=player_stat.xa,
-                key_passes=player_stat.key_passes,
-                passes_into_penalty_area=player_stat.passes_into_penalty_area,
-                crosses_into_penalty_area=player_stat.crosses_into_penalty_area,
-                # pass types
-                touches_in_attacking_third=player_stat.touches_in_attacking_third,
-                touches_in_attacking_penalty_area=player_stat.touches_in_attacking_penalty_area,
-                carries_in_attacking_third=player_stat.carries_in_attacking_third,
-                carries_in_attacking_penalty_area=player_stat.carries_in_attacking_penalty_area,
-                # shot creation
-                sca=player_stat.sca,
-                gca=player_stat.gca,
-                # miscellaneous
-                ball_recoveries=player_stat.ball_recoveries,
-                # sports info
-                sports_team=player_stat.sports_team,
-                sports_name=player_stat.sports_name,
-                role=player_stat.role,
-                price=player_stat.price,
-                percent_ownership=player_stat.percent_ownership,
-                percent_ownership_diff=player_stat.percent_ownership_diff  
-            ))
+        db_session.close()
+
+        timestamps = [timestamp for timestamp in (players_matches_timestamp, schedule_timestamp) if timestamp is not None]
+        return max(timestamps) if timestamps else None
+
+    def get_changed_teams(self, league_name: str, since: datetime) -> Set[str]:
+        """
+        Returns the teams with players matches or parsed schedule rows added
+        after since, together with the teams sharing players with them.
+        """
+        year = self._league_registry.year(league_name)
+
+        db_session: SQLSession = Session()
+
+        changed_teams = {
+            team_name for team_name, in db_session.query(PlayersMatch.team_name).filter(and_(
+                PlayersMatch.league_name == league_name,
+                PlayersMatch.year == year,
+                PlayersMatch.timestamp > since
+            )).distinct()
+        }
+        for home_team, away_team in db_session.query(FbrefSchedule.home_team, FbrefSchedule.away_team).filter(and_(
+            FbrefSchedule.league_name == league_name,
+            FbrefSchedule.year == year,
+            FbrefSchedule.match_parsed == True,
+            FbrefSchedule.timestamp > since
+        )):
+            changed_teams.update((home_team, away_team))
+        players_teams = db_session.query(PlayersMatch.name, PlayersMatch.team_name).filter(and_(
+            PlayersMatch.league_name == league_name,
+            PlayersMatch.year == year,
+            PlayersMatch.date != None
+        )).distinct().all()
 
         db_session.close()
 
-        return result
+        name_2_teams, team_2_names = defaultdict(set), defaultdict(set)
+        for name, team_name in players_teams:
+            name_2_teams[name].add(team_name)
+            team_2_names[team_name].add(name)
+
+        teams_2_check = list(changed_teams)
+        while teams_2_check:
+            for name in team_2_names[teams_2_check.pop()]:
+                for team_name in name_2_teams[name] - changed_teams:
+                    changed_teams.add(team_name)
+                    teams_2_check.append(team_name)
+
+        return changed_teams
+
+    def get_parsed_teams(self, league_name: str) -> Set[str]:
+        year = self._league_registry.year(league_name)
+
+        db_session: SQLSession = Session()
 
-    def update_players_stats_info(
+        parsed_matches = db_session.query(FbrefSchedule.home_team, FbrefSchedule.away_team).filter(and_(
+            FbrefSchedule.league_name == league_name,
+            FbrefSchedule.year == year,
+            FbrefSchedule.match_parsed == True
+        )).distinct().all()
+
+        db_session.close()
+
+        return {team_name for match in parsed_matches for team_name in match}
+
+    def update_players_stats(
         self,
         league_name: str,
-        players_stats_info: List[PlayerStatsInfo],
+        incremental: bool = FS_INCREMENTAL_UPDATE,
         add_sports_info: bool = True
     ) -> None:
-        logger.info(f"starts update players_stats_info for {league_name}")
-        if add_sports_info:
-            logger.info(f"got {len(players_stats_info)} players_stats_info for {league_name}")
-            sports_players = self._fs_sports_players_dao.get_sports_players(league_name)
-            logger.info(f"got {len(sports_players)} sports players for {league_name}")
-            players_stats_info = self._naming_dao.add_sports_info_to_players_stats_info(
-                league_name, players_stats_info, sports_players
-            )
-            logger.info(f"updated {len(players_stats_info)} players_stats_info for {league_name}")
-        
-        db_session: SQLSession = Session()
-
-        # remove all previous stats
-        db_session.query(FSPlayersStats).filter(
-            FSPlayersStats.league_name == league_name
-        ).delete()
-
-        # add new stats
-        for player_stats_info in players_stats_info:
-            db_session.add(FSPlayersStats(league_name=league_name, **asdict(player_stats_info)))
+        """
+        Computes and publishes the players matches of a league and the players
+        tables summed from them.
+
+        The incremental mode recomputes only the matches of the teams changed
+        after the watermark of the published snapshot and reuses the published
+        matches of the other teams of the season. It falls back to a full
+        rebuild when the published snapshot has no watermark or every team has
+        changed.
+        """
+        watermark = self.get_source_watermark(league_name)
+        last_watermark = self._versions_dao.get_watermark(FSPlayersMatches, league_name)
+
+        kept_teams = set()
+        if incremental and last_watermark is not None:
+            changed_teams = self.get_changed_teams(league_name, last_watermark)
+            kept_teams = self.get_parsed_teams(league_name) - changed_teams
+
+        if kept_teams:
+            logger.info(f"incremental update of {len(changed_teams)} teams, {len(kept_teams)} teams kept for {league_name}")
+
+            # sports info is added again, as prices change without new matches
+            players_matches = [
+                replace(player_match, sports_name=None, sports_team=None, role=None, price=None)
+                for player_match in self.get_players_matches(league_name)
+                if player_match.team in kept_teams
+            ]
+            if changed_teams:
+                players_matches += self.compute_players_matches(league_name, changed_teams)
+        else:
+            logger.info(f"full update of players stats for {league_name}")
+            players_matches = self.compute_players_matches(league_name)
 
-        db_session.commit()
-        db_session.close()
+        self.update_players_matches(
+            league_name, players_matches, add_sports_info=add_sports_info, watermark=watermark
+        )
 
     def get_players_stats(self, league_name: str) -> PlayersLeagueStats:
         """
@@ -433,8 +413,11 @@ class FSPlayersStatsDAO:
                 - norm_stats (pandas.DataFrame): A DataFrame containing the normalized player statistics.
                 - free_kicks (pandas.DataFrame): A DataFrame containing the player free kick statistics.
         """
+        import pandas as pd
+
         db_session: SQLSession = Session()
 
+        # the typed rows are kept as they are, fs_players_stats has no published snapshots
         abs_players_stats = db_session.query(FSPlayersStats).filter(
             and_(
                 FSPlayersStats.league_name == league_name,
@@ -483,15 +466,18 @@ class FSPlayersStatsDAO:
         add_sports_info: bool = True
     ) -> None:
         """
-        Updates the player statistics for a given league.
+        Replaces the players free kicks stats of a league. The abs and norm
+        stats are not written, the typed rows of fs_players_stats stay as they are.
 
         Args:
             league_name (str): The name of the league.
-            players_stats (PlayersLeagueStats): The player statistics to update.
+            players_stats (PlayersLeagueStats): The player statistics with the free kicks stats.
 
         Returns:
             None: This function does not return anything.
         """
+        import numpy as np
+
         logger.info(f"start update players free kicks stats for {league_name}")
         if add_sports_info:
             logger.info(f"got {len(players_stats.abs_stats)} players_stats for {league_name}")
@@ -504,41 +490,17 @@ class FSPlayersStatsDAO:
 
         db_session: SQLSession = Session()
 
-        # # remove all previous stats
-        # db_session.query(FSPlayersStats).filter(
-        #     FSPlayersStats.league_name == league_name
-        # ).delete()
-
-        # # add new stats
-        # for index, abs_player_stats in players_stats.abs_stats.replace(
-        #     np.nan, None
-        # ).iterrows():
-        #     db_session.add(
-        #         FSPlayersStats(type="abs", league_name=league_name, **abs_player_stats)
-        #     )
-        # db_session.commit()
-
-        # for index, norm_player_stats in players_stats.norm_stats.replace(
-        #     np.nan, None
-        # ).iterrows():
-        #     db_session.add(
-        #         FSPlayersStats(
-        #             type="norm", league_name=league_name, **norm_player_stats
-        #         )
-        #     )
-        # db_session.commit()
-
         # remove all previous stats
         db_session.query(FSPlayersFreeKicks).filter(
             FSPlayersFreeKicks.league_name == league_name
         ).delete()
 
-        for index, free_kick_stats in players_stats.free_kicks.replace(
-            np.nan, None
-        ).iterrows():
-            db_session.add(
-                FSPlayersFreeKicks(league_name=league_name, **free_kick_stats)
-            )
+        bulk_insert(db_session, FSPlayersFreeKicks, (
+            dict(free_kick_stats, league_name=league_name)
+            for free_kick_stats in players_stats.free_kicks.replace(
+                np.nan, None
+            ).to_dict("records")
+        ))
         db_session.commit()
 
         db_session.close()
@@ -547,8 +509,8 @@ class FSPlayersStatsDAO:
         db_session: SQLSession = Session()
 
         team_names = (
-            db_session.query(FSPlayersStats.sports_team)
-            .filter(FSPlayersStats.league_name == league_name)
+            db_session.query(FSPlayersMatches.sports_team)
+            .filter(FSVersionsDAO.is_current(FSPlayersMatches, league_name))
             .distinct()
             .all()
         )
@@ -562,8 +524,11 @@ class FSPlayersStatsDAO:
         db_session: SQLSession = Session()
 
         player_names = (
-            db_session.query(FSPlayersStats.sports_name)
-            .filter(and_(FSPlayersStats.league_name == league_name, FSPlayersStats.sports_team == team_name))
+            db_session.query(FSPlayersMatches.sports_name)
+            .filter(and_(
+                FSVersionsDAO.is_current(FSPlayersMatches, league_name),
+                FSPlayersMatches.sports_team == team_name
+            ))
             .distinct()
             .all()
         )
@@ -573,16 +538,36 @@ class FSPlayersStatsDAO:
 
         return sorted([player_name[0] for player_name in player_names if player_name[0] is not None])
     
-    def get_players_table_rows(
+    @staticmethod
+    def _get_normalization(normalize_minutes: bool, normalize_matches: bool) -> Normalization:
+        if normalize_minutes:
+            return "minutes"
+        if normalize_matches:
+            return "matches"
+        return "abs"
+
+    @staticmethod
+    def _filter_min_minutes(
+        rows: List[PlayersTableRow], min_minutes: Optional[int]
+    ) -> List[PlayersTableRow]:
+        """
+        Applies the min_minutes filter to a computed players table and fills the
+        unknown minutes, which are kept as None so that the filter drops them.
+        """
+        return [
+            replace(row, minutes=0) if row.minutes is None else row
+            for row in rows
+            if min_minutes is None or (row.minutes is not None and row.minutes >= min_minutes)
+        ]
+
+    def _compute_players_table(
         self,
+        df: "pl.DataFrame",
         league_name: str,
-        games_count: Optional[int] = None,
-        normalize_minutes: bool = False,
-        normalize_matches: bool = False,
-        min_minutes: Optional[int] = None
+        games_count: Optional[int],
+        normalization: Normalization
     ) -> List[PlayersTableRow]:
-        players_stats_info = self.get_players_stats_info(league_name)
-        df = pl.DataFrame([asdict(player_stats) for player_stats in players_stats_info])
+        import polars as pl
 
         if df.is_empty():
             return []
@@ -604,11 +589,8 @@ class FSPlayersStatsDAO:
             df = df.filter(pl.col("games_all") == pl.col("team_max_games"))
             df = df.drop("team_max_games")
 
-        if min_minutes is not None:
-            df = df.filter(pl.col("minutes") >= min_minutes)
-
         # Normalization logic
-        if normalize_minutes:
+        if normalization == "minutes":
             minutes_mask = pl.col("minutes") > 0
             for col in STATS_COLUMNS:
                 if col in df.columns:
@@ -616,7 +598,7 @@ class FSPlayersStatsDAO:
                         pl.when(minutes_mask).then(pl.col(col) / pl.col("minutes"))
                         .otherwise(pl.col(col)).alias(col)
                     )
-        elif normalize_matches:
+        elif normalization == "matches":
             games_mask = pl.col("games") > 0
             for col in STATS_COLUMNS:
                 if col in df.columns:
@@ -625,16 +607,13 @@ class FSPlayersStatsDAO:
                         .otherwise(pl.col(col)).alias(col)
                     )
 
-        # Drop columns with all null values
-        # df = df[[col for col in df.columns if not df[col].null_count() == df.height]]
-
-        # Final processing
+        # Final processing, minutes stay null until the min_minutes filter
         if not df.is_empty() and "sports_name" in df.columns and "role" in df.columns:
             df = df.filter(pl.col("sports_name").is_not_null())
             df = df.with_columns(
-                pl.col("role").map_elements(POSITIONS_MAPPING.get).alias("role")
+                pl.col("role").map_elements(POSITIONS_MAPPING.get, return_dtype=pl.String).alias("role")
             )
-            df = df.fill_null(0)
+            df = df.fill_null(0).with_columns(df["minutes"])
 
         return [
             PlayersTableRow(
@@ -668,3 +647,224 @@ class FSPlayersStatsDAO:
             ) 
             for row in df.to_dicts()
         ]
+
+    def get_players_table_rows(
+        self,
+        league_name: str,
+        games_count: Optional[int] = None,
+        normalize_minutes: bool = False,
+        normalize_matches: bool = False,
+        min_minutes: Optional[int] = None
+    ) -> List[PlayersTableRow]:
+        import polars as pl
+
+        players_stats_info = self.get_players_stats_info(league_name)
+        df = pl.DataFrame(
+            [asdict(player_stats) for player_stats in players_stats_info], infer_schema_length=None
+        )
+
+        rows = self._compute_players_table(
+            df, league_name, games_count, self._get_normalization(normalize_minutes, normalize_matches)
+        )
+        return self._filter_min_minutes(rows, min_minutes)
+
+    def update_players_tables(self, league_name: str, index: "PlayersStatsIndex") -> None:
+        """
+        Precomputes the players table for every games window and normalization
+        mode from the stats index of the players matches and publishes them as
+        one snapshot of fs_players_tables.
+
+        Windows of max games or more are equal to all games and are stored once
+        as games_count = 0.
+        """
+        def players_tables():
+            for games_count in [None, *range(1, index.max_matches)]:
+                df = index.window(games_count=games_count)
+                for normalization in NORMALIZATIONS:
+                    yield dict(
+                        games_count=games_count or 0,
+                        normalization=normalization,
+                        rows=[
+                            asdict(row)
+                            for row in self._compute_players_table(df, league_name, None, normalization)
+                        ],
+                        timestamp=timestamp,
+                    )
+
+        timestamp = datetime.now().replace(tzinfo=utc)
+        self._versions_dao.publish(FSPlayersTables, league_name, players_tables())
+        logger.info(f"updated players tables for {league_name}, max games {index.max_matches}")
+
+    def get_published_players_table_rows(
+        self,
+        league_name: str,
+        games_count: Optional[int] = None,
+        normalize_minutes: bool = False,
+        normalize_matches: bool = False,
+        min_minutes: Optional[int] = None
+    ) -> List[PlayersTableRow]:
+        """
+        Same as get_players_table_rows, but reads the table precomputed by
+        update_players_tables. Falls back to computing it when the league has
+        no published tables.
+        """
+        if games_count is not None and games_count <= 0:
+            return self.get_players_table_rows(
+                league_name, games_count, normalize_minutes, normalize_matches, min_minutes
+            )
+
+        db_session: SQLSession = Session()
+
+        # a window without its own table is at least max games long, so it is the all games table
+        players_table = (
+            db_session.query(FSPlayersTables.rows)
+            .filter(and_(
+                FSVersionsDAO.is_current(FSPlayersTables, league_name),
+                FSPlayersTables.normalization == self._get_normalization(normalize_minutes, normalize_matches),
+                FSPlayersTables.games_count.in_([games_count or 0, 0])
+            ))
+            .order_by(FSPlayersTables.games_count.desc())
+            .first()
+        )
+
+        db_session.close()
+
+        if players_table is None:
+            return self.get_players_table_rows(
+                league_name, games_count, normalize_minutes, normalize_matches, min_minutes
+            )
+
+        return self._filter_min_minutes(
+            [PlayersTableRow(**row) for row in players_table.rows], min_minutes
+        )
+
+    def update_players_matches(
+        self,
+        league_name: str,
+        players_matches: List[PlayerMatchStatsInfo],
+        add_sports_info: bool = True,
+        watermark: Optional[datetime] = None
+    ) -> None:
+        """
+        Publishes the players matches, the source of the players stats index,
+        and the players tables summed from them.
+        """
+        if add_sports_info:
+            players_matches = self._add_sports_info(league_name, players_matches)
+
+        version = self._versions_dao.publish(FSPlayersMatches, league_name, (
+            asdict(player_match) for player_match in players_matches
+        ), watermark=watermark)
+
+        index = self._build_players_stats_index(league_name, version, players_matches)
+        self.update_players_tables(league_name, index)
+
+    def _add_sports_info(
+        self, league_name: str, players_matches: List[PlayerMatchStatsInfo]
+    ) -> List[PlayerMatchStatsInfo]:
+        sports_players = self._fs_sports_players_dao.get_sports_players(league_name)
+        logger.info(f"got {len(sports_players)} sports players for {league_name}")
+        players = {
+            (player_match.name, player_match.team): PlayerStatsInfo(name=player_match.name, team=player_match.team)
+            for player_match in players_matches
+        }
+        players_sports_info = {
+            (player_stats.name, player_stats.team): player_stats
+            for player_stats in self._naming_dao.add_sports_info_to_players_stats_info(
+                league_name, list(players.values()), sports_players
+            )
+            if player_stats.sports_name is not None
+        }
+
+        def with_sports_info(player_match: PlayerMatchStatsInfo) -> PlayerMatchStatsInfo:
+            player_stats = players_sports_info.get((player_match.name, player_match.team))
+            if player_stats is None:
+                return player_match
+            return replace(
+                player_match,
+                sports_name=player_stats.sports_name,
+                sports_team=player_stats.sports_team,
+                role=player_stats.role,
+                price=player_stats.price
+            )
+
+        return [with_sports_info(player_match) for player_match in players_matches]
+
+    def get_players_matches(
+        self, league_name: str, version: Optional[int] = None
+    ) -> List[PlayerMatchStatsInfo]:
+        """
+        Returns the published players matches of a league, or the ones of the
+        given snapshot version.
+        """
+        db_session: SQLSession = Session()
+
+        version_filter = (
+            FSVersionsDAO.is_current(FSPlayersMatches, league_name) if version is None
+            else and_(FSPlayersMatches.league_name == league_name, FSPlayersMatches.version == version)
+        )
+        league_players_matches = db_session.query(FSPlayersMatches).filter(version_filter).all()
+        result = [
+            PlayerMatchStatsInfo(**{
+                column: getattr(player_match, column) for column in PlayerMatchStatsInfo.__dataclass_fields__
+            })
+            for player_match in league_players_matches
+        ]
+
+        db_session.close()
+
+        return result
+
+    def get_players_stats_index(self, league_name: str) -> "PlayersStatsIndex":
+        """
+        Returns the stats index of the published players matches of a league.
+        The index is built once per published version.
+        """
+        version = self._versions_dao.get_version(FSPlayersMatches, league_name)
+        cached = self._stats_indexes.get(league_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        return self._build_players_stats_index(league_name, version, self.get_players_matches(league_name, version))
+
+    def _build_players_stats_index(
+        self, league_name: str, version: Optional[int], players_matches: List[PlayerMatchStatsInfo]
+    ) -> "PlayersStatsIndex":
+        from fantasy_helper.utils.stats_index import PlayersStatsIndex
+
+        index = PlayersStatsIndex(players_matches, columns=("minutes", *STATS_COLUMNS))
+        self._stats_indexes[league_name] = (version, index)
+        logger.info(f"built players stats index v{version} for {league_name} with {index.players_count} players")
+
+        return index
+
+    def get_players_window_rows(
+        self,
+        league_name: str,
+        games_count: Optional[int] = None,
+        gameweek_from: Optional[int] = None,
+        gameweek_to: Optional[int] = None,
+        date_from: Optional[date] = None,
+        normalize_minutes: bool = False,
+        normalize_matches: bool = False,
+        min_minutes: Optional[int] = None
+    ) -> List[PlayersTableRow]:
+        """
+        Computes the players table over an arbitrary window of the team matches:
+        the last games_count matches, optionally since date_from, or the
+        gameweeks from gameweek_from to gameweek_to.
+
+        Raises:
+            ValueError: If a gameweeks range is combined with another window.
+        """
+        df = self.get_players_stats_index(league_name).window(
+            games_count=games_count,
+            gameweek_from=gameweek_from,
+            gameweek_to=gameweek_to,
+            date_from=date_from
+        )
+
+        rows = self._compute_players_table(
+            df, league_name, None, self._get_normalization(normalize_minutes, normalize_matches)
+        )
+        return self._filter_min_minutes(rows, min_minutes)
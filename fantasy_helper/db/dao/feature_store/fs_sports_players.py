@@ -4,6 +4,7 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session as SQLSession
 
 from fantasy_helper.db.models.feature_store.fs_sports_players import FSSportsPlayers
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
 from fantasy_helper.db.database import Session
 from fantasy_helper.utils.dataclasses import SportsPlayerDiff
 
@@ -17,12 +18,15 @@ POSITIONS_MAPPING = {
 
 
 class FSSportsPlayersDAO:
+    def __init__(self):
+        self._versions_dao = FSVersionsDAO()
+
     def get_sports_players(self, league_name: str) -> List[SportsPlayerDiff]:
         db_session: SQLSession = Session()
 
         all_players = (
             db_session.query(FSSportsPlayers)
-            .filter(FSSportsPlayers.league_name == league_name)
+            .filter(FSVersionsDAO.is_current(FSSportsPlayers, league_name))
             .all()
         )
 
@@ -45,24 +49,16 @@ class FSSportsPlayersDAO:
         return result
 
     def update_sports_players(self, league_name: str, players: List[SportsPlayerDiff]) -> None:
-        db_session: SQLSession = Session()
-
-        db_session.query(FSSportsPlayers).filter(
-            FSSportsPlayers.league_name == league_name
-        ).delete()
-
-        for player in players:
-            db_session.add(FSSportsPlayers(**player.__dict__))
-
-        db_session.commit()
-        db_session.close()
+        self._versions_dao.publish(
+            FSSportsPlayers, league_name, (player.__dict__ for player in players)
+        )
 
     def get_players_prices(self, league_name: str) -> List[float]:
         db_session: SQLSession = Session()
 
         query = (
             db_session.query(FSSportsPlayers.price)
-            .filter(FSSportsPlayers.league_name == league_name)
+            .filter(FSVersionsDAO.is_current(FSSportsPlayers, league_name))
             .distinct()
             .order_by(FSSportsPlayers.price)
         )
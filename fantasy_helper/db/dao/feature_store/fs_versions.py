@@ -0,0 +1,202 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Type
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session as SQLSession
+from sqlalchemy.sql.elements import ColumnElement
+from loguru import logger
+
+from fantasy_helper.conf.config import FS_KEEP_VERSIONS
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+
+
+utc = timezone.utc
+
+
+class FSVersionsDAO:
+    """
+    Versioned publishing of feature store tables.
+
+    A rebuild writes its rows under a new version number and flips the
+    per-league pointer in fs_versions in the same transaction, so readers
+    that filter by `is_current` only ever see a complete snapshot. The
+    previous snapshots stay readable until they are garbage collected.
+    """
+
+    def __init__(self, keep_versions: int = FS_KEEP_VERSIONS):
+        self._keep_versions = max(keep_versions, 1)
+
+    @staticmethod
+    def is_current(model: Type[Any], league_name: str) -> ColumnElement:
+        """
+        Builds a filter selecting the published snapshot of a league.
+
+        Args:
+            model (Type[Any]): The versioned feature store model.
+            league_name (str): The name of the league.
+
+        Returns:
+            ColumnElement: The condition on model.league_name and model.version.
+        """
+        current_version = (
+            select(FSVersion.version)
+            .where(and_(
+                FSVersion.league_name == league_name,
+                FSVersion.table_name == model.__tablename__
+            ))
+            .scalar_subquery()
+        )
+        return and_(model.league_name == league_name, model.version == current_version)
+
+    def get_version(self, model: Type[Any], league_name: str) -> Optional[int]:
+        db_session: SQLSession = Session()
+
+        pointer = (
+            db_session.query(FSVersion)
+            .filter(and_(
+                FSVersion.league_name == league_name,
+                FSVersion.table_name == model.__tablename__
+            ))
+            .one_or_none()
+        )
+        result = pointer.version if pointer is not None else None
+
+        db_session.close()
+
+        return result
+
+    def get_watermark(self, model: Type[Any], league_name: str) -> Optional[datetime]:
+        """
+        Returns the source watermark of the published snapshot of a league.
+
+        Args:
+            model (Type[Any]): The versioned feature store model.
+            league_name (str): The name of the league.
+
+        Returns:
+            Optional[datetime]: The watermark passed to publish, if any.
+        """
+        db_session: SQLSession = Session()
+
+        pointer = (
+            db_session.query(FSVersion)
+            .filter(and_(
+                FSVersion.league_name == league_name,
+                FSVersion.table_name == model.__tablename__
+            ))
+            .one_or_none()
+        )
+        result = pointer.watermark if pointer is not None else None
+
+        db_session.close()
+
+        return result
+
+    def get_league_versions(self, league_name: str) -> Dict[str, int]:
+        """
+        Returns the published version of every feature store table of a league.
+
+        Args:
+            league_name (str): The name of the league.
+
+        Returns:
+            Dict[str, int]: The published versions keyed by table name.
+        """
+        db_session: SQLSession = Session()
+
+        pointers = (
+            db_session.query(FSVersion.table_name, FSVersion.version)
+            .filter(FSVersion.league_name == league_name)
+            .all()
+        )
+        result = {table_name: version for table_name, version in pointers}
+
+        db_session.close()
+
+        return result
+
+    def publish(
+        self,
+        model: Type[Any],
+        league_name: str,
+        rows: Iterable[Dict[str, Any]],
+        watermark: Optional[datetime] = None
+    ) -> int:
+        """
+        Writes rows as a new snapshot of the league and makes it current.
+
+        The pointer row is created if missing and locked for the duration of
+        the write, so concurrent rebuilds of the same league are serialized,
+        while readers keep reading the previous snapshot until the commit.
+
+        Args:
+            model (Type[Any]): The versioned feature store model.
+            league_name (str): The name of the league.
+            rows (Iterable[Dict[str, Any]]): The column values of the snapshot rows.
+            watermark (Optional[datetime]): The latest source row timestamp
+                included in the snapshot, for incremental rebuilds.
+
+        Returns:
+            int: The published version.
+        """
+        db_session: SQLSession = Session()
+
+        try:
+            self._insert_pointer(db_session, model, league_name)
+            pointer = (
+                db_session.query(FSVersion)
+                .filter(and_(
+                    FSVersion.league_name == league_name,
+                    FSVersion.table_name == model.__tablename__
+                ))
+                .with_for_update()
+                .one()
+            )
+            new_version = pointer.version + 1
+
+            inserted = bulk_insert(db_session, model, (
+                dict(row, league_name=league_name, version=new_version) for row in rows
+            ))
+
+            pointer.version = new_version
+            pointer.timestamp = datetime.now().replace(tzinfo=utc)
+            pointer.watermark = watermark
+
+            db_session.commit()
+        finally:
+            # rolls back a failed rebuild and releases the pointer lock
+            db_session.close()
+
+        logger.info(f"Published {model.__tablename__} v{new_version} with {inserted} rows for {league_name}")
+
+        self._delete_old_versions(model, league_name, new_version)
+
+        return new_version
+
+    @staticmethod
+    def _insert_pointer(db_session: SQLSession, model: Type[Any], league_name: str) -> None:
+        # on the first publish of a league there is no row to lock yet, a concurrent
+        # insert of the pointer waits for the first one and then leaves it as it is
+        insert = postgresql.insert if db_session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        db_session.execute(
+            insert(FSVersion.__table__)
+            .values(league_name=league_name, table_name=model.__tablename__, version=0)
+            .on_conflict_do_nothing(index_elements=["league_name", "table_name"])
+        )
+
+    def _delete_old_versions(self, model: Type[Any], league_name: str, version: int) -> None:
+        db_session: SQLSession = Session()
+
+        deleted = db_session.query(model).filter(and_(
+            model.league_name == league_name,
+            model.version <= version - self._keep_versions
+        )).delete(synchronize_session=False)
+
+        db_session.commit()
+        db_session.close()
+
+        if deleted:
+            logger.info(f"Deleted {deleted} old {model.__tablename__} rows for {league_name}")
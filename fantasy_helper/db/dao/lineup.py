@@ -1,33 +1,38 @@
-from typing import List
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime, timezone
 from dataclasses import asdict
 
 from sqlalchemy import func, and_
 from sqlalchemy.orm import Session as SQLSession
-from hydra import compose, initialize
-from hydra.core.global_hydra import GlobalHydra
 
 from fantasy_helper.db.models.lineup import Lineup
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
-from fantasy_helper.parsers.mole import MoleParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, TeamLineup
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+from fantasy_helper.utils.dataclasses import TeamLineup
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
 from fantasy_helper.db.dao.feature_store.fs_lineups import FSLineupsDAO
 
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.mole import MoleParser
+
 
 utc = timezone.utc
 
 
 class LineupDAO:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def __mole_parser(self) -> "MoleParser":
+        from fantasy_helper.parsers.mole import MoleParser
 
-        self.__leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self.__leagues}
-        self.__mole_parser = MoleParser(leagues=self.__leagues)
+        return get_dao_provider(self._league_registry).get(MoleParser)
 
     def get_lineups(self, league_name: str) -> List[TeamLineup]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -85,16 +90,16 @@ class LineupDAO:
         else:
             new_update_id = 0
 
-        for lineup in new_lineups:
-            year = self._league_2_year.get(lineup.league_name, "2024")
-            db_session.add(
-                Lineup(
-                    **asdict(lineup),
-                    update_id=new_update_id,
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                    year=year
-                )
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, Lineup, (
+            dict(
+                **asdict(lineup),
+                update_id=new_update_id,
+                timestamp=timestamp,
+                year=self._league_registry.year(lineup.league_name)
             )
+            for lineup in new_lineups
+        ))
 
         db_session.commit()
         db_session.close()
@@ -102,6 +107,6 @@ class LineupDAO:
     def update_feature_store(self) -> None:
         feature_store = FSLineupsDAO()
 
-        for league in self.__leagues:
+        for league in self._league_registry:
             league_lineups = self.get_lineups(league.name)
             feature_store.update_lineups(league.name, league_lineups)
@@ -1,19 +1,25 @@
+import asyncio
+import time
 from collections import defaultdict
 from copy import deepcopy
-from dataclasses import asdict
-from typing import List
+from dataclasses import asdict, replace
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timezone
 
 from sqlalchemy import and_
 from sqlalchemy.orm import Session as SQLSession
-import pandas as pd
 from loguru import logger
 
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, LeagueScheduleInfo, MatchInfo, PlayerName, PlayerStatsInfo, SportsMatchInfo, SportsPlayerDiff, TeamName, PlayersLeagueStats
+from fantasy_helper.conf.config import NAMING_MAX_CONCURRENT_TEAMS
+from fantasy_helper.utils.dataclasses import LeagueScheduleInfo, MatchInfo, PlayerName, PlayerStatsInfo, SportsMatchInfo, SportsPlayerDiff, TeamName, PlayersLeagueStats
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.models.ml.player_name import PlayerName as DBPlayerName
 from fantasy_helper.db.models.ml.team_name import TeamName as DBTeamName
+from fantasy_helper.db.dao.provider import get_dao_provider
+from fantasy_helper.db.dao.ml.naming_index import LeagueNamingIndex, naming_index_cache
 from fantasy_helper.ml.naming.name_matcher import NameMatcher
 
 
@@ -21,40 +27,68 @@ utc = timezone.utc
 
 
 class NamingDAO:
-    def __init__(self, logger = None):
-        cfg = load_config(config_path="../../conf", config_name="config")
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._name_matcher = NameMatcher()
+    def __init__(self, logger = None, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
 
-    def update_league_naming(self, league_name: str) -> None:
+    @cached_property
+    def _name_matcher(self) -> NameMatcher:
+        return get_dao_provider(self._league_registry).get(NameMatcher)
+
+    async def update_league_naming(self, league_name: str) -> None:
         logger.info(f"Updating naming for league {league_name}")
-        year = self._league_2_year.get(league_name, "2024")
-        teams_names = self._get_teams_names(league_name, year)
+        start_time = time.perf_counter()
+        year = self._league_registry.year(league_name)
+        teams_names = await asyncio.to_thread(self._get_teams_names, league_name, year)
         logger.info(f"Found {len(teams_names)} teams names for league {league_name}")
 
         # update teams names
-        teams_names_to_add, teams_names_to_delete = self._name_matcher.match_teams(
-            league_name=league_name, 
+        teams_names_to_add, teams_names_to_delete = await asyncio.to_thread(
+            self._name_matcher.match_teams,
+            league_name=league_name,
             teams_names=teams_names
         )
         logger.info(f"Adding {len(teams_names_to_add)}, deleting {len(teams_names_to_delete)} teams names for league {league_name}")
-        self._delete_teams_names(teams_names_to_delete)
-        self._add_teams_names(teams_names_to_add)
+        await asyncio.to_thread(self._delete_teams_names, teams_names_to_delete)
+        await asyncio.to_thread(self._add_teams_names, teams_names_to_add)
 
         # update players names
-        new_teams_names = self._get_teams_names(league_name, year)
-        for team_name in new_teams_names:
-            players_names = self._get_players_names(league_name, team_name.name)
-            logger.info(f"Found {len(players_names)} players names for team {team_name.name} in {league_name}")
-            players_names_to_add, players_names_to_delete = self._name_matcher.match_players(
-                league_name=league_name, 
-                team_name=team_name,
-                players_names=players_names
-            )
-            logger.info(f"Adding {len(players_names_to_add)}, deleting {len(players_names_to_delete)} players names for team {team_name.name} in {league_name}")
-            self._delete_players_names(players_names_to_delete)
-            self._add_players_names(players_names_to_add)
+        new_teams_names = await asyncio.to_thread(self._get_teams_names, league_name, year)
+        players_names_to_add, players_names_to_delete = await self._match_league_players(
+            league_name, new_teams_names
+        )
+        logger.info(f"Adding {len(players_names_to_add)}, deleting {len(players_names_to_delete)} players names in {league_name}")
+        await asyncio.to_thread(self._update_players_names, players_names_to_add, players_names_to_delete)
+
+        logger.info(f"Updated naming for league {league_name} in {time.perf_counter() - start_time:.1f}s")
+
+    async def _match_league_players(
+        self, league_name: str, teams_names: List[TeamName]
+    ) -> Tuple[List[PlayerName], List[PlayerName]]:
+        """
+        Players names to add and delete of all teams of a league, teams are
+        matched concurrently, at most NAMING_MAX_CONCURRENT_TEAMS at once.
+        """
+        semaphore = asyncio.Semaphore(NAMING_MAX_CONCURRENT_TEAMS)
+
+        async with self._name_matcher.create_async_openai_client() as client:
+            async def match_team(team_name: TeamName) -> Tuple[List[PlayerName], List[PlayerName]]:
+                async with semaphore:
+                    players_names = await asyncio.to_thread(self._get_players_names, league_name, team_name.name)
+                    logger.info(f"Found {len(players_names)} players names for team {team_name.name} in {league_name}")
+                    players_names_to_add, players_names_to_delete = await self._name_matcher.amatch_players(
+                        client,
+                        league_name=league_name,
+                        team_name=team_name,
+                        players_names=players_names
+                    )
+                    logger.info(f"Matched {len(players_names_to_add)} new, {len(players_names_to_delete)} outdated players names for team {team_name.name} in {league_name}")
+                    return players_names_to_add, players_names_to_delete
+
+            teams_results = await asyncio.gather(*[match_team(team_name) for team_name in teams_names])
+
+        players_names_to_add = [player_name for to_add, _ in teams_results for player_name in to_add]
+        players_names_to_delete = [player_name for _, to_delete in teams_results for player_name in to_delete]
+        return players_names_to_add, players_names_to_delete
 
     def _get_teams_names(self, league_name: str, year: str = "2024") -> List[TeamName]:
         db_session: SQLSession = Session()
@@ -88,22 +122,26 @@ class NamingDAO:
     def _add_teams_names(self, teams_names: List[TeamName]) -> None:
         db_session: SQLSession = Session()
 
-        for team_name in teams_names:
-            year = self._league_2_year.get(team_name.league_name, "2024")
-            db_session.add(DBTeamName(
-                timestamp=datetime.now().replace(tzinfo=utc), 
-                year=year,
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, DBTeamName, (
+            dict(
+                timestamp=timestamp,
+                year=self._league_registry.year(team_name.league_name),
                 **asdict(team_name)
-            ))
+            )
+            for team_name in teams_names
+        ))
 
         db_session.commit()
         db_session.close()
 
+        self._invalidate_naming_index(teams_names)
+
     def _delete_teams_names(self, teams_names: List[TeamName]) -> None:
         db_session: SQLSession = Session()
 
         for team_name in teams_names:
-            year = self._league_2_year.get(team_name.league_name, "2024")
+            year = self._league_registry.year(team_name.league_name)
             db_session.query(DBTeamName).filter(and_(
                 DBTeamName.league_name == team_name.league_name,
                 DBTeamName.name == team_name.name,
@@ -117,8 +155,10 @@ class NamingDAO:
         db_session.commit()
         db_session.close()
 
+        self._invalidate_naming_index(teams_names)
+
     def _get_players_names(self, league_name: str, team_name: str) -> List[PlayerName]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -149,24 +189,21 @@ class NamingDAO:
         return result
     
     def _add_players_names(self, players_names: List[PlayerName]) -> None:
-        db_session: SQLSession = Session()
-
-        for player_name in players_names:
-            year = self._league_2_year.get(player_name.league_name, "2024")
-            db_session.add(DBPlayerName(
-                timestamp=datetime.now().replace(tzinfo=utc), 
-                year=year,
-                **asdict(player_name)
-            ))
-
-        db_session.commit()
-        db_session.close()
+        self._update_players_names(players_names_to_add=players_names, players_names_to_delete=[])
 
     def _delete_players_names(self, players_names: List[PlayerName]) -> None:
+        self._update_players_names(players_names_to_add=[], players_names_to_delete=players_names)
+
+    def _update_players_names(
+        self, players_names_to_add: List[PlayerName], players_names_to_delete: List[PlayerName]
+    ) -> None:
+        """
+        Deletes and adds players names in one transaction.
+        """
         db_session: SQLSession = Session()
 
-        for player_name in players_names:
-            year = self._league_2_year.get(player_name.league_name, "2024")
+        for player_name in players_names_to_delete:
+            year = self._league_registry.year(player_name.league_name)
             db_session.query(DBPlayerName).filter(and_(
                 DBPlayerName.league_name == player_name.league_name,
                 DBPlayerName.name == player_name.name,
@@ -176,15 +213,39 @@ class NamingDAO:
                 DBPlayerName.year == year
             )).delete()
 
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, DBPlayerName, (
+            dict(
+                timestamp=timestamp,
+                year=self._league_registry.year(player_name.league_name),
+                **asdict(player_name)
+            )
+            for player_name in players_names_to_add
+        ))
+
         db_session.commit()
         db_session.close()
 
-    def update_naming_all_leagues(self) -> None:
-        for league in self._leagues:
-            self.update_league_naming(league.name)
+        self._invalidate_naming_index(players_names_to_add + players_names_to_delete)
 
-    def get_teams(self, league_name: str) -> List[TeamName]:
-        year = self._league_2_year.get(league_name, "2024")
+    @staticmethod
+    def _invalidate_naming_index(names: List[Union[TeamName, PlayerName]]) -> None:
+        for league_name in {name.league_name for name in names}:
+            naming_index_cache.invalidate(league_name)
+
+    async def update_naming_all_leagues(self) -> None:
+        for league in self._league_registry:
+            await self.update_league_naming(league.name)
+
+    def get_naming_index(self, league_name: str) -> LeagueNamingIndex:
+        """
+        Teams and players names of the league with lookups between sources,
+        shared by all NamingDAO instances of the process until the naming changes.
+        """
+        return naming_index_cache.get(league_name, self._load_naming)
+
+    def _load_naming(self, league_name: str) -> Tuple[List[TeamName], List[PlayerName]]:
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -196,8 +257,16 @@ class NamingDAO:
             ))
             .all()
         )
+        players = (
+            db_session.query(DBPlayerName)
+            .filter(and_(
+                DBPlayerName.league_name == league_name,
+                DBPlayerName.year == year
+            ))
+            .all()
+        )
 
-        result = [
+        teams_result = [
             TeamName(
                 league_name=team.league_name,
                 sports_name=team.sports_name,
@@ -208,27 +277,7 @@ class NamingDAO:
             ) 
             for team in teams
         ]
-
-        db_session.commit()
-        db_session.close()
-    
-        return result
-
-    def get_players(self, league_name: str) -> List[PlayerName]:
-        year = self._league_2_year.get(league_name, "2024")
-
-        db_session: SQLSession = Session()
-
-        players = (
-            db_session.query(DBPlayerName)
-            .filter(and_(
-                DBPlayerName.league_name == league_name,
-                DBPlayerName.year == year
-            ))
-            .all()
-        )
-
-        result = [
+        players_result = [
             PlayerName(
                 league_name=player.league_name,
                 team_name=player.team_name,
@@ -242,7 +291,13 @@ class NamingDAO:
         db_session.commit()
         db_session.close()
 
-        return result
+        return teams_result, players_result
+
+    def get_teams(self, league_name: str) -> List[TeamName]:
+        return [deepcopy(team) for team in self.get_naming_index(league_name).teams]
+
+    def get_players(self, league_name: str) -> List[PlayerName]:
+        return [deepcopy(player) for player in self.get_naming_index(league_name).players]
 
     def add_sports_info_to_players_stats(
             self, 
@@ -250,21 +305,23 @@ class NamingDAO:
             players_stats: PlayersLeagueStats, 
             sports_players: List[SportsPlayerDiff]
         ) -> PlayersLeagueStats:
+        import pandas as pd
+
+        from fantasy_helper.db.dao.ml.sports_info import SPORTS_INFO_COLUMNS, join_sports_info
+
+        naming_index = self.get_naming_index(league_name)
+
         # get teams info
-        teams_names = self.get_teams(league_name)
         teams_info = pd.DataFrame([
             {
                 "team": team.fbref_name,
                 "sports_team": team.sports_name,
             }
-            for team in teams_names
-        ])
+            for team in naming_index.teams
+        ], columns=["team", "sports_team"])
         
         # get players info
-        players_names = self.get_players(league_name)
-        players_sports_2_fbref = {
-            player.sports_name: player.fbref_name for player in players_names
-        }
+        players_sports_2_fbref = naming_index.players_sports_2_fbref
         players_info = pd.DataFrame([
             {
                 "name": players_sports_2_fbref.get(player.name),
@@ -276,44 +333,14 @@ class NamingDAO:
                 "percent_ownership_diff": player.percent_ownership_diff
             }
             for player in sports_players
-        ])
-
-        # drop sports columns
-        result = deepcopy(players_stats)
-        result.abs_stats.drop(
-            labels=["sports_team", "sports_name", "role", "price", "percent_ownership", "percent_ownership_diff"],
-            axis=1,
-            inplace=True,
-            errors="ignore"
-        )
-        result.norm_stats.drop(
-            labels=["sports_team", "sports_name", "role", "price", "percent_ownership", "percent_ownership_diff"],
-            axis=1,
-            inplace=True,
-            errors="ignore"
-        )
-        result.free_kicks.drop(
-            labels=["sports_team", "sports_name", "role", "price", "percent_ownership", "percent_ownership_diff"],
-            axis=1,
-            inplace=True,
-            errors="ignore"
-        )
+        ], columns=["name"] + SPORTS_INFO_COLUMNS)
 
-        # join teams and players info
-        if "team" in result.abs_stats.columns:
-            result.abs_stats = result.abs_stats.merge(teams_info, how="left", on="team")
-            if "sports_team" in result.abs_stats.columns:
-                result.abs_stats = result.abs_stats.merge(players_info, how="left", on=["name", "sports_team"])
-        if "team" in result.norm_stats.columns:
-            result.norm_stats = result.norm_stats.merge(teams_info, how="left", on="team")
-            if "sports_team" in result.norm_stats.columns:
-                result.norm_stats = result.norm_stats.merge(players_info, how="left", on=["name", "sports_team"])
-        if "team" in result.free_kicks.columns:
-            result.free_kicks = result.free_kicks.merge(teams_info, how="left", on="team")
-            if "sports_team" in result.free_kicks.columns:
-                result.free_kicks = result.free_kicks.merge(players_info, how="left", on=["name", "sports_team"])
-
-        return result
+        # join teams and players info, stats columns are shared with players_stats
+        return PlayersLeagueStats(
+            abs_stats=join_sports_info(players_stats.abs_stats, teams_info, players_info),
+            norm_stats=join_sports_info(players_stats.norm_stats, teams_info, players_info),
+            free_kicks=join_sports_info(players_stats.free_kicks, teams_info, players_info),
+        )
     
     def add_sports_info_to_players_stats_info(
             self, 
@@ -321,17 +348,9 @@ class NamingDAO:
             players_stats_info: List[PlayerStatsInfo], 
             sports_players: List[SportsPlayerDiff]
         ) -> List[PlayerStatsInfo]:
-        # get teams info
-        teams_names = self.get_teams(league_name)
-        teams_sports_2_fbref = {
-            team.sports_name: team.fbref_name for team in teams_names
-        }
-
-        # get players info
-        players_names = self.get_players(league_name)
-        players_sports_2_fbref = {
-            player.sports_name: player.fbref_name for player in players_names
-        }
+        naming_index = self.get_naming_index(league_name)
+        teams_sports_2_fbref = naming_index.teams_sports_2_fbref
+        players_sports_2_fbref = naming_index.players_sports_2_fbref
 
         # sports info
         fbref_2_sports_players = {}
@@ -341,21 +360,23 @@ class NamingDAO:
             if fbref_name and fbref_team:
                 fbref_2_sports_players[(fbref_name, fbref_team)] = player
 
-        # add sports info
+        # add sports info, players without it are returned as they are
         result = []
         for player_stats_info in players_stats_info:
-            cur_player_stats_info = deepcopy(player_stats_info)
             sports_player = fbref_2_sports_players.get(
                 (player_stats_info.name, player_stats_info.team)
             )
             if sports_player is not None:
-                cur_player_stats_info.sports_name = sports_player.name
-                cur_player_stats_info.sports_team = sports_player.team_name
-                cur_player_stats_info.role = sports_player.role
-                cur_player_stats_info.price = sports_player.price
-                cur_player_stats_info.percent_ownership = sports_player.percent_ownership
-                cur_player_stats_info.percent_ownership_diff = sports_player.percent_ownership_diff
-            result.append(cur_player_stats_info)
+                player_stats_info = replace(
+                    player_stats_info,
+                    sports_name=sports_player.name,
+                    sports_team=sports_player.team_name,
+                    role=sports_player.role,
+                    price=sports_player.price,
+                    percent_ownership=sports_player.percent_ownership,
+                    percent_ownership_diff=sports_player.percent_ownership_diff,
+                )
+            result.append(player_stats_info)
 
         return result
 
@@ -365,12 +386,7 @@ class NamingDAO:
             coeffs: List[MatchInfo],
             sports_matches: List[LeagueScheduleInfo]
         ) -> List[MatchInfo]:
-        teams_names = self.get_teams(league_name)
-        
-        betcity_team_2_sports = {
-            team.betcity_name: team.sports_name
-            for team in teams_names
-        }
+        betcity_team_2_sports = self.get_naming_index(league_name).teams_betcity_2_sports
 
         teams_2_coeffs = {
             (
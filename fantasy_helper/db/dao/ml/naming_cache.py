@@ -0,0 +1,81 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session as SQLSession
+from loguru import logger
+
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.models.ml.naming_cache import NamingCache
+
+
+utc = timezone.utc
+
+
+class NamingCacheDAO:
+    """
+    Persistent cache of llm names matching results.
+
+    Entries are addressed by the content of a request: the prompt, the model
+    and the names lists, so a changed prompt or model never reads results of
+    the previous one and entries only have to be cleared to force new answers.
+    """
+
+    @staticmethod
+    def compute_key(prompt: List[Dict[str, Any]], model: str, names_1: List[str], names_2: List[str]) -> str:
+        content = json.dumps(
+            {
+                "prompt": prompt,
+                "model": model,
+                "names_1": sorted(names_1, key=str),
+                "names_2": sorted(names_2, key=str),
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        db_session: SQLSession = Session()
+
+        entry = db_session.query(NamingCache).filter(NamingCache.key == key).first()
+        result = json.loads(entry.result) if entry is not None else None
+
+        db_session.commit()
+        db_session.close()
+
+        return result
+
+    def put(self, key: str, kind: str, model: str, result: Dict[str, str]) -> None:
+        db_session: SQLSession = Session()
+
+        entry = db_session.query(NamingCache).filter(NamingCache.key == key).first()
+        if entry is None:
+            entry = NamingCache(key=key, kind=kind, model=model, result="", timestamp=None)
+            db_session.add(entry)
+        entry.result = json.dumps(result, ensure_ascii=False)
+        entry.timestamp = datetime.now().replace(tzinfo=utc)
+
+        db_session.commit()
+        db_session.close()
+
+    def clear(self, kind: Optional[str] = None) -> int:
+        """
+        Removes cached results, all of them or of one kind ("teams" or "players").
+
+        Returns:
+            int: The number of removed entries.
+        """
+        db_session: SQLSession = Session()
+
+        query = db_session.query(NamingCache)
+        if kind is not None:
+            query = query.filter(NamingCache.kind == kind)
+        deleted = query.delete(synchronize_session=False)
+
+        db_session.commit()
+        db_session.close()
+
+        logger.info(f"Deleted {deleted} naming cache entries" + (f" of {kind}" if kind else ""))
+        return deleted
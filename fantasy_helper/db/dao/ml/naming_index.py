@@ -0,0 +1,100 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from fantasy_helper.conf.config import NAMING_INDEX_TTL
+from fantasy_helper.utils.dataclasses import PlayerName, TeamName
+
+
+@dataclass(frozen=True)
+class LeagueNamingIndex:
+    """
+    Teams and players names of a league with lookups between their sources,
+    built once per version of the league naming.
+    """
+
+    league_name: str
+    version: int
+    teams: Tuple[TeamName, ...]
+    players: Tuple[PlayerName, ...]
+    teams_sports_2_fbref: Dict[str, str] = field(default_factory=dict)
+    teams_fbref_2_sports: Dict[str, str] = field(default_factory=dict)
+    teams_sports_2_betcity: Dict[str, str] = field(default_factory=dict)
+    teams_betcity_2_sports: Dict[str, str] = field(default_factory=dict)
+    players_sports_2_fbref: Dict[str, str] = field(default_factory=dict)
+    players_fbref_2_sports: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, league_name: str, version: int, teams: Sequence[TeamName], players: Sequence[PlayerName]
+    ) -> "LeagueNamingIndex":
+        # later names win on duplicates, as the dicts built from get_teams and get_players did
+        return cls(
+            league_name=league_name,
+            version=version,
+            teams=tuple(teams),
+            players=tuple(players),
+            teams_sports_2_fbref={team.sports_name: team.fbref_name for team in teams},
+            teams_fbref_2_sports={team.fbref_name: team.sports_name for team in teams},
+            teams_sports_2_betcity={team.sports_name: team.betcity_name for team in teams},
+            teams_betcity_2_sports={team.betcity_name: team.sports_name for team in teams},
+            players_sports_2_fbref={player.sports_name: player.fbref_name for player in players},
+            players_fbref_2_sports={player.fbref_name: player.sports_name for player in players},
+        )
+
+
+class NamingIndexCache:
+    """
+    Process wide cache of LeagueNamingIndex, shared by all NamingDAO instances.
+
+    Writes to the naming tables made through NamingDAO bump the league
+    version, so the next lookup rebuilds the index. Writes of other processes
+    are picked up once an index is older than ttl seconds.
+    """
+
+    def __init__(self, ttl: float = NAMING_INDEX_TTL, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        self._versions: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[float, LeagueNamingIndex]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, league_name: str) -> int:
+        with self._lock:
+            return self._versions.get(league_name, 0)
+
+    def get(
+        self,
+        league_name: str,
+        loader: Callable[[str], Tuple[Sequence[TeamName], Sequence[PlayerName]]]
+    ) -> LeagueNamingIndex:
+        with self._lock:
+            version = self._versions.get(league_name, 0)
+            entry = self._entries.get(league_name)
+            if entry is not None and entry[1].version == version and self._clock() - entry[0] < self._ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # load outside of the lock, a concurrent invalidation makes the result stale on arrival
+        loaded_at = self._clock()
+        teams, players = loader(league_name)
+        index = LeagueNamingIndex.build(league_name, version, teams, players)
+        with self._lock:
+            if self._versions.get(league_name, 0) == version:
+                self._entries[league_name] = (loaded_at, index)
+        return index
+
+    def invalidate(self, league_name: Optional[str] = None) -> None:
+        with self._lock:
+            league_names = set(self._entries) | set(self._versions) if league_name is None else {league_name}
+            for name in league_names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+                self._entries.pop(name, None)
+
+
+naming_index_cache = NamingIndexCache()
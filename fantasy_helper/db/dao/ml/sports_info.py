@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+
+SPORTS_INFO_COLUMNS = ["sports_team", "sports_name", "role", "price", "percent_ownership", "percent_ownership_diff"]
+
+
+def factorize(*keys: pd.Series) -> List[np.ndarray]:
+    """
+    Shared integer codes of key columns, missing keys get a code of their
+    own, as pandas merges them with each other.
+    """
+    codes, uniques = pd.factorize(np.concatenate([key.to_numpy(dtype=object) for key in keys]))
+    codes[codes < 0] = len(uniques)
+    return np.split(codes, np.cumsum([len(key) for key in keys[:-1]]))
+
+
+def left_join_rows(
+    left_keys: Dict[str, np.ndarray], right_keys: Dict[str, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of the left and right rows of a left join, -1 for unmatched
+    right rows, in the order of DataFrame.merge.
+    """
+    left_size = len(next(iter(left_keys.values())))
+    right_size = len(next(iter(right_keys.values())))
+    joined = pl.DataFrame({**left_keys, "left_row": np.arange(left_size)}).join(
+        pl.DataFrame({**right_keys, "right_row": np.arange(right_size)}),
+        on=list(left_keys), how="left", maintain_order="left_right"
+    )
+    return joined["left_row"].to_numpy(), joined["right_row"].fill_null(-1).to_numpy()
+
+
+def gather(values: pd.Series, rows: np.ndarray, index: pd.RangeIndex) -> pd.Series:
+    # rows of -1 are unmatched and become missing values, as in a left merge
+    return pd.Series(
+        pd.api.extensions.take(values.to_numpy(), rows, allow_fill=True), index=index, name=values.name
+    )
+
+
+def join_sports_info(
+    stats: Optional[pd.DataFrame], teams_info: pd.DataFrame, players_info: pd.DataFrame
+) -> Optional[pd.DataFrame]:
+    """
+    Left merge of the stats with teams_info on team and then with
+    players_info on (name, sports_team). Only integer codes of the key
+    columns are joined, in Polars, and the sports columns are gathered by
+    the matched rows, so the stats columns are reused as they are unless
+    the join repeats rows.
+    """
+    if stats is None:
+        return None
+    columns = [column for column in stats.columns if column not in SPORTS_INFO_COLUMNS]
+    if "team" not in columns:
+        return stats[columns]
+
+    stats_teams, info_teams = factorize(stats["team"], teams_info["team"])
+    rows, teams_rows = left_join_rows({"team": stats_teams}, {"team": info_teams})
+    players_rows = None
+    if "name" in columns:
+        sports_teams = gather(teams_info["sports_team"], teams_rows, pd.RangeIndex(len(rows)))
+        stats_names, info_names = factorize(stats["name"].take(rows), players_info["name"])
+        stats_sports_teams, info_sports_teams = factorize(sports_teams, players_info["sports_team"])
+        joined_rows, players_rows = left_join_rows(
+            {"name": stats_names, "sports_team": stats_sports_teams},
+            {"name": info_names, "sports_team": info_sports_teams}
+        )
+        rows, teams_rows = rows[joined_rows], teams_rows[joined_rows]
+
+    index = pd.RangeIndex(len(rows))
+    repeated = len(rows) != len(stats) or bool((rows != np.arange(len(stats))).any())
+    if repeated:
+        stats = stats.iloc[rows, [stats.columns.get_loc(column) for column in columns]]
+    result_columns = [stats[column].set_axis(index, copy=False) for column in columns]
+    result_columns.append(gather(teams_info["sports_team"], teams_rows, index))
+    if players_rows is not None:
+        result_columns.extend(
+            gather(players_info[column], players_rows, index)
+            for column in SPORTS_INFO_COLUMNS if column != "sports_team"
+        )
+
+    return pd.concat(result_columns, axis=1, copy=False)
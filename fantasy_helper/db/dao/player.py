@@ -1,416 +1,220 @@
-from typing import Any, Dict, List, Optional, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
-from dataclasses import asdict
+from dataclasses import asdict, fields
 
 import pandas as pd
 from fantasy_helper.db.models.actual_player import ActualPlayer
 import numpy as np
 from sqlalchemy import func, and_
 from sqlalchemy.orm import Session as SQLSession
-from hydra import compose, initialize
-from hydra.core.global_hydra import GlobalHydra
 from loguru import logger
 
 from fantasy_helper.db.models.player import Player
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
-from fantasy_helper.parsers.fbref import FbrefParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.utils.dataclasses import (
-    LeagueInfo,
     PlayerStats,
     PlayerStatsInfo,
     FreeKicksInfo,
     PlayersLeagueStats,
 )
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
 from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
 
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.fbref import FbrefParser
 
-utc = timezone.utc
-
-
-class PlayerDAO:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
-
-        self.__leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self.__leagues}
-        self.__fbref_parser = FbrefParser(leagues=self.__leagues)
-
-    def _compute_diff_value(
-        self, max_value: Any, min_value: Any, minutes: Optional[int] = None
-    ) -> Any:
-        if (max_value is not None and not np.isnan(max_value)) and (
-            min_value is not None and not np.isnan(min_value)
-        ):
-            if minutes is None or np.isnan(minutes):
-                return max_value - min_value
-            else:
-                if minutes > 0:
-                    return float(max_value - min_value) * 90.0 / minutes
-                else:
-                    return None
-        else:
-            return None
-
-    def _compute_avg_diff_value(
-        self, max_value: Any, min_value: Any, min_games: Any, max_games: Any
-    ) -> Any:
-        if min_games is None or pd.isna(min_games) or max_games is None \
-            or pd.isna(max_games) or max_games == 0 or \
-                min_value is None or pd.isna(min_value):
-            return None
-
-        value_diff = self._compute_diff_value(max_value, min_value * min_games / max_games)
-        games_diff = self._compute_diff_value(max_games, min_games)
-
-        if value_diff is None or games_diff is None or games_diff == 0:
-            return None
-
-        return value_diff * max_games / games_diff
-
-    def _add_shooting_stats_abs(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        stats_info.goals = self._compute_diff_value(
-            max_stats["goals"], min_stats.get("goals", 0)
-        )
-        stats_info.shots = self._compute_diff_value(
-            max_stats["shots"], min_stats.get("shots", 0)
-        )
-        stats_info.shots_on_target = self._compute_diff_value(
-            max_stats["shots_on_target"], min_stats.get("shots_on_target", 0)
-        )
-        stats_info.average_shot_distance = self._compute_avg_diff_value(
-            max_stats["average_shot_distance"], 
-            min_stats.get("average_shot_distance", 0),
-            max_stats["games"], 
-            min_stats.get("games", 0)
-        )
-        stats_info.xg = self._compute_diff_value(
-            max_stats["xg"], min_stats.get("xg", 0)
-        )
-        stats_info.xg_np = self._compute_diff_value(
-            max_stats["npxg"], min_stats.get("npxg", 0)
-        )
-        if max_stats.get("pass_xa") is not None:
-            stats_info.xg_xa = self._compute_diff_value(
-                max_stats["xg"] + max_stats["pass_xa"],
-                min_stats.get("xg", 0) + min_stats.get("pass_xa", 0)
-            )
-            stats_info.xg_np_xa = self._compute_diff_value(
-                max_stats["npxg"] + max_stats["pass_xa"], 
-                min_stats.get("npxg", 0) + min_stats.get("pass_xa", 0)
-            )
-        return stats_info
-
-    def _add_shooting_stats_norm(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
-
-        stats_info.goals = self._compute_diff_value(
-            max_stats["goals"], min_stats.get("goals", 0), minutes
-        )
-        stats_info.shots = self._compute_diff_value(
-            max_stats["shots"], min_stats.get("shots", 0), minutes
-        )
-        stats_info.shots_on_target = self._compute_diff_value(
-            max_stats["shots_on_target"], 
-            min_stats.get("shots_on_target", 0), 
-            minutes
-        )
-        stats_info.average_shot_distance = self._compute_avg_diff_value(
-            max_stats["average_shot_distance"],
-            min_stats.get("average_shot_distance", 0),
-            max_stats["games"], 
-            min_stats.get("games", 0)
-        )
-        stats_info.xg = self._compute_diff_value(
-            max_stats["xg"], min_stats.get("xg", 0), minutes
-        )
-        stats_info.xg_np = self._compute_diff_value(
-            max_stats["npxg"], min_stats.get("npxg", 0), minutes
-        )
-        if max_stats.get("pass_xa") is not None:
-            stats_info.xg_xa = self._compute_diff_value(
-                max_stats["xg"] + max_stats["pass_xa"], 
-                min_stats.get("xg", 0) + min_stats.get("pass_xa", 0), 
-                minutes
-            )
-            stats_info.xg_np_xa = self._compute_diff_value(
-                max_stats["npxg"] + max_stats["pass_xa"], 
-                min_stats.get("npxg", 0) + min_stats.get("pass_xa", 0), 
-                minutes
-            )
-        return stats_info
-
-    def _add_passing_stats_abs(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        stats_info.assists = self._compute_diff_value(
-            max_stats["assists"], min_stats.get("assists", 0)
-        )
-        stats_info.xa = self._compute_diff_value(
-            max_stats["pass_xa"], min_stats.get("pass_xa", 0)
-        )
-        stats_info.key_passes = self._compute_diff_value(
-            max_stats["assisted_shots"], min_stats.get("assisted_shots", 0)
-        )
-        stats_info.passes_into_penalty_area = self._compute_diff_value(
-            max_stats["passes_into_penalty_area"], 
-            min_stats.get("passes_into_penalty_area", 0)
-        )
-        stats_info.crosses_into_penalty_area = self._compute_diff_value(
-            max_stats["crosses_into_penalty_area"],
-            min_stats.get("crosses_into_penalty_area", 0),
-        )
-        return stats_info
-
-    def _add_passing_stats_norm(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
-
-        stats_info.assists = self._compute_diff_value(
-            max_stats["assists"], min_stats.get("assists", 0), minutes
-        )
-        stats_info.xa = self._compute_diff_value(
-            max_stats["pass_xa"], min_stats.get("pass_xa", 0), minutes
-        )
-        stats_info.key_passes = self._compute_diff_value(
-            max_stats["assisted_shots"], min_stats.get("assisted_shots", 0), minutes
-        )
-        stats_info.passes_into_penalty_area = self._compute_diff_value(
-            max_stats["passes_into_penalty_area"],
-            min_stats.get("passes_into_penalty_area", 0),
-            minutes,
-        )
-        stats_info.crosses_into_penalty_area = self._compute_diff_value(
-            max_stats["crosses_into_penalty_area"],
-            min_stats.get("crosses_into_penalty_area", 0),
-            minutes,
-        )
-        return stats_info
-
-    def _add_possesion_stats_abs(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        stats_info.touches_in_attacking_third = self._compute_diff_value(
-            max_stats["touches_att_3rd"], min_stats.get("touches_att_3rd", 0)
-        )
-        stats_info.touches_in_attacking_penalty_area = self._compute_diff_value(
-            max_stats["touches_att_pen_area"],
-            min_stats.get("touches_att_pen_area", 0),
-        )
-        stats_info.carries_in_attacking_third = self._compute_diff_value(
-            max_stats["carries_into_final_third"],
-            min_stats.get("carries_into_final_third", 0),
-        )
-        stats_info.carries_in_attacking_penalty_area = self._compute_diff_value(
-            max_stats["carries_into_penalty_area"],
-            min_stats.get("carries_into_penalty_area", 0),
-        )
-        return stats_info
-
-    def _add_possesion_stats_norm(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
-        stats_info.touches_in_attacking_third = self._compute_diff_value(
-            max_stats["touches_att_3rd"],
-            min_stats.get("touches_att_3rd", 0),
-            minutes,
-        )
-        stats_info.touches_in_attacking_penalty_area = self._compute_diff_value(
-            max_stats["touches_att_pen_area"],
-            min_stats.get("touches_att_pen_area", 0),
-            minutes,
-        )
-        stats_info.carries_in_attacking_third = self._compute_diff_value(
-            max_stats["carries_into_final_third"],
-            min_stats.get("carries_into_final_third", 0),
-            minutes,
-        )
-        stats_info.carries_in_attacking_penalty_area = self._compute_diff_value(
-            max_stats["carries_into_penalty_area"],
-            min_stats.get("carries_into_penalty_area", 0),
-            minutes,
-        )
-        return stats_info
-
-    def _add_standart_stats_abs(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        if stats_info.assists is None:
-            stats_info.assists = self._compute_diff_value(
-                max_stats["assists"],
-                min_stats.get("assists", 0)
-            )
-        return stats_info
-
-    def _add_standart_stats_norm(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        if stats_info.assists is None:
-            minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
-
-            stats_info.assists = self._compute_diff_value(
-                max_stats["assists"],
-                min_stats.get("assists", 0),
-                minutes
-            )
-        return stats_info
-
-    def _add_shot_creation_stats_abs(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        stats_info.sca = self._compute_diff_value(
-            max_stats["sca"],
-            min_stats.get("sca", 0)
-        )
-        stats_info.gca = self._compute_diff_value(
-            max_stats["gca"],
-            min_stats.get("gca", 0)
-        )
-        return stats_info
 
-    def _add_shot_creation_stats_norm(
-        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
-    ) -> PlayerStatsInfo:
-        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+utc = timezone.utc
 
-        stats_info.sca = self._compute_diff_value(
-            max_stats["sca"],
-            min_stats.get("sca", 0),
-            minutes
-        )
-        stats_info.gca = self._compute_diff_value(
-            max_stats["gca"],
-            min_stats.get("gca", 0),
-            minutes
-        )
-        return stats_info
-
-    def _compute_stats_values(
-        self, max_stats: Dict, min_stats: Dict, team_name: str, position: str
-    ) -> Tuple[PlayerStatsInfo, PlayerStatsInfo]:
-        abs_stats_info = PlayerStatsInfo(
-            name=max_stats["name"],
-            team=team_name,
-            position=position,
-        )
-        norm_stats_info = PlayerStatsInfo(
-            name=max_stats["name"],
-            team=team_name,
-            position=position,
-        )
-        league_name = max_stats["league_name"]
+# PlayerStatsInfo field -> Player column, by fbref stats table
+SHOOTING_COLUMNS = {
+    "goals": "goals",
+    "shots": "shots",
+    "shots_on_target": "shots_on_target",
+    "xg": "xg",
+    "xg_np": "npxg",
+}
+PASSING_COLUMNS = {
+    "assists": "assists",
+    "xa": "pass_xa",
+    "key_passes": "assisted_shots",
+    "passes_into_penalty_area": "passes_into_penalty_area",
+    "crosses_into_penalty_area": "crosses_into_penalty_area",
+}
+POSSESSION_COLUMNS = {
+    "touches_in_attacking_third": "touches_att_3rd",
+    "touches_in_attacking_penalty_area": "touches_att_pen_area",
+    "carries_in_attacking_third": "carries_into_final_third",
+    "carries_in_attacking_penalty_area": "carries_into_penalty_area",
+}
+SHOT_CREATION_COLUMNS = {
+    "sca": "sca",
+    "gca": "gca",
+}
+STANDART_COLUMNS = {
+    "assists": "assists",
+}
+# FreeKicksInfo field -> Player column
+FREE_KICKS_COLUMNS = {
+    "corner_kicks": "corner_kicks",
+    "penalty_goals": "pens_made",
+    "penalty_shots": "pens_att",
+    "free_kicks_shots": "shots_free_kicks",
+}
 
-        if league_name in self.__fbref_parser.get_playing_time_leagues():
-            games = self._compute_diff_value(max_stats["games"], min_stats.get("games", 0))
-            abs_stats_info.games, norm_stats_info.games = games, games
-            minutes = self._compute_diff_value(
-                max_stats["minutes"], min_stats.get("minutes", 0)
-            )
-            abs_stats_info.minutes, norm_stats_info.minutes = minutes, minutes
 
+class PlayerDAO:
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def __fbref_parser(self) -> "FbrefParser":
+        from fantasy_helper.parsers.fbref import FbrefParser
+
+        return get_dao_provider(self._league_registry).get(FbrefParser)
+
+    @staticmethod
+    def _diff_values(
+        max_values: np.ndarray, min_values: np.ndarray, minutes: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Differences between two snapshots, nan where either value is missing.
+        With minutes the differences are scaled per 90 minutes: nan for
+        non-positive minutes and left as is for missing minutes.
+        """
+        diff = max_values - min_values
+        if minutes is None:
+            return diff
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            per_90 = diff * 90.0 / minutes
+        return np.where(np.isnan(minutes), diff, np.where(minutes > 0, per_90, np.nan))
+
+    @staticmethod
+    def _avg_diff_values(
+        max_values: np.ndarray, min_values: np.ndarray, max_games: np.ndarray, min_games: np.ndarray
+    ) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (max_values - min_values * max_games / min_games) * min_games / (min_games - max_games)
+        return np.where((min_games == 0) | (min_games == max_games), np.nan, result)
+
+    @staticmethod
+    def _mode_by_name(df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        The most frequent value of a column for every player, the smallest one on ties.
+        """
+        counts = df.groupby(by=["name", column]).size().reset_index(name="count")
+        counts = counts.sort_values(
+            by=["name", "count", column], ascending=[True, False, True], kind="stable"
+        )
+        return counts.drop_duplicates(subset=["name"]).set_index("name")[column]
+
+    @staticmethod
+    def _to_frame(dataclass_type: type, columns: Dict[str, Any]) -> pd.DataFrame:
+        return pd.DataFrame({
+            field.name: columns.get(field.name) for field in fields(dataclass_type)
+        })
+
+    def _compute_league_stats(self, df: pd.DataFrame, league_name: str) -> PlayersLeagueStats:
+        """
+        Computes the abs, norm and free kicks stats from the players snapshots
+        of a league.
+
+        The snapshot with the most games of every player is compared with no
+        games and with each earlier snapshot, which gives the stats of the
+        player's last games. Missing values stay nan.
+        """
+        df = df[df["name"].notna()]
+        players = df[df["games"].notna()].sort_values(
+            by=["name", "games"], ascending=[True, False], kind="stable", ignore_index=True
+        )
+
+        # the first row of every player has the most games
+        names = players["name"].to_numpy()
+        is_max = np.r_[True, names[1:] != names[:-1]] if len(players) else np.zeros(0, dtype=bool)
+        max_positions = np.flatnonzero(is_max)
+        player_ids = np.cumsum(is_max) - 1
+
+        # every player starts with the latest snapshot against no games,
+        # followed by the earlier snapshots from the fewest games
+        positions = np.arange(len(players))
+        order = np.lexsort((np.where(is_max, -len(players), -positions), player_ids))
+        max_rows = max_positions[player_ids[order]]
+        min_rows = np.where(is_max[order], -1, order)
+
+        def snapshots(column: str) -> Tuple[np.ndarray, np.ndarray]:
+            values = players[column].to_numpy(dtype=float, na_value=np.nan)
+            if not len(values):
+                return values, values
+            return values[max_rows], np.where(min_rows < 0, 0.0, values[min_rows])
+
+        max_minutes, min_minutes = snapshots("minutes")
+        minutes = max_minutes - min_minutes
+
+        stats_columns = {}
         if league_name in self.__fbref_parser.get_shooting_leagues():
-            abs_stats_info = self._add_shooting_stats_abs(
-                abs_stats_info, max_stats, min_stats
-            )
-            norm_stats_info = self._add_shooting_stats_norm(
-                norm_stats_info, max_stats, min_stats
-            )
-
+            stats_columns.update(SHOOTING_COLUMNS)
         if league_name in self.__fbref_parser.get_passing_leagues():
-            abs_stats_info = self._add_passing_stats_abs(
-                abs_stats_info, max_stats, min_stats
-            )
-            norm_stats_info = self._add_passing_stats_norm(
-                norm_stats_info, max_stats, min_stats
-            )
-
+            stats_columns.update(PASSING_COLUMNS)
         if league_name in self.__fbref_parser.get_possession_leagues():
-            abs_stats_info = self._add_possesion_stats_abs(
-                abs_stats_info, max_stats, min_stats
-            )
-            norm_stats_info = self._add_possesion_stats_norm(
-                norm_stats_info, max_stats, min_stats
-            )
-
+            stats_columns.update(POSSESSION_COLUMNS)
         if league_name in self.__fbref_parser.get_shot_creation_leagues():
-            abs_stats_info = self._add_shot_creation_stats_abs(
-                abs_stats_info, max_stats, min_stats
-            )
-            norm_stats_info = self._add_shot_creation_stats_norm(
-                norm_stats_info, max_stats, min_stats
-            )
-        
+            stats_columns.update(SHOT_CREATION_COLUMNS)
         if league_name in self.__fbref_parser.get_standart_leagues():
-            abs_stats_info = self._add_standart_stats_abs(
-                abs_stats_info, max_stats, min_stats
-            )
-            norm_stats_info = self._add_standart_stats_norm(
-                norm_stats_info, max_stats, min_stats
-            )
+            stats_columns.update(STANDART_COLUMNS)
 
-        return abs_stats_info, norm_stats_info
-
-    def _compute_player_stats(
-        self, group: pd.DataFrame, is_abs_stats: bool = True
-    ) -> pd.DataFrame:
-        group = group[~group["games"].isna()]
-        sorted_df = group.sort_values("games", ascending=True)
-        if len(sorted_df) == 0:
-            return pd.DataFrame()
-        
-        abs_stats_infos, norm_stats_infos = [], []
-        team_name = group["team_name"].mode().iloc[0]
-        position = group["position"].mode().iloc[0]
-        max_games_row = sorted_df.iloc[-1].to_dict()
-        
-        abs_stats_info, norm_stats_info = self._compute_stats_values(
-            max_games_row, {}, team_name, position
-        )
-        abs_stats_infos.append(asdict(abs_stats_info))
-        norm_stats_infos.append(asdict(norm_stats_info))
+        stats_teams = self._mode_by_name(players, "team_name")
+        abs_columns = {
+            "name": names[max_rows],
+            "team": stats_teams.reindex(names[max_rows]).to_numpy(),
+            "position": self._mode_by_name(players, "position").reindex(names[max_rows]).to_numpy(),
+        }
+        norm_columns = dict(abs_columns)
 
-        for _, row in sorted_df.iloc[:-1].iterrows():
-            abs_stats_info, norm_stats_info = self._compute_stats_values(
-                max_games_row, row.to_dict(), team_name, position
-            )
-            abs_stats_infos.append(asdict(abs_stats_info))
-            norm_stats_infos.append(asdict(norm_stats_info))
+        if league_name in self.__fbref_parser.get_playing_time_leagues():
+            abs_columns["games"] = norm_columns["games"] = self._diff_values(*snapshots("games"))
+            abs_columns["minutes"] = norm_columns["minutes"] = minutes
 
-        if is_abs_stats and abs_stats_infos:
-            return pd.DataFrame(abs_stats_infos)
-        elif (not is_abs_stats) and norm_stats_infos:
-            return pd.DataFrame(norm_stats_infos)
-        else:
-            return pd.DataFrame()
-
-    def _compute_free_kicks_stats_values(self, stats: Dict) -> FreeKicksInfo:
-        return FreeKicksInfo(
-            name=stats["name"],
-            games=stats["games"],
-            corner_kicks=stats["corner_kicks"],
-            penalty_goals=stats["pens_made"],
-            penalty_shots=stats["pens_att"],
-            free_kicks_shots=stats["shots_free_kicks"],
-        )
+        for field_name, column in stats_columns.items():
+            max_values, min_values = snapshots(column)
+            abs_columns[field_name] = self._diff_values(max_values, min_values)
+            norm_columns[field_name] = self._diff_values(max_values, min_values, minutes)
 
-    def _compute_free_kicks_stats(self, group: pd.DataFrame) -> pd.DataFrame:
-        max_games = group["games"].max()
-        if max_games is None or pd.isna(max_games):
-            return pd.DataFrame()
-        team_name = group["team_name"].mode()
-        position = group["position"].mode()
-        max_games_row = group[group["games"] == max_games].iloc[0].to_dict()
+        if league_name in self.__fbref_parser.get_shooting_leagues():
+            max_pass_xa, min_pass_xa = snapshots("pass_xa")
+            for field_name, column in [("xg_xa", "xg"), ("xg_np_xa", "npxg")]:
+                max_values, min_values = snapshots(column)
+                max_values, min_values = max_values + max_pass_xa, min_values + min_pass_xa
+                abs_columns[field_name] = self._diff_values(max_values, min_values)
+                norm_columns[field_name] = self._diff_values(max_values, min_values, minutes)
+
+            max_games, min_games = snapshots("games")
+            abs_columns["average_shot_distance"] = norm_columns["average_shot_distance"] = self._avg_diff_values(
+                *snapshots("average_shot_distance"), max_games, min_games
+            )
 
-        free_kikcs_info = self._compute_free_kicks_stats_values(max_games_row)
-        free_kikcs_info.team = team_name
-        free_kikcs_info.position = position
-        return pd.DataFrame(asdict(free_kikcs_info), index=[0])
+        # free kicks of the latest snapshot, team and position over all snapshots
+        latest = players.iloc[max_positions]
+        latest_names = latest["name"].to_numpy()
+        free_kicks_columns = {
+            "name": latest_names,
+            "team": self._mode_by_name(df, "team_name").reindex(latest_names).to_numpy(),
+            "position": self._mode_by_name(df, "position").reindex(latest_names).to_numpy(),
+            "games": latest["games"].to_numpy(),
+        }
+        for field_name, column in FREE_KICKS_COLUMNS.items():
+            free_kicks_columns[field_name] = latest[column].to_numpy()
+
+        return PlayersLeagueStats(
+            abs_stats=self._to_frame(PlayerStatsInfo, abs_columns)
+            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True),
+            norm_stats=self._to_frame(PlayerStatsInfo, norm_columns)
+            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True),
+            free_kicks=self._to_frame(FreeKicksInfo, free_kicks_columns),
+        )
 
     def get_teams_names(self, league_name: str) -> List[str]:
         db_session: SQLSession = Session()
@@ -443,7 +247,7 @@ class PlayerDAO:
         return sorted([player_name[0] for player_name in player_names])
 
     def get_players_stats(self, league_name: str) -> PlayersLeagueStats:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
 
         db_session: SQLSession = Session()
 
@@ -477,21 +281,7 @@ class PlayerDAO:
         db_session.commit()
         db_session.close()
 
-        result = PlayersLeagueStats(
-            abs_stats=df.groupby(by=["name"])
-            .apply(lambda x: self._compute_player_stats(x, is_abs_stats=True))
-            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True)
-            .reset_index(drop=True, inplace=False),
-            norm_stats=df.groupby(by=["name"])
-            .apply(lambda x: self._compute_player_stats(x, is_abs_stats=False))
-            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True)
-            .reset_index(drop=True, inplace=False),
-            free_kicks=df.groupby(by=["name"])
-            .apply(self._compute_free_kicks_stats)
-            .drop_duplicates(subset=["name", "team"], ignore_index=True)
-            .reset_index(drop=True, inplace=False),
-        )
-        return result
+        return self._compute_league_stats(df, league_name)
 
     def update_players_stats_all_leagues(self) -> None:
         for league_name in self.__fbref_parser.get_all_leagues():
@@ -500,33 +290,29 @@ class PlayerDAO:
     def update_players_stats(self, league_name: str) -> None:
         if league_name in self.__fbref_parser.get_all_leagues():
             logger.info(f"Start update naming for league {league_name}")
-            year = self._league_2_year.get(league_name, "2024")
+            year = self._league_registry.year(league_name)
 
             players_stats: List[PlayerStats] = self.__fbref_parser.get_stats_league(
                 league_name
             )
             db_session: SQLSession = Session()
 
-            for player in players_stats:
-                db_session.add(
-                    Player(
-                        **asdict(player), 
-                        timestamp=datetime.now().replace(tzinfo=utc),
-                        year=year
-                    )
-                )
-
-            for player in players_stats:
-                db_session.add(
-                    ActualPlayer(
-                        name=player.name,
-                        league_name=player.league_name,
-                        team_name=player.team_name,
-                        position=player.position,
-                        timestamp=datetime.now().replace(tzinfo=utc),
-                        year=year
-                    )
+            timestamp = datetime.now().replace(tzinfo=utc)
+            bulk_insert(db_session, Player, (
+                dict(**asdict(player), timestamp=timestamp, year=year)
+                for player in players_stats
+            ))
+            bulk_insert(db_session, ActualPlayer, (
+                dict(
+                    name=player.name,
+                    league_name=player.league_name,
+                    team_name=player.team_name,
+                    position=player.position,
+                    timestamp=timestamp,
+                    year=year
                 )
+                for player in players_stats
+            ))
 
             db_session.commit()
             db_session.close()
@@ -542,7 +328,7 @@ class PlayerDAO:
     def update_actual_players_stats(self, league_name: str) -> None:
         if league_name in self.__fbref_parser.get_all_leagues():
             logger.info(f"Start update actual players for league {league_name}")
-            year = self._league_2_year.get(league_name, "2024")
+            year = self._league_registry.year(league_name)
 
             players_stats: List[PlayerStats] = self.__fbref_parser.get_actual_players_league(
                 league_name
@@ -554,17 +340,18 @@ class PlayerDAO:
                 ActualPlayer.year == year
             )).delete()
 
-            for player in players_stats:
-                db_session.add(
-                    ActualPlayer(
-                        name=player.name,
-                        league_name=player.league_name,
-                        team_name=player.team_name,
-                        position=player.position,
-                        timestamp=datetime.now().replace(tzinfo=utc),
-                        year=year
-                    )
+            timestamp = datetime.now().replace(tzinfo=utc)
+            bulk_insert(db_session, ActualPlayer, (
+                dict(
+                    name=player.name,
+                    league_name=player.league_name,
+                    team_name=player.team_name,
+                    position=player.position,
+                    timestamp=timestamp,
+                    year=year
                 )
+                for player in players_stats
+            ))
 
             db_session.commit()
             db_session.close()
@@ -576,16 +363,15 @@ class PlayerDAO:
 
     def update_feature_store(self, league_name: str) -> None:
         logger.info(f"Start update players stats feature store for {league_name}")
-        feature_store = FSPlayersStatsDAO()
+        feature_store = FSPlayersStatsDAO(league_registry=self._league_registry)
 
-        if league_name in [x.name for x in self.__leagues]:
+        if league_name in self._league_registry:
             players_stats = self.get_players_stats(league_name)
             feature_store.update_players_free_kicks_stats(league_name, players_stats, add_sports_info=True)
-            players_stats_info = feature_store.compute_players_stats_info(league_name)
-            feature_store.update_players_stats_info(league_name, players_stats_info, add_sports_info=True)
+            feature_store.update_players_stats(league_name, add_sports_info=True)
         else:
             logger.info(f"League {league_name} not found in players stats")
 
     def update_feature_store_all_leagues(self) -> None:
-        for league in self.__leagues:
+        for league in self._league_registry:
             self.update_feature_store(league.name)
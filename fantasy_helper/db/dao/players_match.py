@@ -1,6 +1,7 @@
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, List, Literal, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Union
 from copy import deepcopy
 import os.path as path
 
@@ -11,27 +12,38 @@ from sqlalchemy.orm import Session as SQLSession
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.sql import alias
 
+from fantasy_helper.conf.config import FBREF_MATCHES_BATCH_SIZE
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.models.players_match import PlayersMatch
-from fantasy_helper.parsers.fbref import FbrefParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.parsers.scraping_engine import ScrapingEngine
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.fbref import FbrefParser
 
 
 utc = timezone.utc
 
 
 class PlayersMatchDao:
-    def __init__(self, leagues: Optional[List[LeagueInfo]] = None):
-        if leagues is None:
-            cfg = load_config(config_path="../../conf", config_name="config")
-            self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        else:
-            self._leagues = leagues
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._fbref_parser = FbrefParser(leagues=self._leagues)
+    def __init__(self, leagues: Optional[Union[LeagueRegistry, List[LeagueInfo]]] = None):
+        self._league_registry = as_league_registry(leagues) if leagues is not None else get_league_registry()
+
+    @cached_property
+    def _scraping_engine(self) -> ScrapingEngine:
+        # one engine per process, so its rate limiter spaces the requests of every DAO
+        return get_dao_provider(self._league_registry).get(ScrapingEngine)
+
+    @cached_property
+    def _fbref_parser(self) -> "FbrefParser":
+        from fantasy_helper.parsers.fbref import FbrefParser
+
+        return get_dao_provider(self._league_registry).get(FbrefParser)
 
     def get_leagues(self) -> List[str]:
-        return [league.name for league in self._leagues]
+        return self._league_registry.names
 
     def _add_match_info_to_player(
         self, players: List[PlayerMatchStats], match: LeagueScheduleInfo
@@ -49,40 +61,65 @@ class PlayersMatchDao:
 
         return result
 
+    def _parse_match_players(
+        self, league_name: str, match: LeagueScheduleInfo
+    ) -> List[PlayerMatchStats]:
+        match_players = self._fbref_parser.parse_match_stats(match.match_url, league_name)
+        if not match_players:
+            raise ValueError(f"No players stats for match_url={match.match_url}")
+        return match_players
+
     def parse_matches(
         self, league_name: str, matches: List[LeagueScheduleInfo]
     ) -> List[LeagueScheduleInfo]:
         result = []
 
+        matches_with_url = [match for match in matches if match.match_url is not None]
+        parsed_players = self._scraping_engine.map(
+            lambda match: self._parse_match_players(league_name, match),
+            matches_with_url,
+            url=lambda match: match.match_url,
+        )
+
+        players_batch: List[PlayerMatchStats] = []
+        matches_in_batch = 0
         for match in matches:
             if match.match_url is not None:
-                match_players = self._fbref_parser.parse_match_stats(match.match_url, league_name)
+                match_players = next(parsed_players)
             else:
                 match_players = None
 
             new_match = deepcopy(match)
             if match_players:
                 new_match.match_parsed = True
-                match_players = self._add_match_info_to_player(match_players, new_match)
-                self.add_match_players(match_players)
+                players_batch += self._add_match_info_to_player(match_players, new_match)
+                matches_in_batch += 1
             else:
                 new_match.match_parsed = False
 
+            if matches_in_batch >= FBREF_MATCHES_BATCH_SIZE:
+                self.add_match_players(players_batch)
+                players_batch, matches_in_batch = [], 0
+
             result.append(new_match)
 
+        if players_batch:
+            self.add_match_players(players_batch)
+
         return result
 
     def add_match_players(self, players_matches: List[PlayerMatchStats]) -> None:
         db_session: SQLSession = Session()
 
-        for players_match in players_matches:
-            db_session.add(
-                PlayersMatch(
-                    **asdict(players_match), 
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                    year=self._league_2_year.get(players_match.league_name, "2024")
-                )
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, PlayersMatch, (
+            dict(
+                **asdict(players_match),
+                timestamp=timestamp,
+                year=self._league_registry.year(players_match.league_name)
             )
+            for players_match in players_matches
+        ))
 
         db_session.commit()
         db_session.close()
@@ -159,7 +196,7 @@ class PlayersMatchDao:
         )
 
     def get_players_match_stats(self, league_name: str) -> List[PlayerMatchStats]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
         
         db_session: SQLSession = Session()
 
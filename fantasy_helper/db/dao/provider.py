@@ -0,0 +1,68 @@
+import inspect
+import threading
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+
+T = TypeVar("T")
+
+
+class DaoProvider:
+    """
+    DAOs and parsers of a process, built on first use and shared as one
+    instance per class.
+
+    Nothing is constructed up front, so a process serving reads never builds
+    the DAOs of the update jobs nor their parsers. Classes taking a
+    league_registry, or leagues as the parsers do, get the registry of the
+    provider.
+    """
+
+    def __init__(self, league_registry: LeagueRegistry):
+        self._league_registry = league_registry
+        self._instances: Dict[type, Any] = {}
+        # reentrant, a class may get its own dependencies while being built
+        self._lock = threading.RLock()
+
+    @property
+    def league_registry(self) -> LeagueRegistry:
+        return self._league_registry
+
+    def get(self, cls: Type[T]) -> T:
+        with self._lock:
+            instance = self._instances.get(cls)
+            if instance is None:
+                instance = self._build(cls)
+                self._instances[cls] = instance
+            return instance
+
+    def built(self) -> List[str]:
+        with self._lock:
+            return [cls.__name__ for cls in self._instances]
+
+    def _build(self, cls: Type[T]) -> T:
+        parameters = inspect.signature(cls).parameters
+        if "league_registry" in parameters:
+            return cls(league_registry=self._league_registry)
+        if "leagues" in parameters:
+            return cls(leagues=self._league_registry)
+        return cls()
+
+
+_dao_providers: Dict[LeagueRegistry, DaoProvider] = {}
+_dao_providers_lock = threading.Lock()
+
+
+def get_dao_provider(league_registry: Optional[LeagueRegistry] = None) -> DaoProvider:
+    """
+    The provider of the process for a registry, by default for the registry
+    of conf/config.yaml.
+    """
+    if league_registry is None:
+        league_registry = get_league_registry()
+
+    with _dao_providers_lock:
+        if league_registry not in _dao_providers:
+            _dao_providers[league_registry] = DaoProvider(league_registry)
+        return _dao_providers[league_registry]
@@ -1,36 +1,39 @@
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import List, Optional
-import os.path as path
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy.orm import Session as SQLSession
 from sqlalchemy import and_, func
 from loguru import logger
 
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.models.schedule import Schedule
 from fantasy_helper.db.models.table import Table
-from fantasy_helper.parsers.sports import SportsParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, LeagueScheduleInfo, SportsMatchInfo
+from fantasy_helper.utils.dataclasses import LeagueScheduleInfo, SportsMatchInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.sports import SportsParser
 
 
 utc = timezone.utc
 
 
 class ScheduleDao:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
-
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._sports_parser = SportsParser(
-            leagues=self._leagues,
-            queries_path=path.join(path.dirname(__file__), "../../parsers/queries"),
-        )
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def _sports_parser(self) -> "SportsParser":
+        from fantasy_helper.parsers.sports import SportsParser
+
+        return get_dao_provider(self._league_registry).get(SportsParser)
 
     def get_leagues(self) -> List[str]:
-        return [league.name for league in self._leagues]
+        return self._league_registry.names
 
     def get_schedule(self, league_name: str, year: str = "2024") -> List[LeagueScheduleInfo]:
         current_datetime = datetime.now()
@@ -95,7 +98,7 @@ class ScheduleDao:
         return result
 
     def get_current_tour_number(self, league_name: str) -> Optional[int]:
-        league_year = self._league_2_year.get(league_name)
+        league_year = self._league_registry.year(league_name, None)
         schedule = self.get_schedule(league_name, league_year)
         if not schedule:
             return None
@@ -106,7 +109,7 @@ class ScheduleDao:
         return min_gameweek
 
     def get_next_tour_number(self, league_name: str) -> Optional[int]:
-        league_year = self._league_2_year.get(league_name)
+        league_year = self._league_registry.year(league_name, None)
         schedule = self.get_schedule(league_name, league_year)
         if not schedule:
             return None
@@ -117,7 +120,7 @@ class ScheduleDao:
         return min_gameweek + 1
 
     def get_next_matches(self, league_name: str, tour_count: int) -> List[LeagueScheduleInfo]:
-        league_year = self._league_2_year.get(league_name)
+        league_year = self._league_registry.year(league_name, None)
         schedule = self.get_schedule(league_name, league_year)
         if not schedule:
             return []
@@ -138,7 +141,7 @@ class ScheduleDao:
     def update_schedules(self, league_name: str) -> None:
         if league_name in self._sports_parser.get_leagues():
             logger.info(f"Start update sports schedules for {league_name}")
-            league_year = self._league_2_year.get(league_name)
+            league_year = self._league_registry.year(league_name, None)
 
             schedule_rows: List[SportsMatchInfo] = self._sports_parser.get_next_matches(
                 league_name=league_name, tour_count=5
@@ -146,19 +149,20 @@ class ScheduleDao:
 
             db_session: SQLSession = Session()
 
-            for match in schedule_rows:
-                db_session.add(
-                    Schedule(
-                        league_name=league_name,
-                        home_team=match.home_team,
-                        away_team=match.away_team,
-                        gameweek=match.tour_number,
-                        tour_name=match.tour_name,
-                        date=match.scheduled_at_datetime.date() if match.scheduled_at_datetime else None,
-                        timestamp=datetime.now().replace(tzinfo=utc),
-                        year=league_year
-                    )
+            timestamp = datetime.now().replace(tzinfo=utc)
+            bulk_insert(db_session, Schedule, (
+                dict(
+                    league_name=league_name,
+                    home_team=match.home_team,
+                    away_team=match.away_team,
+                    gameweek=match.tour_number,
+                    tour_name=match.tour_name,
+                    date=match.scheduled_at_datetime.date() if match.scheduled_at_datetime else None,
+                    timestamp=timestamp,
+                    year=league_year
                 )
+                for match in schedule_rows
+            ))
 
             db_session.commit()
             db_session.close()
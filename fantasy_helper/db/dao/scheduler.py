@@ -0,0 +1,251 @@
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.orm import Session as SQLSession
+from loguru import logger
+
+from fantasy_helper.conf.config import SCHEDULER_HEARTBEAT_MINUTES, SCHEDULER_STALE_RUN_HOURS
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.models.job_run import JobRun
+from fantasy_helper.db.models.scheduled_job import ScheduledJob
+from fantasy_helper.utils.dataclasses import JobRunInfo, ScheduledJobInfo
+
+
+utc = timezone.utc
+
+
+class SchedulerDAO:
+    """
+    Schedule table and runs history of the update daemon.
+
+    A job never overlaps itself, even across daemons: a run starts only if
+    there is no live running run of the same job, otherwise a skipped run is
+    recorded. A running run is live while it is younger than stale_run_hours
+    and its daemon, the owner, refreshed its heartbeat within
+    heartbeat_minutes. Runs of a killed daemon stop being live after that
+    time, or once a daemon with the same owner restarts.
+    """
+
+    def __init__(
+        self,
+        stale_run_hours: float = SCHEDULER_STALE_RUN_HOURS,
+        heartbeat_minutes: float = SCHEDULER_HEARTBEAT_MINUTES,
+        owner: Optional[str] = None
+    ):
+        self._stale_run_hours = stale_run_hours
+        self._heartbeat_minutes = heartbeat_minutes
+        self._owner = owner if owner is not None else f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def owner(self) -> str:
+        return self._owner
+
+    def get_jobs(self) -> List[ScheduledJobInfo]:
+        db_session: SQLSession = Session()
+
+        jobs = db_session.query(ScheduledJob).order_by(ScheduledJob.name).all()
+        result = [
+            ScheduledJobInfo(
+                name=job.name,
+                job=job.job,
+                cron=job.cron,
+                league_name=job.league_name,
+                enabled=job.enabled
+            )
+            for job in jobs
+        ]
+
+        db_session.commit()
+        db_session.close()
+
+        return result
+
+    def add_jobs(self, jobs: List[ScheduledJobInfo]) -> int:
+        """
+        Adds the jobs missing in the schedule, existing ones keep their edits.
+
+        Returns:
+            int: The number of added jobs.
+        """
+        db_session: SQLSession = Session()
+
+        existing_names = {name for name, in db_session.query(ScheduledJob.name).all()}
+        timestamp = datetime.now().replace(tzinfo=utc)
+        new_jobs = [job for job in jobs if job.name not in existing_names]
+        for job in new_jobs:
+            db_session.add(ScheduledJob(
+                name=job.name,
+                job=job.job,
+                league_name=job.league_name,
+                cron=job.cron,
+                enabled=job.enabled,
+                timestamp=timestamp
+            ))
+
+        db_session.commit()
+        db_session.close()
+
+        return len(new_jobs)
+
+    def start_run(self, job: ScheduledJobInfo, scheduled_at: Optional[datetime] = None) -> Optional[int]:
+        """
+        Records a run of the job as running, or as skipped if the job is still running.
+
+        Returns:
+            Optional[int]: The id of the started run, None if it was skipped.
+        """
+        db_session: SQLSession = Session()
+
+        self._lock_job(db_session, job.name)
+        now = datetime.now()
+        running = (
+            db_session.query(JobRun)
+            .filter(and_(
+                JobRun.name == job.name,
+                JobRun.status == "running",
+                JobRun.started_at > now - timedelta(hours=self._stale_run_hours),
+                func.coalesce(JobRun.heartbeat_at, JobRun.started_at) > self._dead_before(now)
+            ))
+            .first()
+        )
+        job_run = JobRun(
+            name=job.name,
+            job=job.job,
+            league_name=job.league_name,
+            status="running" if running is None else "skipped",
+            scheduled_at=scheduled_at,
+            started_at=now,
+            finished_at=None if running is None else now,
+            duration=None if running is None else 0.0,
+            error=None if running is None else f"run {running.id} of {running.owner} started at {running.started_at} is still running",
+            owner=self._owner,
+            heartbeat_at=now
+        )
+        db_session.add(job_run)
+        db_session.commit()
+        run_id = job_run.id if running is None else None
+        db_session.close()
+
+        if run_id is None:
+            logger.warning(f"Skip job {job.name}, it is still running")
+        return run_id
+
+    def add_skipped_run(self, job: ScheduledJobInfo, scheduled_at: Optional[datetime], reason: str) -> None:
+        db_session: SQLSession = Session()
+
+        now = datetime.now()
+        db_session.add(JobRun(
+            name=job.name,
+            job=job.job,
+            league_name=job.league_name,
+            status="skipped",
+            scheduled_at=scheduled_at,
+            started_at=now,
+            finished_at=now,
+            duration=0.0,
+            error=reason
+        ))
+
+        db_session.commit()
+        db_session.close()
+
+    def finish_run(self, run_id: int, status: str, error: Optional[str] = None) -> None:
+        db_session: SQLSession = Session()
+
+        job_run = db_session.query(JobRun).filter(JobRun.id == run_id).first()
+        if job_run is not None:
+            job_run.status = status
+            job_run.finished_at = datetime.now()
+            job_run.duration = (job_run.finished_at - job_run.started_at).total_seconds()
+            job_run.error = error
+
+        db_session.commit()
+        db_session.close()
+
+    def heartbeat(self) -> int:
+        """
+        Marks the running runs of this owner as alive.
+
+        Returns:
+            int: The number of running runs.
+        """
+        db_session: SQLSession = Session()
+
+        updated = (
+            db_session.query(JobRun)
+            .filter(and_(JobRun.status == "running", JobRun.owner == self._owner))
+            .update({JobRun.heartbeat_at: datetime.now()}, synchronize_session=False)
+        )
+
+        db_session.commit()
+        db_session.close()
+
+        return updated
+
+    def fail_dead_runs(self, reason: str = "interrupted by a restart") -> int:
+        """
+        Marks runs left running by dead daemons as failed: runs of this
+        owner, called before it starts any run, and runs without a heartbeat
+        within heartbeat_minutes. Runs of other live daemons are kept.
+
+        Returns:
+            int: The number of failed runs.
+        """
+        db_session: SQLSession = Session()
+
+        updated = (
+            db_session.query(JobRun)
+            .filter(and_(
+                JobRun.status == "running",
+                or_(
+                    JobRun.owner == self._owner,
+                    func.coalesce(JobRun.heartbeat_at, JobRun.started_at) <= self._dead_before(datetime.now())
+                )
+            ))
+            .update({JobRun.status: "failed", JobRun.error: reason}, synchronize_session=False)
+        )
+
+        db_session.commit()
+        db_session.close()
+
+        return updated
+
+    def _dead_before(self, now: datetime) -> datetime:
+        return now - timedelta(minutes=self._heartbeat_minutes)
+
+    @staticmethod
+    def _lock_job(db_session: SQLSession, name: str) -> None:
+        # serializes the check and insert of start_run across daemons until
+        # the commit, sqlite serializes writers by itself
+        if db_session.get_bind().dialect.name == "postgresql":
+            db_session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": name})
+
+    def get_runs(self, name: Optional[str] = None, limit: int = 50) -> List[JobRunInfo]:
+        db_session: SQLSession = Session()
+
+        query = db_session.query(JobRun)
+        if name is not None:
+            query = query.filter(JobRun.name == name)
+        runs = query.order_by(JobRun.started_at.desc(), JobRun.id.desc()).limit(limit).all()
+        result = [
+            JobRunInfo(
+                name=run.name,
+                job=run.job,
+                status=run.status,
+                started_at=run.started_at,
+                league_name=run.league_name,
+                scheduled_at=run.scheduled_at,
+                finished_at=run.finished_at,
+                duration=run.duration,
+                error=run.error
+            )
+            for run in runs
+        ]
+
+        db_session.commit()
+        db_session.close()
+
+        return result
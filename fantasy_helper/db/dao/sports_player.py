@@ -1,6 +1,6 @@
-from typing import List
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime, timezone
-import os.path as path
 
 import pandas as pd
 from sqlalchemy import and_
@@ -9,25 +9,28 @@ from loguru import logger
 
 from fantasy_helper.db.dao.feature_store.fs_sports_players import FSSportsPlayersDAO
 from fantasy_helper.db.models.sports_player import SportsPlayer
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
-from fantasy_helper.parsers.sports import SportsParser
-from fantasy_helper.utils.dataclasses import LeagueInfo, SportsPlayerDiff
-from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+from fantasy_helper.utils.dataclasses import SportsPlayerDiff
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.sports import SportsParser
 
 
 utc = timezone.utc
 
 
 class SportsPlayerDAO:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf")
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def _sports_parser(self) -> "SportsParser":
+        from fantasy_helper.parsers.sports import SportsParser
 
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._sports_parser = SportsParser(
-            leagues=self._leagues,
-            queries_path=path.join(path.dirname(__file__), "../../parsers/queries")
-        )
+        return get_dao_provider(self._league_registry).get(SportsParser)
 
     @staticmethod
     def _compute_popularity_diff(group: pd.DataFrame) -> pd.DataFrame:
@@ -53,7 +56,7 @@ class SportsPlayerDAO:
         return pd.DataFrame(result)
 
     def get_players(self, league_name: str, year: str = "2024") -> List[SportsPlayerDiff]:
-        league_year = self._league_2_year.get(league_name, "2024")
+        league_year = self._league_registry.year(league_name)
         current_tour = self._sports_parser.get_current_tour(league_name)
         if current_tour is None:
             return None
@@ -80,19 +83,16 @@ class SportsPlayerDAO:
     def update_players(self, league_name: str) -> None:
         logger.info(f"Start update sports players for {league_name}")
 
-        league_year = self._league_2_year.get(league_name, "2024")        
+        league_year = self._league_registry.year(league_name)        
         players_stats = self._sports_parser.get_players_stats_info(league_name)
 
         db_session: SQLSession = Session()
         
-        for player_stats in players_stats:
-            db_session.add(
-                SportsPlayer(
-                    **player_stats.__dict__,
-                    timestamp=datetime.now().replace(tzinfo=utc),
-                    year=league_year
-                )
-            )
+        timestamp = datetime.now().replace(tzinfo=utc)
+        bulk_insert(db_session, SportsPlayer, (
+            dict(**player_stats.__dict__, timestamp=timestamp, year=league_year)
+            for player_stats in players_stats
+        ))
 
         db_session.commit()
         db_session.close()
@@ -100,14 +100,14 @@ class SportsPlayerDAO:
         logger.info(f"Updated {len(players_stats)} players for {league_name}")
 
     def update_players_all_leagues(self) -> None:
-        for league in self._leagues:
+        for league in self._league_registry:
             self.update_players(league.name)
 
     def update_feature_store(self, league_name: str) -> None:
         logger.info(f"Start update sports players feature store for {league_name}")
         feature_store = FSSportsPlayersDAO()
 
-        if league_name in [x.name for x in self._leagues]:
+        if league_name in self._league_registry:
             players = self.get_players(league_name)
             if players:
                 feature_store.update_sports_players(league_name, players)
@@ -116,5 +116,5 @@ class SportsPlayerDAO:
             logger.info(f"League {league_name} not found in sports")
 
     def update_feature_store_all_leagues(self) -> None:
-        for league in self._leagues:
+        for league in self._league_registry:
             self.update_feature_store(league.name)
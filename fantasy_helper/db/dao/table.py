@@ -1,31 +1,39 @@
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import List
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy.orm import Session as SQLSession
 from sqlalchemy import func, and_
 from loguru import logger
 
+from fantasy_helper.db.dao.provider import get_dao_provider
 from fantasy_helper.db.database import Session
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
 from fantasy_helper.db.models.table import Table
-from fantasy_helper.parsers.fbref import FbrefParser
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, LeagueTableInfo
+from fantasy_helper.utils.dataclasses import LeagueTableInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from fantasy_helper.parsers.fbref import FbrefParser
 
 
 utc = timezone.utc
 
 
 class TableDao:
-    def __init__(self):
-        cfg = load_config(config_path="../../conf", config_name="config")
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
+
+    @cached_property
+    def _fbref_parser(self) -> "FbrefParser":
+        # selenium is imported on the first update only, readers never load it
+        from fantasy_helper.parsers.fbref import FbrefParser
 
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
-        self._fbref_parser = FbrefParser(leagues=self._leagues)
+        return get_dao_provider(self._league_registry).get(FbrefParser)
 
     def get_leagues(self) -> List[str]:
-        return [league.name for league in self._leagues]
+        return self._league_registry.names
 
     def get_table(self, league_name: str, year: str = "2024") -> List[LeagueTableInfo]:
         db_session: SQLSession = Session()
@@ -79,21 +87,18 @@ class TableDao:
         if league_name in self._fbref_parser.get_all_leagues():
             logger.info(f"Start update fbref tables for {league_name}")
 
-            league_year = self._league_2_year.get(league_name, "2024")
+            league_year = self._league_registry.year(league_name)
             table_rows: List[LeagueTableInfo] = self._fbref_parser.get_league_table(
                 league_name, league_year
             )
 
             db_session: SQLSession = Session()
 
-            for table_row in table_rows:
-                db_session.add(
-                    Table(
-                        **asdict(table_row), 
-                        timestamp=datetime.now().replace(tzinfo=utc),
-                        year=league_year
-                    )
-                )
+            timestamp = datetime.now().replace(tzinfo=utc)
+            bulk_insert(db_session, Table, (
+                dict(**asdict(table_row), timestamp=timestamp, year=league_year)
+                for table_row in table_rows
+            ))
 
             db_session.commit()
             db_session.close()
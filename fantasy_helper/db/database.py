@@ -1,5 +1,4 @@
 from sqlalchemy import create_engine
-from sqlalchemy_utils import database_exists, create_database
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -7,8 +6,16 @@ from fantasy_helper.conf.config import DATABASE_URI
 
 
 db_engine = create_engine(DATABASE_URI)
-if not database_exists(db_engine.url):
-    create_database(db_engine.url)
-
 Session = sessionmaker(bind=db_engine)
 Base = declarative_base()
+
+
+def create_database_if_missing() -> None:
+    """
+    Creates the database of DATABASE_URI, called by the migrations and the
+    update scripts, not at import, so readers like the api skip the check.
+    """
+    from sqlalchemy_utils import database_exists, create_database
+
+    if not database_exists(db_engine.url):
+        create_database(db_engine.url)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime
 
 from fantasy_helper.db.database import Base
@@ -18,6 +18,10 @@ class ActualPlayer(Base):
     timestamp = Column(DateTime, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_actual_players_league_year", "league_name", "year"),
+    )
+
     def __init__(
         self,
         name: Optional[str],
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Float
 
 from fantasy_helper.db.database import Base
@@ -90,6 +90,10 @@ class Coeff(Base):
 
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_coeffs_league_year_timestamp", "league_name", "year", "timestamp"),
+    )
+
     def __init__(
         self,
         home_team: str,
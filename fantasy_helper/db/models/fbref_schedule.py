@@ -1,7 +1,7 @@
 import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Date, Boolean, Float
 
 from fantasy_helper.db.database import Base
@@ -26,6 +26,10 @@ class FbrefSchedule(Base):
     match_parsed = Column(Boolean, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_fbref_schedules_league_year_parsed", "league_name", "year", "match_parsed"),
+    )
+
     def __init__(
         self,
         league_name: str,
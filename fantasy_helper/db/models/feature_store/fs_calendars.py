@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, JSON, DateTime
 
 from fantasy_helper.db.database import Base
@@ -13,6 +13,7 @@ class FSCalendars(Base):
     id = Column(Integer, primary_key=True)
     team_name = Column(String, nullable=False)
     league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
     tour_names = Column(JSON, nullable=True)
     tour_numbers = Column(JSON, nullable=True)
     tour_rivals = Column(JSON, nullable=True)
@@ -22,6 +23,10 @@ class FSCalendars(Base):
     tour_xg_colors = Column(JSON, nullable=True)
     timestamp = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index("ix_fs_calendars_league_version", "league_name", "version"),
+    )
+
     def __init__(
         self,
         team_name: str,
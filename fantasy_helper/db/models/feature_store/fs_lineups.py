@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String
 
 from fantasy_helper.db.database import Base
@@ -11,9 +11,14 @@ class FSLineups(Base):
 
     id = Column(Integer, primary_key=True)
     league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
     team_name = Column(String, nullable=True)
     lineup = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_fs_lineups_league_version", "league_name", "version"),
+    )
+
     def __init__(
         self,
         league_name: str,
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, Float, BigInteger
 
 from fantasy_helper.db.database import Base
@@ -31,6 +31,10 @@ class FSPlayersFreeKicks(Base):
     percent_ownership = Column(Float, nullable=True)
     percent_ownership_diff = Column(Float, nullable=True)
 
+    __table_args__ = (
+        Index("ix_fs_players_free_kicks_league", "league_name"),
+    )
+
     def __init__(
         self,
         league_name: str,
@@ -0,0 +1,139 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy import Column, Index
+from sqlalchemy import Integer, String, Float, Date
+
+from fantasy_helper.db.database import Base
+
+
+class FSPlayersMatches(Base):
+    """
+    Stats of a player in one team match, the source of the players stats index.
+    match_number = 1 is the latest match of the team.
+    """
+    __tablename__ = "fs_players_matches"
+
+    id = Column(Integer, primary_key=True)
+    league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+    # common
+    name = Column(String, nullable=False)
+    team = Column(String, nullable=False)
+    position = Column(String, nullable=True)
+    # team match
+    match_number = Column(Integer, nullable=False)
+    gameweek = Column(Integer, nullable=True)
+    date = Column(Date, nullable=True)
+    # playing time
+    minutes = Column(Integer, nullable=True)
+    # shooting
+    goals = Column(Integer, nullable=True)
+    shots = Column(Integer, nullable=True)
+    shots_on_target = Column(Integer, nullable=True)
+    xg = Column(Float, nullable=True)
+    xg_np = Column(Float, nullable=True)
+    xg_xa = Column(Float, nullable=True)
+    xg_np_xa = Column(Float, nullable=True)
+    # passing
+    assists = Column(Integer, nullable=True)
+    xa = Column(Float, nullable=True)
+    passes_into_penalty_area = Column(Integer, nullable=True)
+    crosses_into_penalty_area = Column(Integer, nullable=True)
+    # possesion
+    touches_in_attacking_third = Column(Integer, nullable=True)
+    touches_in_attacking_penalty_area = Column(Integer, nullable=True)
+    carries_in_attacking_third = Column(Integer, nullable=True)
+    carries_in_attacking_penalty_area = Column(Integer, nullable=True)
+    # shot creation
+    sca = Column(Integer, nullable=True)
+    gca = Column(Integer, nullable=True)
+    # miscellaneous
+    ball_recoveries = Column(Integer, nullable=True)
+    # sports info
+    sports_team = Column(String, nullable=True)
+    sports_name = Column(String, nullable=True)
+    role = Column(String, nullable=True)
+    price = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_fs_players_matches_league_version", "league_name", "version"),
+    )
+
+    def __init__(
+        self,
+        league_name: str,
+        name: str,
+        team: str,
+        match_number: int,
+        version: int = 0,
+        position: Optional[str] = None,
+        gameweek: Optional[int] = None,
+        date: Optional[datetime.date] = None,
+        minutes: Optional[int] = None,
+        goals: Optional[int] = None,
+        shots: Optional[int] = None,
+        shots_on_target: Optional[int] = None,
+        xg: Optional[float] = None,
+        xg_np: Optional[float] = None,
+        xg_xa: Optional[float] = None,
+        xg_np_xa: Optional[float] = None,
+        assists: Optional[int] = None,
+        xa: Optional[float] = None,
+        passes_into_penalty_area: Optional[int] = None,
+        crosses_into_penalty_area: Optional[int] = None,
+        touches_in_attacking_third: Optional[int] = None,
+        touches_in_attacking_penalty_area: Optional[int] = None,
+        carries_in_attacking_third: Optional[int] = None,
+        carries_in_attacking_penalty_area: Optional[int] = None,
+        sca: Optional[int] = None,
+        gca: Optional[int] = None,
+        ball_recoveries: Optional[int] = None,
+        sports_team: Optional[str] = None,
+        sports_name: Optional[str] = None,
+        role: Optional[str] = None,
+        price: Optional[float] = None
+    ):
+        self.league_name = league_name
+        self.version = version
+        # common
+        self.name = name
+        self.team = team
+        self.position = position
+        # team match
+        self.match_number = match_number
+        self.gameweek = gameweek
+        self.date = date
+        # playing time
+        self.minutes = minutes
+        # shooting
+        self.goals = goals
+        self.shots = shots
+        self.shots_on_target = shots_on_target
+        self.xg = xg
+        self.xg_np = xg_np
+        self.xg_xa = xg_xa
+        self.xg_np_xa = xg_np_xa
+        # passing
+        self.assists = assists
+        self.xa = xa
+        self.passes_into_penalty_area = passes_into_penalty_area
+        self.crosses_into_penalty_area = crosses_into_penalty_area
+        # possesion
+        self.touches_in_attacking_third = touches_in_attacking_third
+        self.touches_in_attacking_penalty_area = touches_in_attacking_penalty_area
+        self.carries_in_attacking_third = carries_in_attacking_third
+        self.carries_in_attacking_penalty_area = carries_in_attacking_penalty_area
+        # shot creation
+        self.sca = sca
+        self.gca = gca
+        # miscellaneous
+        self.ball_recoveries = ball_recoveries
+        # sports info
+        self.sports_team = sports_team
+        self.sports_name = sports_name
+        self.role = role
+        self.price = price
+
+    def __repr__(self):
+        return f"{self.name} ({self.team}) [{self.match_number}]"
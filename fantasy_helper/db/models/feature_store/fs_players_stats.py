@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, Float, BigInteger
 
 from fantasy_helper.db.database import Base
@@ -11,6 +11,7 @@ class FSPlayersStats(Base):
 
     id = Column(BigInteger, primary_key=True)
     league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
     type = Column(String, nullable=True)
     # common
     name = Column(String, primary_key=False)
@@ -53,6 +54,10 @@ class FSPlayersStats(Base):
     percent_ownership = Column(Float, nullable=True)
     percent_ownership_diff = Column(Float, nullable=True)
 
+    __table_args__ = (
+        Index("ix_fs_players_stats_league_version_type", "league_name", "version", "type"),
+    )
+
     def __init__(
         self,
         league_name: str,
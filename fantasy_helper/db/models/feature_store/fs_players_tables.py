@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Column, Index
+from sqlalchemy import Integer, String, DateTime, JSON
+
+from fantasy_helper.db.database import Base
+
+
+class FSPlayersTables(Base):
+    """
+    Players table of /players_stats_info/ precomputed for one games window
+    and normalization mode. games_count = 0 stands for all games.
+    """
+    __tablename__ = "fs_players_tables"
+
+    id = Column(Integer, primary_key=True)
+    league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+    games_count = Column(Integer, nullable=False)
+    normalization = Column(String, nullable=False)
+    rows = Column(JSON, nullable=False)
+    timestamp = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_fs_players_tables_lookup", "league_name", "version", "normalization", "games_count"),
+    )
+
+    def __init__(
+        self,
+        league_name: str,
+        games_count: int,
+        normalization: str,
+        rows: List[Dict[str, Any]],
+        version: int = 0,
+        timestamp: Optional[datetime] = None
+    ):
+        self.league_name = league_name
+        self.version = version
+        self.games_count = games_count
+        self.normalization = normalization
+        self.rows = rows
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"{self.league_name} v{self.version} [{self.games_count}, {self.normalization}]"
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, Float
 
 from fantasy_helper.db.database import Base
@@ -12,12 +12,17 @@ class FSSportsPlayers(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     league_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
     team_name = Column(String, nullable=True)
     role = Column(String, nullable=True)
     price = Column(Float, nullable=True)
     percent_ownership = Column(Float, nullable=True)
     percent_ownership_diff = Column(Float, nullable=True)
 
+    __table_args__ = (
+        Index("ix_fs_sports_players_league_version", "league_name", "version"),
+    )
+
     def __init__(
         self,
         name: str,
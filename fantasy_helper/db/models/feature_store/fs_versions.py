@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy import Integer, String, DateTime
+
+from fantasy_helper.db.database import Base
+
+
+class FSVersion(Base):
+    __tablename__ = "fs_versions"
+    __table_args__ = (UniqueConstraint("league_name", "table_name"),)
+
+    id = Column(Integer, primary_key=True)
+    league_name = Column(String, nullable=False)
+    table_name = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)
+    timestamp = Column(DateTime, nullable=True)
+    # the latest source row timestamp included in the published version
+    watermark = Column(DateTime, nullable=True)
+
+    def __init__(
+        self,
+        league_name: str,
+        table_name: str,
+        version: int,
+        timestamp: Optional[datetime] = None,
+        watermark: Optional[datetime] = None
+    ):
+        self.league_name = league_name
+        self.table_name = table_name
+        self.version = version
+        self.timestamp = timestamp
+        self.watermark = watermark
+
+    def __repr__(self):
+        return f"{self.table_name} [{self.league_name}]: v{self.version}"
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, Index
+from sqlalchemy import Integer, Float, String, Text, DateTime
+
+from fantasy_helper.db.database import Base
+
+
+class JobRun(Base):
+    __tablename__ = "jobs_runs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    job = Column(String, nullable=False)
+    league_name = Column(String, nullable=True)
+    # running, done, failed or skipped
+    status = Column(String, nullable=False)
+    scheduled_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    duration = Column(Float, nullable=True)
+    error = Column(Text, nullable=True)
+    # host:pid of the daemon running the job, refreshed heartbeat_at every tick
+    owner = Column(String, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_runs_name_started_at", "name", "started_at"),
+    )
+
+    def __init__(
+        self,
+        name: str,
+        job: str,
+        league_name: Optional[str],
+        status: str,
+        scheduled_at: Optional[datetime],
+        started_at: datetime,
+        finished_at: Optional[datetime] = None,
+        duration: Optional[float] = None,
+        error: Optional[str] = None,
+        owner: Optional[str] = None,
+        heartbeat_at: Optional[datetime] = None,
+    ):
+        self.name = name
+        self.job = job
+        self.league_name = league_name
+        self.status = status
+        self.scheduled_at = scheduled_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self.duration = duration
+        self.error = error
+        self.owner = owner
+        self.heartbeat_at = heartbeat_at
+
+    def __repr__(self):
+        return f"{self.name} [{self.status}] at {self.started_at}"
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime
 
 from fantasy_helper.db.database import Base
@@ -18,6 +18,11 @@ class Lineup(Base):
     timestamp = Column(DateTime, nullable=False)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_lineups_league_year_dedup", "league_name", "year", "team_name", timestamp.desc()),
+        Index("ix_lineups_timestamp", "timestamp"),
+    )
+
     def __init__(
         self,
         update_id: int,
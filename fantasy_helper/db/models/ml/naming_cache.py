@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column
+from sqlalchemy import Integer, String, Text, DateTime
+
+from fantasy_helper.db.database import Base
+
+
+class NamingCache(Base):
+    __tablename__ = "naming_cache"
+
+    id = Column(Integer, primary_key=True)
+    # sha256 of the prompt, the model and the sorted names lists
+    key = Column(String, nullable=False, unique=True, index=True)
+    kind = Column(String, nullable=False, index=True)
+    model = Column(String, nullable=False)
+    # json object of matched names
+    result = Column(Text, nullable=False)
+    timestamp = Column(DateTime, nullable=False)
+
+    def __init__(
+        self,
+        key: str,
+        kind: str,
+        model: str,
+        result: str,
+        timestamp: Optional[datetime],
+    ):
+        self.key = key
+        self.kind = kind
+        self.model = model
+        self.result = result
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"{self.kind} [{self.model}]: {self.key}"
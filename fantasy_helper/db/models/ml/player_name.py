@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime
 
 from fantasy_helper.db.database import Base
@@ -19,6 +19,10 @@ class PlayerName(Base):
     timestamp = Column(DateTime, nullable=False)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_players_names_league_year_team", "league_name", "year", "team_name"),
+    )
+
     def __init__(
         self,
         league_name: Optional[str],
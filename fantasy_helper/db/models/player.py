@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Float
 
 from fantasy_helper.db.database import Base
@@ -141,6 +141,11 @@ class Player(Base):
     red_cards = Column(Integer, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_players_league_year_dedup", "league_name", "year", "name", "team_name", "position", "games", timestamp.desc()),
+        Index("ix_players_league_team", "league_name", "team_name"),
+    )
+
     def __init__(
         self,
         name: str,
@@ -1,7 +1,7 @@
 import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Float, Date
 
 from fantasy_helper.db.database import Base
@@ -152,6 +152,10 @@ class PlayersMatch(Base):
     gk_avg_distance_def_actions = Column(Float, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_players_matches_league_year_dedup", "league_name", "year", "player_id", "date", timestamp.desc()),
+    )
+
     def __init__(
         self,
         # common
@@ -1,7 +1,7 @@
 import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Date, Float
 
 from fantasy_helper.db.database import Base
@@ -22,6 +22,10 @@ class Schedule(Base):
     away_goals = Column(Integer, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_schedules_league_year_date", "league_name", "year", "date"),
+    )
+
     def __init__(
         self,
         league_name: str,
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column
+from sqlalchemy import Boolean, Integer, String, DateTime
+
+from fantasy_helper.db.database import Base
+
+
+class ScheduledJob(Base):
+    __tablename__ = "scheduled_jobs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True, index=True)
+    # league_full or sports_players
+    job = Column(String, nullable=False)
+    league_name = Column(String, nullable=True)
+    # five fields crontab expression in the local time of the scheduler
+    cron = Column(String, nullable=False)
+    enabled = Column(Boolean, nullable=False, default=True)
+    timestamp = Column(DateTime, nullable=False)
+
+    def __init__(
+        self,
+        name: str,
+        job: str,
+        league_name: Optional[str],
+        cron: str,
+        enabled: bool,
+        timestamp: Optional[datetime],
+    ):
+        self.name = name
+        self.job = job
+        self.league_name = league_name
+        self.cron = cron
+        self.enabled = enabled
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"{self.name} [{self.cron}]"
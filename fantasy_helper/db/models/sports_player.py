@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Float
 
 from fantasy_helper.db.database import Base
@@ -32,6 +32,10 @@ class SportsPlayer(Base):
     saves = Column(Integer, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_sports_players_league_year_tour", "league_name", "year", "tour"),
+    )
+
     def __init__(
         self,
         sports_id: int,
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy import Integer, String, DateTime, Float
 
 from fantasy_helper.db.database import Base
@@ -25,6 +25,10 @@ class Table(Base):
     xg_against = Column(Float, nullable=True)
     year = Column(String, nullable=True, default="2024")
 
+    __table_args__ = (
+        Index("ix_tables_league_year_dedup", "league_name", "year", "team_name", timestamp.desc()),
+    )
+
     def __init__(
         self,
         league_name: str,
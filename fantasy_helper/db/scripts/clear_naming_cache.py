@@ -0,0 +1,19 @@
+import sys
+
+from loguru import logger
+
+sys.path.insert(0, "/fantasy_helper")
+
+from fantasy_helper.db.dao.ml.naming_cache import NamingCacheDAO
+
+
+if __name__ == "__main__":
+    # optional kind of cached results to clear: teams or players
+    kind = sys.argv[1] if len(sys.argv) > 1 else None
+    if kind not in (None, "teams", "players"):
+        logger.error(f"Unknown naming cache kind {kind}, expected teams or players")
+        sys.exit(1)
+
+    logger.info(f"Start clear naming cache")
+    NamingCacheDAO().clear(kind)
+    logger.info(f"Finish clear naming cache")
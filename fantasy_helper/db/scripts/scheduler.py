@@ -0,0 +1,79 @@
+import asyncio
+from typing import Dict, List, Optional
+import sys
+
+from loguru import logger
+
+sys.path.insert(0, "/fantasy_helper")
+
+from fantasy_helper.conf.config import SCHEDULER_TICK
+from fantasy_helper.db.dao.provider import get_dao_provider
+from fantasy_helper.db.dao.scheduler import SchedulerDAO
+from fantasy_helper.db.dao.sports_player import SportsPlayerDAO
+from fantasy_helper.db.scripts.update_league_full import LeagueUpdater
+from fantasy_helper.db.utils.create_db import create_db
+from fantasy_helper.utils.dataclasses import ScheduledJobInfo
+from fantasy_helper.utils.scheduler import JobRunner, JobScheduler
+
+
+# the default schedule, formerly fantasy_helper/crontab, added to the schedule table once
+DEFAULT_JOBS: List[ScheduledJobInfo] = [
+    ScheduledJobInfo(name=f"league_full_{league_name}", job="league_full", cron=cron, league_name=league_name)
+    for league_name, cron in [
+        ("Championship", "0 21 * * *"),
+        ("England", "0 22 * * *"),
+        ("Spain", "0 23 * * *"),
+        ("France", "0 0 * * *"),
+        ("Portugal", "0 1 * * *"),
+        ("Netherlands", "0 2 * * *"),
+        ("Turkey", "0 3 * * *"),
+        ("Germany", "0 4 * * *"),
+        ("Italy", "0 5 * * *"),
+        ("Russia", "0 6 * * *"),
+        ("ChampionsLeague", "0 7 * * *"),
+    ]
+] + [
+    ScheduledJobInfo(name="sports_players", job="sports_players", cron="15 * * * *"),
+]
+
+
+def create_runners() -> Dict[str, JobRunner]:
+    """
+    The daemon keeps one league updater and sports players DAO for all runs,
+    so parsers, browsers and db connections outlive a job.
+    """
+    league_updater = LeagueUpdater()
+    sports_player_dao = get_dao_provider().get(SportsPlayerDAO)
+
+    async def update_league_full(job: ScheduledJobInfo) -> Optional[str]:
+        report = await league_updater.update(job.league_name)
+        if report.failed:
+            return f"failed stages: {', '.join(report.failed)}"
+        return None
+
+    def update_sports_players() -> None:
+        sports_player_dao.update_players_all_leagues()
+        sports_player_dao.update_feature_store_all_leagues()
+
+    async def update_sports_players_async(job: ScheduledJobInfo) -> Optional[str]:
+        await asyncio.to_thread(update_sports_players)
+        return None
+
+    return {
+        "league_full": update_league_full,
+        "sports_players": update_sports_players_async,
+    }
+
+
+async def main():
+    dao = SchedulerDAO()
+    added = dao.add_jobs(DEFAULT_JOBS)
+    logger.info(f"Added {added} default jobs to the schedule")
+
+    scheduler = JobScheduler(dao, create_runners(), tick=SCHEDULER_TICK)
+    await scheduler.serve()
+
+
+if __name__ == "__main__":
+    create_db()
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 import asyncio
-from typing import List
+from functools import partial
+from typing import Optional
 import os.path as path
 import datetime
 import sys
@@ -8,9 +9,10 @@ from loguru import logger
 
 sys.path.insert(0, "/fantasy_helper")
 
-from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.conf.config import LEAGUE_PIPELINE_MAX_THREADS
+from fantasy_helper.utils.pipeline import Pipeline, PipelineReport, Stage
 from fantasy_helper.db.utils.create_db import create_db
-from fantasy_helper.utils.dataclasses import LeagueInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
 from fantasy_helper.db.dao.table import TableDao
 from fantasy_helper.db.dao.schedule import ScheduleDao
 from fantasy_helper.db.dao.fbref_schedule import FbrefScheduleDao
@@ -19,55 +21,101 @@ from fantasy_helper.db.dao.coeff import CoeffDAO
 from fantasy_helper.db.dao.sports_player import SportsPlayerDAO
 from fantasy_helper.db.dao.ml.naming import NamingDAO
 from fantasy_helper.db.dao.player import PlayerDAO
+from fantasy_helper.db.dao.provider import get_dao_provider
 
 
-async def main(league_name: str):
-    schedule_dao = ScheduleDao()
-    table_dao = TableDao()
-    calendar_dao = FSCalendarsDAO()
-    fbref_schedule_dao = FbrefScheduleDao()
-    coeff_dao = CoeffDAO()
-    sports_player_dao = SportsPlayerDAO()
-    naming_dao = NamingDAO()
-    player_dao = PlayerDAO()
-    
-    # update actual fbref names and players
-    player_dao.update_actual_players_stats(league_name)
-    naming_dao.update_league_naming(league_name)
-
-    # update main tables
-    schedule_dao.update_schedules(league_name)
-    table_dao.update_tables(league_name)
-    calendar_dao.update_calendar(league_name)
-    fbref_schedule_dao.update_schedule(league_name)
-
-    await coeff_dao.update_coeffs(league_name)
-    
-    # disable for separate script
-    # sports_player_dao.update_players(league_name)
-
-    # disable for player_dao.update_feature_store
-    # player_dao.update_players_stats(league_name)
-
-    # update feature stores
-    coeff_dao.update_feature_store(league_name)
-    # disable for separate script
-    # sports_player_dao.update_feature_store(league_name)
-    player_dao.update_feature_store(league_name)
-
-    import gc
-    gc.collect()
+class LeagueUpdater:
+    """
+    DAOs of the full league update, created once so a resident process such
+    as db/scripts/scheduler.py keeps their parsers, drivers and connections
+    warm between leagues.
+    """
+
+    def __init__(self, league_registry: Optional[LeagueRegistry] = None):
+        # the DAOs of the stages and their own DAOs and parsers are shared process wide
+        dao_provider = get_dao_provider(league_registry)
+        self.schedule_dao = dao_provider.get(ScheduleDao)
+        self.table_dao = dao_provider.get(TableDao)
+        self.calendar_dao = dao_provider.get(FSCalendarsDAO)
+        self.fbref_schedule_dao = dao_provider.get(FbrefScheduleDao)
+        self.coeff_dao = dao_provider.get(CoeffDAO)
+        self.sports_player_dao = dao_provider.get(SportsPlayerDAO)
+        self.naming_dao = dao_provider.get(NamingDAO)
+        self.player_dao = dao_provider.get(PlayerDAO)
+
+    def build_pipeline(self, league_name: str) -> Pipeline:
+        # stages sharing a scraped site hold its resource, so fbref is still parsed one page flow at a time
+        return Pipeline(league_name, [
+            # update actual fbref names and players
+            Stage(
+                "actual_players", partial(self.player_dao.update_actual_players_stats, league_name),
+                outputs=("actual_players",), resources=("fbref",)
+            ),
+            Stage(
+                "naming", partial(self.naming_dao.update_league_naming, league_name),
+                inputs=("actual_players",), outputs=("naming",)
+            ),
+
+            # update main tables
+            Stage("schedule", partial(self.schedule_dao.update_schedules, league_name), outputs=("schedule",)),
+            Stage(
+                "table", partial(self.table_dao.update_tables, league_name),
+                outputs=("table",), resources=("fbref",)
+            ),
+            Stage(
+                "calendar", partial(self.calendar_dao.update_calendar, league_name),
+                inputs=("schedule", "table", "naming"), outputs=("fs_calendar",)
+            ),
+            Stage(
+                "fbref_schedule", partial(self.fbref_schedule_dao.update_schedule, league_name),
+                outputs=("fbref_schedule", "players_matches"), resources=("fbref",)
+            ),
+            Stage("coeffs", partial(self.coeff_dao.update_coeffs, league_name), outputs=("coeffs",)),
+
+            # disable for separate script
+            # self.sports_player_dao.update_players(league_name)
+
+            # disable for player_dao.update_feature_store
+            # self.player_dao.update_players_stats(league_name)
+
+            # update feature stores
+            Stage(
+                "coeffs_feature_store", partial(self.coeff_dao.update_feature_store, league_name),
+                inputs=("coeffs", "schedule", "naming"), outputs=("fs_coeffs",)
+            ),
+            # disable for separate script
+            # self.sports_player_dao.update_feature_store(league_name)
+            Stage(
+                "players_feature_store", partial(self.player_dao.update_feature_store, league_name),
+                inputs=("players_matches", "naming"), outputs=("fs_players_stats",)
+            ),
+        ], max_threads=LEAGUE_PIPELINE_MAX_THREADS)
+
+    async def update(self, league_name: str) -> PipelineReport:
+        report = await self.build_pipeline(league_name).run()
+
+        import gc
+        gc.collect()
+
+        return report
+
+
+async def main(league_name: str) -> PipelineReport:
+    return await LeagueUpdater().update(league_name)
 
 
 if __name__ == "__main__":
     create_db()
-    cfg = load_config(config_path="../../conf", config_name="config")
-    all_leagues: List[LeagueInfo] = instantiate_leagues(cfg)
+    all_leagues = get_league_registry().leagues
 
     # add league name parameter
     if len(sys.argv) > 1:
         league_name = sys.argv[1]
-        asyncio.run(main(league_name))
+        reports = [asyncio.run(main(league_name))]
     else:
-        for league in all_leagues:
-            asyncio.run(main(league.name))
+        reports = [asyncio.run(main(league.name)) for league in all_leagues]
+
+    failed = [f"{report.name}: {', '.join(report.failed)}" for report in reports if report.failed]
+    if failed:
+        logger.error(f"Failed stages, {'; '.join(failed)}")
+        sys.exit(1)
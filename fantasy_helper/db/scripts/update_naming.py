@@ -1,3 +1,4 @@
+import asyncio
 import sys
 
 from loguru import logger
@@ -8,10 +9,14 @@ from fantasy_helper.db.utils.create_db import create_db
 from fantasy_helper.db.dao.ml.naming import NamingDAO
 
 
-if __name__ == "__main__":
+async def main():
     create_db()
 
     logger.info(f"Start update naming")
     dao = NamingDAO()
-    dao.update_naming_all_leagues()
+    await dao.update_naming_all_leagues()
     logger.info(f"Finish update naming")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
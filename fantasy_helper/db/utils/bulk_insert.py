@@ -0,0 +1,51 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Type
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session as SQLSession
+
+from fantasy_helper.conf.config import BULK_INSERT_BATCH_SIZE
+
+
+def bulk_insert(
+    db_session: SQLSession,
+    model: Type[Any],
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = BULK_INSERT_BATCH_SIZE,
+) -> int:
+    """
+    Inserts rows into the model table with one executemany per batch
+    instead of building an ORM object per row. The caller owns the
+    transaction.
+
+    Args:
+        db_session (SQLSession): The session to execute the inserts in.
+        model (Type[Any]): The declarative model of the target table.
+        rows (Iterable[Dict[str, Any]]): The column values of the new rows.
+        batch_size (int): The maximum number of rows sent in one statement.
+
+    Returns:
+        int: The number of inserted rows.
+
+    Raises:
+        TypeError: A row has a key that is not a column of the table, as
+            the model constructor does, so a renamed field is not lost.
+    """
+    table = model.__table__
+    columns = set(table.columns.keys())
+    statement = insert(table)
+
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        batch = list(islice(rows, max(batch_size, 1)))
+        for row in batch:
+            unknown = row.keys() - columns
+            if unknown:
+                raise TypeError(f"{', '.join(map(repr, sorted(unknown)))} are not columns of {table.name}")
+        if not batch:
+            break
+        db_session.execute(statement, batch)
+        inserted += len(batch)
+
+    return inserted
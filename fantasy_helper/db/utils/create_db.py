@@ -1,4 +1,4 @@
-from fantasy_helper.db.database import Base, db_engine
+from fantasy_helper.db.database import Base, create_database_if_missing, db_engine
 from fantasy_helper.db.models.coeff import Coeff
 from fantasy_helper.db.models.source import Source
 from fantasy_helper.db.models.user import User
@@ -18,8 +18,14 @@ from fantasy_helper.db.models.feature_store.fs_players_free_kicks import (
 )
 from fantasy_helper.db.models.feature_store.fs_sports_players import FSSportsPlayers
 from fantasy_helper.db.models.feature_store.fs_calendars import FSCalendars
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
 from fantasy_helper.db.models.ml.team_name import TeamName
 from fantasy_helper.db.models.ml.player_name import PlayerName
+from fantasy_helper.db.models.ml.naming_cache import NamingCache
+from fantasy_helper.db.models.scheduled_job import ScheduledJob
+from fantasy_helper.db.models.job_run import JobRun
 
 
 def create_db():
@@ -28,6 +34,7 @@ def create_db():
     NOTE: This is deprecated in favor of Alembic migrations.
     Use 'alembic upgrade head' instead.
     """
+    create_database_if_missing()
     Base.metadata.create_all(db_engine)
 
 
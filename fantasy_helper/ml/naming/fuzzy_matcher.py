@@ -0,0 +1,145 @@
+import re
+import unicodedata
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from fantasy_helper.utils.assignment import linear_sum_assignment
+
+
+CYRILLIC_TO_LATIN = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z",
+    "и": "i", "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r",
+    "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh",
+    "щ": "shch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+    "і": "i", "ї": "yi", "є": "ye", "ґ": "g",
+    # latin letters without a decomposition
+    "ø": "o", "æ": "ae", "œ": "oe", "ł": "l", "đ": "d", "ß": "ss", "ı": "i",
+})
+# spelling variants of the same sounds, folded on both sides after transliteration
+LATIN_FOLDS = (
+    ("shch", "sh"), ("tz", "c"), ("ts", "c"), ("ph", "f"), ("x", "ks"), ("w", "v"), ("q", "k"),
+    ("c", "k"), ("kh", "h"), ("j", "i"), ("y", "i"),
+)
+NGRAM_SIZE = 3
+INITIAL_SCORE = 0.9
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Lowercase latin form of a name: cyrillic is transliterated, diacritics,
+    punctuation and doubled letters are removed and spelling variants are
+    folded, e.g. "Фёдор Чалов" and "Fyodor Chalov" become "fedor halov" and
+    "fiodor halov".
+    """
+    name = (name or "").lower().translate(CYRILLIC_TO_LATIN)
+    name = "".join(ch for ch in unicodedata.normalize("NFKD", name) if not unicodedata.combining(ch))
+    name = re.sub(r"[^a-z0-9]+", " ", name)
+    for variant, folded in LATIN_FOLDS:
+        name = name.replace(variant, folded)
+    name = re.sub(r"([a-z])\1+", r"\1", name)
+    return " ".join(name.split())
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> List[str]:
+    padded = f" {text} "
+    return [padded[i:i + n] for i in range(max(len(padded) - n + 1, 0))] if text else []
+
+
+class NgramIndex:
+    """
+    Binary character n-gram vectors of a list of strings over a shared
+    vocabulary, so the similarities of two lists are one matrix product.
+    """
+
+    def __init__(self, texts_1: Sequence[str], texts_2: Sequence[str], n: int = NGRAM_SIZE):
+        ngrams_1 = [set(char_ngrams(text, n)) for text in texts_1]
+        ngrams_2 = [set(char_ngrams(text, n)) for text in texts_2]
+        vocabulary = {ngram: i for i, ngram in enumerate(sorted(set().union(*ngrams_1, *ngrams_2)))}
+        self._vectors_1 = self._vectorize(ngrams_1, vocabulary)
+        self._vectors_2 = self._vectorize(ngrams_2, vocabulary)
+
+    @staticmethod
+    def _vectorize(ngrams: List[set], vocabulary: Dict[str, int]) -> np.ndarray:
+        vectors = np.zeros((len(ngrams), len(vocabulary)), dtype=np.float32)
+        for row, text_ngrams in enumerate(ngrams):
+            vectors[row, [vocabulary[ngram] for ngram in text_ngrams]] = 1.0
+        return vectors
+
+    def similarity(self) -> np.ndarray:
+        """
+        Dice coefficients of the n-gram sets, 0 for empty strings.
+        """
+        common = self._vectors_1 @ self._vectors_2.T
+        sizes = self._vectors_1.sum(axis=1)[:, None] + self._vectors_2.sum(axis=1)[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(sizes > 0, 2.0 * common / sizes, 0.0)
+
+
+class FuzzyNameMatcher:
+    """
+    Offline matching of two lists of names of the same entities written by
+    different sources, possibly in different scripts. Every pair gets a score
+    in [0, 1]: the mean of the n-gram similarity of the whole names and of
+    their tokens, where every token of the shorter name is compared with its
+    best counterpart, so "Смолов" and "Fedor Smolov" still match. Pairs come
+    from the maximum score assignment and only confident ones are returned:
+    the score is high enough and ahead of every other candidate of both names.
+    """
+
+    def __init__(self, min_score: float = 0.75, min_margin: float = 0.2):
+        self._min_score = min_score
+        self._min_margin = min_margin
+
+    def score(self, names_1: Sequence[str], names_2: Sequence[str]) -> np.ndarray:
+        normalized_1 = [normalize_name(name) for name in names_1]
+        normalized_2 = [normalize_name(name) for name in names_2]
+        names_similarity = NgramIndex(normalized_1, normalized_2).similarity()
+
+        tokens_1 = [name.split() for name in normalized_1]
+        tokens_2 = [name.split() for name in normalized_2]
+        all_tokens_1 = sorted({token for tokens in tokens_1 for token in tokens})
+        all_tokens_2 = sorted({token for tokens in tokens_2 for token in tokens})
+        tokens_similarity = NgramIndex(all_tokens_1, all_tokens_2).similarity()
+        # an initial matches any token it starts
+        for i, token_1 in enumerate(all_tokens_1):
+            for j, token_2 in enumerate(all_tokens_2):
+                if (len(token_1) == 1 or len(token_2) == 1) and token_1[0] == token_2[0]:
+                    tokens_similarity[i, j] = max(tokens_similarity[i, j], INITIAL_SCORE)
+        token_2_id_1 = {token: i for i, token in enumerate(all_tokens_1)}
+        token_2_id_2 = {token: i for i, token in enumerate(all_tokens_2)}
+
+        result = np.zeros((len(names_1), len(names_2)))
+        for i, name_tokens_1 in enumerate(tokens_1):
+            if not name_tokens_1:
+                continue
+            rows = tokens_similarity[[token_2_id_1[token] for token in name_tokens_1]]
+            for j, name_tokens_2 in enumerate(tokens_2):
+                if not name_tokens_2:
+                    continue
+                pairs = rows[:, [token_2_id_2[token] for token in name_tokens_2]]
+                axis = 1 if len(name_tokens_1) <= len(name_tokens_2) else 0
+                result[i, j] = (names_similarity[i, j] + pairs.max(axis=axis).mean()) / 2.0
+        return result
+
+    def match(self, names_1: Sequence[str], names_2: Sequence[str]) -> Dict[str, str]:
+        """
+        Confident pairs of names of the first list to names of the second one,
+        the remaining names are left for a slower matcher.
+        """
+        if len(names_1) == 0 or len(names_2) == 0:
+            return {}
+
+        scores = self.score(names_1, names_2)
+        rows, columns = linear_sum_assignment(-scores)
+
+        result = {}
+        for row, column in zip(rows, columns):
+            score = scores[row, column]
+            competitors = np.concatenate([
+                np.delete(scores[row], column), np.delete(scores[:, column], row)
+            ])
+            runner_up = competitors.max() if len(competitors) else 0.0
+            if score >= self._min_score and score - runner_up >= self._min_margin:
+                result[names_1[row]] = names_2[column]
+        return result
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import os.path as path
 import json
 from datetime import datetime
@@ -8,28 +9,35 @@ import time
 
 from sqlalchemy.orm import Session as SQLSession
 from sqlalchemy import and_
-from openai import OpenAI
-import openai
-import httpx
 from loguru import logger
 
 from fantasy_helper.db.models.coeff import Coeff
 from fantasy_helper.db.models.actual_player import ActualPlayer
 from fantasy_helper.db.models.sports_player import SportsPlayer
 from fantasy_helper.db.database import Session
-from fantasy_helper.conf.config import PROXY_HOSTS, PROXY_PORTS, PROXY_USERS, PROXY_PASSWORDS, OPENROUTER_API_KEY
-from fantasy_helper.utils.common import instantiate_leagues, load_config
-from fantasy_helper.utils.dataclasses import LeagueInfo, PlayerName, TeamName
+from fantasy_helper.conf.config import (
+    PROXY_HOSTS, PROXY_PORTS, PROXY_USERS, PROXY_PASSWORDS, OPENROUTER_API_KEY,
+    NAMING_FUZZY_MIN_SCORE, NAMING_FUZZY_MIN_MARGIN, NAMING_CACHE_ENABLED, NAMING_LLM_RETRIES,
+    NAMING_LLM_BACKOFF
+)
+from fantasy_helper.db.dao.ml.naming_cache import NamingCacheDAO
+from fantasy_helper.utils.dataclasses import PlayerName, TeamName
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+    from fantasy_helper.ml.naming.fuzzy_matcher import FuzzyNameMatcher
 
 
 class NameMatcher:
-    def __init__(self, openai_model: str = "google/gemini-2.0-flash-001"):
-        proxy_url = f"http://{PROXY_USERS[-1]}:{PROXY_PASSWORDS[-1]}@{PROXY_HOSTS[-1]}:{PROXY_PORTS[-1]}"
-        self._openai_client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=OPENROUTER_API_KEY,
-            http_client=httpx.Client(proxy=proxy_url)
-        )
+    def __init__(
+        self,
+        openai_model: str = "google/gemini-2.0-flash-001",
+        use_cache: bool = NAMING_CACHE_ENABLED,
+        league_registry: Optional[LeagueRegistry] = None,
+    ):
+        self._proxy_url = f"http://{PROXY_USERS[-1]}:{PROXY_PASSWORDS[-1]}@{PROXY_HOSTS[-1]}:{PROXY_PORTS[-1]}"
         self._openai_model = openai_model
 
         self._teams_names_prompt = json.load(
@@ -38,13 +46,34 @@ class NameMatcher:
         self._players_names_prompt = json.load(
             open(path.join(path.dirname(__file__), "prompts/players_names.json"), "r")
         )
-        cfg = load_config(config_path="../../conf", config_name="config")
-        self._leagues: List[LeagueInfo] = instantiate_leagues(cfg)
-        self._league_2_year = {league.name: league.year for league in self._leagues}
+        self._league_registry = league_registry if league_registry is not None else get_league_registry()
         
+        self._use_cache = use_cache
+        self._naming_cache_dao = NamingCacheDAO()
+        self._cache_hits, self._cache_misses = 0, 0
+
         # Add retry configuration
-        self._max_retries = 3
+        self._max_retries = NAMING_LLM_RETRIES
         self._retry_delay = 5  # seconds
+        self._retry_backoff = NAMING_LLM_BACKOFF  # seconds, doubled on every async attempt
+
+    @cached_property
+    def _openai_client(self) -> "OpenAI":
+        # openai and httpx are imported on the first llm request, names lookups don't need them
+        import httpx
+        from openai import OpenAI
+
+        return OpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=OPENROUTER_API_KEY,
+            http_client=httpx.Client(proxy=self._proxy_url)
+        )
+
+    @cached_property
+    def _fuzzy_matcher(self) -> "FuzzyNameMatcher":
+        from fantasy_helper.ml.naming.fuzzy_matcher import FuzzyNameMatcher
+
+        return FuzzyNameMatcher(min_score=NAMING_FUZZY_MIN_SCORE, min_margin=NAMING_FUZZY_MIN_MARGIN)
 
     def get_sports_teams_names(self, league_name: str, year: str = "2024") -> Optional[List[str]]:
         db_session: SQLSession = Session()
@@ -165,10 +194,48 @@ class NameMatcher:
         all_team_names = [elem[0] for elem in home_team_names] + [elem[0] for elem in away_team_names]
         return sorted(set(all_team_names))
 
+    def _get_cached_result(self, kind: str, key: str) -> Optional[Dict[str, str]]:
+        if not self._use_cache:
+            return None
+
+        try:
+            result = self._naming_cache_dao.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read naming cache for {kind} names: {e}")
+            result = None
+
+        if result is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+        logger.info(
+            f"Naming cache {'hit' if result is not None else 'miss'} for {kind} names, "
+            f"hit rate {self._cache_hits}/{self._cache_hits + self._cache_misses}"
+        )
+        return result
+
+    def _put_cached_result(self, kind: str, key: str, result: Any) -> None:
+        if not self._use_cache or not isinstance(result, dict):
+            return
+
+        try:
+            self._naming_cache_dao.put(key, kind, self._openai_model, result)
+        except Exception as e:
+            logger.warning(f"Failed to write naming cache for {kind} names: {e}")
+
     def _get_match_teams_names(self, teams_names_1: List[str], teams_names_2: List[str]) -> Dict[str, str]:
+        import openai
+
         if len(teams_names_1) == 0 or len(teams_names_2) == 0:
             return {}
 
+        cache_key = self._naming_cache_dao.compute_key(
+            self._teams_names_prompt, self._openai_model, teams_names_1, teams_names_2
+        )
+        cached_result = self._get_cached_result("teams", cache_key)
+        if cached_result is not None:
+            return cached_result
+
         user_message = {"role": "user", "content": f"list 1: {teams_names_1}, list 2: {teams_names_2}"}
         
         for attempt in range(self._max_retries):
@@ -187,6 +254,7 @@ class NameMatcher:
 
                 result = json.loads(completion.choices[0].message.content)
                 logger.info(f"Successfully matched {len(result)} teams names for {teams_names_1[0]}... {teams_names_2[0]}...")
+                self._put_cached_result("teams", cache_key, result)
                 return result
             except openai.APIConnectionError as e:
                 logger.warning(f"API connection error when matching teams names (attempt {attempt + 1}/{self._max_retries}): {e}")
@@ -211,17 +279,42 @@ class NameMatcher:
         logger.error(f"All {self._max_retries} attempts failed for matching teams names")
         return {}
 
+    def _match_names_locally(
+        self, names_1: List[str], names_2: List[str]
+    ) -> Tuple[Dict[str, str], List[str], List[str]]:
+        """
+        Confident pairs of the fuzzy matcher and the names left for the llm.
+        """
+        result = self._fuzzy_matcher.match(names_1, names_2)
+        matched_names_2 = set(result.values())
+        names_1_left = [name for name in names_1 if name not in result]
+        names_2_left = [name for name in names_2 if name not in matched_names_2]
+        if names_1 and names_2:
+            logger.info(f"Matched {len(result)} of {len(names_1)} names locally for {names_1[0]}... {names_2[0]}...")
+        return result, names_1_left, names_2_left
+
     def match_teams_names(self, teams_names_1: List[str], teams_names_2: List[str]) -> Dict[str, str]:
-        result = self._get_match_teams_names(teams_names_1, teams_names_2)
-        teams_names_1_add = list(filter(lambda x: x not in result.keys(), teams_names_1))
-        teams_names_2_add = list(filter(lambda x: x not in result.values(), teams_names_2))
-        result.update(self._get_match_teams_names(teams_names_1_add, teams_names_2_add))
+        result, teams_names_1, teams_names_2 = self._match_names_locally(teams_names_1, teams_names_2)
+        llm_result = self._get_match_teams_names(teams_names_1, teams_names_2)
+        teams_names_1_add = list(filter(lambda x: x not in llm_result.keys(), teams_names_1))
+        teams_names_2_add = list(filter(lambda x: x not in llm_result.values(), teams_names_2))
+        llm_result.update(self._get_match_teams_names(teams_names_1_add, teams_names_2_add))
+        result.update(llm_result)
         return result
 
     def _get_match_players_names(self, players_names_1: List[str], players_names_2: List[str]) -> Dict[str, str]:
+        import openai
+
         if len(players_names_1) == 0 or len(players_names_2) == 0:
             return {}
 
+        cache_key = self._naming_cache_dao.compute_key(
+            self._players_names_prompt, self._openai_model, players_names_1, players_names_2
+        )
+        cached_result = self._get_cached_result("players", cache_key)
+        if cached_result is not None:
+            return cached_result
+
         user_message = {"role": "user", "content": f"list 1: {players_names_1}, list 2: {players_names_2}"}
         
         for attempt in range(self._max_retries):
@@ -240,6 +333,7 @@ class NameMatcher:
 
                 result = json.loads(completion.choices[0].message.content)
                 logger.info(f"Successfully matched {len(result)} players names for {players_names_1[0]}... {players_names_2[0]}...")
+                self._put_cached_result("players", cache_key, result)
                 return result
             except openai.APIConnectionError as e:
                 logger.warning(f"API connection error when matching players names (attempt {attempt + 1}/{self._max_retries}): {e}")
@@ -265,14 +359,16 @@ class NameMatcher:
         return {}
 
     def match_players_names(self, players_names_1: List[str], players_names_2: List[str]) -> Dict[str, str]:
+        result, players_names_1, players_names_2 = self._match_names_locally(players_names_1, players_names_2)
         try:
-            result = self._get_match_players_names(players_names_1, players_names_2)
-            players_names_1_add = list(filter(lambda x: x not in result.keys(), players_names_1))
-            players_names_2_add = list(filter(lambda x: x not in result.values(), players_names_2))
-            result.update(self._get_match_players_names(players_names_1_add, players_names_2_add))
+            llm_result = self._get_match_players_names(players_names_1, players_names_2)
+            players_names_1_add = list(filter(lambda x: x not in llm_result.keys(), players_names_1))
+            players_names_2_add = list(filter(lambda x: x not in llm_result.values(), players_names_2))
+            llm_result.update(self._get_match_players_names(players_names_1_add, players_names_2_add))
         except AttributeError:
             logger.error(f"Failed to parse matching result for {players_names_1[0]}... {players_names_2[0]}...")
-            result = {}
+            llm_result = {}
+        result.update(llm_result)
         return result
     
     def _compute_free_and_delete_elements(
@@ -311,7 +407,7 @@ class NameMatcher:
         return result
 
     def match_teams(self, league_name: str, teams_names: List[TeamName]) -> Tuple[List[TeamName], List[TeamName]]:
-        year = self._league_2_year.get(league_name, "2024")
+        year = self._league_registry.year(league_name)
         cur_sports_teams_names = self.get_sports_teams_names(league_name, year)
         cur_fbref_teams_names = self.get_fbref_teams_names(league_name, year)
         cur_betcity_teams_names = self.get_betcity_teams_names(league_name, year)
@@ -385,16 +481,19 @@ class NameMatcher:
 
         return teams_to_add, teams_to_delete
 
-    def match_players(
+    def _compute_players_to_match(
         self, league_name: str, team_name: TeamName, players_names: List[PlayerName]
-    ) -> Tuple[List[PlayerName], List[PlayerName]]:
-        year = self._league_2_year.get(league_name, "2024")
+    ) -> Tuple[List[str], List[str], List[PlayerName]]:
+        """
+        Sources players names of a team without a stored pair and stored pairs
+        of players gone from their sources.
+        """
+        year = self._league_registry.year(league_name)
         cur_sports_players_names = self.get_sports_players_names(league_name, team_name.sports_name, year)
         cur_fbref_players_names = self.get_fbref_players_names(league_name, team_name.fbref_name, year)
         logger.info(f"Cur players names for {team_name.name} in {league_name}: sports({len(cur_sports_players_names)}), fbref({len(cur_fbref_players_names)})")
 
-        free_sports_players_names, free_fbref_players_names = [], []
-        players_to_add, players_to_delete = [], []
+        players_to_delete = []
 
         cur_sports_name_2_player = {player_name.sports_name: player_name for player_name in players_names}
         cur_fbref_name_2_player = {player_name.fbref_name: player_name for player_name in players_names}
@@ -412,16 +511,142 @@ class NameMatcher:
                 sports_players_to_delete + fbref_players_to_delete
             ))
 
+        return free_sports_players_names, free_fbref_players_names, players_to_delete
+
+    @staticmethod
+    def _build_players_to_add(
+        league_name: str, team_name: TeamName, sports_2_fbref_players: Dict[str, str]
+    ) -> List[PlayerName]:
+        return [
+            PlayerName(
+                league_name=league_name,
+                team_name=team_name.name,
+                sports_name=k,
+                fbref_name=v,
+            )
+            for k, v in sports_2_fbref_players.items()
+        ]
+
+    def match_players(
+        self, league_name: str, team_name: TeamName, players_names: List[PlayerName]
+    ) -> Tuple[List[PlayerName], List[PlayerName]]:
+        free_sports_players_names, free_fbref_players_names, players_to_delete = self._compute_players_to_match(
+            league_name, team_name, players_names
+        )
+
         # compute new players names
+        players_to_add = []
         if free_sports_players_names or free_fbref_players_names:
             sports_2_fbref_players = self.match_players_names(free_sports_players_names, free_fbref_players_names)
+            players_to_add = self._build_players_to_add(league_name, team_name, sports_2_fbref_players)
+
+        return players_to_add, players_to_delete
 
-            for k, v in sports_2_fbref_players.items():
-                players_to_add.append(PlayerName(
-                    league_name=league_name,
-                    team_name=team_name.name,
-                    sports_name=k, 
-                    fbref_name=v,
-                ))
+    def create_async_openai_client(self) -> "AsyncOpenAI":
+        """
+        Client for the async llm requests, its connections are bound to the
+        running event loop, so it is created and closed (`async with`) per loop.
+        """
+        import httpx
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=OPENROUTER_API_KEY,
+            http_client=httpx.AsyncClient(proxy=self._proxy_url)
+        )
+
+    async def _sleep_before_retry(self, attempt: int) -> None:
+        if attempt < self._max_retries - 1:
+            # exponential backoff with jitter, so concurrent requests don't retry at once
+            await asyncio.sleep(self._retry_backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+    async def _aget_match_names(
+        self,
+        client: "AsyncOpenAI",
+        kind: str,
+        prompt: List[Dict[str, str]],
+        names_1: List[str],
+        names_2: List[str]
+    ) -> Dict[str, str]:
+        import openai
+
+        if len(names_1) == 0 or len(names_2) == 0:
+            return {}
+
+        cache_key = self._naming_cache_dao.compute_key(prompt, self._openai_model, names_1, names_2)
+        cached_result = await asyncio.to_thread(self._get_cached_result, kind, cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        user_message = {"role": "user", "content": f"list 1: {names_1}, list 2: {names_2}"}
+
+        for attempt in range(self._max_retries):
+            try:
+                completion = await client.chat.completions.create(
+                    model=self._openai_model,
+                    messages=prompt + [user_message],
+                    response_format={"type": "json_object"},
+                )
+
+                if completion.choices is None:
+                    logger.warning(f"Failed to match {kind} names for {names_1[0]}... {names_2[0]}... (attempt {attempt + 1}/{self._max_retries})")
+                    await self._sleep_before_retry(attempt)
+                    continue
+
+                result = json.loads(completion.choices[0].message.content)
+                logger.info(f"Successfully matched {len(result)} {kind} names for {names_1[0]}... {names_2[0]}...")
+                await asyncio.to_thread(self._put_cached_result, kind, cache_key, result)
+                return result
+            except (openai.APIConnectionError, openai.RateLimitError) as e:
+                logger.warning(f"API {type(e).__name__} when matching {kind} names (attempt {attempt + 1}/{self._max_retries}): {e}")
+                await self._sleep_before_retry(attempt)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse response for {names_1[0]}... {names_2[0]}... (attempt {attempt + 1}/{self._max_retries}): {e}")
+                await self._sleep_before_retry(attempt)
+            except Exception as e:
+                logger.exception(f"Unexpected error when matching {kind} names (attempt {attempt + 1}/{self._max_retries}): {e}")
+                break
+
+        logger.error(f"All {self._max_retries} attempts failed for matching {kind} names")
+        return {}
+
+    async def amatch_players_names(
+        self, client: "AsyncOpenAI", players_names_1: List[str], players_names_2: List[str]
+    ) -> Dict[str, str]:
+        result, players_names_1, players_names_2 = self._match_names_locally(players_names_1, players_names_2)
+        try:
+            llm_result = await self._aget_match_names(
+                client, "players", self._players_names_prompt, players_names_1, players_names_2
+            )
+            players_names_1_add = list(filter(lambda x: x not in llm_result.keys(), players_names_1))
+            players_names_2_add = list(filter(lambda x: x not in llm_result.values(), players_names_2))
+            llm_result.update(await self._aget_match_names(
+                client, "players", self._players_names_prompt, players_names_1_add, players_names_2_add
+            ))
+        except AttributeError:
+            logger.error(f"Failed to parse matching result for {players_names_1[0]}... {players_names_2[0]}...")
+            llm_result = {}
+        result.update(llm_result)
+        return result
+
+    async def amatch_players(
+        self, client: "AsyncOpenAI", league_name: str, team_name: TeamName, players_names: List[PlayerName]
+    ) -> Tuple[List[PlayerName], List[PlayerName]]:
+        """
+        match_players of the async naming update: db lookups run in a worker
+        thread and llm requests go through the async client.
+        """
+        free_sports_players_names, free_fbref_players_names, players_to_delete = await asyncio.to_thread(
+            self._compute_players_to_match, league_name, team_name, players_names
+        )
+
+        # compute new players names
+        players_to_add = []
+        if free_sports_players_names or free_fbref_players_names:
+            sports_2_fbref_players = await self.amatch_players_names(
+                client, free_sports_players_names, free_fbref_players_names
+            )
+            players_to_add = self._build_players_to_add(league_name, team_name, sports_2_fbref_players)
 
         return players_to_add, players_to_delete
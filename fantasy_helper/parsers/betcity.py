@@ -7,24 +7,21 @@ import os
 import json
 import time
 import pytz
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from playwright._impl._errors import Error as PlaywrightError
 from bs4 import BeautifulSoup
 from loguru import logger
 
-from fantasy_helper.conf.config import PROXY_HOSTS, PROXY_PORTS, PROXY_USERS, PROXY_PASSWORDS
+from fantasy_helper.conf.config import BETCITY_MAX_CONCURRENT_PAGES, PROXY_HOSTS, PROXY_PORTS, PROXY_USERS, PROXY_PASSWORDS
 from fantasy_helper.utils.dataclasses import LeagueInfo, MatchInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry
 
 
 class BetcityParser:
-    def __init__(self, leagues: List[LeagueInfo]):
-        self._leagues = {
-            l.name: l.betcity_url
-            for l in leagues
-            if l.betcity_url is not None and l.is_active
-        }
+    def __init__(self, leagues: Union[LeagueRegistry, List[LeagueInfo]]):
+        self._leagues = as_league_registry(leagues).source("betcity_url")
 
         self._bet_group_methods = {
             "обе забьют": self._parse_both_scores_bets,
@@ -38,12 +35,10 @@ class BetcityParser:
         self._max_retries = 3
         self._retry_delay = 10  # seconds - increased delay
         self._page_timeout = 60  # seconds - increased timeout
+        self._max_concurrent_pages = BETCITY_MAX_CONCURRENT_PAGES
 
-    async def _create_browser_context(self, use_proxy: bool = True, attempt: int = 0) -> tuple[Browser, BrowserContext]:
-        """Create a Playwright browser context with optional proxy configuration."""
-        playwright = await async_playwright().start()
-        
-        # Browser launch options
+    async def _launch_browser(self, playwright: Any) -> Browser:
+        """Launch a headless Chromium shared by all pages of a league run."""
         launch_options = {
             "headless": True,
             "args": [
@@ -52,7 +47,10 @@ class BetcityParser:
                 "--disable-features=VizDisplayCompositor"
             ]
         }
-        
+        return await playwright.chromium.launch(**launch_options)
+
+    async def _create_browser_context(self, browser: Browser, use_proxy: bool = True, attempt: int = 0) -> BrowserContext:
+        """Create a Playwright browser context with optional proxy configuration."""
         USER_AGENTS = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -93,33 +91,29 @@ class BetcityParser:
                 "password": proxy_password
             }
         
-        browser = await playwright.chromium.launch(**launch_options)
         context = await browser.new_context(**context_options)
         
         # Block images and CSS for faster loading
         await context.route("**/*.{png,jpg,jpeg,gif,svg,css}", lambda route: route.abort())
     
-        return playwright, browser, context
+        return context
 
-    async def _parse_league_matches(self, league_name: str) -> Optional[List[MatchInfo]]:
+    async def _parse_league_matches(self, browser: Browser, league_name: str) -> Optional[List[MatchInfo]]:
         if league_name not in self._leagues:
             return None
 
         result = []
-        playwright = None
-        browser = None
-        context = None
         use_proxy = True
 
         for attempt in range(self._max_retries):
+            context = None
             try:
-                playwright, browser, context = await self._create_browser_context(use_proxy=use_proxy, attempt=attempt)
+                context = await self._create_browser_context(browser, use_proxy=use_proxy, attempt=attempt)
                 page = await context.new_page()
                 page.set_default_timeout(self._page_timeout * 1000)  # Playwright uses milliseconds
                 
                 logger.info(f"Attempt {attempt + 1}: Getting league matches from {self._leagues[league_name]} (proxy: {use_proxy})")
                 await page.goto(self._leagues[league_name])
-                await page.wait_for_timeout(3000)  # 3 seconds
 
                 champ_line = await page.wait_for_selector(".line__champ", timeout=10000)
                 if champ_line is None:
@@ -175,10 +169,6 @@ class BetcityParser:
             finally:
                 if context is not None:
                     await context.close()
-                if browser is not None:
-                    await browser.close()
-                if playwright is not None:
-                    await playwright.stop()
 
         return result
 
@@ -556,9 +546,8 @@ class BetcityParser:
 
     async def _parse_header_bets(self, page: Page, match_info: MatchInfo) -> MatchInfo:
         try:
-            await page.wait_for_load_state('networkidle', timeout=30000)
-            
-            line_header = await page.wait_for_selector(".line__header", timeout=3000)
+            # the bets are rendered by scripts after domcontentloaded
+            line_header = await page.wait_for_selector(".line__header", timeout=30000)
             if line_header is None:
                 logger.warning(f"Line header not found for match: {match_info.url}")
                 return match_info
@@ -585,23 +574,19 @@ class BetcityParser:
 
         return match_info
 
-    async def _parse_match(self, match_info: MatchInfo) -> MatchInfo:
-        playwright = None
-        browser = None
-        context = None
+    async def _parse_match(self, browser: Browser, match_info: MatchInfo) -> MatchInfo:
         use_proxy = True
 
         for attempt in range(self._max_retries):
+            context = None
             try:
-                playwright, browser, context = await self._create_browser_context(use_proxy=use_proxy, attempt=attempt)
+                context = await self._create_browser_context(browser, use_proxy=use_proxy, attempt=attempt)
                 page = await context.new_page()
                 page.set_default_timeout(self._page_timeout * 1000)
 
                 logger.info(f"Attempt {attempt + 1}: Parsing match {match_info.url} (proxy: {use_proxy})")
                 
-                response = await page.goto(match_info.url, wait_until='domcontentloaded', timeout=30000)
-                await page.wait_for_timeout(3000)
-                await page.wait_for_load_state('networkidle', timeout=30000)
+                await page.goto(match_info.url, wait_until='domcontentloaded', timeout=30000)
 
                 match_info = await self._parse_header_bets(page, match_info)
                 match_info = await self._parse_main_bets(page, match_info)
@@ -628,26 +613,39 @@ class BetcityParser:
             finally:
                 if context is not None:
                     await context.close()
-                if browser is not None:
-                    await browser.close()
-                if playwright is not None:
-                    await playwright.stop()
 
         return match_info
 
     async def get_league_matches(self, league_name: str) -> List[MatchInfo]:
         result = []
         logger.info(f"get betcity matches for {league_name}")
-        league_matches = await self._parse_league_matches(league_name)
-        if league_matches is not None:
-            for match in league_matches:
-                parsed_match = await self._parse_match(match)
-                if (
-                    parsed_match.total_1_over_1_5 is not None
-                    or parsed_match.total_1_under_0_5 is not None
-                    or parsed_match.total_2_over_1_5 is not None
-                    or parsed_match.total_2_under_0_5 is not None
-                ):
-                    result.append(parsed_match)
+
+        async with async_playwright() as playwright:
+            browser = await self._launch_browser(playwright)
+            try:
+                league_matches = await self._parse_league_matches(browser, league_name)
+                if league_matches is None:
+                    return result
+
+                semaphore = asyncio.Semaphore(self._max_concurrent_pages)
+
+                async def parse_match(match: MatchInfo) -> MatchInfo:
+                    async with semaphore:
+                        return await self._parse_match(browser, match)
+
+                parsed_matches = await asyncio.gather(
+                    *(parse_match(match) for match in league_matches)
+                )
+            finally:
+                await browser.close()
+
+        for parsed_match in parsed_matches:
+            if (
+                parsed_match.total_1_over_1_5 is not None
+                or parsed_match.total_1_under_0_5 is not None
+                or parsed_match.total_2_over_1_5 is not None
+                or parsed_match.total_2_under_0_5 is not None
+            ):
+                result.append(parsed_match)
 
         return result
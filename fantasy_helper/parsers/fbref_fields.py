@@ -0,0 +1,428 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def cast_to_float(text: str) -> Optional[float]:
+    if not text:
+        return None
+    try:
+        return float(text.strip())
+    except ValueError:
+        logging.warning(f"To float: text={text} len={len(text)}")
+        return None
+
+
+def cast_to_int(text: str) -> Optional[int]:
+    if not text:
+        return None
+    elif "," in text:
+        text = text.replace(",", "").strip()
+    elif "(" in text and ")" in text:
+        text = re.sub(r"\(.*?\)", "", text).strip()
+    else:
+        text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        logging.warning(f"To int: text={text} len={len(text)}")
+        return None
+
+
+def cast_to_nationality(text: str) -> str:
+    return text.split(" ")[-1]
+
+
+@dataclass(frozen=True)
+class StatField:
+    name: str
+    data_stat: str
+    cast: Callable[[str], Any] = cast_to_int
+
+
+def decode_row(row: Any) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Walk the cells of a table row once.
+
+    Returns text of the `td` cells and the `th` cells themselves (their
+    attributes carry player ids), both keyed by `data-stat`.
+    """
+    cells: Dict[str, str] = {}
+    header_cells: Dict[str, Any] = {}
+    for cell in row:
+        data_stat = cell.get("data-stat") if isinstance(cell.tag, str) else None
+        if data_stat is None:
+            continue
+        if cell.tag == "td":
+            cells[data_stat] = cell.text_content()
+        elif cell.tag == "th":
+            header_cells[data_stat] = cell
+    return cells, header_cells
+
+
+def decode_fields(cells: Dict[str, str], fields: Tuple[StatField, ...]) -> Dict[str, Any]:
+    result = {}
+    for field in fields:
+        text = cells.get(field.data_stat)
+        result[field.name] = field.cast(text) if text is not None else None
+    return result
+
+
+PLAYING_TIME_FIELDS: Tuple[StatField, ...] = (
+    StatField("games", "games"),
+    StatField("minutes", "minutes"),
+    StatField("minutes_per_game", "minutes_per_game"),
+    StatField("minutes_pct", "minutes_pct", cast_to_float),
+    StatField("minutes_90s", "minutes_90s", cast_to_float),
+    StatField("games_starts", "games_starts"),
+    StatField("minutes_per_start", "minutes_per_start"),
+    StatField("games_complete", "games_complete"),
+    StatField("games_subs", "games_subs"),
+    StatField("minutes_per_sub", "minutes_per_sub"),
+    StatField("unused_subs", "unused_subs"),
+    StatField("points_per_game", "points_per_game", cast_to_float),
+    StatField("on_goals_for", "on_goals_for"),
+    StatField("on_goals_against", "on_goals_against"),
+    StatField("plus_minus", "plus_minus"),
+    StatField("plus_minus_per90", "plus_minus_per90", cast_to_float),
+    StatField("plus_minus_wowy", "plus_minus_wowy", cast_to_float),
+    StatField("on_xg_for", "on_xg_for", cast_to_float),
+    StatField("on_xg_against", "on_xg_against", cast_to_float),
+    StatField("xg_plus_minus", "xg_plus_minus", cast_to_float),
+    StatField("xg_plus_minus_per90", "xg_plus_minus_per90", cast_to_float),
+    StatField("xg_plus_minus_wowy", "xg_plus_minus_wowy", cast_to_float),
+)
+
+STANDART_FIELDS: Tuple[StatField, ...] = (
+    StatField("games", "games"),
+    StatField("games_starts", "games_starts"),
+    StatField("minutes", "minutes"),
+    StatField("goals", "goals"),
+    StatField("assists", "assists"),
+    StatField("yellow_cards", "cards_yellow"),
+    StatField("red_cards", "cards_red"),
+)
+
+SHOOTING_FIELDS: Tuple[StatField, ...] = (
+    StatField("goals", "goals"),
+    StatField("shots", "shots"),
+    StatField("shots_on_target", "shots_on_target"),
+    StatField("shots_on_target_pct", "shots_on_target_pct", cast_to_float),
+    StatField("shots_per90", "shots_per_90", cast_to_float),
+    StatField("shots_on_target_per90", "shots_on_target_per90", cast_to_float),
+    StatField("goals_per_shot", "goals_per_shot", cast_to_float),
+    StatField("goals_per_shot_on_target", "goals_per_shot_on_target", cast_to_float),
+    StatField("average_shot_distance", "average_shot_distance", cast_to_float),
+    StatField("shots_free_kicks", "shots_free_kicks"),
+    StatField("pens_made", "pens_made"),
+    StatField("pens_att", "pens_att"),
+    StatField("xg", "xg", cast_to_float),
+    StatField("npxg", "npxg", cast_to_float),
+    StatField("xa", "xa", cast_to_float),
+    StatField("npxg_per_shot", "npxg_per_shot", cast_to_float),
+    StatField("xg_net", "xg_net", cast_to_float),
+    StatField("npxg_net", "npxg_net", cast_to_float),
+)
+
+PASSING_FIELDS: Tuple[StatField, ...] = (
+    StatField("passes_completed", "passes_completed"),
+    StatField("passes", "passes"),
+    StatField("passes_pct", "passes_pct", cast_to_float),
+    StatField("passes_total_distance", "passes_total_distance"),
+    StatField("passes_progressive_distance", "passes_progressive_distance"),
+    StatField("passes_short", "passes_short"),
+    StatField("passes_completed_short", "passes_completed_short"),
+    StatField("passes_pct_short", "passes_pct_short", cast_to_float),
+    StatField("passes_medium", "passes_medium"),
+    StatField("passes_completed_medium", "passes_completed_medium"),
+    StatField("passes_pct_medium", "passes_pct_medium", cast_to_float),
+    StatField("passes_long", "passes_long"),
+    StatField("passes_completed_long", "passes_completed_long"),
+    StatField("passes_pct_long", "passes_pct_long", cast_to_float),
+    StatField("assists", "assists"),
+    StatField("xg_assist", "xg_assist", cast_to_float),
+    StatField("pass_xa", "pass_xa", cast_to_float),
+    StatField("xg_assist_net", "xg_assist_net", cast_to_float),
+    StatField("assisted_shots", "assisted_shots"),
+    StatField("passes_into_final_third", "passes_into_final_third"),
+    StatField("passes_into_penalty_area", "passes_into_penalty_area"),
+    StatField("crosses_into_penalty_area", "crosses_into_penalty_area"),
+    StatField("progressive_passes", "progressive_passes"),
+)
+
+PASS_TYPES_FIELDS: Tuple[StatField, ...] = (
+    StatField("passes_live", "passes_live"),
+    StatField("passes_dead", "passes_dead"),
+    StatField("passes_free_kicks", "passes_free_kicks"),
+    StatField("through_balls", "through_balls"),
+    StatField("passes_switches", "passes_switches"),
+    StatField("crosses", "crosses"),
+    StatField("throw_ins", "throw_ins"),
+    StatField("corner_kicks", "corner_kicks"),
+    StatField("corner_kicks_in", "corner_kicks_in"),
+    StatField("corner_kicks_out", "corner_kicks_out"),
+    StatField("corner_kicks_straight", "corner_kicks_straight"),
+    StatField("passes_completed", "passes_completed"),
+    StatField("passes_offsides", "passes_offsides"),
+    StatField("passes_blocked", "passes_blocked"),
+)
+
+POSSESSION_FIELDS: Tuple[StatField, ...] = (
+    StatField("touches", "touches"),
+    StatField("touches_def_pen_area", "touches_def_pen_area"),
+    StatField("touches_def_3rd", "touches_def_3rd"),
+    StatField("touches_mid_3rd", "touches_mid_3rd"),
+    StatField("touches_att_3rd", "touches_att_3rd"),
+    StatField("touches_att_pen_area", "touches_att_pen_area"),
+    StatField("touches_live_ball", "touches_live_ball"),
+    StatField("take_ons", "take_ons"),
+    StatField("take_ons_won", "take_ons_won"),
+    StatField("take_ons_won_pct", "take_ons_won_pct", cast_to_float),
+    StatField("take_ons_tackled", "take_ons_tackled"),
+    StatField("take_ons_tackled_pct", "take_ons_tackled_pct", cast_to_float),
+    StatField("carries", "carries"),
+    StatField("carries_distance", "carries_distance"),
+    StatField("carries_progressive_distance", "carries_progressive_distance"),
+    StatField("progressive_carries", "progressive_carries"),
+    StatField("carries_into_final_third", "carries_into_final_third"),
+    StatField("carries_into_penalty_area", "carries_into_penalty_area"),
+    StatField("miscontrols", "miscontrols"),
+    StatField("dispossessed", "dispossessed"),
+    StatField("passes_received", "passes_received"),
+    StatField("progressive_passes_received", "progressive_passes_received"),
+)
+
+SHOT_CREATION_FIELDS: Tuple[StatField, ...] = (
+    StatField("sca", "sca"),
+    StatField("sca_per90", "sca_per90", cast_to_float),
+    StatField("sca_passes_live", "sca_passes_live"),
+    StatField("sca_passes_dead", "sca_passes_dead"),
+    StatField("sca_take_ons", "sca_take_ons"),
+    StatField("sca_shots", "sca_shots"),
+    StatField("sca_fouled", "sca_fouled"),
+    StatField("sca_defense", "sca_defense"),
+    StatField("gca", "gca"),
+    StatField("gca_per90", "gca_per90", cast_to_float),
+    StatField("gca_passes_live", "gca_passes_live"),
+    StatField("gca_passes_dead", "gca_passes_dead"),
+    StatField("gca_take_ons", "gca_take_ons"),
+    StatField("gca_shots", "gca_shots"),
+    StatField("gca_fouled", "gca_fouled"),
+    StatField("gca_defense", "gca_defense"),
+)
+
+MATCH_SUMMARY_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("goals", "goals"),
+    StatField("assists", "assists"),
+    StatField("pens_made", "pens_made"),
+    StatField("pens_att", "pens_att"),
+    StatField("shots", "shots"),
+    StatField("shots_on_target", "shots_on_target"),
+    StatField("yellow_cards", "cards_yellow"),
+    StatField("red_cards", "cards_red"),
+    StatField("touches", "touches"),
+    StatField("tackles", "tackles"),
+    StatField("interceptions", "interceptions"),
+    StatField("blocks", "blocks"),
+    StatField("xg", "xg", cast_to_float),
+    StatField("xg_np", "npxg", cast_to_float),
+    StatField("xg_assist", "xg_assist", cast_to_float),
+    StatField("sca", "sca", cast_to_float),
+    StatField("gca", "gca", cast_to_float),
+    StatField("passes_completed", "passes_completed"),
+    StatField("passes", "passes"),
+    StatField("passes_pct", "passes_pct", cast_to_float),
+    StatField("progressive_passes", "progressive_passes"),
+    StatField("carries", "carries"),
+    StatField("progressive_carries", "progressive_carries"),
+    StatField("take_ons", "take_ons"),
+    StatField("take_ons_won", "take_ons_won"),
+)
+
+MATCH_PASSING_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("passes_completed", "passes_completed"),
+    StatField("passes", "passes"),
+    StatField("passes_pct", "passes_pct", cast_to_float),
+    StatField("passes_total_distance", "passes_total_distance"),
+    StatField("passes_progressive_distance", "passes_progressive_distance"),
+    StatField("passes_short", "passes_short"),
+    StatField("passes_completed_short", "passes_completed_short"),
+    StatField("passes_pct_short", "passes_pct_short", cast_to_float),
+    StatField("passes_medium", "passes_medium"),
+    StatField("passes_completed_medium", "passes_completed_medium"),
+    StatField("passes_pct_medium", "passes_pct_medium", cast_to_float),
+    StatField("passes_long", "passes_long"),
+    StatField("passes_completed_long", "passes_completed_long"),
+    StatField("passes_pct_long", "passes_pct_long", cast_to_float),
+    StatField("assists", "assists"),
+    StatField("xg_assist", "xg_assist", cast_to_float),
+    StatField("pass_xa", "pass_xa", cast_to_float),
+    StatField("assisted_shots", "assisted_shots"),
+    StatField("passes_into_final_third", "passes_into_final_third"),
+    StatField("passes_into_penalty_area", "passes_into_penalty_area"),
+    StatField("crosses_into_penalty_area", "crosses_into_penalty_area"),
+    StatField("progressive_passes", "progressive_passes"),
+)
+
+MATCH_PASS_TYPES_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("passes_live", "passes_live"),
+    StatField("passes_dead", "passes_dead"),
+    StatField("passes_free_kicks", "passes_free_kicks"),
+    StatField("through_balls", "through_balls"),
+    StatField("passes_switches", "passes_switches"),
+    StatField("crosses", "crosses"),
+    StatField("throw_ins", "throw_ins"),
+    StatField("corner_kicks", "corner_kicks"),
+    StatField("corner_kicks_in", "corner_kicks_in"),
+    StatField("corner_kicks_out", "corner_kicks_out"),
+    StatField("corner_kicks_straight", "corner_kicks_straight"),
+    StatField("passes_completed", "passes_completed"),
+    StatField("passes_offsides", "passes_offsides"),
+    StatField("passes_blocked", "passes_blocked"),
+)
+
+MATCH_DEFENSIVE_ACTIONS_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("tackles", "tackles"),
+    StatField("tackles_won", "tackles_won"),
+    StatField("tackles_def_3rd", "tackles_def_3rd"),
+    StatField("tackles_mid_3rd", "tackles_mid_3rd"),
+    StatField("tackles_att_3rd", "tackles_att_3rd"),
+    StatField("challenge_tackles", "challenge_tackles"),
+    StatField("challenges", "challenges"),
+    StatField("challenge_tackles_pct", "challenge_tackles_pct", cast_to_float),
+    StatField("challenges_lost", "challenges_lost"),
+    StatField("blocks", "blocks"),
+    StatField("blocked_shots", "blocked_shots"),
+    StatField("blocked_passes", "blocked_passes"),
+    StatField("interceptions", "interceptions"),
+    StatField("tackles_interceptions", "tackles_interceptions"),
+    StatField("clearances", "clearances"),
+    StatField("errors", "errors"),
+)
+
+MATCH_POSSESSION_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("touches", "touches"),
+    StatField("touches_def_pen_area", "touches_def_pen_area"),
+    StatField("touches_def_3rd", "touches_def_3rd"),
+    StatField("touches_mid_3rd", "touches_mid_3rd"),
+    StatField("touches_att_3rd", "touches_att_3rd"),
+    StatField("touches_att_pen_area", "touches_att_pen_area"),
+    StatField("touches_live_ball", "touches_live_ball"),
+    StatField("take_ons", "take_ons"),
+    StatField("take_ons_won", "take_ons_won"),
+    StatField("take_ons_won_pct", "take_ons_won_pct", cast_to_float),
+    StatField("take_ons_tackled", "take_ons_tackled"),
+    StatField("take_ons_tackled_pct", "take_ons_tackled_pct", cast_to_float),
+    StatField("carries", "carries"),
+    StatField("carries_distance", "carries_distance"),
+    StatField("carries_progressive_distance", "carries_progressive_distance"),
+    StatField("progressive_carries", "progressive_carries"),
+    StatField("carries_into_final_third", "carries_into_final_third"),
+    StatField("carries_into_penalty_area", "carries_into_penalty_area"),
+    StatField("miscontrols", "miscontrols"),
+    StatField("dispossessed", "dispossessed"),
+    StatField("passes_received", "passes_received"),
+    StatField("progressive_passes_received", "progressive_passes_received"),
+)
+
+MATCH_MISCELLANEOUS_FIELDS: Tuple[StatField, ...] = (
+    StatField("shirt_number", "shirtnumber"),
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("position", "position", str),
+    StatField("minutes", "minutes"),
+    StatField("yellow_cards", "cards_yellow"),
+    StatField("red_cards", "cards_red"),
+    StatField("yellow_red_cards", "cards_yellow_red"),
+    StatField("fouls", "fouls"),
+    StatField("fouled", "fouled"),
+    StatField("offsides", "offsides"),
+    StatField("crosses", "crosses"),
+    StatField("interceptions", "interceptions"),
+    StatField("tackles_won", "tackles_won"),
+    StatField("pens_won", "pens_won"),
+    StatField("pens_conceded", "pens_conceded"),
+    StatField("own_goals", "own_goals"),
+    StatField("ball_recoveries", "ball_recoveries"),
+    StatField("aerials_won", "aerials_won"),
+    StatField("aerials_lost", "aerials_lost"),
+    StatField("aerials_won_pct", "aerials_won_pct", cast_to_float),
+)
+
+MATCH_GOALKEEPER_FIELDS: Tuple[StatField, ...] = (
+    StatField("nationality", "nationality", cast_to_nationality),
+    StatField("minutes", "minutes"),
+    StatField("gk_shots_on_target_against", "gk_shots_on_target_against"),
+    StatField("gk_goals_against", "gk_goals_against"),
+    StatField("gk_saves", "gk_saves"),
+    StatField("gk_save_pct", "gk_save_pct", cast_to_float),
+    StatField("gk_psxg", "gk_psxg", cast_to_float),
+    StatField("gk_passes_completed_launched", "gk_passes_completed_launched"),
+    StatField("gk_passes_launched", "gk_passes_launched"),
+    StatField("gk_passes_pct_launched", "gk_passes_pct_launched", cast_to_float),
+    StatField("gk_passes", "gk_passes"),
+    StatField("gk_passes_throws", "gk_passes_throws"),
+    StatField("gk_pct_passes_launched", "gk_pct_passes_launched", cast_to_float),
+    StatField("gk_passes_length_avg", "gk_passes_length_avg", cast_to_float),
+    StatField("gk_goal_kicks", "gk_goal_kicks"),
+    StatField("gk_pct_goal_kicks_launched", "gk_pct_goal_kicks_launched", cast_to_float),
+    StatField("gk_goal_kick_length_avg", "gk_goal_kick_length_avg", cast_to_float),
+    StatField("gk_crosses", "gk_crosses"),
+    StatField("gk_crosses_stopped", "gk_crosses_stopped"),
+    StatField("gk_crosses_stopped_pct", "gk_crosses_stopped_pct", cast_to_float),
+    StatField("gk_def_actions_outside_pen_area", "gk_def_actions_outside_pen_area"),
+    StatField("gk_avg_distance_def_actions", "gk_avg_distance_def_actions", cast_to_float),
+)
+
+@dataclass(frozen=True)
+class MatchStatsSection:
+    anchor_class: str
+    table_id: str
+    title: str
+    fields: Tuple[StatField, ...]
+
+
+MATCH_STATS_SECTIONS: Tuple[MatchStatsSection, ...] = (
+    MatchStatsSection(
+        "assoc_stats_{team_id}_summary", "div_stats_{team_id}_summary", "Player Stats", MATCH_SUMMARY_FIELDS
+    ),
+    MatchStatsSection(
+        "assoc_stats_{team_id}_passing", "div_stats_{team_id}_passing", "Player Stats", MATCH_PASSING_FIELDS
+    ),
+    MatchStatsSection(
+        "assoc_stats_{team_id}_passing_types", "div_stats_{team_id}_passing_types", "Player Stats", MATCH_PASS_TYPES_FIELDS
+    ),
+    MatchStatsSection(
+        "assoc_stats_{team_id}_defense", "div_stats_{team_id}_defense", "Player Stats", MATCH_DEFENSIVE_ACTIONS_FIELDS
+    ),
+    MatchStatsSection(
+        "assoc_stats_{team_id}_possession", "div_stats_{team_id}_possession", "Player Stats", MATCH_POSSESSION_FIELDS
+    ),
+    MatchStatsSection(
+        "assoc_stats_{team_id}_misc", "div_stats_{team_id}_misc", "Player Stats", MATCH_MISCELLANEOUS_FIELDS
+    ),
+)
+
+MATCH_GOALKEEPER_SECTION = MatchStatsSection(
+    "assoc_keeper_stats_{team_id}", "div_keeper_stats_{team_id}", "Goalkeeper Stats", MATCH_GOALKEEPER_FIELDS
+)
@@ -0,0 +1,124 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fantasy_helper.conf.config import FBREF_HTTP_POOL_SIZE
+
+
+def uncomment_html(html: str) -> str:
+    # fbref ships most of the secondary tables inside html comments
+    # and unwraps them with js in the browser
+    return html.replace("<!--", "").replace("-->", "")
+
+
+def extract_element_html(html: str, element_id: str) -> Optional[str]:
+    if f'id="{element_id}"' not in html:
+        return None
+
+    parsed_page = BeautifulSoup(uncomment_html(html), "lxml")
+    element = parsed_page.find(id=element_id)
+    if element is None:
+        return None
+    return str(element)
+
+
+class HttpFetcher:
+    """
+    Pooled keep-alive session with gzip and conditional GET.
+
+    Bodies of the last `cache_size` responses with an ETag or Last-Modified
+    header are kept, so repeated requests to an unchanged page cost a 304.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = FBREF_HTTP_POOL_SIZE,
+        timeout: int = 30,
+        cache_size: int = 32,
+    ):
+        self._timeout = timeout
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, Tuple[Optional[str], Optional[str], str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def get(self, url: str) -> Optional[str]:
+        headers = {}
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self._session.get(url, headers=headers, timeout=self._timeout)
+        except requests.exceptions.RequestException as ex:
+            logging.warning(f"Ex={ex} url={url}")
+            return None
+
+        if response.status_code == 304 and cached is not None:
+            # a concurrent fetch may have evicted the entry since it was read
+            self._store(url, cached, replace=False)
+            return cached[2]
+        if response.status_code != 200:
+            logging.warning(f"status_code={response.status_code} url={url}")
+            return None
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            self._store(url, (etag, last_modified, response.text))
+
+        return response.text
+
+    def _store(self, url: str, entry: Tuple[Optional[str], Optional[str], str], replace: bool = True) -> None:
+        with self._lock:
+            if replace or url not in self._cache:
+                self._cache[url] = entry
+            self._cache.move_to_end(url)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_http_fetcher: Optional[HttpFetcher] = None
+_http_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    global _http_fetcher
+
+    with _http_fetcher_lock:
+        if _http_fetcher is None:
+            _http_fetcher = HttpFetcher()
+        return _http_fetcher
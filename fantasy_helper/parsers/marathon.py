@@ -1,20 +1,17 @@
 import asyncio
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from loguru import logger
 from playwright.async_api import async_playwright
 
 from fantasy_helper.conf.config import PROXY_HOST, PROXY_PORT, PROXY_USER, PROXY_PASSWORD
 from fantasy_helper.utils.dataclasses import LeagueInfo, MatchInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry
 
 
 class MarathonParser:
-    def __init__(self, leagues: List[LeagueInfo]):
-        self._leagues = {
-            l.name: l.marathon_url
-            for l in leagues
-            if l.marathon_url is not None and l.is_active
-        }
+    def __init__(self, leagues: Union[LeagueRegistry, List[LeagueInfo]]):
+        self._leagues = as_league_registry(leagues).source("marathon_url")
 
     async def _parse_league_matches(self, league_name: str) -> Optional[List[MatchInfo]]:
         if league_name not in self._leagues:
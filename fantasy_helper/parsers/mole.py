@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Union
 
 import requests
 from bs4 import BeautifulSoup
@@ -8,13 +8,14 @@ from urllib3.util.retry import Retry
 
 
 from fantasy_helper.utils.dataclasses import LeagueInfo, TeamLineup
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry
 
 
 class MoleParser:
-    def __init__(self, leagues: List[LeagueInfo]):
+    def __init__(self, leagues: Union[LeagueRegistry, List[LeagueInfo]]):
         self._url = "https://www.sportsmole.co.uk/football/preview/"
         self._leagues = {
-            l.sportsmole_name: l.name for l in leagues if l.sportsmole_name is not None and l.is_active
+            mole_name: name for name, mole_name in as_league_registry(leagues).source("sportsmole_name").items()
         }
 
         self._session = requests.Session()
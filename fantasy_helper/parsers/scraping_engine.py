@@ -0,0 +1,88 @@
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar
+from urllib.parse import urlparse
+
+from fantasy_helper.conf.config import (
+    FBREF_MATCHES_CONCURRENCY,
+    FBREF_MATCHES_RETRIES,
+    FBREF_REQUESTS_PER_MINUTE,
+)
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RateLimiter:
+    """Spaces requests to the same host at least 60 / requests_per_minute seconds apart."""
+
+    def __init__(self, requests_per_minute: float):
+        self._interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if self._interval == 0:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot[host])
+            self._next_slot[host] = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ScrapingEngine:
+    """
+    Runs scraping tasks on a bounded worker pool.
+
+    Every attempt waits for the per-host rate limiter, failed attempts are
+    retried with exponential backoff. Results are yielded in input order,
+    a task that failed all attempts yields None.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = FBREF_MATCHES_CONCURRENCY,
+        requests_per_minute: float = FBREF_REQUESTS_PER_MINUTE,
+        max_retries: int = FBREF_MATCHES_RETRIES,
+        backoff: float = 5.0,
+    ):
+        self._max_workers = max(max_workers, 1)
+        self._rate_limiter = RateLimiter(requests_per_minute)
+        self._max_retries = max(max_retries, 0)
+        self._backoff = backoff
+
+    def _run_task(self, func: Callable[[T], R], item: T, url: str) -> Optional[R]:
+        for attempt in range(self._max_retries + 1):
+            self._rate_limiter.wait(url)
+            try:
+                return func(item)
+            except Exception as ex:
+                if attempt == self._max_retries:
+                    logging.warning(f"Ex={ex} url={url} attempts={attempt + 1}")
+                    return None
+                delay = self._backoff * 2**attempt * (1 + random.random())
+                logging.warning(f"Ex={ex} url={url}, retry in {delay:.1f}s")
+                time.sleep(delay)
+
+    def map(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        url: Callable[[T], str],
+    ) -> Iterator[Optional[R]]:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self._run_task, func, item, url(item)) for item in items
+            ]
+            for future in futures:
+                yield future.result()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Literal, Optional, Tuple
+from typing import Dict, Any, List, Literal, Optional, Tuple, Union
 import os
 import logging
 import json
@@ -6,16 +6,17 @@ import pytz
 from datetime import datetime
 
 import requests
-from fantasy_helper.parsers.fbref import cast_to_int
+from fantasy_helper.parsers.fbref_fields import cast_to_int
 import iso8601
 
 from fantasy_helper.utils.dataclasses import LeagueInfo, SportsMatchInfo, SportsPlayerStats, SportsTourInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry
 
 
 class SportsParser:
     def __init__(
         self,
-        leagues: List[LeagueInfo],
+        leagues: Union[LeagueRegistry, List[LeagueInfo]],
         url: str = "https://www.sports.ru/gql/graphql/",
         queries_path: Optional[str] = None,
     ):
@@ -24,9 +25,9 @@ class SportsParser:
         if queries_path is not None:
             self._queries_path = queries_path
         else:
-            self._queries_path = os.path.join(os.path.dirname(__file__), "/queries")
+            self._queries_path = os.path.join(os.path.dirname(__file__), "queries")
 
-        self._leagues = {l.name: l.squad_id for l in leagues if l.squad_id is not None and l.is_active}
+        self._leagues = as_league_registry(leagues).source("squad_id")
 
     def get_leagues(self) -> List[str]:
         return list(self._leagues.keys())
@@ -0,0 +1,148 @@
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver import FirefoxOptions
+
+from fantasy_helper.conf.config import FBREF_DRIVER_POOL_SIZE, FBREF_DRIVER_MAX_PAGES
+
+
+def create_firefox_driver() -> Any:
+    opts = FirefoxOptions()
+    opts.add_argument("--headless")
+    opts.add_argument("--disable-blink-features=AutomationControlled")
+
+    return webdriver.Firefox(
+        executable_path=os.environ["GECKODRIVER_PATH"], options=opts
+    )
+
+
+class WebDriverPool:
+    """
+    Bounded pool of warm webdrivers.
+
+    At most `max_size` drivers are alive at the same time, callers block on
+    checkout until one is returned. A driver is health-checked before reuse
+    and recycled after it has served `max_pages` pages, so long runs don't
+    accumulate browser memory.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any] = create_firefox_driver,
+        max_size: int = FBREF_DRIVER_POOL_SIZE,
+        max_pages: int = FBREF_DRIVER_MAX_PAGES,
+    ):
+        self._driver_factory = driver_factory
+        self._max_size = max(max_size, 1)
+        self._max_pages = max(max_pages, 1)
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_size)
+        self._idle: List[Any] = []
+        self._pages: Dict[int, int] = {}
+        self._closed = False
+
+        self.launches = 0
+        self.recycles = 0
+
+    def _launch(self) -> Any:
+        driver = self._driver_factory()
+        with self._lock:
+            self.launches += 1
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _quit(self, driver: Any) -> None:
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as ex:
+            logging.warning(f"Failed to quit webdriver: {ex}")
+
+    @staticmethod
+    def _is_alive(driver: Any) -> bool:
+        try:
+            driver.current_url
+        except Exception:
+            return False
+        return True
+
+    def checkout(self) -> Any:
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("WebDriverPool is closed")
+                    driver = self._idle.pop() if self._idle else None
+
+                if driver is None:
+                    return self._launch()
+                if self._is_alive(driver):
+                    return driver
+
+                logging.warning("Dropping dead webdriver from pool")
+                self._quit(driver)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def checkin(self, driver: Any, healthy: bool = True) -> None:
+        try:
+            with self._lock:
+                pages = self._pages.get(id(driver), 0) + 1
+                self._pages[id(driver)] = pages
+                keep = healthy and not self._closed and pages < self._max_pages
+
+                if keep:
+                    self._idle.append(driver)
+                elif healthy:
+                    self.recycles += 1
+
+            if not keep:
+                self._quit(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        driver = self.checkout()
+        healthy = True
+        try:
+            yield driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            self.checkin(driver, healthy)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for driver in idle:
+            self._quit(driver)
+
+
+_driver_pool: Optional[WebDriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> WebDriverPool:
+    global _driver_pool
+
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = WebDriverPool()
+            atexit.register(_driver_pool.close)
+        return _driver_pool
@@ -4,7 +4,7 @@ import sys
 import os
 import json
 import pytz
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -13,15 +13,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import FirefoxOptions
 
 from fantasy_helper.utils.dataclasses import LeagueInfo, MatchInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, as_league_registry
 
 
 class XbetParser:
-    def __init__(self, leagues: List[LeagueInfo]):
-        self._leagues = {
-            l.name: l.xber_url
-            for l in leagues
-            if l.xber_url is not None and l.is_active
-        }
+    def __init__(self, leagues: Union[LeagueRegistry, List[LeagueInfo]]):
+        self._leagues = as_league_registry(leagues).source("xber_url")
 
     @staticmethod
     def _parse_start_datetime(driver: Any) -> datetime.datetime:
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Optional
+
+from fastapi.dependencies.utils import get_dependant
+
+from fantasy_helper.api.cache import ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(versions, clock, **kwargs) -> ResponseCache:
+    return ResponseCache(
+        lambda league_name: dict(versions[league_name]), clock=clock, enabled=True, **kwargs
+    )
+
+
+def test_cached_endpoint_hits_and_misses():
+    versions = {"Russia": {"fs_coeffs": 1}, "England": {"fs_coeffs": 1}}
+    cache = make_cache(versions, Clock())
+    calls = []
+
+    @cache.cached
+    async def get_coeffs(league_name: str, games_count: Optional[int] = None):
+        calls.append((league_name, games_count))
+        return [league_name, games_count]
+
+    assert asyncio.run(get_coeffs(league_name="Russia")) == ["Russia", None]
+    assert asyncio.run(get_coeffs(league_name="Russia")) == ["Russia", None]
+    asyncio.run(get_coeffs(league_name="Russia", games_count=3))
+    asyncio.run(get_coeffs(league_name="England"))
+
+    assert calls == [("Russia", None), ("Russia", 3), ("England", None)]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = make_cache({"Russia": {}}, clock, ttl=10)
+    cache.put("key", (), "value")
+
+    clock.now = 5
+    assert cache.get("key", ()) == (True, "value")
+    clock.now = 11
+    assert cache.get("key", ()) == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache({}, Clock(), max_entries=2)
+    cache.put("first", (), 1)
+    cache.put("second", (), 2)
+    cache.get("first", ())
+    cache.put("third", (), 3)
+
+    assert cache.get("second", ()) == (False, None)
+    assert cache.get("first", ()) == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_publish_invalidates_league_entries():
+    clock = Clock()
+    versions = {"Russia": {"fs_coeffs": 1}, "England": {"fs_coeffs": 1}}
+    cache = make_cache(versions, clock, version_check_interval=5)
+    calls = []
+
+    @cache.cached
+    async def get_coeffs(league_name: str):
+        calls.append(league_name)
+        return league_name
+
+    asyncio.run(get_coeffs(league_name="Russia"))
+    asyncio.run(get_coeffs(league_name="England"))
+    versions["Russia"]["fs_coeffs"] = 2
+
+    # the new version is not seen until the next versions check
+    asyncio.run(get_coeffs(league_name="Russia"))
+    clock.now = 6
+    asyncio.run(get_coeffs(league_name="Russia"))
+    asyncio.run(get_coeffs(league_name="England"))
+
+    assert calls == ["Russia", "England", "Russia"]
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_fastapi_sees_endpoint_params():
+    cache = make_cache({}, Clock())
+
+    @cache.cached
+    async def get_players_stats_info(league_name: str, games_count: Optional[int] = None):
+        return []
+
+    dependant = get_dependant(path="/players_stats_info/", call=get_players_stats_info)
+
+    assert [param.name for param in dependant.query_params] == ["league_name", "games_count"]
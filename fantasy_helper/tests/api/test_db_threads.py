@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fantasy_helper.api import db_threads
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    monkeypatch.setattr(db_threads, "API_DB_WORKERS", 2)
+    monkeypatch.setattr(db_threads, "_limiter", None)
+
+
+def test_blocking_call_does_not_stall_event_loop():
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        result = await db_threads.run_in_db_thread(lambda value: time.sleep(0.2) or value, "rows")
+        ticker_task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+
+    assert result == "rows"
+    assert ticks >= 10
+
+
+def test_concurrent_calls_are_bounded():
+    lock = threading.Lock()
+    running, max_running = 0, 0
+
+    def query(item: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return item
+
+    async def main():
+        return await asyncio.gather(*[db_threads.run_in_db_thread(query, i) for i in range(8)])
+
+    assert asyncio.run(main()) == list(range(8))
+    assert max_running == 2
@@ -0,0 +1,64 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).parents[2] / "db" / "scripts"
+SCRIPTS = sorted(
+    f"fantasy_helper.db.scripts.{script.stem}" for script in SCRIPTS_DIR.glob("*.py") if script.stem != "__init__"
+)
+
+# cumulative import time budgets in seconds, including module level DAOs construction
+API_BUDGET = 4.0
+SCRIPT_BUDGET = 3.0
+
+# scraping backends and llm clients are imported by the code paths using them only
+SCRAPING_MODULES = ("selenium", "playwright", "bs4", "lxml", "openai")
+# the api never builds dataframes at import
+DATAFRAME_MODULES = ("pandas", "numpy", "polars")
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_time(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Imports the module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple[float, Dict[str, float]]: The cumulative import time of the
+            module and of every imported module, in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    missing = re.search(r"ModuleNotFoundError: No module named '([^']+)'", result.stderr)
+    if result.returncode != 0 and missing is not None:
+        pytest.skip(f"{missing.group(1)} is not installed")
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imported = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            imported[match.group(4)] = int(match.group(2)) / 1e6
+    return imported[module], imported
+
+
+def test_api_import_time():
+    elapsed, imported = import_time("fantasy_helper.api.app")
+
+    assert elapsed < API_BUDGET
+    assert [module for module in SCRAPING_MODULES + DATAFRAME_MODULES if module in imported] == []
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_script_import_time(script: str):
+    elapsed, imported = import_time(script)
+
+    assert elapsed < SCRIPT_BUDGET
+    assert [module for module in SCRAPING_MODULES if module in imported] == []
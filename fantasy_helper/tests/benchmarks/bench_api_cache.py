@@ -0,0 +1,74 @@
+"""
+Load test of the cached read-only API endpoints. Start the API twice, with
+API_CACHE_ENABLED=0 and API_CACHE_ENABLED=1, and run the script against each
+to compare requests per second:
+
+    API_CACHE_ENABLED=0 uvicorn fantasy_helper.api.app:app --port 8000
+    python -m fantasy_helper.tests.benchmarks.bench_api_cache --url http://localhost:8000 --league Russia
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+
+
+ENDPOINTS = (
+    "/players_stats_info/?league_name={league}&games_count=3",
+    "/players_stats_teams_names/?league_name={league}",
+    "/players_stats_prices/?league_name={league}",
+    "/coeffs/?league_name={league}",
+    "/calendar/?league_name={league}",
+    "/lineups/?league_name={league}",
+    "/sports_players/?league_name={league}",
+)
+
+
+async def worker(client: httpx.AsyncClient, paths: List[str], deadline: float, latencies: List[float]) -> int:
+    errors = 0
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get(paths[i % len(paths)])
+        latencies.append(time.perf_counter() - start)
+        errors += response.status_code != 200
+        i += 1
+    return errors
+
+
+async def run(url: str, league: str, concurrency: int, duration: float) -> None:
+    paths = [endpoint.format(league=league) for endpoint in ENDPOINTS]
+    latencies: List[float] = []
+
+    async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+        start = time.perf_counter()
+        errors = await asyncio.gather(*[
+            worker(client, paths, start + duration, latencies) for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - start
+        stats = (await client.get("/cache_stats/")).json()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    print(
+        f"requests={len(latencies)} errors={sum(errors)} rps={len(latencies) / elapsed:.1f} "
+        f"p50={p50:.1f}ms p95={p95:.1f}ms"
+    )
+    print(f"cache: {stats}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--url", default="http://localhost:8000")
+    arg_parser.add_argument("--league", default="Russia")
+    arg_parser.add_argument("--concurrency", type=int, default=16)
+    arg_parser.add_argument("--duration", type=float, default=30)
+    args = arg_parser.parse_args()
+
+    asyncio.run(run(args.url, args.league, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+200 parallel clients against an endpoint doing a blocking DB call, inlined in
+the async handler (previous implementation) and offloaded with
+run_in_db_thread. Alongside, a cheap async endpoint (like /me) is polled to
+show how long the event loop is stalled. The query is simulated with sleep.
+
+    python -m fantasy_helper.tests.benchmarks.bench_api_db_offload --clients 200 --query-ms 20
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, List
+
+from fantasy_helper.api import db_threads
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)] * 1000
+
+
+async def run(handler: Callable, clients: int) -> None:
+    latencies: List[float] = []
+    me_latencies: List[float] = []
+
+    # all clients arrive at once, so latency is measured from the common start
+    async def client():
+        await handler()
+        latencies.append(time.perf_counter() - start)
+
+    async def me_client():
+        for _ in range(20):
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            me_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await asyncio.gather(me_client(), *[client() for _ in range(clients)])
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"  db endpoint p50={percentile(latencies, 0.5):8.1f}ms p99={percentile(latencies, 0.99):8.1f}ms "
+        f"| /me p50={percentile(me_latencies, 0.5):8.1f}ms p99={percentile(me_latencies, 0.99):8.1f}ms "
+        f"| wall={elapsed:.2f}s"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--clients", type=int, default=200)
+    arg_parser.add_argument("--query-ms", type=float, default=20)
+    arg_parser.add_argument("--workers", type=int, default=db_threads.API_DB_WORKERS)
+    args = arg_parser.parse_args()
+
+    db_threads.API_DB_WORKERS = args.workers
+
+    def query():
+        time.sleep(args.query_ms / 1000)
+        return []
+
+    async def blocking_handler():
+        return query()
+
+    async def offloaded_handler():
+        return await db_threads.run_in_db_thread(query)
+
+    print("blocking call in async handler")
+    asyncio.run(run(blocking_handler, args.clients))
+    print(f"run_in_db_thread, workers={args.workers}")
+    asyncio.run(run(offloaded_handler, args.clients))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Startup time and memory of the API process with DAOs built on first use
+against building them up front. The eager run imports the app and builds
+every DAO the app used to create at import, with the DAOs and parsers
+those DAOs built in their constructors. The lazy run imports the app and
+gets the DAOs of all read endpoints from the provider, as the first
+requests do. Each run is a fresh interpreter, no database is queried:
+
+    python -m fantasy_helper.tests.benchmarks.bench_api_startup --repeats 3
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+SCENARIO = """
+import json, resource, sys, time
+start = time.perf_counter()
+import fantasy_helper.api.app as app
+from fantasy_helper.db.dao.feature_store.fs_calendar import FSCalendarsDAO
+from fantasy_helper.db.dao.feature_store.fs_coeffs import FSCoeffsDAO
+from fantasy_helper.db.dao.feature_store.fs_lineups import FSLineupsDAO
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.dao.feature_store.fs_sports_players import FSSportsPlayersDAO
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
+from fantasy_helper.db.dao.schedule import ScheduleDao
+from fantasy_helper.db.dao.user import UserDAO
+reads = [UserDAO, FSCoeffsDAO, FSLineupsDAO, FSPlayersStatsDAO, FSSportsPlayersDAO, FSCalendarsDAO, FSVersionsDAO, ScheduleDao]
+for dao in reads:
+    app.dao_provider.get(dao)
+skipped = []
+if {eager}:
+    from fantasy_helper.db.dao.coeff import CoeffDAO
+    coeff_dao = app.dao_provider.get(CoeffDAO)
+    calendar_dao = app.dao_provider.get(FSCalendarsDAO)
+    players_stats_dao = app.dao_provider.get(FSPlayersStatsDAO)
+    dependencies = [
+        (calendar_dao, "_schedule_dao"), (calendar_dao, "_table_dao"), (calendar_dao, "_naming_dao"),
+        (players_stats_dao, "_fs_sports_players_dao"), (calendar_dao._naming_dao, "_name_matcher"),
+        (calendar_dao._schedule_dao, "_sports_parser"), (calendar_dao._table_dao, "_fbref_parser"),
+        (coeff_dao, "_betcity_parser"),
+    ]
+    for dao, dependency in dependencies:
+        try:
+            getattr(dao, dependency)
+        except ModuleNotFoundError as ex:
+            skipped.append(f"{{type(dao).__name__}}.{{dependency}}: {{ex.name}} is not installed")
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    elapsed=elapsed,
+    max_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    built=app.dao_provider.built(),
+    scraping=sorted(m for m in ("selenium", "playwright", "bs4", "lxml", "openai") if m in sys.modules),
+    skipped=skipped,
+)))
+"""
+
+
+def run(eager: bool, repeats: int):
+    results = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", SCENARIO.format(eager=eager)], check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    for name, eager in [("eager", True), ("lazy", False)]:
+        results = run(eager, args.repeats)
+        elapsed = statistics.median(result["elapsed"] for result in results)
+        max_rss = statistics.median(result["max_rss_mb"] for result in results)
+        print(f"{name:<6} startup median={elapsed * 1000:8.1f}ms  max rss median={max_rss:7.1f}MB")
+        print(f"{'':<6} built: {', '.join(results[-1]['built'])}")
+        print(f"{'':<6} scraping modules: {', '.join(results[-1]['scraping']) or '-'}")
+        for skipped in results[-1]["skipped"]:
+            print(f"{'':<6} skipped {skipped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare writing a season of players_match rows through the per-row ORM
+`db_session.add` loop (previous implementation) and through `bulk_insert`
+with several batch sizes. Runs against the configured DATABASE_URI, every
+measurement is rolled back so the tables are left untouched.
+
+    python -m fantasy_helper.tests.benchmarks.bench_bulk_insert --rows 20000
+"""
+import argparse
+import datetime
+import time
+from dataclasses import asdict
+
+from datetime import timezone
+
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.models.players_match import PlayersMatch
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+from fantasy_helper.utils.dataclasses import PlayerMatchStats
+
+
+def fixture_rows(rows_count: int):
+    return [
+        asdict(PlayerMatchStats(
+            name=f"Player {i}",
+            player_id=str(i),
+            league_name="Benchmark",
+            team_name=f"Team {i % 20}",
+            minutes=90,
+            home_team=f"Team {i % 20}",
+            away_team=f"Team {(i + 1) % 20}",
+            gameweek=i % 38 + 1,
+            date=datetime.date(2024, 8, 1) + datetime.timedelta(days=i % 300),
+        ))
+        for i in range(rows_count)
+    ]
+
+
+def write_with_add(db_session, rows) -> None:
+    for row in rows:
+        db_session.add(PlayersMatch(**row, timestamp=datetime.datetime.now().replace(tzinfo=timezone.utc), year="2024"))
+    db_session.flush()
+
+
+def write_with_bulk_insert(db_session, rows, batch_size: int) -> None:
+    timestamp = datetime.datetime.now().replace(tzinfo=timezone.utc)
+    bulk_insert(
+        db_session, PlayersMatch, (dict(row, timestamp=timestamp, year="2024") for row in rows), batch_size
+    )
+
+
+def bench(write) -> float:
+    db_session = Session()
+    try:
+        start = time.perf_counter()
+        write(db_session)
+        return time.perf_counter() - start
+    finally:
+        db_session.rollback()
+        db_session.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--rows", type=int, default=20000)
+    arg_parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    args = arg_parser.parse_args()
+
+    rows = fixture_rows(args.rows)
+
+    add_time = bench(lambda db_session: write_with_add(db_session, rows))
+    print(f"orm add      rows={args.rows:<7} wall={add_time:.2f}s")
+    for batch_size in args.batch_sizes:
+        bulk_time = bench(lambda db_session: write_with_bulk_insert(db_session, rows, batch_size))
+        print(
+            f"bulk insert  rows={args.rows:<7} batch={batch_size:<5} "
+            f"wall={bulk_time:.2f}s speedup={add_time / bulk_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
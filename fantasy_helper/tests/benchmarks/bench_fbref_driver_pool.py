@@ -0,0 +1,121 @@
+"""
+Compare browser launches and wall time of a full FbrefParser.get_stats_league
+run with one browser per page (old behaviour) and with a shared driver pool.
+
+Pages are served from a local fixture server, so only browser overhead is
+measured. Requires firefox and GECKODRIVER_PATH.
+
+    python -m fantasy_helper.tests.benchmarks.bench_fbref_driver_pool --leagues 3
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from fantasy_helper.parsers.fbref import FbrefParser
+from fantasy_helper.parsers.webdriver_pool import WebDriverPool
+from fantasy_helper.utils.dataclasses import LeagueInfo
+
+
+TABLES = [
+    "stats_playing_time",
+    "stats_standard",
+    "stats_shooting",
+    "stats_passing",
+    "stats_passing_types",
+    "stats_possession",
+    "stats_gca",
+]
+
+
+def fixture_page(players_count: int = 500) -> bytes:
+    rows = "".join(
+        "<tr>"
+        f'<th data-stat="ranker">{i}</th>'
+        f'<td data-stat="player">Player {i}</td>'
+        f'<td data-stat="team">Team {i % 20}</td>'
+        '<td data-stat="position">MF</td>'
+        '<td data-stat="games">10</td>'
+        '<td data-stat="minutes">900</td>'
+        '<td data-stat="goals">3</td>'
+        '<td data-stat="shots">20</td>'
+        '<td data-stat="xg">2.5</td>'
+        "</tr>"
+        for i in range(players_count)
+    )
+    header = "<tr><th>Group</th></tr><tr><th>Column</th></tr>"
+    tables = "".join(
+        f'<table id="{table}">{header}{rows}</table>' for table in TABLES
+    )
+    return f"<html><body>{tables}</body></html>".encode()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    page = fixture_page()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.page)))
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_leagues(base_url: str, leagues_count: int) -> List[LeagueInfo]:
+    return [
+        LeagueInfo(
+            name=f"League{i}",
+            ru_name=f"Лига{i}",
+            emoji="",
+            is_active=True,
+            fbref_playing_time_url=f"{base_url}/{i}/playingtime",
+            fbref_standart_url=f"{base_url}/{i}/stats",
+            fbref_shooting_url=f"{base_url}/{i}/shooting",
+            fbref_passing_url=f"{base_url}/{i}/passing",
+            fbref_pass_types_url=f"{base_url}/{i}/passing_types",
+            fbref_possesion_url=f"{base_url}/{i}/possession",
+            fbref_shot_creation_url=f"{base_url}/{i}/gca",
+        )
+        for i in range(leagues_count)
+    ]
+
+
+def run(leagues: List[LeagueInfo], pool: WebDriverPool) -> None:
+    parser = FbrefParser(leagues, driver_pool=pool, fetch_mode="selenium")
+    start = time.perf_counter()
+    players = 0
+    for league in leagues:
+        players += len(parser.get_stats_league(league.name))
+    elapsed = time.perf_counter() - start
+    pool.close()
+
+    print(
+        f"max_pages={pool._max_pages:<4} launches={pool.launches:<3} "
+        f"players={players:<6} wall={elapsed:.2f}s"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--leagues", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    leagues = make_leagues(f"http://127.0.0.1:{server.server_port}", args.leagues)
+
+    try:
+        # one browser per page, as before the pool
+        run(leagues, WebDriverPool(max_size=1, max_pages=1))
+        # shared warm browser
+        run(leagues, WebDriverPool(max_size=1))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Microbenchmark of fbref row parsing: a BeautifulSoup `.find` per field
+(previous implementation) against the single-pass lxml row decoder.
+
+    python -m fantasy_helper.tests.benchmarks.bench_fbref_row_decoder --rows 600
+"""
+import argparse
+import random
+import time
+
+import lxml.html
+from bs4 import BeautifulSoup
+
+from fantasy_helper.parsers.fbref_fields import (
+    PASSING_FIELDS,
+    POSSESSION_FIELDS,
+    SHOOTING_FIELDS,
+    decode_fields,
+    decode_row,
+)
+
+
+def fixture_table(fields, rows_count: int) -> str:
+    rows = []
+    for i in range(rows_count):
+        cells = "".join(
+            f'<td data-stat="{field.data_stat}">{random.randint(0, 90)}</td>'
+            for field in fields
+        )
+        rows.append(
+            f'<tr><th data-stat="ranker">{i}</th>'
+            f'<td data-stat="player">Player {i}</td>'
+            f'<td data-stat="team">Team {i % 20}</td>'
+            f'<td data-stat="position">MF</td>{cells}</tr>'
+        )
+    header = "<tr><th>Group</th></tr><tr><th>Column</th></tr>"
+    return f'<table id="stats">{header}{"".join(rows)}</table>'
+
+
+def parse_with_find(table_html: str, fields) -> int:
+    players = BeautifulSoup(table_html, "html.parser").find_all("tr")[2:]
+    parsed = 0
+    for player in players:
+        if player.find("td", {"data-stat": "player"}) is None:
+            continue
+        values = {}
+        for field in fields:
+            cell = player.find("td", {"data-stat": field.data_stat})
+            values[field.name] = field.cast(cell.text) if cell else None
+        parsed += 1
+    return parsed
+
+
+def parse_with_decoder(table_html: str, fields) -> int:
+    players = list(lxml.html.fromstring(table_html).iter("tr"))[2:]
+    parsed = 0
+    for player in players:
+        cells, _ = decode_row(player)
+        if "player" not in cells:
+            continue
+        decode_fields(cells, fields)
+        parsed += 1
+    return parsed
+
+
+def bench(func, table_html: str, fields, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(table_html, fields)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--rows", type=int, default=600)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    for name, fields in [
+        ("shooting", SHOOTING_FIELDS),
+        ("passing", PASSING_FIELDS),
+        ("possession", POSSESSION_FIELDS),
+    ]:
+        table_html = fixture_table(fields, args.rows)
+        find_time = bench(parse_with_find, table_html, fields, args.repeat)
+        decoder_time = bench(parse_with_decoder, table_html, fields, args.repeat)
+        print(
+            f"{name:<12} find={find_time * 1000:8.1f}ms "
+            f"decoder={decoder_time * 1000:8.1f}ms "
+            f"speedup={find_time / decoder_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Offline accuracy and latency of the local fuzzy names matching, using the
+pairs already stored in teams_names and players_names of the configured
+DATABASE_URI as ground truth: sports teams against fbref and betcity teams
+per league, sports players against fbref players per team. Coverage is the
+share of names resolved without the llm, precision is the share of those
+pairs that agree with the stored ones.
+
+    python -m fantasy_helper.tests.benchmarks.bench_fuzzy_name_matching --min-score 0.75 --min-margin 0.2
+"""
+import argparse
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.models.ml.player_name import PlayerName
+from fantasy_helper.db.models.ml.team_name import TeamName
+from fantasy_helper.ml.naming.fuzzy_matcher import FuzzyNameMatcher
+
+
+def load_groups() -> Dict[str, List[Dict[str, str]]]:
+    """
+    Ground truth pairs of every matching call update_league_naming makes.
+    """
+    db_session = Session()
+    teams_names = db_session.query(TeamName).all()
+    players_names = db_session.query(PlayerName).all()
+    db_session.close()
+
+    groups = defaultdict(dict)
+    for team_name in teams_names:
+        for source in ("fbref", "betcity"):
+            target_name = getattr(team_name, f"{source}_name")
+            if team_name.sports_name and target_name:
+                groups[("teams", source, team_name.league_name, team_name.year)][team_name.sports_name] = target_name
+    for player_name in players_names:
+        if player_name.sports_name and player_name.fbref_name:
+            key = ("players", "fbref", player_name.league_name, player_name.year, player_name.team_name)
+            groups[key][player_name.sports_name] = player_name.fbref_name
+
+    result = defaultdict(list)
+    for key, pairs in groups.items():
+        result[f"{key[0]}/{key[1]}"].append(pairs)
+    return result
+
+
+def evaluate(matcher: FuzzyNameMatcher, groups: List[Dict[str, str]]) -> Tuple[int, int, int, List[float]]:
+    names_count, matched_count, correct_count, latencies = 0, 0, 0, []
+    for pairs in groups:
+        names_1 = list(pairs)
+        names_2 = list(set(pairs.values()))
+        random.shuffle(names_2)
+
+        start = time.perf_counter()
+        result = matcher.match(names_1, names_2)
+        latencies.append(time.perf_counter() - start)
+
+        names_count += len(names_1)
+        matched_count += len(result)
+        correct_count += sum(pairs[name_1] == name_2 for name_1, name_2 in result.items())
+    return names_count, matched_count, correct_count, latencies
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--min-score", type=float, default=0.75)
+    arg_parser.add_argument("--min-margin", type=float, default=0.2)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    matcher = FuzzyNameMatcher(min_score=args.min_score, min_margin=args.min_margin)
+    for kind, groups in sorted(load_groups().items()):
+        names_count, matched_count, correct_count, latencies = evaluate(matcher, groups)
+        print(
+            f"{kind:<14} groups={len(groups):<4} names={names_count:<6} "
+            f"coverage={matched_count / max(names_count, 1):6.1%} "
+            f"precision={correct_count / max(matched_count, 1):6.1%} "
+            f"p50={statistics.median(latencies) * 1000:6.1f}ms max={max(latencies) * 1000:6.1f}ms "
+            f"total={sum(latencies):5.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
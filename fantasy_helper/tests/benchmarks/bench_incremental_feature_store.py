@@ -0,0 +1,113 @@
+"""
+Feature store update after a midweek match in the middle of a season of 20
+teams with 25 players each: the full rebuild of fs_players_matches and
+fs_players_tables against the incremental update that recomputes only the
+teams with newly parsed matches. Runs against the configured DATABASE_URI
+under a throwaway league name that is removed afterwards.
+
+    python -m fantasy_helper.tests.benchmarks.bench_incremental_feature_store --teams 20 --gameweeks 19
+"""
+import argparse
+import datetime
+import random
+import time
+
+from sqlalchemy import insert
+
+from fantasy_helper.db.database import Session, db_engine
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.models.fbref_schedule import FbrefSchedule
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.db.models.players_match import PlayersMatch
+
+
+LEAGUE_NAME = "Benchmark"
+YEAR = "2024"
+
+
+def add_matches(matches, players_count: int, timestamp: datetime.datetime) -> None:
+    schedule_rows, players_rows = [], []
+    for gameweek, home_team, away_team in matches:
+        date = datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * gameweek)
+        schedule_rows.append(dict(
+            league_name=LEAGUE_NAME, year=YEAR, timestamp=timestamp, home_team=home_team, away_team=away_team,
+            gameweek=gameweek, date=date, match_parsed=True
+        ))
+        for team_name in (home_team, away_team):
+            for player in random.sample(range(players_count), 16):
+                players_rows.append(dict(
+                    league_name=LEAGUE_NAME, year=YEAR, timestamp=timestamp, name=f"Player {team_name} {player}",
+                    player_id=f"{team_name} {player}", team_name=team_name, home_team=home_team,
+                    away_team=away_team, gameweek=gameweek, date=date, minutes=random.randint(1, 90),
+                    goals=random.randint(0, 1), shots=random.randint(0, 4), xg=random.random(),
+                    xg_assist=random.random(), sca=random.randint(0, 4)
+                ))
+
+    with db_engine.begin() as connection:
+        connection.execute(insert(FbrefSchedule.__table__), schedule_rows)
+        connection.execute(insert(PlayersMatch.__table__), players_rows)
+
+
+def season_matches(teams, gameweeks: range):
+    """
+    A round robin: every team plays once per gameweek.
+    """
+    result = []
+    for gameweek in gameweeks:
+        rotated = teams[:1] + teams[1:][gameweek % (len(teams) - 1):] + teams[1:][:gameweek % (len(teams) - 1)]
+        half = len(teams) // 2
+        result.extend((gameweek, rotated[i], rotated[-i - 1]) for i in range(half))
+    return result
+
+
+def timed_update(dao: FSPlayersStatsDAO, incremental: bool) -> float:
+    start = time.perf_counter()
+    dao.update_players_stats(LEAGUE_NAME, incremental=incremental, add_sports_info=False)
+    return time.perf_counter() - start
+
+
+def cleanup() -> None:
+    db_session = Session()
+    for model in (FSPlayersMatches, FSPlayersTables, FSVersion, FbrefSchedule, PlayersMatch):
+        db_session.query(model).filter(model.league_name == LEAGUE_NAME).delete()
+    db_session.commit()
+    db_session.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--teams", type=int, default=20)
+    arg_parser.add_argument("--gameweeks", type=int, default=19)
+    arg_parser.add_argument("--players", type=int, default=25)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    # the benchmark league is not configured and gets the default year
+    dao = FSPlayersStatsDAO()
+    teams = [f"Team {team}" for team in range(args.teams)]
+    timestamp = datetime.datetime(2024, 12, 1)
+
+    try:
+        add_matches(season_matches(teams, range(1, args.gameweeks + 1)), args.players, timestamp)
+        print(f"first publish: {timed_update(dao, incremental=True):.2f}s")
+
+        # a postponed match played midweek
+        add_matches([(args.gameweeks + 1, teams[0], teams[1])], args.players, timestamp + datetime.timedelta(days=3))
+        print(f"incremental after 1 match: {timed_update(dao, incremental=True):.2f}s")
+        print(f"full rebuild:              {timed_update(dao, incremental=False):.2f}s")
+
+        add_matches(
+            season_matches(teams, range(args.gameweeks + 2, args.gameweeks + 3)),
+            args.players,
+            timestamp + datetime.timedelta(days=7)
+        )
+        print(f"incremental after a round: {timed_update(dao, incremental=True):.2f}s")
+        print(f"full rebuild:              {timed_update(dao, incremental=False):.2f}s")
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
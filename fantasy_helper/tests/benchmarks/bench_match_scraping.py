@@ -0,0 +1,39 @@
+"""
+Estimate the wall time of a full-season match reports backfill (380 matches)
+with the serial loop and with the concurrent ScrapingEngine. Page latency is
+simulated, so the numbers show the effect of concurrency under the per-host
+rate limit rather than fbref itself.
+
+    python -m fantasy_helper.tests.benchmarks.bench_match_scraping --latency 2 --rpm 30
+"""
+import argparse
+import time
+
+from fantasy_helper.parsers.scraping_engine import ScrapingEngine
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--matches", type=int, default=380)
+    arg_parser.add_argument("--latency", type=float, default=2.0)
+    arg_parser.add_argument("--rpm", type=float, default=30)
+    arg_parser.add_argument("--workers", type=int, default=4)
+    args = arg_parser.parse_args()
+
+    def fetch(match_id: int) -> int:
+        time.sleep(args.latency)
+        return match_id
+
+    urls = lambda match_id: f"https://fbref.com/en/matches/{match_id}"
+    matches = range(args.matches)
+
+    for workers in [1, args.workers]:
+        engine = ScrapingEngine(max_workers=workers, requests_per_minute=args.rpm)
+        start = time.perf_counter()
+        parsed = sum(1 for result in engine.map(fetch, matches, url=urls) if result is not None)
+        elapsed = time.perf_counter() - start
+        print(f"workers={workers:<3} rpm={args.rpm:<5} matches={parsed:<4} wall={elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
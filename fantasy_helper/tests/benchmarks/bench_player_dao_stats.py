@@ -0,0 +1,81 @@
+"""
+PlayerDAO.get_players_stats on a synthetic Player table of several seasons
+with 600 players and a snapshot after every round: the row by row
+implementation with three groupby passes against the vectorized one. Every
+season is computed separately, as get_players_stats filters the current year.
+Data is in memory, so the numbers exclude the database read.
+
+    python -m fantasy_helper.tests.benchmarks.bench_player_dao_stats --seasons 3 --players 600 --rounds 38
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from fantasy_helper.db.dao.player import PlayerDAO
+from fantasy_helper.tests.db.test_player_dao_stats import STATS_COLUMNS, ReferencePlayerStats, records
+
+
+LEAGUE_NAME = "England"
+
+
+def fixture_players_table(seasons_count: int, players_count: int, rounds_count: int) -> pd.DataFrame:
+    rnd = np.random.default_rng(0)
+    frames = []
+    for season in range(seasons_count):
+        # a player misses about a quarter of the rounds, the snapshot is taken anyway
+        played = rnd.random((players_count, rounds_count)) < 0.75
+        games = np.cumsum(played, axis=1)
+        frame = pd.DataFrame({
+            "name": np.repeat([f"Player {player}" for player in range(players_count)], rounds_count),
+            "league_name": LEAGUE_NAME,
+            "year": str(2022 + season),
+            "team_name": np.repeat([f"Team {player % 20}" for player in range(players_count)], rounds_count),
+            "position": "MF",
+            "games": games.ravel(),
+            "minutes": np.cumsum(played * rnd.integers(1, 91, played.shape), axis=1).ravel(),
+            "average_shot_distance": 10 + 10 * rnd.random(played.size),
+        })
+        for column in STATS_COLUMNS:
+            frame[column] = np.cumsum(played * rnd.random(played.shape), axis=1).ravel()
+        # the query keeps one snapshot per games count
+        frames.append(frame.drop_duplicates(subset=["name", "team_name", "position", "games"], keep="last"))
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--seasons", type=int, default=3)
+    arg_parser.add_argument("--players", type=int, default=600)
+    arg_parser.add_argument("--rounds", type=int, default=38)
+    args = arg_parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    players_table = fixture_players_table(args.seasons, args.players, args.rounds)
+    seasons = [season_df for _, season_df in players_table.groupby("year")]
+    dao = PlayerDAO()
+    reference = ReferencePlayerStats(dao._PlayerDAO__fbref_parser)
+
+    results = {}
+    for name, func in [
+        ("row by row", reference.get_players_stats),
+        ("vectorized", lambda df: dao._compute_league_stats(df, LEAGUE_NAME)),
+    ]:
+        start = time.perf_counter()
+        results[name] = [func(season_df) for season_df in seasons]
+        elapsed = time.perf_counter() - start
+        rows = sum(len(result.abs_stats) for result in results[name])
+        print(f"{name:<11} snapshots={len(players_table)} abs_rows={rows} time={elapsed:8.2f}s")
+
+    identical = all(
+        records(getattr(actual, field_name)) == records(getattr(expected, field_name))
+        for actual, expected in zip(results["vectorized"], results["row by row"])
+        for field_name in ("abs_stats", "norm_stats", "free_kicks")
+    )
+    print(f"identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
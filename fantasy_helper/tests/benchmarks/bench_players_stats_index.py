@@ -0,0 +1,123 @@
+"""
+Players stats window queries for a 600-player league over 38 games: the
+players table of the last N games computed from the cumulative rows (one row
+per player and games_all, as fs_players_stats stores them) against the prefix
+sums of PlayersStatsIndex, plus windows the cumulative rows can't answer.
+Data is synthetic and in memory, so the numbers exclude the database read.
+
+    python -m fantasy_helper.tests.benchmarks.bench_players_stats_index --players 600 --games 38
+"""
+import argparse
+import datetime
+import random
+import statistics
+import time
+from dataclasses import asdict
+from unittest.mock import patch
+
+import polars as pl
+
+from fantasy_helper.db.dao.feature_store.fs_players_stats import STATS_COLUMNS, FSPlayersStatsDAO
+from fantasy_helper.utils.dataclasses import PlayerMatchStatsInfo, PlayerStatsInfo
+from fantasy_helper.utils.stats_index import PlayersStatsIndex
+
+
+def fixture_players_matches(players_count: int, games_count: int):
+    result = []
+    for player in range(players_count):
+        team_id = player % 20
+        for position in range(games_count):
+            result.append(PlayerMatchStatsInfo(
+                name=f"Player {player}",
+                team=f"Team {team_id}",
+                position="MIDFIELDER",
+                match_number=games_count - position,
+                gameweek=position + 1,
+                date=datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * position),
+                minutes=random.randint(0, 90),
+                sports_team=f"Sports Team {team_id}",
+                sports_name=f"Sports Player {player}",
+                role="MIDFIELDER",
+                price=random.random() * 12,
+                **{column: random.randint(0, 3) for column in STATS_COLUMNS},
+            ))
+    return result
+
+
+def cumulative_stats(players_matches):
+    """
+    The cumulative rows fs_players_stats published from the same matches.
+    """
+    result = []
+    players = {}
+    for player_match in sorted(players_matches, key=lambda x: x.match_number):
+        players.setdefault((player_match.team, player_match.name), []).append(player_match)
+    for matches in players.values():
+        sums = dict.fromkeys(("minutes", *STATS_COLUMNS), 0)
+        games = 0
+        for player_match in matches:
+            games += 1 if player_match.minutes > 0 else 0
+            for column in sums:
+                sums[column] += getattr(player_match, column)
+            result.append(PlayerStatsInfo(
+                name=player_match.name,
+                team=player_match.team,
+                position=player_match.position,
+                games=games,
+                games_all=player_match.match_number,
+                sports_team=player_match.sports_team,
+                sports_name=player_match.sports_name,
+                role=player_match.role,
+                price=player_match.price,
+                **sums,
+            ))
+    return result
+
+
+def bench(func, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000, max(latencies) * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--players", type=int, default=600)
+    arg_parser.add_argument("--games", type=int, default=38)
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    players_matches = fixture_players_matches(args.players, args.games)
+    players_stats = cumulative_stats(players_matches)
+    dao = FSPlayersStatsDAO()
+
+    start = time.perf_counter()
+    index = PlayersStatsIndex(players_matches, columns=("minutes", *STATS_COLUMNS))
+    print(f"index build: {(time.perf_counter() - start) * 1000:.0f}ms for {len(players_matches)} matches rows "
+          f"against {len(players_stats)} cumulative rows")
+
+    def cumulative_window():
+        with patch.object(dao, "get_players_stats_info", return_value=players_stats):
+            dao.get_players_table_rows("Russia", games_count=5, normalize_matches=True)
+
+    def index_window(**params):
+        with patch.object(dao, "get_players_stats_index", return_value=index):
+            dao.get_players_window_rows("Russia", normalize_matches=True, **params)
+
+    for name, func in [
+        ("cumulative last 5 games", cumulative_window),
+        ("index last 5 games", lambda: index_window(games_count=5)),
+        ("index gameweeks 10..20", lambda: index_window(gameweek_from=10, gameweek_to=20)),
+        ("index since date", lambda: index_window(date_from=datetime.date(2024, 12, 1))),
+        ("index sums only", lambda: index.window(games_count=5)),
+        ("index cumulative rows", index.cumulative),
+    ]:
+        p50, p_max = bench(func, args.repeat)
+        print(f"{name:<26} p50={p50:8.1f}ms max={p_max:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Latency of /players_stats_info/ reads for a 600-player league over 38 games:
+computing the table from the published players matches on every request
+against reading the table precomputed at publish time.
+Runs against the configured DATABASE_URI under a throwaway league name that
+is removed afterwards.
+
+    python -m fantasy_helper.tests.benchmarks.bench_players_tables --players 600 --games 38
+"""
+import argparse
+import random
+import statistics
+import time
+
+from fantasy_helper.db.database import Session
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.tests.benchmarks.bench_players_stats_index import fixture_players_matches
+
+
+LEAGUE_NAME = "Benchmark"
+
+
+def bench(func, repeat: int):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000, max(latencies) * 1000
+
+
+def cleanup() -> None:
+    db_session = Session()
+    for model in (FSPlayersMatches, FSPlayersTables):
+        db_session.query(model).filter(model.league_name == LEAGUE_NAME).delete()
+    db_session.query(FSVersion).filter(FSVersion.league_name == LEAGUE_NAME).delete()
+    db_session.commit()
+    db_session.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--players", type=int, default=600)
+    arg_parser.add_argument("--games", type=int, default=38)
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    dao = FSPlayersStatsDAO()
+    players_matches = fixture_players_matches(args.players, args.games)
+
+    try:
+        start = time.perf_counter()
+        dao.update_players_matches(LEAGUE_NAME, players_matches, add_sports_info=False)
+        print(f"publish with materialization: {time.perf_counter() - start:.1f}s, {len(players_matches)} matches rows")
+
+        for games_count, normalize_minutes in [(None, False), (5, False), (5, True)]:
+            params = (LEAGUE_NAME, games_count, normalize_minutes, False, 90)
+            computed = bench(lambda: dao.get_players_table_rows(*params), args.repeat)
+            published = bench(lambda: dao.get_published_players_table_rows(*params), args.repeat)
+            print(
+                f"games_count={str(games_count):<5} normalize_minutes={normalize_minutes!s:<5} "
+                f"computed p50={computed[0]:7.1f}ms max={computed[1]:7.1f}ms | "
+                f"published p50={published[0]:7.1f}ms max={published[1]:7.1f}ms"
+            )
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Per job overhead of a league update started by cron against the resident
+scheduler. A cron job starts an interpreter, imports the update script with
+its DAOs, parsers and ml stack and creates the DAOs before the first stage
+runs; the scheduler pays that once and per job only records the run in the
+history and builds the stages. Stages do not run, so the numbers are the
+overhead alone. Writes the runs history, run against a scratch database:
+
+    DATABASE_URI=sqlite:////tmp/scheduler_bench.db python -m fantasy_helper.tests.benchmarks.bench_scheduler_overhead --league England --repeats 5
+"""
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+from fantasy_helper.db.dao.scheduler import SchedulerDAO
+from fantasy_helper.db.database import Base, db_engine
+from fantasy_helper.db.models.job_run import JobRun
+from fantasy_helper.db.models.scheduled_job import ScheduledJob
+from fantasy_helper.utils.dataclasses import ScheduledJobInfo
+from fantasy_helper.utils.scheduler import JobScheduler
+
+
+COLD_START = (
+    "import fantasy_helper.db.scripts.update_league_full as m; "
+    "m.LeagueUpdater().build_pipeline({league!r})"
+)
+
+
+def measure_cold(league: str, repeats: int):
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", COLD_START.format(league=league)], check=True)
+        elapsed.append(time.perf_counter() - start)
+    return elapsed
+
+
+async def measure_warm(league: str, repeats: int):
+    from fantasy_helper.db.scripts.update_league_full import LeagueUpdater
+
+    start = time.perf_counter()
+    league_updater = LeagueUpdater()
+    warm_up = time.perf_counter() - start
+
+    async def build_only(job: ScheduledJobInfo):
+        league_updater.build_pipeline(job.league_name)
+
+    job = ScheduledJobInfo(name=f"bench_{league}", job="league_full", cron="* * * * *", league_name=league)
+    scheduler = JobScheduler(SchedulerDAO(), {"league_full": build_only})
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await scheduler.run_job(job)
+        elapsed.append(time.perf_counter() - start)
+    return warm_up, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--league", type=str, default="England")
+    arg_parser.add_argument("--repeats", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    Base.metadata.create_all(db_engine, tables=[ScheduledJob.__table__, JobRun.__table__])
+    cold = measure_cold(args.league, args.repeats)
+    warm_up, warm = asyncio.run(measure_warm(args.league, args.repeats))
+
+    print(f"{'cron cold start per job':<32} median={statistics.median(cold) * 1000:9.1f}ms")
+    print(f"{'scheduler start once':<32} {'':7}{warm_up * 1000:9.1f}ms")
+    print(f"{'scheduler per job':<32} median={statistics.median(warm) * 1000:9.1f}ms")
+    print(f"saved per job: {(statistics.median(cold) - statistics.median(warm)) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+NamingDAO sports info enrichment on a synthetic league of 20 teams with 30
+players each and a players stats row per player and round, as the players
+stats feature store holds them: deepcopy and merge of the whole stats against
+the key columns join, for the PlayersLeagueStats frames and the
+PlayerStatsInfo list. The naming index is built in memory, so the numbers
+exclude the database read.
+
+    python -m fantasy_helper.tests.benchmarks.bench_sports_info_join --teams 20 --players 30 --rounds 38
+"""
+import argparse
+import time
+from dataclasses import asdict, replace
+from unittest.mock import patch
+
+import pandas as pd
+
+from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.tests.db.test_naming_sports_info import (
+    LEAGUE_NAME,
+    reference_add_sports_info_to_players_stats,
+    reference_add_sports_info_to_players_stats_info,
+    synthetic_league,
+)
+from fantasy_helper.utils.dataclasses import PlayersLeagueStats
+
+
+def measure(name: str, func, repeats: int = 3):
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        elapsed.append(time.perf_counter() - start)
+    print(f"{name:<28} best={min(elapsed) * 1000:8.1f}ms")
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--teams", type=int, default=20)
+    arg_parser.add_argument("--players", type=int, default=30)
+    arg_parser.add_argument("--rounds", type=int, default=38)
+    args = arg_parser.parse_args()
+
+    naming_index, players_stats_info, sports_players = synthetic_league(0, args.teams, args.players)
+    players_stats_info = [
+        replace(info, games_all=round_number)
+        for info in players_stats_info
+        for round_number in range(1, args.rounds + 1)
+    ]
+    df = pd.DataFrame([asdict(info) for info in players_stats_info])
+    players_stats = PlayersLeagueStats(abs_stats=df, norm_stats=df.copy(), free_kicks=df.copy())
+    print(f"stats rows={len(df)} columns={len(df.columns)} sports players={len(sports_players)}")
+
+    naming_dao = NamingDAO()
+    with patch.object(naming_dao, "get_naming_index", return_value=naming_index):
+        expected = measure("frames deepcopy + merge", lambda: reference_add_sports_info_to_players_stats(
+            naming_index, players_stats, sports_players
+        ))
+        actual = measure("frames keys join", lambda: naming_dao.add_sports_info_to_players_stats(
+            LEAGUE_NAME, players_stats, sports_players
+        ))
+        identical = all(
+            getattr(actual, attr).equals(getattr(expected, attr))
+            for attr in ("abs_stats", "norm_stats", "free_kicks")
+        )
+        print(f"identical frames: {identical}")
+
+        expected_info = measure("list deepcopy per row", lambda: reference_add_sports_info_to_players_stats_info(
+            naming_index, players_stats_info, sports_players
+        ))
+        actual_info = measure("list replace matched rows", lambda: naming_dao.add_sports_info_to_players_stats_info(
+            LEAGUE_NAME, players_stats_info, sports_players
+        ))
+        print(f"identical list: {actual_info == expected_info}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from fantasy_helper.db.utils.bulk_insert import bulk_insert
+
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "bulk_rows"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
+    year = Column(String, nullable=True, default="2024")
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_bulk_insert_batches(db_session):
+    executed = []
+
+    @event.listens_for(db_session.get_bind(), "before_cursor_execute")
+    def count_rows(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            executed.append(len(parameters) if executemany else 1)
+
+    inserted = bulk_insert(db_session, Row, ({"name": str(i)} for i in range(7)), batch_size=3)
+    db_session.commit()
+
+    assert inserted == 7
+    assert executed == [3, 3, 1]
+    assert [row.name for row in db_session.query(Row).order_by(Row.id)] == [str(i) for i in range(7)]
+
+
+def test_bulk_insert_applies_defaults(db_session):
+    bulk_insert(db_session, Row, [{"name": "a"}])
+    db_session.commit()
+
+    row = db_session.query(Row).one()
+    assert (row.name, row.year) == ("a", "2024")
+
+
+def test_bulk_insert_rejects_unknown_keys(db_session):
+    with pytest.raises(TypeError, match="'not_a_column'"):
+        bulk_insert(db_session, Row, [{"name": "a"}, {"name": "b", "not_a_column": 1}])
+
+    assert db_session.query(Row).count() == 0
+
+
+def test_bulk_insert_empty(db_session):
+    assert bulk_insert(db_session, Row, []) == 0
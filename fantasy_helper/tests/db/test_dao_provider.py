@@ -0,0 +1,80 @@
+import os.path as path
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fantasy_helper.db.dao.coeff import CoeffDAO
+from fantasy_helper.db.dao.feature_store.fs_calendar import FSCalendarsDAO
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.db.dao.provider import get_dao_provider
+from fantasy_helper.db.dao.schedule import ScheduleDao
+from fantasy_helper.db.dao.table import TableDao
+from fantasy_helper.parsers.sports import SportsParser
+from fantasy_helper.utils.dataclasses import LeagueInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+
+PARSERS = {"FbrefParser", "SportsParser", "BetcityParser", "MoleParser", "ScrapingEngine"}
+
+
+@pytest.fixture
+def registry() -> LeagueRegistry:
+    # a registry of its own gets a fresh provider
+    return LeagueRegistry([
+        LeagueInfo(name="Spain", ru_name="Ла Лига", emoji="", is_active=True, squad_id=1, year="2025"),
+    ])
+
+
+def test_provider_shares_instances(registry: LeagueRegistry):
+    dao_provider = get_dao_provider(registry)
+
+    assert get_dao_provider(registry) is dao_provider
+    assert get_dao_provider() is get_dao_provider(get_league_registry())
+    assert get_dao_provider() is not dao_provider
+
+    table_dao = dao_provider.get(TableDao)
+    assert dao_provider.get(TableDao) is table_dao
+    assert table_dao._league_registry is registry
+
+
+def test_composite_daos_build_dependencies_lazily(registry: LeagueRegistry):
+    dao_provider = get_dao_provider(registry)
+
+    calendar_dao = dao_provider.get(FSCalendarsDAO)
+    dao_provider.get(FSPlayersStatsDAO)
+    coeff_dao = dao_provider.get(CoeffDAO)
+    assert dao_provider.built() == ["FSCalendarsDAO", "FSPlayersStatsDAO", "CoeffDAO"]
+
+    assert calendar_dao._valid_leagues == ["Spain"]
+    assert coeff_dao._schedule_dao is calendar_dao._schedule_dao
+    assert set(dao_provider.built()) == {"FSCalendarsDAO", "FSPlayersStatsDAO", "CoeffDAO", "ScheduleDao", "TableDao"}
+
+
+def test_reads_never_build_parsers(registry: LeagueRegistry):
+    dao_provider = get_dao_provider(registry)
+
+    naming_dao = dao_provider.get(NamingDAO)
+    naming_dao._name_matcher
+    dao_provider.get(FSCalendarsDAO)._valid_leagues
+
+    assert PARSERS.isdisjoint(dao_provider.built())
+
+
+def test_parsers_are_shared_by_daos(registry: LeagueRegistry):
+    dao_provider = get_dao_provider(registry)
+
+    parser = dao_provider.get(ScheduleDao)._sports_parser
+    assert isinstance(parser, SportsParser)
+    assert parser is ScheduleDao(league_registry=registry)._sports_parser
+    assert parser.get_leagues() == ["Spain"]
+    assert path.exists(path.join(parser._queries_path, "squad.graphql"))
+
+
+def test_provider_builds_once_across_threads(registry: LeagueRegistry):
+    dao_provider = get_dao_provider(registry)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        naming_daos = list(executor.map(lambda _: dao_provider.get(NamingDAO), range(32)))
+
+    assert all(naming_dao is naming_daos[0] for naming_dao in naming_daos)
@@ -0,0 +1,146 @@
+import datetime
+import random
+from dataclasses import asdict
+from typing import List, Tuple
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import BigInteger, insert
+from sqlalchemy.ext.compiler import compiles
+
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.models.fbref_schedule import FbrefSchedule
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.db.models.players_match import PlayersMatch
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+
+
+LEAGUE_NAME = "Russia"
+TEAMS = ("Team A", "Team B", "Team C", "Team D", "Team E", "Team F")
+
+
+@compiles(BigInteger, "sqlite")
+def compile_big_integer(type_, compiler, **kw):
+    # sqlite only autoincrements INTEGER primary keys
+    return "INTEGER"
+
+
+@pytest.fixture
+def engine():
+    models = [FSVersion, FSPlayersMatches, FSPlayersTables, FbrefSchedule, PlayersMatch]
+    with sqlite_session_factory(models, [
+        "fantasy_helper.db.dao.feature_store.fs_versions",
+        "fantasy_helper.db.dao.feature_store.fs_players_stats",
+    ]) as factory:
+        yield factory.kw["bind"]
+
+
+@pytest.fixture
+def dao(engine) -> FSPlayersStatsDAO:
+    return FSPlayersStatsDAO()
+
+
+def add_matches(
+    engine, dao: FSPlayersStatsDAO, matches: List[Tuple[int, str, str]], timestamp: datetime.datetime
+) -> None:
+    """
+    Adds parsed matches (gameweek, home team, away team) with their players stats.
+    "Player 0" of Team E moves to Team F from gameweek 4.
+    """
+    rnd = random.Random(len(matches) + timestamp.day)
+    year = dao._league_registry.year(LEAGUE_NAME)
+    schedule_rows, players_rows = [], []
+    for gameweek, home_team, away_team in matches:
+        date = datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * gameweek)
+        schedule_rows.append(dict(
+            league_name=LEAGUE_NAME, year=year, timestamp=timestamp, home_team=home_team, away_team=away_team,
+            gameweek=gameweek, date=date, match_parsed=True
+        ))
+        for team_name in (home_team, away_team):
+            for player in range(5):
+                if team_name == "Team E" and player == 0 and gameweek >= 4:
+                    continue
+                players_rows.append(dict(
+                    league_name=LEAGUE_NAME, year=year, timestamp=timestamp, name=f"Player {team_name} {player}",
+                    player_id=f"{team_name} {player}", team_name=team_name, home_team=home_team,
+                    away_team=away_team, gameweek=gameweek, date=date, minutes=rnd.choice([None, 0, 45, 90]),
+                    goals=rnd.randint(0, 2), xg=rnd.random(), xg_assist=rnd.choice([None, rnd.random()]),
+                    sca=rnd.randint(0, 4)
+                ))
+            if team_name == "Team F" and gameweek >= 4:
+                players_rows.append(dict(players_rows[-1], name="Player Team E 0", player_id="Team E 0"))
+
+    with engine.begin() as connection:
+        connection.execute(insert(FbrefSchedule.__table__), schedule_rows)
+        connection.execute(insert(PlayersMatch.__table__), players_rows)
+
+
+def season_matches(gameweeks: range) -> List[Tuple[int, str, str]]:
+    return [
+        (gameweek, TEAMS[(i + gameweek) % 6], TEAMS[(i + gameweek + 3) % 6])
+        for gameweek in gameweeks
+        for i in range(3)
+    ]
+
+
+def published(dao: FSPlayersStatsDAO):
+    players_stats = sorted(
+        (asdict(x) for x in dao.get_players_stats_info(LEAGUE_NAME)),
+        key=lambda x: (x["team"], x["name"], x["games_all"])
+    )
+    players_matches = sorted(
+        (asdict(x) for x in dao.get_players_matches(LEAGUE_NAME)),
+        key=lambda x: (x["team"], x["name"], x["match_number"])
+    )
+    return players_stats, players_matches
+
+
+def test_first_update_is_full(engine, dao: FSPlayersStatsDAO):
+    add_matches(engine, dao, season_matches(range(1, 4)), datetime.datetime(2024, 9, 1))
+
+    with patch.object(dao, "get_changed_teams") as get_changed_teams:
+        dao.update_players_stats(LEAGUE_NAME, incremental=True, add_sports_info=False)
+
+    get_changed_teams.assert_not_called()
+    assert len(dao.get_players_stats_info(LEAGUE_NAME)) > 0
+
+
+@pytest.mark.parametrize("new_match,changed_teams", [
+    ((6, "Team A", "Team B"), {"Team A", "Team B"}),
+    ((6, "Team F", "Team C"), {"Team C", "Team E", "Team F"}),
+])
+def test_incremental_update_matches_full_rebuild(engine, dao: FSPlayersStatsDAO, new_match, changed_teams):
+    add_matches(engine, dao, season_matches(range(1, 6)), datetime.datetime(2024, 9, 1))
+    dao.update_players_stats(LEAGUE_NAME, incremental=True, add_sports_info=False)
+
+    # a midweek match of gameweek 6
+    add_matches(engine, dao, [new_match], datetime.datetime(2024, 9, 8))
+    with patch.object(dao, "compute_players_matches", wraps=dao.compute_players_matches) as compute:
+        dao.update_players_stats(LEAGUE_NAME, incremental=True, add_sports_info=False)
+    assert compute.call_args.args == (LEAGUE_NAME, changed_teams)
+    incremental = published(dao)
+
+    dao.update_players_stats(LEAGUE_NAME, incremental=False, add_sports_info=False)
+
+    assert published(dao) == incremental
+
+
+def test_no_new_matches_recomputes_nothing(engine, dao: FSPlayersStatsDAO):
+    add_matches(engine, dao, season_matches(range(1, 4)), datetime.datetime(2024, 9, 1))
+    dao.update_players_stats(LEAGUE_NAME, incremental=True, add_sports_info=False)
+    full = published(dao)
+
+    with patch.object(dao, "compute_players_matches") as compute:
+        dao.update_players_stats(LEAGUE_NAME, incremental=True, add_sports_info=False)
+
+    compute.assert_not_called()
+    assert published(dao) == full
+
+
+def test_changed_teams_include_teams_sharing_players(engine, dao: FSPlayersStatsDAO):
+    add_matches(engine, dao, season_matches(range(1, 6)), datetime.datetime(2024, 9, 1))
+    add_matches(engine, dao, [(6, "Team F", "Team A")], datetime.datetime(2024, 9, 8))
+
+    assert dao.get_changed_teams(LEAGUE_NAME, datetime.datetime(2024, 9, 1)) == {"Team A", "Team E", "Team F"}
@@ -0,0 +1,67 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import insert
+
+from fantasy_helper.db.dao.feature_store.fs_players_stats import FSPlayersStatsDAO
+from fantasy_helper.db.models.feature_store.fs_players_free_kicks import FSPlayersFreeKicks
+from fantasy_helper.db.models.feature_store.fs_players_stats import FSPlayersStats
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+
+
+LEAGUE_NAME = "Russia"
+MIGRATION = Path(__file__).parents[3] / "alembic" / "versions" / "c5f1a8d3e726_drop_fs_players_stats_snapshots.py"
+
+
+@pytest.fixture
+def engine():
+    models = [FSVersion, FSPlayersStats, FSPlayersFreeKicks]
+    with sqlite_session_factory(models, ["fantasy_helper.db.dao.feature_store.fs_players_stats"]) as factory:
+        yield factory.kw["bind"]
+
+
+def upgrade(engine) -> None:
+    spec = importlib.util.spec_from_file_location("drop_fs_players_stats_snapshots", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+
+def test_typed_players_stats_are_read_after_migration(engine):
+    stats_rows = [
+        # typed rows written before the versioning, moved to version 0 with a pointer
+        dict(id=1, league_name=LEAGUE_NAME, version=0, type="abs", name="Player A", team="Team A", games=3, goals=2),
+        dict(id=2, league_name=LEAGUE_NAME, version=0, type="norm", name="Player A", team="Team A", games=3, goals=1),
+        # published cumulative snapshots
+        dict(id=3, league_name=LEAGUE_NAME, version=1, type=None, name="Player A", team="Team A", games=1, goals=1),
+        dict(id=4, league_name=LEAGUE_NAME, version=2, type=None, name="Player A", team="Team A", games=2, goals=2),
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(FSPlayersStats), stats_rows)
+        connection.execute(insert(FSPlayersFreeKicks), [dict(
+            id=1, league_name=LEAGUE_NAME, name="Player A", team="Team A", position="FW", games=3, corner_kicks=1.0
+        )])
+        connection.execute(insert(FSVersion), [
+            dict(league_name=LEAGUE_NAME, table_name="fs_players_stats", version=2),
+            dict(league_name=LEAGUE_NAME, table_name="fs_players_matches", version=5),
+        ])
+
+    upgrade(engine)
+
+    with engine.connect() as connection:
+        types = sorted(row.type for row in connection.execute(FSPlayersStats.__table__.select()))
+        pointers = [row.table_name for row in connection.execute(FSVersion.__table__.select())]
+    assert types == ["abs", "norm"]
+    assert pointers == ["fs_players_matches"]
+
+    players_stats = FSPlayersStatsDAO().get_players_stats(LEAGUE_NAME)
+    assert players_stats.abs_stats[["name", "games", "goals"]].values.tolist() == [["Player A", 3, 2]]
+    assert players_stats.norm_stats[["name", "games", "goals"]].values.tolist() == [["Player A", 3, 1]]
+    assert players_stats.free_kicks["name"].tolist() == ["Player A"]
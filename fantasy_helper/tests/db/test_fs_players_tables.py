@@ -0,0 +1,107 @@
+import datetime
+import random
+from dataclasses import asdict, replace
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from fantasy_helper.db.dao.feature_store.fs_players_stats import STATS_COLUMNS, FSPlayersStatsDAO
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+from fantasy_helper.utils.dataclasses import PlayerMatchStatsInfo, PlayersTableRow
+
+
+@pytest.fixture
+def dao() -> FSPlayersStatsDAO:
+    with sqlite_session_factory([FSVersion, FSPlayersMatches, FSPlayersTables], [
+        "fantasy_helper.db.dao.feature_store.fs_versions",
+        "fantasy_helper.db.dao.feature_store.fs_players_stats",
+    ]):
+        yield FSPlayersStatsDAO()
+
+
+@pytest.fixture
+def players_matches() -> List[PlayerMatchStatsInfo]:
+    rnd = random.Random(0)
+    result = []
+    for player in range(40):
+        team_id = player % 4
+        matches_count = 8 - team_id % 2
+        role, price = rnd.choice(["FORWARD", "DEFENDER", None]), rnd.random() * 10
+        for match_number in range(1, matches_count + 1):
+            if rnd.random() < 0.2:
+                continue
+            result.append(PlayerMatchStatsInfo(
+                name=f"Player {player}",
+                team=f"Team {team_id}",
+                position="FORWARD",
+                match_number=match_number,
+                gameweek=matches_count - match_number + 1,
+                date=datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * (matches_count - match_number)),
+                minutes=rnd.choice([None, 0, rnd.randint(1, 90)]),
+                sports_team=f"Sports Team {team_id}",
+                sports_name=None if player % 9 == 0 else f"Sports Player {player}",
+                role=role,
+                price=price,
+                **{column: rnd.choice([None, rnd.randint(0, 3)]) for column in STATS_COLUMNS},
+            ))
+    return result
+
+
+def sorted_rows(rows: List[PlayersTableRow]) -> List[PlayersTableRow]:
+    return sorted(rows, key=lambda row: (row.team_name, row.name))
+
+
+def test_published_tables_match_computed(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+
+    for games_count in [None, 1, 3, 7, 8, 20]:
+        for normalize_minutes, normalize_matches in [(False, False), (True, False), (False, True)]:
+            for min_minutes in [None, 0, 60]:
+                params = (games_count, normalize_minutes, normalize_matches, min_minutes)
+                assert sorted_rows(dao.get_published_players_table_rows("Russia", *params)) == \
+                    sorted_rows(dao.get_players_table_rows("Russia", *params)), params
+
+
+def test_missing_tables_fall_back_to_computing(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    # players matches published without their tables
+    dao._versions_dao.publish(FSPlayersMatches, "Russia", (asdict(x) for x in players_matches))
+
+    rows = dao.get_published_players_table_rows("Russia", 3)
+    assert rows and rows == dao.get_players_window_rows("Russia", 3)
+
+
+def test_names_are_read_from_players_matches(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+
+    assert dao.get_teams_names("Russia") == [f"Sports Team {team_id}" for team_id in range(4)]
+    assert dao.get_players_names("Russia", "Sports Team 1") == sorted(
+        f"Sports Player {player}" for player in range(1, 40, 4) if player % 9 != 0
+    )
+
+
+def test_sports_info_is_added_to_players_matches(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    def add_sports_info(league_name, players_stats, sports_players):
+        return [
+            replace(x, sports_name=f"Sports {x.name}", sports_team="Sports Team", role="FORWARD", price=1.5)
+            if x.name == "Player 1" else x
+            for x in players_stats
+        ]
+
+    dao.__dict__["_fs_sports_players_dao"] = MagicMock()
+    dao.__dict__["_naming_dao"] = MagicMock(add_sports_info_to_players_stats_info=add_sports_info)
+    players_matches = [
+        replace(x, sports_name=None, sports_team=None, role=None, price=None) for x in players_matches
+    ]
+    dao.update_players_matches("Russia", players_matches)
+
+    assert {
+        (x.name, x.sports_name, x.sports_team, x.role, x.price) for x in dao.get_players_matches("Russia")
+        if x.sports_name is not None
+    } == {("Player 1", "Sports Player 1", "Sports Team", "FORWARD", 1.5)}
+    assert [(row.name, row.team_name) for row in dao.get_published_players_table_rows("Russia")] == [
+        ("Sports Player 1", "Sports Team")
+    ]
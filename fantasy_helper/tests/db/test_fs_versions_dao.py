@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
+from fantasy_helper.db.models.feature_store.fs_sports_players import FSSportsPlayers
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+
+
+@pytest.fixture
+def session_factory():
+    with sqlite_session_factory([FSVersion, FSSportsPlayers], ["fantasy_helper.db.dao.feature_store.fs_versions"]) as factory:
+        yield factory
+
+
+def players(prefix: str, count: int):
+    return [{"name": f"{prefix} {i}", "price": float(i)} for i in range(count)]
+
+
+def current_names(session_factory, league_name: str):
+    db_session = session_factory()
+    rows = db_session.query(FSSportsPlayers).filter(
+        FSVersionsDAO.is_current(FSSportsPlayers, league_name)
+    ).all()
+    db_session.close()
+    return sorted(row.name for row in rows)
+
+
+def test_readers_see_only_published_snapshot(session_factory):
+    dao = FSVersionsDAO(keep_versions=2)
+
+    assert current_names(session_factory, "RPL") == []
+    assert dao.publish(FSSportsPlayers, "RPL", players("old", 3)) == 1
+    assert dao.publish(FSSportsPlayers, "RPL", players("new", 2)) == 2
+    dao.publish(FSSportsPlayers, "EPL", players("other", 1))
+
+    assert current_names(session_factory, "RPL") == ["new 0", "new 1"]
+    assert current_names(session_factory, "EPL") == ["other 0"]
+    assert dao.get_version(FSSportsPlayers, "RPL") == 2
+
+
+def test_old_versions_are_garbage_collected(session_factory):
+    dao = FSVersionsDAO(keep_versions=2)
+    for version in range(4):
+        dao.publish(FSSportsPlayers, "RPL", players(f"v{version}", 2))
+
+    db_session = session_factory()
+    versions = {row.version for row in db_session.query(FSSportsPlayers)}
+    db_session.close()
+
+    assert versions == {3, 4}
+
+
+def test_failed_publish_keeps_previous_snapshot(session_factory):
+    dao = FSVersionsDAO()
+    dao.publish(FSSportsPlayers, "RPL", players("old", 2))
+
+    def broken_rows():
+        yield {"name": "new 0"}
+        raise RuntimeError("rebuild failed")
+
+    with pytest.raises(RuntimeError):
+        dao.publish(FSSportsPlayers, "RPL", broken_rows())
+
+    assert current_names(session_factory, "RPL") == ["old 0", "old 1"]
+    assert dao.get_version(FSSportsPlayers, "RPL") == 1
+
+
+def test_first_publishes_of_a_league_are_serialized(tmp_path):
+    # a file database, so the two publishes run in their own transactions
+    engine = create_engine(f"sqlite:///{tmp_path / 'fs.db'}", connect_args={"timeout": 30})
+    for model in [FSVersion, FSSportsPlayers]:
+        model.__table__.create(engine)
+    dao = FSVersionsDAO()
+    barrier = Barrier(2)
+
+    def slow_rows(prefix: str):
+        for row in players(prefix, 2):
+            time.sleep(0.1)
+            yield row
+
+    def publish(prefix: str) -> int:
+        barrier.wait()
+        return dao.publish(FSSportsPlayers, "RPL", slow_rows(prefix))
+
+    with patch("fantasy_helper.db.dao.feature_store.fs_versions.Session", sessionmaker(bind=engine)):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            versions = sorted(executor.map(publish, ["a", "b"]))
+
+        assert versions == [1, 2]
+        assert dao.get_version(FSSportsPlayers, "RPL") == 2
+
+
+def test_pointer_insert_skips_existing_pointer():
+    db_session = MagicMock()
+    db_session.get_bind.return_value.dialect.name = "postgresql"
+
+    FSVersionsDAO._insert_pointer(db_session, FSSportsPlayers, "RPL")
+
+    statement = db_session.execute.call_args.args[0]
+    assert "ON CONFLICT (league_name, table_name) DO NOTHING" in str(statement.compile(dialect=postgresql.dialect()))
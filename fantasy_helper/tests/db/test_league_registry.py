@@ -0,0 +1,93 @@
+import time
+from types import MappingProxyType
+from typing import Callable
+
+import pytest
+
+from fantasy_helper.db.dao.coeff import CoeffDAO
+from fantasy_helper.db.dao.feature_store.fs_calendar import FSCalendarsDAO
+from fantasy_helper.db.dao.table import TableDao
+from fantasy_helper.parsers.sports import SportsParser
+from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.utils.dataclasses import LeagueInfo
+from fantasy_helper.utils.league_registry import LeagueRegistry, get_league_registry
+
+
+def make_league(name: str, is_active: bool = True, **kwargs) -> LeagueInfo:
+    return LeagueInfo(name=name, ru_name=f"ru {name}", emoji="", is_active=is_active, **kwargs)
+
+
+@pytest.fixture
+def registry() -> LeagueRegistry:
+    return LeagueRegistry([
+        make_league("Spain", squad_id=1, betcity_url="https://betcity/spain", year="2025"),
+        make_league("Italy", betcity_url="https://betcity/italy"),
+        make_league("Russia", is_active=False, squad_id=3),
+    ])
+
+
+def test_lookups(registry: LeagueRegistry):
+    assert registry.names == ["Spain", "Italy"]
+    assert "Spain" in registry and "Russia" not in registry
+    assert registry.get("Italy").betcity_url == "https://betcity/italy"
+    assert registry.get("Russia") is None
+    assert registry.get_by_ru_name("ru Spain").name == "Spain"
+    assert registry.ru_name_2_name == {"ru Spain": "Spain", "ru Italy": "Italy"}
+
+    assert registry.year("Spain") == "2025"
+    assert registry.year("Unknown") == "2024"
+    assert registry.year("Unknown", None) is None
+
+    assert registry.source("squad_id") == {"Spain": 1}
+    assert registry.source("betcity_url") == {"Spain": "https://betcity/spain", "Italy": "https://betcity/italy"}
+    with pytest.raises(KeyError):
+        registry.source("name")
+
+
+def test_registry_is_read_only(registry: LeagueRegistry):
+    assert isinstance(registry.leagues, tuple)
+    with pytest.raises(AttributeError):
+        registry._leagues = ()
+    with pytest.raises(TypeError):
+        registry.source("squad_id")["Italy"] = 2
+    assert isinstance(registry.source("squad_id"), MappingProxyType)
+
+
+def test_parsers_share_registry_maps(registry: LeagueRegistry):
+    parser = SportsParser(leagues=registry)
+    assert parser.get_leagues() == ["Spain"]
+    assert SportsParser(leagues=list(registry.leagues)).get_leagues() == ["Spain"]
+
+
+def test_registry_is_built_once():
+    registry = get_league_registry()
+
+    assert get_league_registry() is registry
+    assert registry.names == [league.name for league in instantiate_leagues(load_config())]
+    assert TableDao()._league_registry is registry
+    assert CoeffDAO()._naming_dao._name_matcher._league_registry is registry
+
+
+def median_time(constructor: Callable[[], object], repeats: int = 5) -> float:
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        constructor()
+        elapsed.append(time.perf_counter() - start)
+    return sorted(elapsed)[len(elapsed) // 2]
+
+
+def test_dao_construction_time():
+    get_league_registry()
+
+    # before, every DAO constructor composed the config and instantiated the leagues
+    def load_leagues():
+        leagues = instantiate_leagues(load_config())
+        return {league.name: league.year for league in leagues}
+
+    before = median_time(load_leagues)
+    # FSCalendarsDAO used to load the leagues five times, through its own
+    # constructor, ScheduleDao, TableDao, NamingDAO and NameMatcher
+    after = median_time(FSCalendarsDAO)
+
+    assert after < before
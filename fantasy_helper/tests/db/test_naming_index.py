@@ -0,0 +1,98 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.db.dao.ml.naming_index import NamingIndexCache
+from fantasy_helper.db.models.ml.player_name import PlayerName as DBPlayerName
+from fantasy_helper.db.models.ml.team_name import TeamName as DBTeamName
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+from fantasy_helper.utils.dataclasses import MatchInfo, LeagueScheduleInfo, PlayerName, TeamName
+
+
+LEAGUE_NAME = "Test League"
+
+
+@pytest.fixture
+def naming_index_cache():
+    cache = NamingIndexCache(ttl=60)
+    with patch("fantasy_helper.db.dao.ml.naming.naming_index_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def session_factory(naming_index_cache):
+    with sqlite_session_factory([DBTeamName, DBPlayerName], ["fantasy_helper.db.dao.ml.naming"]) as factory:
+        db_session = factory()
+        db_session.add(DBTeamName(
+            league_name=LEAGUE_NAME, sports_name="Зенит", fbref_name="Zenit", xbet_name=None,
+            betcity_name="Зенит СПб", name="Зенит", timestamp=datetime.now()
+        ))
+        db_session.add(DBPlayerName(
+            league_name=LEAGUE_NAME, team_name="Зенит", sports_name="Матвей Сафонов",
+            fbref_name="Matvey Safonov", name="Матвей Сафонов", timestamp=datetime.now()
+        ))
+        db_session.commit()
+        db_session.close()
+
+        yield factory
+
+
+def test_index_is_shared_between_daos(session_factory, naming_index_cache):
+    naming_dao_1, naming_dao_2 = NamingDAO(), NamingDAO()
+
+    index = naming_dao_1.get_naming_index(LEAGUE_NAME)
+
+    assert naming_dao_2.get_naming_index(LEAGUE_NAME) is index
+    assert (naming_index_cache.hits, naming_index_cache.misses) == (1, 1)
+    assert index.teams_sports_2_fbref == {"Зенит": "Zenit"}
+    assert index.teams_betcity_2_sports == {"Зенит СПб": "Зенит"}
+    assert index.players_fbref_2_sports == {"Matvey Safonov": "Матвей Сафонов"}
+
+
+def test_index_is_invalidated_by_naming_writes(session_factory, naming_index_cache):
+    naming_dao = NamingDAO()
+    index = naming_dao.get_naming_index(LEAGUE_NAME)
+    new_player = PlayerName(
+        league_name=LEAGUE_NAME, team_name="Зенит", sports_name="Вендел", fbref_name="Wendel"
+    )
+
+    naming_dao._add_players_names([new_player])
+    new_index = naming_dao.get_naming_index(LEAGUE_NAME)
+
+    assert new_index.version == index.version + 1
+    assert new_index.players_sports_2_fbref["Вендел"] == "Wendel"
+
+    naming_dao._delete_teams_names([TeamName(league_name="Other League", sports_name="Спартак")])
+    assert naming_dao.get_naming_index(LEAGUE_NAME) is new_index
+
+
+def test_index_expires_after_ttl():
+    now = 0.0
+    cache = NamingIndexCache(ttl=10, clock=lambda: now)
+    loads = []
+
+    def loader(league_name):
+        loads.append(league_name)
+        return [], []
+
+    cache.get(LEAGUE_NAME, loader)
+    now = 5.0
+    cache.get(LEAGUE_NAME, loader)
+    now = 11.0
+    cache.get(LEAGUE_NAME, loader)
+
+    assert loads == [LEAGUE_NAME, LEAGUE_NAME]
+
+
+def test_add_sports_info_to_coeffs_uses_index(session_factory):
+    naming_dao = NamingDAO()
+    coeffs = [MatchInfo(league_name=LEAGUE_NAME, home_team="Зенит СПб", away_team="Зенит СПб")]
+    matches = [LeagueScheduleInfo(
+        league_name=LEAGUE_NAME, home_team="Зенит", away_team="Зенит", gameweek=1, tour_name="1 тур"
+    )]
+
+    result = naming_dao.add_sports_info_to_coeffs(LEAGUE_NAME, coeffs, matches)
+
+    assert [(match.home_team, match.tour_number) for match in result] == [("Зенит", 1)]
@@ -0,0 +1,187 @@
+import random
+from copy import deepcopy
+from typing import List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.db.dao.ml.naming_index import LeagueNamingIndex
+from fantasy_helper.utils.dataclasses import (
+    PlayerName, PlayerStatsInfo, PlayersLeagueStats, SportsPlayerDiff, TeamName
+)
+
+
+LEAGUE_NAME = "Test League"
+SPORTS_COLUMNS = ["sports_team", "sports_name", "role", "price", "percent_ownership", "percent_ownership_diff"]
+
+
+def reference_add_sports_info_to_players_stats(
+    naming_index: LeagueNamingIndex, players_stats: PlayersLeagueStats, sports_players: List[SportsPlayerDiff]
+) -> PlayersLeagueStats:
+    """
+    NamingDAO.add_sports_info_to_players_stats before the columnar join.
+    """
+    teams_info = pd.DataFrame([
+        {"team": team.fbref_name, "sports_team": team.sports_name} for team in naming_index.teams
+    ])
+    players_sports_2_fbref = {player.sports_name: player.fbref_name for player in naming_index.players}
+    players_info = pd.DataFrame([
+        {
+            "name": players_sports_2_fbref.get(player.name),
+            "sports_name": player.name,
+            "sports_team": player.team_name,
+            "role": player.role,
+            "price": player.price,
+            "percent_ownership": player.percent_ownership,
+            "percent_ownership_diff": player.percent_ownership_diff
+        }
+        for player in sports_players
+    ])
+
+    result = deepcopy(players_stats)
+    for attr in ("abs_stats", "norm_stats", "free_kicks"):
+        stats = getattr(result, attr)
+        stats.drop(labels=SPORTS_COLUMNS, axis=1, inplace=True, errors="ignore")
+        if "team" in stats.columns:
+            stats = stats.merge(teams_info, how="left", on="team")
+            if "sports_team" in stats.columns:
+                stats = stats.merge(players_info, how="left", on=["name", "sports_team"])
+        setattr(result, attr, stats)
+    return result
+
+
+def reference_add_sports_info_to_players_stats_info(
+    naming_index: LeagueNamingIndex, players_stats_info: List[PlayerStatsInfo], sports_players: List[SportsPlayerDiff]
+) -> List[PlayerStatsInfo]:
+    """
+    NamingDAO.add_sports_info_to_players_stats_info before the columnar join.
+    """
+    teams_sports_2_fbref = {team.sports_name: team.fbref_name for team in naming_index.teams}
+    players_sports_2_fbref = {player.sports_name: player.fbref_name for player in naming_index.players}
+
+    fbref_2_sports_players = {}
+    for player in sports_players:
+        fbref_name = players_sports_2_fbref.get(player.name)
+        fbref_team = teams_sports_2_fbref.get(player.team_name)
+        if fbref_name and fbref_team:
+            fbref_2_sports_players[(fbref_name, fbref_team)] = player
+
+    result = []
+    for player_stats_info in players_stats_info:
+        cur_player_stats_info = deepcopy(player_stats_info)
+        sports_player = fbref_2_sports_players.get((player_stats_info.name, player_stats_info.team))
+        if sports_player is not None:
+            cur_player_stats_info.sports_name = sports_player.name
+            cur_player_stats_info.sports_team = sports_player.team_name
+            cur_player_stats_info.role = sports_player.role
+            cur_player_stats_info.price = sports_player.price
+            cur_player_stats_info.percent_ownership = sports_player.percent_ownership
+            cur_player_stats_info.percent_ownership_diff = sports_player.percent_ownership_diff
+        result.append(cur_player_stats_info)
+    return result
+
+
+def synthetic_league(
+    seed: int, teams_count: int = 6, players_count: int = 15
+) -> Tuple[LeagueNamingIndex, List[PlayerStatsInfo], List[SportsPlayerDiff]]:
+    """
+    Names of a league with the gaps of real data: teams and players without
+    a pair, sports players without a team and two sports players of one
+    fbref player.
+    """
+    rnd = random.Random(seed)
+    teams, players, players_stats_info, sports_players = [], [], [], []
+    for i in range(teams_count):
+        team_name = TeamName(
+            league_name=LEAGUE_NAME, sports_name=f"Команда {i}",
+            fbref_name=f"Team {i}" if rnd.random() > 0.15 else None
+        )
+        teams.append(team_name)
+        for j in range(players_count):
+            fbref_name = f"Player {i}-{j}"
+            if rnd.random() > 0.1:
+                players.append(PlayerName(
+                    league_name=LEAGUE_NAME, team_name=team_name.name,
+                    sports_name=f"Игрок {i}-{j}", fbref_name=fbref_name
+                ))
+            if rnd.random() > 0.05:
+                sports_players.append(SportsPlayerDiff(
+                    name=f"Игрок {i}-{j}", league_name=LEAGUE_NAME,
+                    team_name=team_name.sports_name if rnd.random() > 0.05 else None,
+                    role=rnd.choice(["GK", "DEF", "MID", "FOR"]), price=rnd.choice([4.5, 5.0, 7.5, None]),
+                    percent_ownership=rnd.random(), percent_ownership_diff=rnd.random() - 0.5
+                ))
+            players_stats_info.append(PlayerStatsInfo(
+                name=fbref_name, team=team_name.fbref_name or f"Team {i}", position="MF",
+                games=rnd.randint(0, 10), minutes=rnd.randint(0, 900), goals=rnd.randint(0, 5),
+                xg=rnd.random() * 3, sports_name="outdated" if rnd.random() > 0.5 else None
+            ))
+    # a fbref player with two sports players
+    players.append(PlayerName(
+        league_name=LEAGUE_NAME, team_name=teams[0].name, sports_name="Дубль", fbref_name="Player 0-0"
+    ))
+    sports_players.append(SportsPlayerDiff(
+        name="Дубль", league_name=LEAGUE_NAME, team_name=teams[0].sports_name, role="MID", price=5.0
+    ))
+
+    naming_index = LeagueNamingIndex.build(LEAGUE_NAME, 0, teams, players)
+    return naming_index, players_stats_info, sports_players
+
+
+def to_players_stats(players_stats_info: List[PlayerStatsInfo]) -> PlayersLeagueStats:
+    df = pd.DataFrame([
+        {
+            "name": info.name, "team": info.team, "games": info.games, "minutes": info.minutes,
+            "goals": info.goals, "xg": info.xg, "sports_name": info.sports_name
+        }
+        for info in players_stats_info
+    ])
+    df.index = np.arange(len(df)) * 2 + 10
+    return PlayersLeagueStats(
+        abs_stats=df,
+        norm_stats=df.assign(xg=df["xg"] / 90),
+        free_kicks=df[["name", "team", "goals"]].copy()
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_add_sports_info_to_players_stats_matches_merge(seed: int):
+    naming_index, players_stats_info, sports_players = synthetic_league(seed)
+    players_stats = to_players_stats(players_stats_info)
+    naming_dao = NamingDAO()
+
+    with patch.object(naming_dao, "get_naming_index", return_value=naming_index):
+        result = naming_dao.add_sports_info_to_players_stats(LEAGUE_NAME, players_stats, sports_players)
+    expected = reference_add_sports_info_to_players_stats(naming_index, players_stats, sports_players)
+
+    for attr in ("abs_stats", "norm_stats", "free_kicks"):
+        pd.testing.assert_frame_equal(getattr(result, attr), getattr(expected, attr))
+    # the input is left as it was
+    assert "sports_name" in players_stats.abs_stats.columns
+    assert players_stats.abs_stats.index[0] == 10
+
+
+def test_add_sports_info_to_players_stats_without_team():
+    naming_index, players_stats_info, sports_players = synthetic_league(0)
+    players_stats = to_players_stats(players_stats_info)
+    players_stats.free_kicks = players_stats.free_kicks.drop(columns=["team"])
+    naming_dao = NamingDAO()
+
+    with patch.object(naming_dao, "get_naming_index", return_value=naming_index):
+        result = naming_dao.add_sports_info_to_players_stats(LEAGUE_NAME, players_stats, sports_players)
+
+    pd.testing.assert_frame_equal(result.free_kicks, players_stats.free_kicks)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_add_sports_info_to_players_stats_info_matches_reference(seed: int):
+    naming_index, players_stats_info, sports_players = synthetic_league(seed)
+    naming_dao = NamingDAO()
+
+    with patch.object(naming_dao, "get_naming_index", return_value=naming_index):
+        result = naming_dao.add_sports_info_to_players_stats_info(LEAGUE_NAME, players_stats_info, sports_players)
+
+    assert result == reference_add_sports_info_to_players_stats_info(naming_index, players_stats_info, sports_players)
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fantasy_helper.utils.pipeline import Pipeline, Stage
+
+
+def sleeper(events: list, name: str, seconds: float = 0.1):
+    def func():
+        events.append(("start", name))
+        time.sleep(seconds)
+        events.append(("end", name))
+    return func
+
+
+def test_independent_stages_run_concurrently():
+    events = []
+    pipeline = Pipeline("test", [
+        Stage("schedule", sleeper(events, "schedule", 0.2), outputs=("schedule",)),
+        Stage("table", sleeper(events, "table", 0.2), outputs=("table",)),
+        Stage("calendar", sleeper(events, "calendar", 0.0), inputs=("schedule", "table")),
+    ])
+
+    start = time.perf_counter()
+    report = asyncio.run(pipeline.run())
+
+    assert time.perf_counter() - start < 0.35
+    assert events[:2] == [("start", "schedule"), ("start", "table")]
+    assert events[-2:] == [("start", "calendar"), ("end", "calendar")]
+    assert [stage.status for stage in report.stages] == ["done", "done", "done"]
+
+
+def test_failure_skips_only_dependents():
+    def fail():
+        raise RuntimeError("site is down")
+
+    events = []
+    pipeline = Pipeline("test", [
+        Stage("actual_players", fail, outputs=("actual_players",)),
+        Stage("naming", sleeper(events, "naming"), inputs=("actual_players",), outputs=("naming",)),
+        Stage("calendar", sleeper(events, "calendar"), inputs=("naming",)),
+        Stage("coeffs", sleeper(events, "coeffs"), outputs=("coeffs",)),
+    ])
+
+    report = asyncio.run(pipeline.run())
+
+    assert report.failed == ["actual_players"]
+    assert report.skipped == ["naming", "calendar"]
+    assert events == [("start", "coeffs"), ("end", "coeffs")]
+    assert "RuntimeError: site is down" in report.format()
+
+
+def test_stages_of_one_resource_run_one_by_one():
+    running, max_running = 0, 0
+    lock = threading.Lock()
+
+    def scrape():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    pipeline = Pipeline("test", [
+        Stage(f"fbref_{i}", scrape, resources=("fbref",)) for i in range(3)
+    ])
+    report = asyncio.run(pipeline.run())
+
+    assert max_running == 1
+    assert [stage.status for stage in report.stages] == ["done"] * 3
+
+
+def test_coroutine_stages_run_on_the_event_loop():
+    threads = []
+
+    async def parse():
+        threads.append(threading.current_thread())
+        await asyncio.sleep(0)
+
+    report = asyncio.run(Pipeline("test", [Stage("coeffs", parse)]).run())
+
+    assert threads == [threading.main_thread()]
+    assert report.stages[0].status == "done"
+
+
+def test_critical_path():
+    events = []
+    pipeline = Pipeline("test", [
+        Stage("schedule", sleeper(events, "schedule", 0.01), outputs=("schedule",)),
+        Stage("table", sleeper(events, "table", 0.15), outputs=("table",)),
+        Stage("calendar", sleeper(events, "calendar", 0.01), inputs=("schedule", "table")),
+        Stage("coeffs", sleeper(events, "coeffs", 0.05)),
+    ])
+
+    report = asyncio.run(pipeline.run())
+
+    assert report.critical_path == ["table", "calendar"]
+
+
+@pytest.mark.parametrize("stages,message", [
+    ([Stage("a", print, inputs=("x",))], "No stage produces x"),
+    ([Stage("a", print, outputs=("x",)), Stage("b", print, outputs=("x",))], "produced by a and b"),
+    ([Stage("a", print), Stage("a", print)], "Duplicated stage"),
+    ([Stage("a", print, inputs=("y",), outputs=("x",)), Stage("b", print, inputs=("x",), outputs=("y",))], "cycle"),
+])
+def test_invalid_pipelines(stages, message):
+    with pytest.raises(ValueError, match=message):
+        Pipeline("test", stages)
@@ -0,0 +1,486 @@
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasy_helper.db.dao.player import PlayerDAO
+from fantasy_helper.utils.dataclasses import FreeKicksInfo, PlayersLeagueStats, PlayerStatsInfo
+
+
+class ReferencePlayerStats:
+    """
+    The row by row implementation that PlayerDAO._compute_league_stats replaced.
+    """
+
+    def __init__(self, fbref_parser):
+        self.__fbref_parser = fbref_parser
+
+    def _compute_diff_value(
+        self, max_value: Any, min_value: Any, minutes: Optional[int] = None
+    ) -> Any:
+        if (max_value is not None and not np.isnan(max_value)) and (
+            min_value is not None and not np.isnan(min_value)
+        ):
+            if minutes is None or np.isnan(minutes):
+                return max_value - min_value
+            else:
+                if minutes > 0:
+                    return float(max_value - min_value) * 90.0 / minutes
+                else:
+                    return None
+        else:
+            return None
+
+    def _compute_avg_diff_value(
+        self, max_value: Any, min_value: Any, min_games: Any, max_games: Any
+    ) -> Any:
+        if min_games is None or pd.isna(min_games) or max_games is None \
+            or pd.isna(max_games) or max_games == 0 or \
+                min_value is None or pd.isna(min_value):
+            return None
+
+        value_diff = self._compute_diff_value(max_value, min_value * min_games / max_games)
+        games_diff = self._compute_diff_value(max_games, min_games)
+
+        if value_diff is None or games_diff is None or games_diff == 0:
+            return None
+
+        return value_diff * max_games / games_diff
+
+    def _add_shooting_stats_abs(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        stats_info.goals = self._compute_diff_value(
+            max_stats["goals"], min_stats.get("goals", 0)
+        )
+        stats_info.shots = self._compute_diff_value(
+            max_stats["shots"], min_stats.get("shots", 0)
+        )
+        stats_info.shots_on_target = self._compute_diff_value(
+            max_stats["shots_on_target"], min_stats.get("shots_on_target", 0)
+        )
+        stats_info.average_shot_distance = self._compute_avg_diff_value(
+            max_stats["average_shot_distance"], 
+            min_stats.get("average_shot_distance", 0),
+            max_stats["games"], 
+            min_stats.get("games", 0)
+        )
+        stats_info.xg = self._compute_diff_value(
+            max_stats["xg"], min_stats.get("xg", 0)
+        )
+        stats_info.xg_np = self._compute_diff_value(
+            max_stats["npxg"], min_stats.get("npxg", 0)
+        )
+        if max_stats.get("pass_xa") is not None:
+            stats_info.xg_xa = self._compute_diff_value(
+                max_stats["xg"] + max_stats["pass_xa"],
+                min_stats.get("xg", 0) + min_stats.get("pass_xa", 0)
+            )
+            stats_info.xg_np_xa = self._compute_diff_value(
+                max_stats["npxg"] + max_stats["pass_xa"], 
+                min_stats.get("npxg", 0) + min_stats.get("pass_xa", 0)
+            )
+        return stats_info
+
+    def _add_shooting_stats_norm(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+
+        stats_info.goals = self._compute_diff_value(
+            max_stats["goals"], min_stats.get("goals", 0), minutes
+        )
+        stats_info.shots = self._compute_diff_value(
+            max_stats["shots"], min_stats.get("shots", 0), minutes
+        )
+        stats_info.shots_on_target = self._compute_diff_value(
+            max_stats["shots_on_target"], 
+            min_stats.get("shots_on_target", 0), 
+            minutes
+        )
+        stats_info.average_shot_distance = self._compute_avg_diff_value(
+            max_stats["average_shot_distance"],
+            min_stats.get("average_shot_distance", 0),
+            max_stats["games"], 
+            min_stats.get("games", 0)
+        )
+        stats_info.xg = self._compute_diff_value(
+            max_stats["xg"], min_stats.get("xg", 0), minutes
+        )
+        stats_info.xg_np = self._compute_diff_value(
+            max_stats["npxg"], min_stats.get("npxg", 0), minutes
+        )
+        if max_stats.get("pass_xa") is not None:
+            stats_info.xg_xa = self._compute_diff_value(
+                max_stats["xg"] + max_stats["pass_xa"], 
+                min_stats.get("xg", 0) + min_stats.get("pass_xa", 0), 
+                minutes
+            )
+            stats_info.xg_np_xa = self._compute_diff_value(
+                max_stats["npxg"] + max_stats["pass_xa"], 
+                min_stats.get("npxg", 0) + min_stats.get("pass_xa", 0), 
+                minutes
+            )
+        return stats_info
+
+    def _add_passing_stats_abs(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        stats_info.assists = self._compute_diff_value(
+            max_stats["assists"], min_stats.get("assists", 0)
+        )
+        stats_info.xa = self._compute_diff_value(
+            max_stats["pass_xa"], min_stats.get("pass_xa", 0)
+        )
+        stats_info.key_passes = self._compute_diff_value(
+            max_stats["assisted_shots"], min_stats.get("assisted_shots", 0)
+        )
+        stats_info.passes_into_penalty_area = self._compute_diff_value(
+            max_stats["passes_into_penalty_area"], 
+            min_stats.get("passes_into_penalty_area", 0)
+        )
+        stats_info.crosses_into_penalty_area = self._compute_diff_value(
+            max_stats["crosses_into_penalty_area"],
+            min_stats.get("crosses_into_penalty_area", 0),
+        )
+        return stats_info
+
+    def _add_passing_stats_norm(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+
+        stats_info.assists = self._compute_diff_value(
+            max_stats["assists"], min_stats.get("assists", 0), minutes
+        )
+        stats_info.xa = self._compute_diff_value(
+            max_stats["pass_xa"], min_stats.get("pass_xa", 0), minutes
+        )
+        stats_info.key_passes = self._compute_diff_value(
+            max_stats["assisted_shots"], min_stats.get("assisted_shots", 0), minutes
+        )
+        stats_info.passes_into_penalty_area = self._compute_diff_value(
+            max_stats["passes_into_penalty_area"],
+            min_stats.get("passes_into_penalty_area", 0),
+            minutes,
+        )
+        stats_info.crosses_into_penalty_area = self._compute_diff_value(
+            max_stats["crosses_into_penalty_area"],
+            min_stats.get("crosses_into_penalty_area", 0),
+            minutes,
+        )
+        return stats_info
+
+    def _add_possesion_stats_abs(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        stats_info.touches_in_attacking_third = self._compute_diff_value(
+            max_stats["touches_att_3rd"], min_stats.get("touches_att_3rd", 0)
+        )
+        stats_info.touches_in_attacking_penalty_area = self._compute_diff_value(
+            max_stats["touches_att_pen_area"],
+            min_stats.get("touches_att_pen_area", 0),
+        )
+        stats_info.carries_in_attacking_third = self._compute_diff_value(
+            max_stats["carries_into_final_third"],
+            min_stats.get("carries_into_final_third", 0),
+        )
+        stats_info.carries_in_attacking_penalty_area = self._compute_diff_value(
+            max_stats["carries_into_penalty_area"],
+            min_stats.get("carries_into_penalty_area", 0),
+        )
+        return stats_info
+
+    def _add_possesion_stats_norm(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+        stats_info.touches_in_attacking_third = self._compute_diff_value(
+            max_stats["touches_att_3rd"],
+            min_stats.get("touches_att_3rd", 0),
+            minutes,
+        )
+        stats_info.touches_in_attacking_penalty_area = self._compute_diff_value(
+            max_stats["touches_att_pen_area"],
+            min_stats.get("touches_att_pen_area", 0),
+            minutes,
+        )
+        stats_info.carries_in_attacking_third = self._compute_diff_value(
+            max_stats["carries_into_final_third"],
+            min_stats.get("carries_into_final_third", 0),
+            minutes,
+        )
+        stats_info.carries_in_attacking_penalty_area = self._compute_diff_value(
+            max_stats["carries_into_penalty_area"],
+            min_stats.get("carries_into_penalty_area", 0),
+            minutes,
+        )
+        return stats_info
+
+    def _add_standart_stats_abs(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        if stats_info.assists is None:
+            stats_info.assists = self._compute_diff_value(
+                max_stats["assists"],
+                min_stats.get("assists", 0)
+            )
+        return stats_info
+
+    def _add_standart_stats_norm(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        if stats_info.assists is None:
+            minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+
+            stats_info.assists = self._compute_diff_value(
+                max_stats["assists"],
+                min_stats.get("assists", 0),
+                minutes
+            )
+        return stats_info
+
+    def _add_shot_creation_stats_abs(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        stats_info.sca = self._compute_diff_value(
+            max_stats["sca"],
+            min_stats.get("sca", 0)
+        )
+        stats_info.gca = self._compute_diff_value(
+            max_stats["gca"],
+            min_stats.get("gca", 0)
+        )
+        return stats_info
+
+    def _add_shot_creation_stats_norm(
+        self, stats_info: PlayerStatsInfo, max_stats: Dict, min_stats: Dict
+    ) -> PlayerStatsInfo:
+        minutes = max_stats["minutes"] - min_stats.get("minutes", 0)
+
+        stats_info.sca = self._compute_diff_value(
+            max_stats["sca"],
+            min_stats.get("sca", 0),
+            minutes
+        )
+        stats_info.gca = self._compute_diff_value(
+            max_stats["gca"],
+            min_stats.get("gca", 0),
+            minutes
+        )
+        return stats_info
+
+    def _compute_stats_values(
+        self, max_stats: Dict, min_stats: Dict, team_name: str, position: str
+    ) -> Tuple[PlayerStatsInfo, PlayerStatsInfo]:
+        abs_stats_info = PlayerStatsInfo(
+            name=max_stats["name"],
+            team=team_name,
+            position=position,
+        )
+        norm_stats_info = PlayerStatsInfo(
+            name=max_stats["name"],
+            team=team_name,
+            position=position,
+        )
+        league_name = max_stats["league_name"]
+
+        if league_name in self.__fbref_parser.get_playing_time_leagues():
+            games = self._compute_diff_value(max_stats["games"], min_stats.get("games", 0))
+            abs_stats_info.games, norm_stats_info.games = games, games
+            minutes = self._compute_diff_value(
+                max_stats["minutes"], min_stats.get("minutes", 0)
+            )
+            abs_stats_info.minutes, norm_stats_info.minutes = minutes, minutes
+
+        if league_name in self.__fbref_parser.get_shooting_leagues():
+            abs_stats_info = self._add_shooting_stats_abs(
+                abs_stats_info, max_stats, min_stats
+            )
+            norm_stats_info = self._add_shooting_stats_norm(
+                norm_stats_info, max_stats, min_stats
+            )
+
+        if league_name in self.__fbref_parser.get_passing_leagues():
+            abs_stats_info = self._add_passing_stats_abs(
+                abs_stats_info, max_stats, min_stats
+            )
+            norm_stats_info = self._add_passing_stats_norm(
+                norm_stats_info, max_stats, min_stats
+            )
+
+        if league_name in self.__fbref_parser.get_possession_leagues():
+            abs_stats_info = self._add_possesion_stats_abs(
+                abs_stats_info, max_stats, min_stats
+            )
+            norm_stats_info = self._add_possesion_stats_norm(
+                norm_stats_info, max_stats, min_stats
+            )
+
+        if league_name in self.__fbref_parser.get_shot_creation_leagues():
+            abs_stats_info = self._add_shot_creation_stats_abs(
+                abs_stats_info, max_stats, min_stats
+            )
+            norm_stats_info = self._add_shot_creation_stats_norm(
+                norm_stats_info, max_stats, min_stats
+            )
+        
+        if league_name in self.__fbref_parser.get_standart_leagues():
+            abs_stats_info = self._add_standart_stats_abs(
+                abs_stats_info, max_stats, min_stats
+            )
+            norm_stats_info = self._add_standart_stats_norm(
+                norm_stats_info, max_stats, min_stats
+            )
+
+        return abs_stats_info, norm_stats_info
+
+    def _compute_player_stats(
+        self, group: pd.DataFrame, is_abs_stats: bool = True
+    ) -> pd.DataFrame:
+        group = group[~group["games"].isna()]
+        sorted_df = group.sort_values("games", ascending=True)
+        if len(sorted_df) == 0:
+            return pd.DataFrame()
+        
+        abs_stats_infos, norm_stats_infos = [], []
+        team_name = group["team_name"].mode().iloc[0]
+        position = group["position"].mode().iloc[0]
+        max_games_row = sorted_df.iloc[-1].to_dict()
+        
+        abs_stats_info, norm_stats_info = self._compute_stats_values(
+            max_games_row, {}, team_name, position
+        )
+        abs_stats_infos.append(asdict(abs_stats_info))
+        norm_stats_infos.append(asdict(norm_stats_info))
+
+        for _, row in sorted_df.iloc[:-1].iterrows():
+            abs_stats_info, norm_stats_info = self._compute_stats_values(
+                max_games_row, row.to_dict(), team_name, position
+            )
+            abs_stats_infos.append(asdict(abs_stats_info))
+            norm_stats_infos.append(asdict(norm_stats_info))
+
+        if is_abs_stats and abs_stats_infos:
+            return pd.DataFrame(abs_stats_infos)
+        elif (not is_abs_stats) and norm_stats_infos:
+            return pd.DataFrame(norm_stats_infos)
+        else:
+            return pd.DataFrame()
+
+    def _compute_free_kicks_stats_values(self, stats: Dict) -> FreeKicksInfo:
+        return FreeKicksInfo(
+            name=stats["name"],
+            games=stats["games"],
+            corner_kicks=stats["corner_kicks"],
+            penalty_goals=stats["pens_made"],
+            penalty_shots=stats["pens_att"],
+            free_kicks_shots=stats["shots_free_kicks"],
+        )
+
+    def _compute_free_kicks_stats(self, group: pd.DataFrame) -> pd.DataFrame:
+        max_games = group["games"].max()
+        if max_games is None or pd.isna(max_games):
+            return pd.DataFrame()
+        team_name = group["team_name"].mode()
+        position = group["position"].mode()
+        max_games_row = group[group["games"] == max_games].iloc[0].to_dict()
+
+        free_kikcs_info = self._compute_free_kicks_stats_values(max_games_row)
+        free_kikcs_info.team = team_name
+        free_kikcs_info.position = position
+        return pd.DataFrame(asdict(free_kikcs_info), index=[0])
+
+    def get_players_stats(self, df: pd.DataFrame) -> PlayersLeagueStats:
+        return PlayersLeagueStats(
+            abs_stats=df.groupby(by=["name"])
+            .apply(lambda x: self._compute_player_stats(x, is_abs_stats=True))
+            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True)
+            .reset_index(drop=True, inplace=False),
+            norm_stats=df.groupby(by=["name"])
+            .apply(lambda x: self._compute_player_stats(x, is_abs_stats=False))
+            .drop_duplicates(subset=["name", "team", "games"], ignore_index=True)
+            .reset_index(drop=True, inplace=False),
+            free_kicks=df.groupby(by=["name"])
+            .apply(self._compute_free_kicks_stats)
+            .drop_duplicates(subset=["name", "team"], ignore_index=True)
+            .reset_index(drop=True, inplace=False),
+        )
+
+
+STATS_COLUMNS = (
+    "goals", "shots", "shots_on_target", "xg", "npxg", "pass_xa", "assists", "assisted_shots",
+    "passes_into_penalty_area", "crosses_into_penalty_area", "touches_att_3rd", "touches_att_pen_area",
+    "carries_into_final_third", "carries_into_penalty_area", "sca", "gca", "corner_kicks", "pens_made",
+    "pens_att", "shots_free_kicks",
+)
+
+
+def random_players_snapshots(seed: int, league_name: str) -> pd.DataFrame:
+    """
+    Cumulative stats snapshots, as get_players_stats reads them: every player
+    has snapshots with distinct games, some of them in another team.
+    """
+    rnd = np.random.default_rng(seed)
+    rows = []
+    for player in range(40):
+        snapshots_count = int(rnd.integers(1, 8))
+        games = np.sort(rnd.choice(np.arange(0, 30), size=snapshots_count, replace=False))
+        teams = rnd.choice(["Team A", "Team B", "Team C"], size=2, replace=False)
+        minutes, stats = 0, dict.fromkeys(STATS_COLUMNS, 0.0)
+        for i, games_count in enumerate(games):
+            minutes += int(rnd.choice([0, 45, 90 * max(games_count - (games[i - 1] if i else 0), 0)]))
+            for column in STATS_COLUMNS:
+                stats[column] += float(rnd.integers(0, 3)) if column != "xg" else rnd.random()
+            rows.append(dict(
+                name=f"Player {player}",
+                league_name=league_name,
+                team_name=teams[int(rnd.random() < 0.2)],
+                position=rnd.choice(["DF", "MF", "FW"]),
+                games=games_count,
+                minutes=np.nan if rnd.random() < 0.1 else minutes,
+                average_shot_distance=np.nan if rnd.random() < 0.1 else 10 + 10 * rnd.random(),
+                **{column: np.nan if rnd.random() < 0.05 else value for column, value in stats.items()},
+            ))
+        if rnd.random() < 0.2:
+            # a snapshot without playing time, in the other team
+            rows.append(dict(rows[-1], team_name=teams[1], games=np.nan))
+    # a player without any playing time
+    rows.append(dict(rows[-1], name="Player Without Games", games=np.nan))
+
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=seed, ignore_index=True)
+
+
+def records(frame: pd.DataFrame):
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+@pytest.fixture(scope="module")
+def dao() -> PlayerDAO:
+    return PlayerDAO()
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("league_name", ["England", "Russia", "Benchmark"])
+def test_league_stats_match_reference(dao: PlayerDAO, seed: int, league_name: str):
+    df = random_players_snapshots(seed, league_name)
+
+    expected = ReferencePlayerStats(dao._PlayerDAO__fbref_parser).get_players_stats(df)
+    result = dao._compute_league_stats(df, league_name)
+
+    for field_name in ("abs_stats", "norm_stats", "free_kicks"):
+        actual_frame, expected_frame = getattr(result, field_name), getattr(expected, field_name)
+        assert list(actual_frame.columns) == list(expected_frame.columns)
+        assert records(actual_frame) == [pytest.approx(row) for row in records(expected_frame)]
+
+
+def test_league_stats_empty(dao: PlayerDAO):
+    df = random_players_snapshots(0, "England").iloc[:0]
+
+    result = dao._compute_league_stats(df, "England")
+
+    assert result.abs_stats.empty and "xg_xa" in result.abs_stats.columns
+    assert result.norm_stats.empty
+    assert result.free_kicks.empty and "penalty_goals" in result.free_kicks.columns
@@ -0,0 +1,208 @@
+import datetime
+import random
+from dataclasses import asdict
+from typing import List
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from fantasy_helper.db.dao.feature_store.fs_players_stats import STATS_COLUMNS, FSPlayersStatsDAO
+from fantasy_helper.db.models.feature_store.fs_players_matches import FSPlayersMatches
+from fantasy_helper.db.models.feature_store.fs_players_tables import FSPlayersTables
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+from fantasy_helper.utils.dataclasses import PlayerMatchStatsInfo, PlayerStatsInfo
+from fantasy_helper.utils.stats_index import PlayersStatsIndex
+
+
+SUM_COLUMNS = ("minutes", *STATS_COLUMNS)
+
+
+@pytest.fixture
+def dao() -> FSPlayersStatsDAO:
+    with sqlite_session_factory([FSVersion, FSPlayersMatches, FSPlayersTables], [
+        "fantasy_helper.db.dao.feature_store.fs_versions",
+        "fantasy_helper.db.dao.feature_store.fs_players_stats",
+    ]):
+        yield FSPlayersStatsDAO()
+
+
+@pytest.fixture
+def players_matches() -> List[PlayerMatchStatsInfo]:
+    rnd = random.Random(0)
+    result = []
+    for team_id in range(4):
+        team = f"Team {team_id}"
+        matches_count = 7 - team_id % 2
+        # the match of gameweek 2 is postponed after gameweek 4
+        gameweeks = [1, 3, 4, 2, 5, 6, 7][:matches_count]
+        for player in range(10):
+            for position in range(matches_count):
+                if rnd.random() < 0.3:
+                    continue
+                stats = {column: rnd.choice([None, rnd.randint(0, 3), rnd.randint(0, 3)]) for column in STATS_COLUMNS}
+                stats["xg"], stats["xa"] = rnd.random(), rnd.choice([None, rnd.random()])
+                stats["xg_xa"] = None if stats["xa"] is None else stats["xg"] + stats["xa"]
+                result.append(PlayerMatchStatsInfo(
+                    name=f"Player {player}",
+                    team=team,
+                    position="FORWARD",
+                    match_number=matches_count - position,
+                    gameweek=gameweeks[position],
+                    date=datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * position + team_id),
+                    minutes=rnd.choice([None, 0, rnd.randint(1, 90)]),
+                    sports_team=f"Sports {team}",
+                    sports_name=None if player == 9 else f"Sports Player {team_id} {player}",
+                    role=["FORWARD", "DEFENDER"][player % 2],
+                    price=player + 0.5,
+                    **stats
+                ))
+    return result
+
+
+def players_stats_info(players_matches: List[PlayerMatchStatsInfo], match_filter) -> List[PlayerStatsInfo]:
+    """
+    Sums the players matches the way the cumulative stats do, one row per player.
+    """
+    result = []
+    players = {(x.team, x.name): x for x in players_matches}
+    for (team, name), player in players.items():
+        team_matches = {x.match_number: x for x in players_matches if x.team == team}
+        window = [
+            match_number for match_number, match in team_matches.items() if match_filter(match_number, match)
+        ]
+        rows = [x for x in players_matches if x.team == team and x.name == name and x.match_number in window]
+        stats = {}
+        for column in SUM_COLUMNS:
+            values = [getattr(x, column) for x in rows if getattr(x, column) is not None]
+            stats[column] = sum(values) if values or not rows else None
+        result.append(PlayerStatsInfo(
+            name=name,
+            team=team,
+            position=player.position,
+            games=sum(1 for x in rows if (x.minutes or 0) > 0),
+            games_all=len(window),
+            sports_team=player.sports_team,
+            sports_name=player.sports_name,
+            role=player.role,
+            price=player.price,
+            **stats
+        ))
+    return result
+
+
+def expected_rows(dao: FSPlayersStatsDAO, players_stats: List[PlayerStatsInfo], **params):
+    with patch.object(dao, "get_players_stats_info", return_value=players_stats):
+        return dao.get_players_table_rows("Russia", **params)
+
+
+def assert_rows_equal(actual, expected):
+    key = lambda row: (row.team_name, row.name)
+    actual, expected = sorted(actual, key=key), sorted(expected, key=key)
+    assert [asdict(row) for row in actual] == [pytest.approx(asdict(row)) for row in expected]
+
+
+@pytest.mark.parametrize("games_count", [1, 3, 6, 7, 20])
+@pytest.mark.parametrize("normalize_minutes,normalize_matches", [(False, False), (True, False), (False, True)])
+def test_last_games_window(
+    dao: FSPlayersStatsDAO,
+    players_matches: List[PlayerMatchStatsInfo],
+    games_count: int,
+    normalize_minutes: bool,
+    normalize_matches: bool
+):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+    players_stats = players_stats_info(players_matches, lambda match_number, _: match_number <= games_count)
+
+    for min_minutes in [None, 0, 100]:
+        params = dict(
+            games_count=games_count,
+            normalize_minutes=normalize_minutes,
+            normalize_matches=normalize_matches,
+            min_minutes=min_minutes
+        )
+        assert_rows_equal(dao.get_players_window_rows("Russia", **params), expected_rows(dao, players_stats, **params))
+
+
+@pytest.mark.parametrize("gameweek_from,gameweek_to", [(2, 2), (2, 4), (None, 3), (5, None), (8, 9)])
+def test_gameweeks_window(
+    dao: FSPlayersStatsDAO,
+    players_matches: List[PlayerMatchStatsInfo],
+    gameweek_from: int,
+    gameweek_to: int
+):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+    players_stats = players_stats_info(
+        players_matches,
+        lambda _, match: (gameweek_from or 0) <= match.gameweek <= (gameweek_to or 100)
+    )
+
+    assert_rows_equal(
+        dao.get_players_window_rows("Russia", gameweek_from=gameweek_from, gameweek_to=gameweek_to),
+        expected_rows(dao, players_stats)
+    )
+
+
+def test_date_window(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+    date_from = datetime.date(2024, 8, 16)
+    players_stats = players_stats_info(
+        players_matches, lambda match_number, match: match.date >= date_from and match_number <= 3
+    )
+
+    assert_rows_equal(
+        dao.get_players_window_rows("Russia", games_count=3, date_from=date_from),
+        expected_rows(dao, players_stats)
+    )
+
+
+def test_gameweeks_window_is_not_combined(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+
+    with pytest.raises(ValueError):
+        dao.get_players_window_rows("Russia", games_count=3, gameweek_from=2)
+
+
+def test_index_is_rebuilt_on_publish(dao: FSPlayersStatsDAO, players_matches: List[PlayerMatchStatsInfo]):
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+    index = dao.get_players_stats_index("Russia")
+    assert dao.get_players_stats_index("Russia") is index
+
+    dao.update_players_matches("Russia", [x for x in players_matches if x.team == "Team 0"], add_sports_info=False)
+    assert dao.get_players_stats_index("Russia") is not index
+    assert {row.team_name for row in dao.get_players_window_rows("Russia")} == {"Sports Team 0"}
+
+
+def test_cumulative_rows_are_last_games_windows(players_matches: List[PlayerMatchStatsInfo]):
+    index = PlayersStatsIndex(players_matches, columns=SUM_COLUMNS)
+    key = ["team", "name", "games_all"]
+
+    windows = pl.concat([
+        index.window(games_count=games_count).filter(pl.col("games_all") == games_count)
+        for games_count in range(1, index.max_matches + 1)
+    ])
+    assert index.cumulative().sort(key).equals(windows.sort(key))
+    assert PlayersStatsIndex([], columns=SUM_COLUMNS).cumulative().is_empty()
+
+
+def test_cumulative_rows_fill_missing_matches(dao: FSPlayersStatsDAO):
+    def player_match(name: str, match_number: int, minutes: int, goals: int) -> PlayerMatchStatsInfo:
+        return PlayerMatchStatsInfo(
+            name=name, team="Team 0", position="FORWARD", match_number=match_number, gameweek=5 - match_number,
+            date=datetime.date(2024, 8, 1) + datetime.timedelta(days=7 * (4 - match_number)),
+            minutes=minutes, goals=goals
+        )
+
+    # "Player 1" misses the latest match and the third latest one
+    players_matches = [player_match("Player 0", match_number, 90, 1) for match_number in range(1, 5)]
+    players_matches += [player_match("Player 1", 2, 30, 1), player_match("Player 1", 4, 0, 0)]
+    dao.update_players_matches("Russia", players_matches, add_sports_info=False)
+
+    rows = sorted(
+        (row.games_all, row.games, row.minutes, row.goals)
+        for row in dao.get_players_stats_info("Russia") if row.name == "Player 1"
+    )
+    # a missing match repeats the previous row, the matches before the first row are zero filled
+    assert rows == [(1, 0, 0, 0), (2, 1, 30, 1), (3, 1, 30, 1), (4, 1, 30, 1)]
+    assert len(dao.get_players_stats_info("Russia")) == 8
@@ -0,0 +1,202 @@
+"""
+Query plan regression tests for the composite indexes.
+
+The tests seed a throwaway schema of the Postgres database from DATABASE_URI
+and check that the DAO read filters are served by their indexes. They are
+skipped when no Postgres database is reachable.
+"""
+import datetime
+import os
+
+import pytest
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, and_, create_engine, func, insert, select, text
+from sqlalchemy.dialects import postgresql
+
+from fantasy_helper.db.utils.create_db import (
+    Base,
+    Coeff,
+    FbrefSchedule,
+    FSCoeffs,
+    FSPlayersStats,
+    Lineup,
+    Player,
+    PlayersMatch,
+    Schedule,
+    SportsPlayer,
+    Table,
+)
+from fantasy_helper.db.dao.feature_store.fs_versions import FSVersionsDAO
+from fantasy_helper.db.models.feature_store.fs_versions import FSVersion
+
+
+SCHEMA = "query_plans_test"
+ROWS_COUNT = 5000
+LEAGUES = ("Russia", "England", "Spain", "Italy", "Germany")
+
+
+def seed_value(column, i: int):
+    if column.name == "league_name":
+        return LEAGUES[i % len(LEAGUES)]
+    if column.name == "year":
+        return "2024" if i % 2 else "2023"
+    if column.name == "version":
+        return i % 3
+    if isinstance(column.type, String):
+        return f"{column.name} {i % 50}"
+    if isinstance(column.type, Integer):
+        return i % 38
+    if isinstance(column.type, Float):
+        return float(i % 10)
+    if isinstance(column.type, DateTime):
+        return datetime.datetime(2024, 8, 1) + datetime.timedelta(hours=i)
+    if isinstance(column.type, Date):
+        return datetime.date(2024, 8, 1) + datetime.timedelta(days=i % 300)
+    if isinstance(column.type, Boolean):
+        return i % 2 == 0
+    return None
+
+
+@pytest.fixture(scope="module")
+def connection():
+    database_uri = os.getenv("DATABASE_URI", "")
+    if not database_uri.startswith("postgresql"):
+        pytest.skip("query plan tests need a Postgres DATABASE_URI")
+    try:
+        engine = create_engine(database_uri)
+        connection = engine.connect()
+    except Exception as ex:
+        pytest.skip(f"Postgres is not reachable: {ex}")
+
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    connection.execute(text(f"SET search_path TO {SCHEMA}"))
+    Base.metadata.create_all(connection)
+
+    for model in (Player, PlayersMatch, Coeff, Schedule, FbrefSchedule, Table, Lineup,
+                  SportsPlayer, FSPlayersStats, FSCoeffs):
+        columns = [column for column in model.__table__.columns if not column.primary_key]
+        connection.execute(
+            insert(model.__table__),
+            [{column.name: seed_value(column, i) for column in columns} for i in range(ROWS_COUNT)],
+        )
+    connection.execute(insert(FSVersion.__table__), [
+        {"league_name": league_name, "table_name": table_name, "version": 1}
+        for league_name in LEAGUES
+        for table_name in (FSPlayersStats.__tablename__, FSCoeffs.__tablename__)
+    ])
+    connection.execute(text("ANALYZE"))
+
+    yield connection
+
+    connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    connection.close()
+
+
+def explain(connection, statement) -> str:
+    compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    with connection.begin():
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = connection.execute(text(f"EXPLAIN {compiled}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def dedup(model, partition_by, *filters):
+    rows = select(model).where(and_(*filters)).subquery()
+    return select(
+        rows,
+        func.row_number().over(
+            order_by=rows.c.timestamp.desc(),
+            partition_by=[rows.c[name] for name in partition_by],
+        ).label("row_number"),
+    )
+
+
+FILTER_QUERIES = [
+    (
+        "ix_coeffs_league_year_timestamp",
+        select(Coeff).where(and_(
+            Coeff.league_name == "Russia",
+            Coeff.year == "2024",
+            Coeff.timestamp >= datetime.datetime(2024, 9, 1)
+        )),
+    ),
+    (
+        "ix_schedules_league_year_date",
+        select(Schedule).where(and_(
+            Schedule.league_name == "Russia",
+            Schedule.year == "2024",
+            Schedule.date >= datetime.date(2024, 9, 1)
+        )),
+    ),
+    (
+        "ix_fbref_schedules_league_year_parsed",
+        select(FbrefSchedule).where(and_(
+            FbrefSchedule.league_name == "Russia",
+            FbrefSchedule.year == "2024",
+            FbrefSchedule.match_parsed == False
+        )),
+    ),
+    (
+        "ix_sports_players_league_year_tour",
+        select(SportsPlayer).where(and_(
+            SportsPlayer.league_name == "Russia",
+            SportsPlayer.year == "2024",
+            SportsPlayer.tour == 5
+        )),
+    ),
+    (
+        "ix_players_league_team",
+        select(Player).where(and_(Player.league_name == "Russia", Player.team_name == "team_name 1")),
+    ),
+    (
+        "ix_fs_players_stats_league_version_type",
+        select(FSPlayersStats).where(and_(
+            FSVersionsDAO.is_current(FSPlayersStats, "Russia"),
+            FSPlayersStats.type == "abs"
+        )),
+    ),
+    (
+        "ix_fs_coeffs_league_version",
+        select(FSCoeffs).where(FSVersionsDAO.is_current(FSCoeffs, "Russia")),
+    ),
+]
+
+DEDUP_QUERIES = [
+    (
+        "ix_players_league_year_dedup",
+        dedup(
+            Player, ("name", "team_name", "position", "games"),
+            Player.league_name == "Russia", Player.year == "2024"
+        ),
+    ),
+    (
+        "ix_players_matches_league_year_dedup",
+        dedup(
+            PlayersMatch, ("player_id", "date"),
+            PlayersMatch.league_name == "Russia", PlayersMatch.year == "2024"
+        ),
+    ),
+    (
+        "ix_tables_league_year_dedup",
+        dedup(Table, ("team_name",), Table.league_name == "Russia", Table.year == "2024"),
+    ),
+    (
+        "ix_lineups_league_year_dedup",
+        dedup(Lineup, ("team_name",), Lineup.league_name == "Russia", Lineup.year == "2024"),
+    ),
+]
+
+
+@pytest.mark.parametrize("index_name,statement", FILTER_QUERIES, ids=[q[0] for q in FILTER_QUERIES])
+def test_filter_uses_index(connection, index_name: str, statement):
+    plan = explain(connection, statement)
+
+    assert index_name in plan, plan
+
+
+@pytest.mark.parametrize("index_name,statement", DEDUP_QUERIES, ids=[q[0] for q in DEDUP_QUERIES])
+def test_dedup_window_reads_index_order(connection, index_name: str, statement):
+    plan = explain(connection, statement)
+
+    assert index_name in plan, plan
+    assert "Sort" not in plan, plan
@@ -0,0 +1,190 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from fantasy_helper.db.dao.scheduler import SchedulerDAO
+from fantasy_helper.db.models.job_run import JobRun
+from fantasy_helper.db.models.scheduled_job import ScheduledJob
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+from fantasy_helper.utils.cron import CronSchedule
+from fantasy_helper.utils.dataclasses import ScheduledJobInfo
+from fantasy_helper.utils.scheduler import JobScheduler
+
+
+@pytest.mark.parametrize("expression,after,expected", [
+    ("0 21 * * *", datetime(2024, 5, 1, 20, 59), datetime(2024, 5, 1, 21, 0)),
+    ("0 21 * * *", datetime(2024, 5, 1, 21, 0), datetime(2024, 5, 2, 21, 0)),
+    ("15 * * * *", datetime(2024, 5, 1, 23, 30), datetime(2024, 5, 2, 0, 15)),
+    ("*/20 9-10 * * *", datetime(2024, 5, 1, 10, 45), datetime(2024, 5, 2, 9, 0)),
+    # 2024-05-04 is a saturday
+    ("0 12 * * 1-5", datetime(2024, 5, 4, 0, 0), datetime(2024, 5, 6, 12, 0)),
+    ("0 12 * * 7", datetime(2024, 5, 4, 0, 0), datetime(2024, 5, 5, 12, 0)),
+    # day of month or day of week
+    ("0 0 10 * 1", datetime(2024, 5, 4, 0, 0), datetime(2024, 5, 6, 0, 0)),
+    ("0 0 29 2 *", datetime(2024, 3, 1, 0, 0), datetime(2028, 2, 29, 0, 0)),
+])
+def test_cron_next_after(expression, after, expected):
+    schedule = CronSchedule(expression)
+
+    assert schedule.next_after(after) == expected
+    assert schedule.matches(expected)
+
+
+@pytest.mark.parametrize("expression", ["0 21 * *", "60 * * * *", "0 0 * 13 *", "*/0 * * * *", "0 0 31 2 *"])
+def test_cron_invalid(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression).next_after(datetime(2024, 1, 1))
+
+
+@pytest.fixture
+def scheduler_dao():
+    # one shared connection, the scheduler writes the history from worker threads
+    with sqlite_session_factory(
+        [ScheduledJob, JobRun], ["fantasy_helper.db.dao.scheduler"], shared_connection=True
+    ):
+        yield SchedulerDAO(stale_run_hours=1)
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_add_jobs_keeps_edited_jobs(scheduler_dao):
+    assert scheduler_dao.add_jobs([ScheduledJobInfo(name="a", job="league_full", cron="0 1 * * *", league_name="Spain")]) == 1
+    assert scheduler_dao.add_jobs([
+        ScheduledJobInfo(name="a", job="league_full", cron="0 2 * * *", league_name="Spain"),
+        ScheduledJobInfo(name="b", job="sports_players", cron="15 * * * *"),
+    ]) == 1
+
+    assert [(job.name, job.cron) for job in scheduler_dao.get_jobs()] == [("a", "0 1 * * *"), ("b", "15 * * * *")]
+
+
+def test_start_run_skips_a_running_job(scheduler_dao):
+    job = ScheduledJobInfo(name="a", job="league_full", cron="0 1 * * *", league_name="Spain")
+
+    run_id = scheduler_dao.start_run(job)
+    assert run_id is not None
+    assert scheduler_dao.start_run(job) is None
+
+    scheduler_dao.finish_run(run_id, "done")
+    assert scheduler_dao.start_run(job) is not None
+    assert sorted(run.status for run in scheduler_dao.get_runs("a")) == ["done", "running", "skipped"]
+
+
+def test_scheduler_runs_due_jobs_once(scheduler_dao):
+    clock = Clock(datetime(2024, 5, 1, 20, 59, 30))
+    calls = []
+
+    async def runner(job: ScheduledJobInfo):
+        calls.append(job.league_name)
+
+    scheduler_dao.add_jobs([
+        ScheduledJobInfo(name="spain", job="league_full", cron="0 21 * * *", league_name="Spain"),
+        ScheduledJobInfo(name="italy", job="league_full", cron="0 22 * * *", league_name="Italy"),
+        ScheduledJobInfo(name="off", job="league_full", cron="0 21 * * *", league_name="Russia", enabled=False),
+    ])
+    scheduler = JobScheduler(scheduler_dao, {"league_full": runner}, clock=clock)
+
+    async def run():
+        for minutes in [0, 1, 1, 2]:
+            clock.now = datetime(2024, 5, 1, 20, 59, 30) + timedelta(minutes=minutes)
+            await scheduler.run_pending()
+            await asyncio.gather(*scheduler.running.values())
+
+    asyncio.run(run())
+
+    assert calls == ["Spain"]
+    runs = scheduler_dao.get_runs()
+    assert [(run.name, run.status, run.scheduled_at) for run in runs] == [("spain", "done", datetime(2024, 5, 1, 21, 0))]
+
+
+def test_scheduler_skips_overlapping_run_and_records_failures(scheduler_dao):
+    clock = Clock(datetime(2024, 5, 1, 20, 59, 30))
+    release = None
+
+    async def runner(job: ScheduledJobInfo):
+        await release.wait()
+        return "failed stages: table"
+
+    scheduler_dao.add_jobs([ScheduledJobInfo(name="spain", job="league_full", cron="* * * * *", league_name="Spain")])
+    scheduler = JobScheduler(scheduler_dao, {"league_full": runner}, clock=clock)
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        for minutes in [0, 1, 2]:
+            clock.now = datetime(2024, 5, 1, 20, 59, 30) + timedelta(minutes=minutes)
+            await scheduler.run_pending()
+            await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(*scheduler.running.values())
+
+    asyncio.run(run())
+
+    runs = {run.scheduled_at: run for run in scheduler_dao.get_runs("spain")}
+    assert runs[datetime(2024, 5, 1, 21, 0)].status == "failed"
+    assert runs[datetime(2024, 5, 1, 21, 0)].error == "failed stages: table"
+    assert runs[datetime(2024, 5, 1, 21, 1)].status == "skipped"
+
+
+def test_scheduler_records_runner_exceptions(scheduler_dao):
+    async def runner(job: ScheduledJobInfo):
+        raise RuntimeError("site is down")
+
+    job = ScheduledJobInfo(name="players", job="sports_players", cron="15 * * * *")
+    scheduler = JobScheduler(scheduler_dao, {"sports_players": runner})
+    asyncio.run(scheduler.run_job(job))
+
+    [run] = scheduler_dao.get_runs("players")
+    assert run.status == "failed"
+    assert run.error == "RuntimeError: site is down"
+    assert run.duration is not None
+
+
+def test_schedulers_keep_runs_of_each_other(scheduler_dao):
+    other_dao = SchedulerDAO(stale_run_hours=1, owner="other-host:1")
+    job = ScheduledJobInfo(name="spain", job="league_full", cron="0 21 * * *", league_name="Spain")
+    release = None
+
+    async def runner(job: ScheduledJobInfo):
+        await release.wait()
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        running = asyncio.create_task(JobScheduler(scheduler_dao, {"league_full": runner}).run_job(job))
+        await asyncio.sleep(0.05)
+
+        # a second daemon starting neither fails the live run nor starts the job again
+        assert other_dao.fail_dead_runs() == 0
+        await JobScheduler(other_dao, {"league_full": runner}).run_job(job)
+        assert scheduler_dao.heartbeat() == 1 and other_dao.heartbeat() == 0
+
+        release.set()
+        await running
+
+    asyncio.run(run())
+
+    assert sorted((run.status, run.error is None) for run in scheduler_dao.get_runs("spain")) == [
+        ("done", True), ("skipped", False)
+    ]
+
+
+def test_dead_runs_are_failed(scheduler_dao):
+    job = ScheduledJobInfo(name="spain", job="league_full", cron="0 21 * * *", league_name="Spain")
+    scheduler_dao.start_run(job)
+
+    # a live daemon of another owner keeps the run
+    assert SchedulerDAO(stale_run_hours=1, owner="other-host:1").fail_dead_runs() == 0
+    # the run missed its heartbeats
+    assert SchedulerDAO(stale_run_hours=1, heartbeat_minutes=0, owner="other-host:1").fail_dead_runs() == 1
+
+    scheduler_dao.start_run(job)
+    # the daemon restarted with the same host and pid, e.g. in a new container
+    assert SchedulerDAO(stale_run_hours=1, owner=scheduler_dao.owner).fail_dead_runs() == 1
+    assert [run.status for run in scheduler_dao.get_runs("spain")] == ["failed", "failed"]
@@ -1,7 +1,12 @@
-from typing import Generator, List
+from contextlib import ExitStack, contextmanager
+from typing import Any, Generator, Iterable, List
+from unittest.mock import patch
 import os.path as path
 
 from pytest import fixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from hydra import compose, initialize
 from hydra.utils import instantiate
 from hydra.core.global_hydra import GlobalHydra
@@ -10,6 +15,31 @@ from fantasy_helper.utils.common import load_config, instantiate_leagues
 from fantasy_helper.utils.dataclasses import LeagueInfo
 
 
+@contextmanager
+def sqlite_session_factory(
+    models: Iterable[Any], patched_modules: Iterable[str], shared_connection: bool = False
+) -> Generator[sessionmaker, None, None]:
+    """
+    In memory sqlite database with the tables of the models, the Session of
+    every patched module opens its sessions there.
+
+    With shared_connection all sessions use one connection, so DAOs writing
+    from worker threads see the same database.
+    """
+    if shared_connection:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine("sqlite://")
+    for model in models:
+        model.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+
+    with ExitStack() as stack:
+        for module in patched_modules:
+            stack.enter_context(patch(f"{module}.Session", factory))
+        yield factory
+
+
 @fixture(scope="session")
 def leagues() -> Generator[List[LeagueInfo], None, None]:
     leagues = [
@@ -0,0 +1,109 @@
+import itertools
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from fantasy_helper.ml.naming.fuzzy_matcher import FuzzyNameMatcher, normalize_name
+from fantasy_helper.ml.naming.name_matcher import NameMatcher
+from fantasy_helper.utils.assignment import linear_sum_assignment
+
+
+TEAMS_NAMES = {
+    "Зенит": "Zenit",
+    "Спартак": "Spartak Moscow",
+    "ЦСКА": "CSKA Moscow",
+    "Локомотив": "Lokomotiv Moscow",
+    "Динамо": "Dynamo Moscow",
+    "Динамо Махачкала": "Dynamo Makhachkala",
+    "Рубин": "Rubin Kazan",
+    "Ахмат": "Akhmat Grozny",
+    "Крылья Советов": "Krylia Sovetov",
+    "Химки": "Khimki",
+    "Пари НН": "Nizhny Novgorod",
+}
+PLAYERS_NAMES = {
+    "Матвей Сафонов": "Matvey Safonov",
+    "Алексей Миранчук": "Aleksei Miranchuk",
+    "Антон Миранчук": "Anton Miranchuk",
+    "Кевин Де Брюйне": "Kevin De Bruyne",
+    "Йошко Гвардиол": "Joško Gvardiol",
+    "Илкай Гюндоган": "İlkay Gündoğan",
+    "Рубен Диаш": "Rúben Dias",
+    "Родри": "Rodri",
+    "Джон Стоунз": "John Stones",
+    "Вильягра": "Cristian Ramírez",
+}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_linear_sum_assignment_is_optimal(seed: int):
+    rnd = np.random.default_rng(seed)
+    rows_count, columns_count = map(int, rnd.integers(1, 6, size=2))
+    cost = rnd.integers(0, 5, size=(rows_count, columns_count)).astype(float)
+
+    rows, columns = linear_sum_assignment(cost)
+
+    assert len(rows) == len(set(rows)) == len(set(columns)) == min(rows_count, columns_count)
+    assert list(rows) == sorted(rows)
+    wide_cost = cost if rows_count <= columns_count else cost.T
+    best = min(
+        sum(wide_cost[row, column] for row, column in enumerate(assigned_columns))
+        for assigned_columns in itertools.permutations(range(wide_cost.shape[1]), wide_cost.shape[0])
+    )
+    assert cost[rows, columns].sum() == pytest.approx(best)
+
+
+@pytest.mark.parametrize("name_1,name_2", [
+    ("Фёдор Чалов", "Fedor Chalov"),
+    ("Игорь Акинфеев", "Igor Akinfeev"),
+    ("Юрий Жирков", "Yuri Zhirkov"),
+    ("Илья Кутепов", "Ilya Kutepov"),
+    ("Цыганков", "Tsygankov"),
+    ("ЦСКА", "CSKA"),
+    ("Joško Gvardiol", "Josko Gvardiol"),
+    ("Mohamed Salah", "Mohamed  Salah."),
+])
+def test_normalize_name(name_1: str, name_2: str):
+    assert normalize_name(name_1) == normalize_name(name_2)
+
+
+@pytest.mark.parametrize("names", [TEAMS_NAMES, PLAYERS_NAMES])
+def test_match_returns_only_correct_pairs(names):
+    names_1 = list(names)
+    names_2 = sorted(names.values())
+
+    result = FuzzyNameMatcher().match(names_1, names_2)
+
+    assert len(result) >= len(names) // 2
+    assert all(names[name_1] == name_2 for name_1, name_2 in result.items())
+
+
+def test_match_leaves_ambiguous_names():
+    result = FuzzyNameMatcher().match(list(TEAMS_NAMES), sorted(TEAMS_NAMES.values()))
+
+    # two dynamos and names with nothing in common
+    assert result["Динамо Махачкала"] == "Dynamo Makhachkala"
+    assert "Динамо" not in result
+    assert "Пари НН" not in result
+
+
+def test_match_empty():
+    assert FuzzyNameMatcher().match([], ["Zenit"]) == {}
+
+
+def test_name_matcher_escalates_only_unmatched_names():
+    name_matcher = NameMatcher()
+    names_1 = list(PLAYERS_NAMES)
+    names_2 = sorted(PLAYERS_NAMES.values())
+    local_result = FuzzyNameMatcher().match(names_1, names_2)
+
+    with patch.object(
+        name_matcher, "_get_match_players_names", return_value={"Вильягра": "Cristian Ramírez"}
+    ) as get_match_players_names:
+        result = name_matcher.match_players_names(names_1, names_2)
+
+    llm_names_1, llm_names_2 = get_match_players_names.call_args_list[0].args
+    assert set(llm_names_1) == set(names_1) - set(local_result)
+    assert set(llm_names_2) == set(names_2) - set(local_result.values())
+    assert result == dict(local_result, **{"Вильягра": "Cristian Ramírez"})
@@ -0,0 +1,77 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fantasy_helper.db.dao.ml.naming_cache import NamingCacheDAO
+from fantasy_helper.db.models.ml.naming_cache import NamingCache
+from fantasy_helper.ml.naming.name_matcher import NameMatcher
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+
+
+PROMPT = [{"role": "system", "content": "match names"}]
+
+
+@pytest.fixture
+def session_factory():
+    with sqlite_session_factory([NamingCache], ["fantasy_helper.db.dao.ml.naming_cache"]) as factory:
+        yield factory
+
+
+def completion(result: dict) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message.content = json.dumps(result)
+    return response
+
+
+def test_key_ignores_names_order():
+    key = NamingCacheDAO.compute_key(PROMPT, "model", ["b", "a"], ["c", "d"])
+
+    assert key == NamingCacheDAO.compute_key(PROMPT, "model", ["a", "b"], ["d", "c"])
+    assert key != NamingCacheDAO.compute_key(PROMPT, "other model", ["a", "b"], ["c", "d"])
+    assert key != NamingCacheDAO.compute_key(PROMPT + PROMPT, "model", ["a", "b"], ["c", "d"])
+    assert key != NamingCacheDAO.compute_key(PROMPT, "model", ["a", "b"], ["c"])
+
+
+def test_put_get_clear(session_factory):
+    dao = NamingCacheDAO()
+    dao.put("key 1", "teams", "model", {"Зенит": "Zenit"})
+    dao.put("key 1", "teams", "model", {"Зенит": "Zenit St. Petersburg"})
+    dao.put("key 2", "players", "model", {})
+
+    assert dao.get("key 1") == {"Зенит": "Zenit St. Petersburg"}
+    assert dao.get("key 2") == {}
+    assert dao.get("key 3") is None
+
+    assert dao.clear("players") == 1
+    assert dao.get("key 2") is None
+    assert dao.clear() == 1
+    assert dao.get("key 1") is None
+
+
+def test_name_matcher_reuses_llm_results(session_factory):
+    name_matcher = NameMatcher(use_cache=True)
+    llm_client = MagicMock()
+    llm_client.chat.completions.create.return_value = completion({"Вильягра": "Cristian Ramírez"})
+
+    with patch.object(name_matcher, "_openai_client", llm_client):
+        first = name_matcher._get_match_players_names(["Вильягра", "Муса"], ["Cristian Ramírez", "Moses Cobnan"])
+        second = name_matcher._get_match_players_names(["Муса", "Вильягра"], ["Moses Cobnan", "Cristian Ramírez"])
+        NamingCacheDAO().clear("players")
+        third = name_matcher._get_match_players_names(["Вильягра", "Муса"], ["Cristian Ramírez", "Moses Cobnan"])
+
+    assert first == second == third == {"Вильягра": "Cristian Ramírez"}
+    assert llm_client.chat.completions.create.call_count == 2
+    assert (name_matcher._cache_hits, name_matcher._cache_misses) == (1, 2)
+
+
+def test_name_matcher_does_not_cache_failures(session_factory):
+    name_matcher = NameMatcher(use_cache=True)
+    name_matcher._retry_delay = 0
+    llm_client = MagicMock()
+    llm_client.chat.completions.create.return_value = MagicMock(choices=None)
+
+    with patch.object(name_matcher, "_openai_client", llm_client):
+        assert name_matcher._get_match_teams_names(["Зенит"], ["Zenit"]) == {}
+        llm_client.chat.completions.create.return_value = completion({"Зенит": "Zenit"})
+        assert name_matcher._get_match_teams_names(["Зенит"], ["Zenit"]) == {"Зенит": "Zenit"}
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fantasy_helper.db.dao.ml.naming import NamingDAO
+from fantasy_helper.db.models.ml.player_name import PlayerName as DBPlayerName
+from fantasy_helper.db.models.ml.team_name import TeamName as DBTeamName
+from fantasy_helper.ml.naming.name_matcher import NameMatcher
+from fantasy_helper.tests.fixtures import sqlite_session_factory
+
+
+LEAGUE_NAME = "Test League"
+TEAMS_COUNT = 6
+MAX_CONCURRENT_TEAMS = 2
+
+
+@pytest.fixture
+def session_factory():
+    # one shared connection, db lookups of the async update run in worker threads
+    with sqlite_session_factory(
+        [DBTeamName, DBPlayerName], ["fantasy_helper.db.dao.ml.naming"], shared_connection=True
+    ) as factory:
+        db_session = factory()
+        for i in range(TEAMS_COUNT):
+            db_session.add(DBTeamName(
+                league_name=LEAGUE_NAME, sports_name=f"Команда {i}", fbref_name=f"Team {i}",
+                xbet_name=None, betcity_name=None, name=f"Team {i}", timestamp=datetime.now()
+            ))
+            # a player gone from both sources
+            db_session.add(DBPlayerName(
+                league_name=LEAGUE_NAME, team_name=f"Team {i}", sports_name=f"Бывший {i}",
+                fbref_name=f"Former {i}", name=f"Бывший {i}", timestamp=datetime.now()
+            ))
+        db_session.commit()
+        db_session.close()
+
+        yield factory
+
+
+def completion(result: dict) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message.content = json.dumps(result)
+    return response
+
+
+def test_update_league_naming_matches_teams_concurrently(session_factory):
+    naming_dao = NamingDAO()
+    name_matcher = naming_dao._name_matcher
+    running, max_running = 0, 0
+
+    async def match_names(client, kind, prompt, names_1, names_2):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return dict(zip(names_1, names_2))
+
+    # db writes run in worker threads, off the event loop
+    write_threads = []
+
+    def in_thread(write):
+        def wrapper(*args, **kwargs):
+            write_threads.append(threading.get_ident())
+            return write(*args, **kwargs)
+        return wrapper
+
+    with patch.object(name_matcher, "match_teams", return_value=([], [])), \
+            patch.object(name_matcher, "get_sports_players_names", side_effect=lambda league, team, year: [f"{team} игрок"]), \
+            patch.object(name_matcher, "get_fbref_players_names", side_effect=lambda league, team, year: [f"{team} player"]), \
+            patch.object(name_matcher, "_match_names_locally", side_effect=lambda names_1, names_2: ({}, names_1, names_2)), \
+            patch.object(name_matcher, "create_async_openai_client", return_value=AsyncMock()), \
+            patch.object(name_matcher, "_aget_match_names", side_effect=match_names), \
+            patch.object(naming_dao, "_delete_teams_names", side_effect=in_thread(naming_dao._delete_teams_names)), \
+            patch.object(naming_dao, "_add_teams_names", side_effect=in_thread(naming_dao._add_teams_names)), \
+            patch.object(naming_dao, "_update_players_names", side_effect=in_thread(naming_dao._update_players_names)) as update_players_names, \
+            patch("fantasy_helper.db.dao.ml.naming.NAMING_MAX_CONCURRENT_TEAMS", MAX_CONCURRENT_TEAMS):
+        asyncio.run(naming_dao.update_league_naming(LEAGUE_NAME))
+
+    assert max_running == MAX_CONCURRENT_TEAMS
+    update_players_names.assert_called_once()
+    assert len(write_threads) == 3 and threading.get_ident() not in write_threads
+
+    players_names = naming_dao.get_players(LEAGUE_NAME)
+    assert sorted((player.team_name, player.sports_name, player.fbref_name) for player in players_names) == [
+        (f"Team {i}", f"Команда {i} игрок", f"Team {i} player") for i in range(TEAMS_COUNT)
+    ]
+
+
+def test_async_match_retries_with_backoff():
+    name_matcher = NameMatcher(use_cache=False)
+    name_matcher._retry_backoff = 0
+    llm_client = MagicMock()
+    llm_client.chat.completions.create = AsyncMock(side_effect=[
+        MagicMock(choices=None), completion({"Вильягра": "Cristian Ramírez"})
+    ])
+
+    result = asyncio.run(name_matcher._aget_match_names(
+        llm_client, "players", [], ["Вильягра"], ["Cristian Ramírez"]
+    ))
+
+    assert result == {"Вильягра": "Cristian Ramírez"}
+    assert llm_client.chat.completions.create.call_count == 2
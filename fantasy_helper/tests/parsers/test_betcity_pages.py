@@ -0,0 +1,182 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+pytest.importorskip("playwright")
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from fantasy_helper.parsers import betcity
+from fantasy_helper.parsers.betcity import BetcityParser
+from fantasy_helper.utils.dataclasses import LeagueInfo
+
+
+LEAGUE_URL = "https://betcity.ru/ru/line/soccer/1"
+FAILED_MATCH = "/ru/line/soccer/1/6"
+MATCH_PAGE = (
+    '<html><body><div class="line__header"></div><div class="line-event__main-bets"></div>'
+    '<div class="dops-item"><div class="dops-item__title">Голы</div>'
+    '<div class="dops-item-row__section"><div class="dops-item-row__block">К1</div>'
+    '<div class="dops-item-row__block"><span class="dops-item-row__block-left">Не забьет</span>'
+    '<span class="dops-item-row__block-right">2.5</span></div></div></div>'
+    "</body></html>"
+)
+
+
+class FakeElement:
+    def __init__(self, text: str = "", attributes: Optional[Dict[str, str]] = None, children=None):
+        self._text = text
+        self._attributes = attributes or {}
+        self._children = children or {}
+
+    async def query_selector(self, selector: str):
+        children = self._children.get(selector, [])
+        return children[0] if children else None
+
+    async def query_selector_all(self, selector: str):
+        return self._children.get(selector, [])
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return self._attributes.get(name)
+
+    async def text_content(self) -> str:
+        return self._text
+
+
+def league_line(matches_count: int) -> FakeElement:
+    events = [
+        FakeElement(children={".line-event__name": [FakeElement(
+            attributes={"href": f"/ru/line/soccer/1/{i}"},
+            children={"b": [FakeElement(f"Home {i}"), FakeElement(f"Away {i}")]},
+        )]})
+        for i in range(matches_count)
+    ]
+    return FakeElement(children={".line-event": events})
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser"):
+        self._browser = browser
+        self._url = None
+
+    def set_default_timeout(self, timeout: float) -> None:
+        pass
+
+    async def goto(self, url: str, **kwargs) -> None:
+        self._url = url
+        # lets the other pages open in the meantime
+        await asyncio.sleep(0.01)
+        if url.endswith(FAILED_MATCH):
+            raise PlaywrightTimeoutError("page is not loaded")
+
+    async def wait_for_load_state(self, state: str, **kwargs) -> None:
+        self._browser.load_states.append(state)
+
+    async def wait_for_selector(self, selector: str, **kwargs):
+        self._browser.selectors.append(selector)
+        if selector == ".line__champ":
+            return league_line(self._browser.matches_count)
+        return FakeElement()
+
+    async def content(self) -> str:
+        return MATCH_PAGE
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self._browser = browser
+        self.pages = 0
+        self.closed = False
+
+    async def route(self, url: str, handler) -> None:
+        pass
+
+    async def new_page(self) -> FakePage:
+        self.pages += 1
+        self._browser.open_pages += 1
+        self._browser.max_open_pages = max(self._browser.max_open_pages, self._browser.open_pages)
+        return FakePage(self._browser)
+
+    async def close(self) -> None:
+        self.closed = True
+        self._browser.open_pages -= self.pages
+
+
+class FakeBrowser:
+    def __init__(self, matches_count: int):
+        self.matches_count = matches_count
+        self.contexts: List[FakeContext] = []
+        self.open_pages = 0
+        self.max_open_pages = 0
+        self.load_states: List[str] = []
+        self.selectors: List[str] = []
+        self.closed = False
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self, matches_count: int):
+        self.browsers: List[FakeBrowser] = []
+        self.chromium = self
+        self._matches_count = matches_count
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        browser = FakeBrowser(self._matches_count)
+        self.browsers.append(browser)
+        return browser
+
+    async def __aenter__(self) -> "FakePlaywright":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def playwright(monkeypatch) -> FakePlaywright:
+    playwright = FakePlaywright(matches_count=8)
+    monkeypatch.setattr(betcity, "async_playwright", lambda: playwright)
+    monkeypatch.setattr(betcity, "BETCITY_MAX_CONCURRENT_PAGES", 3)
+    return playwright
+
+
+@pytest.fixture
+def parser(playwright: FakePlaywright) -> BetcityParser:
+    parser = BetcityParser([
+        LeagueInfo(name="Russia", ru_name="РПЛ", emoji="", is_active=True, betcity_url=LEAGUE_URL)
+    ])
+    parser._retry_delay = 0
+    return parser
+
+
+@pytest.mark.asyncio
+async def test_league_pages_share_one_browser(playwright: FakePlaywright, parser: BetcityParser):
+    matches = await parser.get_league_matches("Russia")
+
+    assert len(playwright.browsers) == 1
+    browser = playwright.browsers[0]
+    assert browser.closed
+    assert 1 < browser.max_open_pages <= betcity.BETCITY_MAX_CONCURRENT_PAGES
+    assert all(context.closed for context in browser.contexts)
+    assert browser.open_pages == 0
+
+    # the failed match is retried in new contexts and left out of the result
+    assert len(browser.contexts) == 1 + 7 + parser._max_retries
+    assert sorted(match.home_team for match in matches) == [f"Home {i}" for i in range(8) if i != 6]
+    assert all(match.total_1_under_0_5 == 2.5 for match in matches)
+
+
+@pytest.mark.asyncio
+async def test_header_bets_wait_for_selector(playwright: FakePlaywright, parser: BetcityParser):
+    await parser.get_league_matches("Russia")
+
+    browser = playwright.browsers[0]
+    assert browser.load_states == []
+    assert browser.selectors.count(".line__header") == 7
@@ -0,0 +1,62 @@
+import lxml.html
+
+from fantasy_helper.parsers.fbref_fields import (
+    SHOOTING_FIELDS,
+    StatField,
+    cast_to_float,
+    decode_fields,
+    decode_row,
+)
+
+
+ROW = (
+    "<table><tr>"
+    '<th data-stat="ranker">1</th>'
+    '<td data-stat="player"><a href="/en/players/1">John Doe</a></td>'
+    '<td data-stat="team">Team</td>'
+    '<td data-stat="goals">1,234</td>'
+    '<td data-stat="xg">2.5</td>'
+    '<td data-stat="shots"></td>'
+    "<!-- comment -->"
+    "<td>no data stat</td>"
+    "</tr></table>"
+)
+
+
+def parse_row(html: str):
+    return next(lxml.html.fromstring(html).iter("tr"))
+
+
+def test_decode_row():
+    cells, header_cells = decode_row(parse_row(ROW))
+
+    assert cells == {
+        "player": "John Doe",
+        "team": "Team",
+        "goals": "1,234",
+        "xg": "2.5",
+        "shots": "",
+    }
+    assert list(header_cells) == ["ranker"]
+
+
+def test_decode_fields():
+    cells, _ = decode_row(parse_row(ROW))
+    fields = (
+        StatField("goals", "goals"),
+        StatField("xg", "xg", cast_to_float),
+        StatField("shots", "shots"),
+        StatField("assists", "assists"),
+    )
+
+    assert decode_fields(cells, fields) == {
+        "goals": 1234,
+        "xg": 2.5,
+        "shots": None,
+        "assists": None,
+    }
+
+
+def test_fields_are_unique():
+    names = [field.name for field in SHOOTING_FIELDS]
+    assert len(names) == len(set(names))
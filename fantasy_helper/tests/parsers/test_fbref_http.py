@@ -0,0 +1,151 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List, Optional
+
+import pytest
+
+from fantasy_helper.parsers.fbref import FbrefParser
+from fantasy_helper.parsers.http_fetcher import HttpFetcher, extract_element_html
+from fantasy_helper.utils.dataclasses import LeagueInfo
+
+
+PLAYERS_TABLE = (
+    '<table id="stats_shooting">'
+    "<tr><th>Group</th></tr><tr><th>Column</th></tr>"
+    '<tr><td data-stat="player">Player A</td><td data-stat="team">Team A</td>'
+    '<td data-stat="position">FW</td><td data-stat="shots">10</td></tr>'
+    "</table>"
+)
+PAGE = (
+    '<html><body><div id="all_stats_shooting"><!--\n'
+    f'<div class="table_container">{PLAYERS_TABLE}</div>\n'
+    "--></div></body></html>"
+)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    requests_count = 0
+
+    def do_GET(self):
+        FixtureHandler.requests_count += 1
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = PAGE.encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class FakeFetcher:
+    def __init__(self, page: Optional[str]):
+        self.page = page
+
+    def get(self, url: str) -> Optional[str]:
+        return self.page
+
+
+class FakePool:
+    def __init__(self):
+        self.checkouts = 0
+
+    def driver(self):
+        self.checkouts += 1
+        raise RuntimeError("selenium is not available")
+
+
+def make_leagues(url: str) -> List[LeagueInfo]:
+    return [
+        LeagueInfo(
+            name="Russia",
+            ru_name="Россия",
+            emoji="",
+            is_active=True,
+            fbref_shooting_url=url,
+        )
+    ]
+
+
+def test_extract_commented_table():
+    table_html = extract_element_html(PAGE, "stats_shooting")
+
+    assert table_html is not None
+    assert table_html.startswith('<table id="stats_shooting">')
+    assert "Player A" in table_html
+
+
+def test_extract_missing_table():
+    assert extract_element_html(PAGE, "stats_passing") is None
+
+
+def test_conditional_get(base_url: str):
+    fetcher = HttpFetcher()
+    FixtureHandler.requests_count = 0
+
+    first = fetcher.get(base_url)
+    second = fetcher.get(base_url)
+
+    assert first == PAGE
+    assert second == PAGE
+    assert FixtureHandler.requests_count == 2
+
+
+def test_not_modified_after_concurrent_eviction(base_url: str):
+    fetcher = HttpFetcher(cache_size=1)
+    fetcher.get(base_url)
+    session_get = fetcher._session.get
+
+    def evicting_get(url, **kwargs):
+        # another worker fetches a different page while this request is in flight
+        fetcher._store(f"{base_url}/other", (None, None, ""))
+        return session_get(url, **kwargs)
+
+    fetcher._session.get = evicting_get
+
+    assert fetcher.get(base_url) == PAGE
+    assert list(fetcher._cache) == [base_url]
+
+
+def test_http_mode_does_not_use_selenium():
+    pool = FakePool()
+    parser = FbrefParser(
+        make_leagues("http://fbref"),
+        driver_pool=pool,
+        http_fetcher=FakeFetcher(PAGE),
+        fetch_mode="http",
+    )
+
+    players = parser.get_stats_league("Russia")
+
+    assert pool.checkouts == 0
+    assert len(players) == 1
+    assert players[0].name == "Player A"
+    assert players[0].shots == 10
+
+
+def test_http_mode_falls_back_to_selenium():
+    pool = FakePool()
+    parser = FbrefParser(
+        make_leagues("http://fbref"),
+        driver_pool=pool,
+        http_fetcher=FakeFetcher(None),
+        fetch_mode="http",
+    )
+
+    assert parser.get_stats_league("Russia") == []
+    assert pool.checkouts == 1
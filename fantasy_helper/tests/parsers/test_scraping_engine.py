@@ -0,0 +1,82 @@
+import random
+import threading
+import time
+
+from fantasy_helper.parsers.scraping_engine import RateLimiter, ScrapingEngine
+
+
+def test_results_keep_input_order():
+    engine = ScrapingEngine(max_workers=4, requests_per_minute=0, max_retries=0)
+
+    def task(item: int) -> int:
+        time.sleep(random.random() * 0.02)
+        return item * 2
+
+    results = list(engine.map(task, range(20), url=lambda item: f"http://host/{item}"))
+
+    assert results == [item * 2 for item in range(20)]
+
+
+def test_concurrency_is_bounded():
+    engine = ScrapingEngine(max_workers=3, requests_per_minute=0, max_retries=0)
+    lock = threading.Lock()
+    running, max_running = 0, 0
+
+    def task(item: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return item
+
+    list(engine.map(task, range(12), url=lambda item: "http://host"))
+
+    assert max_running == 3
+
+
+def test_failed_task_is_retried():
+    engine = ScrapingEngine(max_workers=2, requests_per_minute=0, max_retries=2, backoff=0)
+    attempts = {}
+
+    def task(item: int) -> int:
+        attempts[item] = attempts.get(item, 0) + 1
+        if item == 1 and attempts[item] < 3:
+            raise ValueError("temporary failure")
+        return item
+
+    results = list(engine.map(task, range(3), url=lambda item: "http://host"))
+
+    assert results == [0, 1, 2]
+    assert attempts[1] == 3
+
+
+def test_exhausted_retries_yield_none():
+    engine = ScrapingEngine(max_workers=2, requests_per_minute=0, max_retries=1, backoff=0)
+
+    def task(item: int) -> int:
+        if item == 0:
+            raise ValueError("permanent failure")
+        return item
+
+    results = list(engine.map(task, range(2), url=lambda item: "http://host"))
+
+    assert results == [None, 1]
+
+
+def test_rate_limiter_is_per_host():
+    limiter = RateLimiter(requests_per_minute=600)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait("http://first/page")
+    first_host_time = time.monotonic() - start
+
+    start = time.monotonic()
+    limiter.wait("http://second/page")
+    second_host_time = time.monotonic() - start
+
+    assert first_host_time >= 0.2
+    assert second_host_time < 0.05
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from fantasy_helper.parsers.webdriver_pool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_url(self) -> str:
+        if not self.alive:
+            raise WebDriverException("browser is gone")
+        return "about:blank"
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool() -> WebDriverPool:
+    return WebDriverPool(driver_factory=FakeDriver, max_size=2, max_pages=3)
+
+
+def test_driver_is_reused(pool: WebDriverPool):
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        pass
+
+    assert first is second
+    assert pool.launches == 1
+
+
+def test_driver_is_recycled_after_max_pages(pool: WebDriverPool):
+    drivers = []
+    for _ in range(4):
+        with pool.driver() as driver:
+            drivers.append(driver)
+
+    assert drivers[0] is drivers[2]
+    assert drivers[0].quit_called
+    assert drivers[3] is not drivers[0]
+    assert pool.launches == 2
+    assert pool.recycles == 1
+
+
+def test_dead_driver_is_replaced(pool: WebDriverPool):
+    with pool.driver() as driver:
+        pass
+    driver.alive = False
+
+    with pool.driver() as new_driver:
+        pass
+
+    assert new_driver is not driver
+    assert driver.quit_called
+    assert pool.launches == 2
+
+
+def test_broken_driver_is_not_returned(pool: WebDriverPool):
+    with pytest.raises(WebDriverException):
+        with pool.driver() as driver:
+            raise WebDriverException("crash")
+
+    assert driver.quit_called
+    with pool.driver() as new_driver:
+        assert new_driver is not driver
+
+
+def test_timeout_keeps_driver(pool: WebDriverPool):
+    with pytest.raises(TimeoutException):
+        with pool.driver() as driver:
+            raise TimeoutException("no table")
+
+    with pool.driver() as same_driver:
+        assert same_driver is driver
+
+
+def test_pool_is_bounded(pool: WebDriverPool):
+    first = pool.checkout()
+    second = pool.checkout()
+    acquired = threading.Event()
+
+    def worker():
+        driver = pool.checkout()
+        acquired.set()
+        pool.checkin(driver)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.2)
+
+    pool.checkin(first)
+    assert acquired.wait(1)
+    thread.join()
+    pool.checkin(second)
+
+    assert pool.launches == 2
+
+
+def test_close_quits_idle_drivers(pool: WebDriverPool):
+    with pool.driver() as driver:
+        pass
+    pool.close()
+
+    assert driver.quit_called
+    with pytest.raises(RuntimeError):
+        pool.checkout()
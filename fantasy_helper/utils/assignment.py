@@ -0,0 +1,66 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def linear_sum_assignment(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Minimum cost assignment of rows to columns of a rectangular cost matrix,
+    the Hungarian algorithm with potentials in O(n^2 m).
+
+    Args:
+        cost (np.ndarray): A finite cost matrix of shape (n, m).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Row and column indices of the
+        min(n, m) assigned pairs, sorted by row, as scipy.optimize returns them.
+    """
+    cost = np.asarray(cost, dtype=float)
+    if cost.ndim != 2:
+        raise ValueError(f"cost matrix must be 2-dimensional, got shape {cost.shape}")
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    # 1-based rows and columns, column 0 is the virtual start of every augmenting path
+    u, v = np.zeros(n + 1), np.zeros(m + 1)
+    column_2_row = np.zeros(m + 1, dtype=int)
+    way = np.zeros(m + 1, dtype=int)
+    for row in range(1, n + 1):
+        column_2_row[0] = row
+        column = 0
+        min_reduced = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[column] = True
+            cur_row = column_2_row[column]
+            free = ~used[1:]
+
+            reduced = cost[cur_row - 1] - u[cur_row] - v[1:]
+            improved = free & (reduced < min_reduced[1:])
+            min_reduced[1:][improved] = reduced[improved]
+            way[1:][improved] = column
+
+            next_column = int(np.argmin(np.where(free, min_reduced[1:], np.inf))) + 1
+            delta = min_reduced[next_column]
+            u[column_2_row[used]] += delta
+            v[used] -= delta
+            min_reduced[1:][free] -= delta
+
+            column = next_column
+            if column_2_row[column] == 0:
+                break
+
+        # flip the augmenting path
+        while column:
+            prev_column = way[column]
+            column_2_row[column] = column_2_row[prev_column]
+            column = prev_column
+
+    columns = np.flatnonzero(column_2_row[1:])
+    rows = column_2_row[1:][columns] - 1
+    if transposed:
+        rows, columns = columns, rows
+    order = np.argsort(rows)
+    return rows[order], columns[order]
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from typing import FrozenSet, List, Tuple
+
+
+# minute, hour, day of month, month, day of week (0 or 7 is sunday)
+CRON_FIELDS: List[Tuple[int, int]] = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+
+def _parse_field(field: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = int(step_part) if step_part else 1
+        if step < 1:
+            raise ValueError(f"Invalid cron step in {field}")
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            start, end = map(int, range_part.split("-", 1))
+        else:
+            start = int(range_part)
+            end = high if step_part else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron field {field} is out of [{low}, {high}]")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    A five fields crontab expression: numbers, ranges, lists and steps, as
+    in "0 21 * * *" or "*/15 9-18 * * 1-5". Like cron, a day matches either
+    restricted day of month or day of week.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression {expression!r} must have 5 fields")
+        self.expression = expression
+        self._minutes, self._hours, self._days, self._months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, CRON_FIELDS)
+        )
+        self._weekdays = frozenset(weekday % 7 for weekday in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _matches_day(self, dt: datetime) -> bool:
+        if dt.month not in self._months:
+            return False
+        day_matches = dt.day in self._days
+        # python monday is 0, cron sunday is 0
+        weekday_matches = (dt.weekday() + 1) % 7 in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
+
+    def matches(self, dt: datetime) -> bool:
+        return self._matches_day(dt) and dt.hour in self._hours and dt.minute in self._minutes
+
+    def next_after(self, dt: datetime) -> datetime:
+        """
+        The first matching minute strictly after dt.
+        """
+        start = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        # leap days of a "29 2" schedule are at most 8 years apart
+        for _ in range(366 * 8):
+            if self._matches_day(day):
+                for hour in sorted(self._hours):
+                    for minute in sorted(self._minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 import datetime
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -542,6 +543,47 @@ class PlayerStatsInfo:
     percent_ownership_diff: Optional[float] = None
 
 
+@dataclass
+class PlayerMatchStatsInfo:
+    name: Optional[str] = None
+    team: Optional[str] = None
+    position: Optional[str] = None
+    # team match
+    match_number: Optional[int] = None
+    gameweek: Optional[int] = None
+    date: Optional[datetime.date] = None
+    # playing time
+    minutes: Optional[int] = None
+    # shooting
+    goals: Optional[int] = None
+    shots: Optional[int] = None
+    shots_on_target: Optional[int] = None
+    xg: Optional[float] = None
+    xg_np: Optional[float] = None
+    xg_xa: Optional[float] = None
+    xg_np_xa: Optional[float] = None
+    # passing
+    assists: Optional[int] = None
+    xa: Optional[float] = None
+    passes_into_penalty_area: Optional[int] = None
+    crosses_into_penalty_area: Optional[int] = None
+    # possesion
+    touches_in_attacking_third: Optional[int] = None
+    touches_in_attacking_penalty_area: Optional[int] = None
+    carries_in_attacking_third: Optional[int] = None
+    carries_in_attacking_penalty_area: Optional[int] = None
+    # shot creation
+    sca: Optional[int] = None
+    gca: Optional[int] = None
+    # miscellaneous
+    ball_recoveries: Optional[int] = None
+    # sports info
+    sports_name: Optional[str] = None
+    sports_team: Optional[str] = None
+    role: Optional[str] = None
+    price: Optional[float] = None
+
+
 @dataclass
 class PlayersStatsDiff:
     titles: List[str]
@@ -686,9 +728,9 @@ class PlayerName:
 
 @dataclass
 class PlayersLeagueStats:
-    abs_stats: Optional[pd.DataFrame] = None
-    norm_stats: Optional[pd.DataFrame] = None
-    free_kicks: Optional[pd.DataFrame] = None
+    abs_stats: Optional["pd.DataFrame"] = None
+    norm_stats: Optional["pd.DataFrame"] = None
+    free_kicks: Optional["pd.DataFrame"] = None
 
     def to_json(self) -> Dict:
         """
@@ -713,6 +755,8 @@ class PlayersLeagueStats:
         Returns:
             None
         """
+        import pandas as pd
+
         self.abs_stats = pd.read_json(json_data["abs_stats"])
         self.norm_stats = pd.read_json(json_data["norm_stats"])
         self.free_kicks = pd.read_json(json_data["free_kicks"])
@@ -747,3 +791,25 @@ class PlayersTableRow:
     carries_in_attacking_penalty_area: Optional[float] = None
     sca: Optional[float] = None
     gca: Optional[float] = None
+
+
+@dataclass
+class ScheduledJobInfo:
+    name: str
+    job: str
+    cron: str
+    league_name: Optional[str] = None
+    enabled: bool = True
+
+
+@dataclass
+class JobRunInfo:
+    name: str
+    job: str
+    status: str
+    started_at: datetime.datetime
+    league_name: Optional[str] = None
+    scheduled_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    duration: Optional[float] = None
+    error: Optional[str] = None
@@ -0,0 +1,125 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from omegaconf import DictConfig
+
+from fantasy_helper.utils.common import instantiate_leagues, load_config
+from fantasy_helper.utils.dataclasses import LeagueInfo
+
+
+DEFAULT_YEAR = "2024"
+
+# LeagueInfo fields with the league id or url of a source, the parsers read them by league name
+SOURCE_FIELDS = (
+    "squad_id",
+    "xber_url",
+    "betcity_url",
+    "marathon_url",
+    "sportsmole_name",
+    "fbref_league_id",
+    "fbref_table_url",
+    "fbref_schedule_url",
+    "fbref_playing_time_url",
+    "fbref_standart_url",
+    "fbref_shooting_url",
+    "fbref_passing_url",
+    "fbref_pass_types_url",
+    "fbref_possesion_url",
+    "fbref_shot_creation_url",
+)
+
+
+class LeagueRegistry:
+    """
+    Read only index of the active leagues, built once per process from
+    conf/config.yaml and shared by all DAOs and parsers.
+
+    Lookups by name and ru_name and the per source maps of league name to
+    source id or url are precomputed, so DAOs neither load the config nor
+    scan the leagues list.
+    """
+
+    __slots__ = ("_leagues", "_by_name", "_by_ru_name", "_years", "_sources")
+
+    def __init__(self, leagues: Iterable[LeagueInfo]):
+        active = tuple(league for league in leagues if league.is_active)
+        self._leagues: Tuple[LeagueInfo, ...] = active
+        self._by_name: Mapping[str, LeagueInfo] = MappingProxyType({league.name: league for league in active})
+        self._by_ru_name: Mapping[str, LeagueInfo] = MappingProxyType({league.ru_name: league for league in active})
+        self._years: Mapping[str, str] = MappingProxyType({league.name: league.year for league in active})
+        self._sources: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+            source: MappingProxyType({
+                league.name: getattr(league, source)
+                for league in active
+                if getattr(league, source) is not None
+            })
+            for source in SOURCE_FIELDS
+        })
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError(f"LeagueRegistry is read only, can't set {name}")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "LeagueRegistry":
+        return cls(instantiate_leagues(cfg))
+
+    def __contains__(self, league_name: object) -> bool:
+        return league_name in self._by_name
+
+    def __iter__(self) -> Iterator[LeagueInfo]:
+        return iter(self._leagues)
+
+    def __len__(self) -> int:
+        return len(self._leagues)
+
+    @property
+    def leagues(self) -> Tuple[LeagueInfo, ...]:
+        return self._leagues
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    @property
+    def ru_name_2_name(self) -> Mapping[str, str]:
+        return {ru_name: league.name for ru_name, league in self._by_ru_name.items()}
+
+    def get(self, league_name: str) -> Optional[LeagueInfo]:
+        return self._by_name.get(league_name)
+
+    def get_by_ru_name(self, ru_name: str) -> Optional[LeagueInfo]:
+        return self._by_ru_name.get(ru_name)
+
+    def year(self, league_name: str, default: Optional[str] = DEFAULT_YEAR) -> Optional[str]:
+        return self._years.get(league_name, default)
+
+    def source(self, field: str) -> Mapping[str, Any]:
+        """
+        League name to the value of a source field, leagues without the
+        source are left out.
+        """
+        if field not in self._sources:
+            raise KeyError(f"Unknown league source {field}, expected one of {', '.join(SOURCE_FIELDS)}")
+        return self._sources[field]
+
+
+def as_league_registry(leagues: Union[LeagueRegistry, Iterable[LeagueInfo]]) -> LeagueRegistry:
+    if isinstance(leagues, LeagueRegistry):
+        return leagues
+    return LeagueRegistry(leagues)
+
+
+_league_registry: Optional[LeagueRegistry] = None
+_league_registry_lock = threading.Lock()
+
+
+def get_league_registry() -> LeagueRegistry:
+    global _league_registry
+
+    with _league_registry_lock:
+        if _league_registry is None:
+            _league_registry = LeagueRegistry.from_config(load_config())
+        return _league_registry
@@ -0,0 +1,195 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A step of a pipeline. A coroutine function runs on the event loop, any
+    other callable in a worker thread. The stage starts once the stages
+    producing its inputs are done and never together with another stage
+    holding one of its resources, e.g. a scraped site.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    resources: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageReport:
+    name: str
+    status: str = "pending"  # done, failed or skipped
+    start: Optional[float] = None
+    end: Optional[float] = None
+    error: Optional[str] = None
+    on_critical_path: bool = False
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+@dataclass
+class PipelineReport:
+    name: str
+    stages: List[StageReport] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def failed(self) -> List[str]:
+        return [stage.name for stage in self.stages if stage.status == "failed"]
+
+    @property
+    def skipped(self) -> List[str]:
+        return [stage.name for stage in self.stages if stage.status == "skipped"]
+
+    @property
+    def critical_path(self) -> List[str]:
+        return [stage.name for stage in self.stages if stage.on_critical_path]
+
+    def format(self) -> str:
+        lines = [f"Pipeline {self.name} finished in {self.duration:.1f}s"]
+        lines.append(f"  {'stage':<24} {'status':<8} {'start':>8} {'duration':>9}")
+        for stage in sorted(self.stages, key=lambda x: (x.start is None, x.start or 0.0)):
+            start = f"{stage.start:7.1f}s" if stage.start is not None else f"{'-':>8}"
+            line = f"{'*' if stage.on_critical_path else ' '} {stage.name:<24} {stage.status:<8} {start} {stage.duration:8.1f}s"
+            if stage.error:
+                line += f"  {stage.error}"
+            lines.append(line)
+        lines.append(f"  critical path: {' -> '.join(self.critical_path)}")
+        return "\n".join(lines)
+
+
+class Pipeline:
+    """
+    Runs stages as a DAG: every stage waits only for the producers of its
+    inputs, so independent stages run concurrently. A failed stage skips the
+    stages depending on it, directly or not, and nothing else.
+    """
+
+    def __init__(self, name: str, stages: Sequence[Stage], max_threads: int = 4):
+        self._name = name
+        self._stages = {}
+        for stage in stages:
+            if stage.name in self._stages:
+                raise ValueError(f"Duplicated stage {stage.name}")
+            self._stages[stage.name] = stage
+        self._max_threads = max(max_threads, 1)
+
+        output_2_stage: Dict[str, str] = {}
+        for stage in stages:
+            for output in stage.outputs:
+                if output in output_2_stage:
+                    raise ValueError(f"{output} is produced by {output_2_stage[output]} and {stage.name}")
+                output_2_stage[output] = stage.name
+
+        self._dependencies: Dict[str, Tuple[str, ...]] = {}
+        for stage in stages:
+            missing = [input_ for input_ in stage.inputs if input_ not in output_2_stage]
+            if missing:
+                raise ValueError(f"No stage produces {', '.join(missing)} for {stage.name}")
+            self._dependencies[stage.name] = tuple(dict.fromkeys(
+                output_2_stage[input_] for input_ in stage.inputs
+            ))
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visited, in_path = set(), set()
+
+        def visit(name: str) -> None:
+            if name in in_path:
+                raise ValueError(f"Stages dependencies have a cycle through {name}")
+            if name in visited:
+                return
+            in_path.add(name)
+            for dependency in self._dependencies[name]:
+                visit(dependency)
+            in_path.remove(name)
+            visited.add(name)
+
+        for name in self._stages:
+            visit(name)
+
+    def _mark_critical_path(self, reports: Dict[str, StageReport]) -> None:
+        """
+        Walks back from the stage finishing last through the dependency
+        finishing last, the chain that bounds the pipeline duration.
+        """
+        finished = [report for report in reports.values() if report.end is not None]
+        if not finished:
+            return
+        report = max(finished, key=lambda x: x.end)
+        while report is not None:
+            report.on_critical_path = True
+            dependencies = [
+                reports[name] for name in self._dependencies[report.name] if reports[name].end is not None
+            ]
+            report = max(dependencies, key=lambda x: x.end) if dependencies else None
+
+    async def run(self) -> PipelineReport:
+        reports = {name: StageReport(name=name) for name in self._stages}
+        finished = {name: asyncio.Event() for name in self._stages}
+        locks: Dict[str, asyncio.Lock] = {}
+        for stage in self._stages.values():
+            for resource in stage.resources:
+                locks.setdefault(resource, asyncio.Lock())
+
+        loop = asyncio.get_running_loop()
+        started_at = time.perf_counter()
+
+        async def run_stage(stage: Stage, executor: ThreadPoolExecutor) -> None:
+            report = reports[stage.name]
+            try:
+                for dependency in self._dependencies[stage.name]:
+                    await finished[dependency].wait()
+                not_done = [name for name in self._dependencies[stage.name] if reports[name].status != "done"]
+                if not_done:
+                    report.status = "skipped"
+                    report.error = f"after {', '.join(not_done)}"
+                    logger.warning(f"Skip stage {stage.name} of {self._name}, {', '.join(not_done)} not done")
+                    return
+
+                stage_locks = [locks[resource] for resource in sorted(stage.resources)]
+                for lock in stage_locks:
+                    await lock.acquire()
+                try:
+                    report.start = time.perf_counter() - started_at
+                    logger.info(f"Start stage {stage.name} of {self._name}")
+                    if inspect.iscoroutinefunction(stage.func):
+                        await stage.func()
+                    else:
+                        await loop.run_in_executor(executor, stage.func)
+                    report.status = "done"
+                except Exception as e:
+                    report.status = "failed"
+                    report.error = f"{type(e).__name__}: {e}"
+                    logger.exception(f"Stage {stage.name} of {self._name} failed: {e}")
+                finally:
+                    report.end = time.perf_counter() - started_at
+                    for lock in reversed(stage_locks):
+                        lock.release()
+            finally:
+                finished[stage.name].set()
+
+        with ThreadPoolExecutor(max_workers=self._max_threads, thread_name_prefix=self._name) as executor:
+            await asyncio.gather(*[run_stage(stage, executor) for stage in self._stages.values()])
+
+        self._mark_critical_path(reports)
+        report = PipelineReport(
+            name=self._name,
+            stages=list(reports.values()),
+            duration=time.perf_counter() - started_at
+        )
+        logger.info(report.format())
+        return report
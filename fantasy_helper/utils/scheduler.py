@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from fantasy_helper.db.dao.scheduler import SchedulerDAO
+from fantasy_helper.utils.cron import CronSchedule
+from fantasy_helper.utils.dataclasses import ScheduledJobInfo
+
+
+# runs a scheduled job and returns an error description if it partly failed
+JobRunner = Callable[[ScheduledJobInfo], Awaitable[Optional[str]]]
+
+
+class JobScheduler:
+    """
+    Triggers the jobs of the schedule table in a resident process. The table
+    is re-read every tick, so jobs can be added, disabled or rescheduled
+    without a restart. Runs missed while the process was busy or down are
+    not caught up: a due job runs once and is scheduled after now.
+
+    Jobs of one kind run one at a time, since they share the runner warm
+    state, e.g. parsers drivers, and a job still running when it is due
+    again is skipped and recorded so in the runs history.
+    """
+
+    def __init__(
+        self,
+        dao: SchedulerDAO,
+        runners: Dict[str, JobRunner],
+        tick: float = 30.0,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        self._dao = dao
+        self._runners = runners
+        self._tick = tick
+        self._clock = clock
+        self._locks = {job: asyncio.Lock() for job in runners}
+        self._running: Dict[str, asyncio.Task] = {}
+        # job name -> cron expression and next run
+        self._next_runs: Dict[str, Tuple[str, datetime]] = {}
+
+    @property
+    def running(self) -> Dict[str, asyncio.Task]:
+        return {name: task for name, task in self._running.items() if not task.done()}
+
+    async def run_pending(self) -> None:
+        now = self._clock()
+        jobs = await asyncio.to_thread(self._dao.get_jobs)
+
+        for job in jobs:
+            if not job.enabled or job.job not in self._runners:
+                if job.enabled:
+                    logger.error(f"Unknown job {job.job} of {job.name}")
+                self._next_runs.pop(job.name, None)
+                continue
+
+            cron, next_run = self._next_runs.get(job.name, (None, None))
+            if cron != job.cron:
+                try:
+                    next_run = CronSchedule(job.cron).next_after(now)
+                except ValueError as e:
+                    logger.error(f"Invalid schedule of {job.name}: {e}")
+                    continue
+                self._next_runs[job.name] = (job.cron, next_run)
+                continue
+            if next_run > now:
+                continue
+
+            self._next_runs[job.name] = (job.cron, CronSchedule(job.cron).next_after(now))
+            if job.name in self.running:
+                logger.warning(f"Skip job {job.name}, the previous run is still running")
+                await asyncio.to_thread(
+                    self._dao.add_skipped_run, job, next_run, "the previous run is still running"
+                )
+                continue
+            self._running[job.name] = asyncio.create_task(self.run_job(job, next_run))
+
+    async def run_job(self, job: ScheduledJobInfo, scheduled_at: Optional[datetime] = None) -> None:
+        async with self._locks[job.job]:
+            run_id = await asyncio.to_thread(self._dao.start_run, job, scheduled_at)
+            if run_id is None:
+                return
+
+            logger.info(f"Start job {job.name}")
+            try:
+                error = await self._runners[job.job](job)
+                status = "failed" if error else "done"
+            except Exception as e:
+                logger.exception(f"Job {job.name} failed: {e}")
+                status, error = "failed", f"{type(e).__name__}: {e}"
+            await asyncio.to_thread(self._dao.finish_run, run_id, status, error)
+            logger.info(f"Finish job {job.name}: {status}")
+
+    async def serve(self) -> None:
+        failed = await asyncio.to_thread(self._dao.fail_dead_runs)
+        if failed:
+            logger.warning(f"Marked {failed} runs of dead scheduler processes as failed")
+
+        while True:
+            try:
+                await asyncio.to_thread(self._dao.heartbeat)
+                await self.run_pending()
+            except Exception as e:
+                logger.exception(f"Failed to check the schedule: {e}")
+            await asyncio.sleep(self._tick)
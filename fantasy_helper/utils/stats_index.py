@@ -0,0 +1,218 @@
+import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import polars as pl
+
+from fantasy_helper.utils.dataclasses import PlayerMatchStatsInfo
+
+
+PLAYER_COLUMNS = ("name", "team", "position", "sports_name", "sports_team", "role", "price")
+
+
+class PlayersStatsIndex:
+    """
+    Prefix sums of per-match players stats of one league.
+
+    Every player gets a row of per-match stats aligned with the matches of
+    the player's team, in two orders: by date and by gameweek. A window of
+    matches is contiguous in one of the orders, so its sums are a difference
+    of two prefix sums, computed for all players of the league at once.
+    """
+
+    def __init__(self, players_matches: List[PlayerMatchStatsInfo], columns: Sequence[str]):
+        self._columns = tuple(columns)
+        # games and minutes go first, games is 1 for a match played and never null
+        self._sum_columns = ("games", "minutes", *[c for c in self._columns if c != "minutes"])
+
+        players: Dict[Tuple[str, str], int] = {}
+        players_info: List[PlayerMatchStatsInfo] = []
+        teams: Dict[str, int] = {}
+        teams_matches: List[int] = []
+        for player_match in sorted(players_matches, key=lambda x: x.match_number):
+            team_id = teams.setdefault(player_match.team, len(teams))
+            if team_id == len(teams_matches):
+                teams_matches.append(0)
+            teams_matches[team_id] = max(teams_matches[team_id], player_match.match_number)
+            # the first row of a player is the latest match
+            if (player_match.team, player_match.name) not in players:
+                players[(player_match.team, player_match.name)] = len(players)
+                players_info.append(player_match)
+
+        self._players = pl.DataFrame(
+            {column: [getattr(player, column) for player in players_info] for column in PLAYER_COLUMNS},
+            schema={
+                "name": pl.String, "team": pl.String, "position": pl.String, "sports_name": pl.String,
+                "sports_team": pl.String, "role": pl.String, "price": pl.Float64,
+            }
+        )
+        self._player_team = np.array([teams[player.team] for player in players_info], dtype=np.int64)
+        self._teams_matches = np.array(teams_matches, dtype=np.int64)
+
+        max_matches = int(self._teams_matches.max()) if len(teams_matches) else 0
+        values = np.zeros((len(players), max_matches, len(self._sum_columns)), dtype=np.float64)
+        counts = np.zeros((len(players), max_matches, len(self._sum_columns)), dtype=np.int32)
+        dates = np.full((len(teams), max_matches), np.datetime64("NaT"), dtype="datetime64[D]")
+        # padding after the last match of a team stays at the end of the gameweek order
+        gameweeks = np.full((len(teams), max_matches), np.iinfo(np.int64).max, dtype=np.int64)
+        for team_id, team_matches in enumerate(teams_matches):
+            gameweeks[team_id, :team_matches] = 0
+
+        for player_match in players_matches:
+            team_id = teams[player_match.team]
+            player_id = players[(player_match.team, player_match.name)]
+            # position 0 is the first match of the team
+            position = teams_matches[team_id] - player_match.match_number
+            if player_match.date is not None:
+                dates[team_id, position] = player_match.date
+            if player_match.gameweek is not None:
+                gameweeks[team_id, position] = player_match.gameweek
+
+            values[player_id, position, 0] = 1 if (player_match.minutes or 0) > 0 else 0
+            counts[player_id, position, 0] = 1
+            for i, column in enumerate(self._sum_columns[1:], start=1):
+                value = getattr(player_match, column)
+                if value is not None:
+                    values[player_id, position, i] = value
+                    counts[player_id, position, i] = 1
+
+        self._dates = np.array([self._fill_dates(team_dates) for team_dates in dates]).reshape(dates.shape)
+        self._gameweeks = gameweeks
+        self._gameweek_order = np.argsort(gameweeks, axis=1, kind="stable")
+
+        team_of_player = self._player_team[:, None]
+        gameweek_order = self._gameweek_order[team_of_player, np.arange(max_matches)[None, :]]
+        players_range = np.arange(len(players))[:, None]
+        self._prefix = {
+            "date": (self._prefix_sums(values), self._prefix_sums(counts)),
+            "gameweek": (
+                self._prefix_sums(values[players_range, gameweek_order]),
+                self._prefix_sums(counts[players_range, gameweek_order]),
+            ),
+        }
+
+    @staticmethod
+    def _fill_dates(dates: np.ndarray) -> np.ndarray:
+        # matches without a date take the date of the previous match to keep the order sorted
+        result = dates.copy()
+        last = np.datetime64("1970-01-01")
+        for i, date in enumerate(result):
+            if np.isnat(date):
+                result[i] = last
+            else:
+                last = date
+        return result
+
+    @staticmethod
+    def _prefix_sums(values: np.ndarray) -> np.ndarray:
+        result = np.zeros((values.shape[0], values.shape[1] + 1, values.shape[2]), dtype=values.dtype)
+        np.cumsum(values, axis=1, out=result[:, 1:])
+        return result
+
+    @property
+    def players_count(self) -> int:
+        return len(self._player_team)
+
+    @property
+    def max_matches(self) -> int:
+        return int(self._teams_matches.max()) if len(self._teams_matches) else 0
+
+    def _teams_bounds(
+        self,
+        games_count: Optional[int],
+        gameweek_from: Optional[int],
+        gameweek_to: Optional[int],
+        date_from: Optional[datetime.date]
+    ) -> Tuple[str, np.ndarray, np.ndarray]:
+        if gameweek_from is not None or gameweek_to is not None:
+            if games_count is not None or date_from is not None:
+                raise ValueError("gameweeks range can't be combined with games_count or date_from")
+
+            sorted_gameweeks = np.take_along_axis(self._gameweeks, self._gameweek_order, axis=1)
+            starts, ends = [], []
+            for team_id, team_matches in enumerate(self._teams_matches):
+                team_gameweeks = sorted_gameweeks[team_id, :team_matches]
+                starts.append(np.searchsorted(
+                    team_gameweeks, gameweek_from if gameweek_from is not None else np.iinfo(np.int64).min, "left"
+                ))
+                ends.append(np.searchsorted(
+                    team_gameweeks, gameweek_to if gameweek_to is not None else np.iinfo(np.int64).max, "right"
+                ))
+            return "gameweek", np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+        ends = self._teams_matches.copy()
+        starts = np.zeros_like(ends)
+        if games_count is not None:
+            starts = np.maximum(starts, ends - games_count)
+        if date_from is not None:
+            date_from = np.datetime64(date_from, "D")
+            starts = np.maximum(starts, np.array([
+                np.searchsorted(self._dates[team_id, :team_matches], date_from, "left")
+                for team_id, team_matches in enumerate(self._teams_matches)
+            ], dtype=np.int64))
+        return "date", np.minimum(starts, ends), ends
+
+    def window(
+        self,
+        games_count: Optional[int] = None,
+        gameweek_from: Optional[int] = None,
+        gameweek_to: Optional[int] = None,
+        date_from: Optional[datetime.date] = None
+    ) -> pl.DataFrame:
+        """
+        Sums the players stats over a window of the team matches.
+
+        Args:
+            games_count (Optional[int]): The number of the last team matches.
+            gameweek_from (Optional[int]): The first gameweek of the window.
+            gameweek_to (Optional[int]): The last gameweek of the window.
+            date_from (Optional[datetime.date]): The first date of the window.
+
+        Returns:
+            pl.DataFrame: One row per player with the player info, games_all as the
+            number of team matches in the window and the summed stats. A stat
+            is null when the player played in the window but it is unknown.
+        """
+        order, team_starts, team_ends = self._teams_bounds(games_count, gameweek_from, gameweek_to, date_from)
+        players_range = np.arange(self.players_count)
+        return self._sums(
+            order, players_range, team_starts[self._player_team], team_ends[self._player_team]
+        )
+
+    def cumulative(self) -> pl.DataFrame:
+        """
+        Sums the players stats over every number of the last team matches.
+
+        Returns:
+            pl.DataFrame: One row per player and games_all from 1 to the number
+            of the team matches, with the columns of window(games_count=games_all).
+        """
+        players_matches = self._teams_matches[self._player_team]
+        player_ids = np.repeat(np.arange(self.players_count), players_matches)
+        first_rows = np.repeat(np.cumsum(players_matches) - players_matches, players_matches)
+        games_all = np.arange(len(player_ids)) - first_rows + 1
+
+        ends = players_matches[player_ids]
+        return self._sums("date", player_ids, ends - games_all, ends)
+
+    def _sums(self, order: str, player_ids: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> pl.DataFrame:
+        prefix_values, prefix_counts = self._prefix[order]
+        sums = prefix_values[player_ids, ends] - prefix_values[player_ids, starts]
+        counts = prefix_counts[player_ids, ends] - prefix_counts[player_ids, starts]
+
+        # players without matches in the window get zeros, as in the cumulative stats
+        played = counts[:, 0] > 0
+        known = (counts > 0) | ~played[:, None]
+
+        stats = pl.DataFrame({
+            column: pl.Series(column, sums[:, i]).set(pl.Series(~known[:, i]), None)
+            for i, column in enumerate(self._sum_columns)
+        })
+        return pl.concat([
+            self._players[player_ids],
+            stats.with_columns(
+                pl.col("games").cast(pl.Int64),
+                pl.col("minutes").cast(pl.Int64),
+                pl.Series("games_all", ends - starts, dtype=pl.Int64),
+            ),
+        ], how="horizontal")